@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark loading of SDC service TOSCA templates.
+
+Usage:
+
+    PYTHONPATH=src python scripts/benchmark_tosca_loading.py [CSAR_OR_TEMPLATE] [--copies N]
+
+Run it on a service CSAR (or its Definitions/service-*-template.yml) downloaded
+from SDC. Without a path a large template is built from
+tests/data/service-VfwcdsService-template.yml: its node templates, groups and
+inputs are copied N times under new names, so the result is reproducible.
+"""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import argparse
+import time
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from zipfile import ZipFile
+
+import oyaml
+import yaml
+
+from onapsdk.utils.service_model import (MODEL_TEMPLATE_SECTIONS, SERVICE_TEMPLATE_REGEX,
+                                         ServiceModel, TemplateLoader, load_template)
+
+BASE_TEMPLATE = (Path(__file__).resolve().parent.parent / "tests" / "data" /
+                 "service-VfwcdsService-template.yml")
+
+
+def read_template(path: Path) -> bytes:
+    """Read service template from CSAR or template file.
+
+    Args:
+        path (Path): CSAR or template file path
+
+    Returns:
+        bytes: Service template YAML
+
+    """
+    if path.suffix in (".csar", ".zip"):
+        with ZipFile(path) as csar:
+            for name in csar.namelist():
+                if SERVICE_TEMPLATE_REGEX.match(name):
+                    return csar.read(name)
+        raise SystemExit(f"{path} has no service template")
+    return path.read_bytes()
+
+
+def build_template(copies: int) -> bytes:
+    """Build large service template by copying sections of the base one.
+
+    Values are deep copied, so the dumped YAML has no anchors and aliases.
+
+    Args:
+        copies (int): Number of copies of node templates, groups and inputs
+
+    Returns:
+        bytes: Service template YAML
+
+    """
+    template: Dict[str, Any] = yaml.safe_load(BASE_TEMPLATE.read_bytes())
+    topology_template: Dict[str, Any] = template["topology_template"]
+    for section in ("node_templates", "groups", "inputs"):
+        items: Dict[str, Any] = topology_template.get(section) or {}
+        topology_template[section] = {f"{name}_{copy}" if copy else name: deepcopy(value)
+                                      for copy in range(copies)
+                                      for name, value in items.items()}
+    return yaml.safe_dump(template, sort_keys=False).encode()
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Get the best execution time of the function.
+
+    Args:
+        function (Callable[[], Any]): Function to measure
+        repeat (int): Number of runs
+
+    Returns:
+        float: Best execution time, in seconds
+
+    """
+    times: List[float] = []
+    for _ in range(repeat):
+        started_at: float = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started_at)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", type=Path,
+                        help="service CSAR or template, synthetic template if not set")
+    parser.add_argument("--copies", type=int, default=50,
+                        help="copies of the base template sections (default: 50)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each loader")
+    args = parser.parse_args()
+
+    content: bytes = read_template(args.path) if args.path else build_template(args.copies)
+    print(f"Template: {args.path or f'synthetic, {args.copies} copies'}, "
+          f"{len(content) / 1024 / 1024:.1f} MB, loader {TemplateLoader.__name__}")
+    loaders: Tuple[Tuple[str, Callable[[], Any]], ...] = (
+        ("oyaml.safe_load (baseline)", lambda: oyaml.safe_load(content)),
+        ("load_template", lambda: load_template(content)),
+        ("load_template(MODEL_TEMPLATE_SECTIONS)",
+         lambda: load_template(content, MODEL_TEMPLATE_SECTIONS)),
+        ("ServiceModel from sections",
+         lambda: ServiceModel.from_template(load_template(content, MODEL_TEMPLATE_SECTIONS))),
+    )
+    for name, loader in loaders:
+        print(f"  {name:<42} {measure(loader, args.repeat):7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,8 @@
 #   limitations under the License.
 import enum
 from dataclasses import dataclass, field
-from typing import Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 from onapsdk.configuration import settings
 from onapsdk.onap_service import OnapService
@@ -91,6 +92,86 @@ class RelationshipLabelEnum(enum.Enum):
     USES = "org.onap.relationships.inventory.Uses"
 
 
+@enum.unique
+class AaiResponseFormat(enum.Enum):
+    """A&AI response formats which can be used to read objects.
+
+    Formats which return objects' properties without their relationship lists
+        and nested children are lighter than the default resource representation.
+    """
+
+    RESOURCE = "resource"
+    RESOURCE_AND_URL = "resource_and_url"
+    SIMPLE = "simple"
+    RAW = "raw"
+
+
+@dataclass
+class AaiReadOptions:
+    """Options used to request a lighter representation of A&AI objects.
+
+    Objects' properties are the same for all formats, so objects read using
+        any options are complete. Relationships and nested children, which
+        could be skipped, are fetched on demand by objects' properties
+        (e.g. `relationships`, `tenants` or `vf_modules`).
+    """
+
+    response_format: Optional[AaiResponseFormat] = None
+    depth: Optional[Union[int, str]] = None
+    nodes_only: bool = False
+
+    @property
+    def query_parameters(self) -> Dict[str, str]:
+        """Query parameters which request objects' representation.
+
+        Returns:
+            Dict[str, str]: Query parameters
+
+        """
+        parameters: Dict[str, str] = {}
+        if self.response_format is not None:
+            parameters["format"] = self.response_format.value
+        if self.depth is not None:
+            parameters["depth"] = str(self.depth)
+        if self.nodes_only:
+            parameters["nodes-only"] = ""
+        return parameters
+
+    def objects(self, response: Dict[str, Any], object_type: str) -> Iterator[Dict[str, Any]]:
+        """Get objects' representations from response of given format.
+
+        Representations are normalized to the default resource format. Relationships
+            returned by "simple" and "raw" formats are converted into relationship list.
+
+        Args:
+            response (Dict[str, Any]): A&AI API response
+            object_type (str): A&AI object type, e.g. "cloud-region"
+
+        Yields:
+            Dict[str, Any]: Object's representation
+
+        """
+        if self.response_format is None:
+            yield from response.get(object_type, [])
+            return
+        for result in response.get("results", []):
+            if self.response_format in (AaiResponseFormat.RESOURCE,
+                                        AaiResponseFormat.RESOURCE_AND_URL):
+                if object_type in result:
+                    yield result[object_type]
+                continue
+            api_response: Dict[str, Any] = dict(result.get("properties", {}))
+            if "related-to" in result:
+                api_response["relationship-list"] = {"relationship": [
+                    {
+                        "related-to": related.get("node-type"),
+                        "relationship-label": related.get("relationship-label", ""),
+                        "related-link": related.get("url")
+                    } for related in result["related-to"]
+                ]}
+            yield api_response
+
+
 class AaiElement(OnapService):
     """Mother Class of all A&AI elements."""
 
@@ -193,6 +274,108 @@ class AaiResource(AaiElement):
         """
         raise NotImplementedError
 
+    @classmethod
+    def read_objects(cls,
+                     url: str,
+                     object_type: str,
+                     description: str,
+                     filters: Optional[Dict[str, Optional[str]]] = None,
+                     read_options: Optional[AaiReadOptions] = None) -> Iterator[Dict[str, Any]]:
+        """Read objects' representations from A&AI collection.
+
+        Args:
+            url (str): Collection url
+            object_type (str): A&AI object type, e.g. "cloud-region"
+            description (str): Request description
+            filters (Dict[str, Optional[str]], optional): Object properties to filter by.
+                Properties with None values are not used. Defaults to None.
+            read_options (AaiReadOptions, optional): Options to request lighter objects'
+                representation. Full representation is used if not set. Defaults to None.
+
+        Yields:
+            Dict[str, Any]: Object's representation
+
+        """
+        read_options = read_options or AaiReadOptions()
+        parameters: Dict[str, str] = {**cls.filter_none_key_values(filters or {}),
+                                      **read_options.query_parameters}
+        yield from read_options.objects(
+            cls.send_message_json("GET", description, f"{url}?{urlencode(parameters)}"),
+            object_type
+        )
+
+    @classmethod
+    def get_nodes(cls,
+                  nodes_type: str,
+                  filters: Dict[str, str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Get objects using A&AI nodes API.
+
+        Nodes API finds objects of given type by their properties without
+            walking their parents, e.g. a generic VNF without customer, service
+            subscription and service instance.
+
+        Args:
+            nodes_type (str): Plural A&AI object type, e.g. "generic-vnfs"
+            filters (Dict[str, str]): Object properties to filter by
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: Object's url (without A&AI address)
+                and its representation
+
+        """
+        try:
+            response: Dict[str, Any] = cls.send_message_json(
+                "GET",
+                f"Get {nodes_type} nodes",
+                (f"{cls.base_url}{cls.api_version}/nodes/{nodes_type}?"
+                 f"{urlencode({**filters, 'format': 'resource_and_url'})}")
+            )
+        except ResourceNotFound:
+            return
+        for result in response.get("results", []):
+            for key, api_response in result.items():
+                if key != "url":
+                    yield result["url"], api_response
+
+    @classmethod
+    def get_node(cls, nodes_type: str, filters: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
+        """Get the first object which nodes API returns.
+
+        Args:
+            nodes_type (str): Plural A&AI object type, e.g. "generic-vnfs"
+            filters (Dict[str, str]): Object properties to filter by
+
+        Raises:
+            ResourceNotFound: No object matches given filters
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: Object's url (without A&AI address)
+                and its representation
+
+        """
+        node: Optional[Tuple[str, Dict[str, Any]]] = next(cls.get_nodes(nodes_type, filters), None)
+        if node is None:
+            msg = f"{nodes_type} with {filters} not found"
+            raise ResourceNotFound(msg)
+        return node
+
+    @staticmethod
+    def get_related_link(api_response: Dict[str, Any], related_to: str) -> Optional[str]:
+        """Get a link of the first related object of given type from API response.
+
+        Args:
+            api_response (Dict[str, Any]): Object's A&AI representation
+            related_to (str): Related object type, e.g. "service-instance"
+
+        Returns:
+            Optional[str]: Related object's link, None if there is no such relationship
+
+        """
+        for relationship in (api_response.get("relationship-list") or {}).get("relationship", []):
+            if relationship.get("related-to") == related_to:
+                return relationship.get("related-link")
+        return None
+
     @classmethod
     def count(cls, *args, **kwargs) -> int:
         """Get the count number of all objects of given class.
@@ -19,7 +19,7 @@ from urllib.parse import urlencode, urljoin
 from onapsdk.utils.jinja import jinja_env
 from onapsdk.exceptions import APIError, ParameterError, ResourceNotFound
 
-from ..aai_element import AaiResource, Relationship
+from ..aai_element import AaiReadOptions, AaiResource, Relationship
 from ..cloud_infrastructure.cloud_region import CloudRegion
 from .service import ServiceInstance
 
@@ -399,7 +399,8 @@ class Customer(AaiResource):
     def get_all(cls,
                 global_customer_id: Optional[str] = None,
                 subscriber_name: Optional[str] = None,
-                subscriber_type: Optional[str] = None) -> Iterator["Customer"]:
+                subscriber_type: Optional[str] = None,
+                read_options: Optional[AaiReadOptions] = None) -> Iterator["Customer"]:
         """Get all customers.
 
         Call an API to retrieve all customers. It can be filtered
@@ -409,17 +410,17 @@ class Customer(AaiResource):
             global_customer_id (str): global-customer-id to filer customers by. Defaults to None.
             subscriber_name (str): subscriber-name to filter customers by. Defaults to None.
             subscriber_type (str): subscriber-type to filter customers by. Defaults to None.
+            read_options (AaiReadOptions, optional): Options to request lighter customers
+                representation, e.g. without service subscriptions. Defaults to None.
 
         """
-        filter_parameters: dict = cls.filter_none_key_values(
-            {
-                "global-customer-id": global_customer_id,
-                "subscriber-name": subscriber_name,
-                "subscriber-type": subscriber_type,
-            }
-        )
-        url: str = f"{cls.get_all_url()}?{urlencode(filter_parameters)}"
-        for customer in cls.send_message_json("GET", "get customers", url).get("customer", []):
+        filter_parameters: Dict[str, Optional[str]] = {
+            "global-customer-id": global_customer_id,
+            "subscriber-name": subscriber_name,
+            "subscriber-type": subscriber_type,
+        }
+        for customer in cls.read_objects(cls.get_all_url(), "customer", "get customers",
+                                         filter_parameters, read_options):
             yield Customer(
                 global_customer_id=customer["global-customer-id"],
                 subscriber_name=customer["subscriber-name"],
@@ -14,10 +14,15 @@
 #   limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from onapsdk.exceptions import RelationshipNotFound
 
 from ..aai_element import AaiResource
 
+if TYPE_CHECKING:
+    from .service import ServiceInstance  # pylint: disable=cyclic-import
+
 
 class Instance(AaiResource, ABC):
     """Abstract instance class."""
@@ -54,3 +59,70 @@ class Instance(AaiResource, ABC):
             DeletionRequest: Deletion request
 
         """
+
+
+class ServiceInstanceChildMixin:
+    """Mixin for instances which belong to a service instance.
+
+    Instances got without their service instance (e.g. using A&AI nodes API)
+        keep a link to it, taken from their relationships, and load it on first access.
+        If instance was read without relationships (e.g. using "nodes-only" read option)
+        the link is looked up in its relationships on first access.
+    """
+
+    _service_instance: Optional["ServiceInstance"] = None
+    _service_instance_link: Optional[str] = None
+    _service_instance_lookup: bool = False
+
+    @property
+    def service_instance(self) -> Optional["ServiceInstance"]:
+        """Service instance which instance belongs to.
+
+        Returns:
+            Optional[ServiceInstance]: Service instance, None if it's unknown
+
+        """
+        if self._service_instance is None and self._service_instance_lookup:
+            self._service_instance_lookup = False
+            try:
+                self._service_instance_link = next(
+                    (relationship.related_link for relationship in self.relationships  # pylint: disable=no-member
+                     if relationship.related_to == "service-instance"),
+                    None
+                )
+            except RelationshipNotFound:
+                self._service_instance_link = None
+        if self._service_instance is None and self._service_instance_link:
+            from .service import ServiceInstance  # pylint: disable=import-outside-toplevel, cyclic-import
+            self._service_instance = ServiceInstance.get_by_url(self._service_instance_link)
+        return self._service_instance
+
+    @service_instance.setter
+    def service_instance(self, service_instance: Optional["ServiceInstance"]) -> None:
+        """Set service instance which instance belongs to.
+
+        Args:
+            service_instance (Optional[ServiceInstance]): Service instance
+
+        """
+        self._service_instance = service_instance
+
+    @classmethod
+    def create_from_node(cls, api_response: Dict[str, Any]) -> Any:
+        """Create instance object using A&AI nodes API response dictionary.
+
+        Service instance is not known yet, it's loaded on first access. It can be
+            used with the representation read using any `AaiReadOptions`.
+
+        Args:
+            api_response (Dict[str, Any]): A&AI API response dictionary
+
+        Returns:
+            Any: Instance object
+
+        """
+        instance = cls.create_from_api_response(api_response, None)
+        instance._service_instance_link = cls.get_related_link(api_response,  # pylint: disable=protected-access
+                                                               "service-instance")
+        instance._service_instance_lookup = "relationship-list" not in api_response  # pylint: disable=protected-access
+        return instance
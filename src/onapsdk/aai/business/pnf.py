@@ -22,13 +22,14 @@ from jinja2 import Environment, FileSystemLoader
 from onapsdk.exceptions import ResourceNotFound
 from onapsdk.so.deletion import PnfDeletionRequest
 
-from .instance import Instance
+from ..aai_element import AaiReadOptions
+from .instance import Instance, ServiceInstanceChildMixin
 
 if TYPE_CHECKING:
     from .service import ServiceInstance  # pylint: disable=cyclic-import
 
 
-class PnfInstance(Instance):  # pylint: disable=too-many-instance-attributes
+class PnfInstance(ServiceInstanceChildMixin, Instance):  # pylint: disable=too-many-instance-attributes
     """Pnf instance class."""
 
     def __init__(self, # NOSONAR  # pylint: disable=too-many-arguments, too-many-locals
@@ -169,19 +170,22 @@ class PnfInstance(Instance):  # pylint: disable=too-many-instance-attributes
         return f"{cls.base_url}{cls.api_version}/network/pnfs/"
 
     @classmethod
-    def get_all(cls) -> Iterator["PnfInstance"]:
+    def get_all(cls, read_options: Optional[AaiReadOptions] = None) -> Iterator["PnfInstance"]:
         """Get all PNF instances.
 
+        Service instance of each pnf instance is loaded on first access.
+
+        Args:
+            read_options (AaiReadOptions, optional): Options to request lighter pnf
+                instances representation. Defaults to None.
+
         Yields:
             PnfInstance: Pnf instance
 
         """
-        for pnf_data in cls.send_message_json( \
-                "GET", \
-                "Get all pnf instances", \
-                cls.get_all_url() \
-                ).get("pnf", []):
-            yield cls.create_from_api_response(pnf_data, None)
+        for pnf_data in cls.read_objects(cls.get_all_url(), "pnf", "Get all pnf instances",
+                                         read_options=read_options):
+            yield cls.create_from_node(pnf_data)
 
     @property
     def url(self) -> str:
@@ -261,6 +265,44 @@ class PnfInstance(Instance):  # pylint: disable=too-many-instance-attributes
                    pnf_ipv4_address=api_response.get("pnf-ipv4-address"),
                    pnf_ipv6_address=api_response.get("pnf-ipv6-address"))
 
+    @classmethod
+    def get_by_name(cls, pnf_name: str) -> "PnfInstance":
+        """Get pnf instance by its name without knowing its service instance.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            pnf_name (str): Pnf instance name
+
+        Raises:
+            ResourceNotFound: Pnf instance with given name does not exist
+
+        Returns:
+            PnfInstance: PnfInstance object
+
+        """
+        _, api_response = cls.get_node("pnfs", {"pnf-name": pnf_name})
+        return cls.create_from_node(api_response)
+
+    @classmethod
+    def get_by_id(cls, pnf_id: str) -> "PnfInstance":
+        """Get pnf instance by its id without knowing its service instance.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            pnf_id (str): Pnf instance id
+
+        Raises:
+            ResourceNotFound: Pnf instance with given id does not exist
+
+        Returns:
+            PnfInstance: PnfInstance object
+
+        """
+        _, api_response = cls.get_node("pnfs", {"pnf-id": pnf_id})
+        return cls.create_from_node(api_response)
+
     def delete(self, a_la_carte: bool = True) -> "PnfDeletionRequest":
         """Create PNF deletion request.
 
@@ -13,8 +13,9 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Dict, Iterator, Type, Union, Iterable, Optional
-from urllib.parse import urlencode
+import re
+from typing import Any, Dict, Iterator, Type, Union, Iterable, Optional
+from urllib.parse import unquote
 
 from onapsdk.exceptions import StatusError, ParameterError
 from onapsdk.sdc.service import Service
@@ -22,11 +23,18 @@ from onapsdk.so.deletion import ServiceDeletionRequest
 from onapsdk.so.instantiation import NetworkInstantiation, VnfInstantiation, PnfInstantiation
 from onapsdk.utils.jinja import jinja_env
 
+from ..aai_element import AaiReadOptions
 from .instance import Instance
 from .network import NetworkInstance
 from .pnf import PnfInstance
 from .vnf import VnfInstance
 
+SERVICE_INSTANCE_URL_REGEX = re.compile(
+    r"/business/customers/customer/(?P<global_customer_id>[^/]+)"
+    r"/service-subscriptions/service-subscription/(?P<service_type>[^/]+)"
+    r"/service-instances/service-instance/"
+)
+
 
 class ServiceInstance(Instance):  # pylint: disable=too-many-instance-attributes
     """Service instanve class."""
@@ -324,7 +332,8 @@ class ServiceInstance(Instance):  # pylint: disable=too-many-instance-attributes
     @classmethod
     def get_all(cls,
                 service_subscription: "ServiceSubscription",
-                service_type: Optional[str] = None) -> Iterator["ServiceInstance"]:
+                service_type: Optional[str] = None,
+                read_options: Optional[AaiReadOptions] = None) -> Iterator["ServiceInstance"]:
         """Get all service instances for service subscription.
 
         Call an API to retrieve all service instances for given service subscription.
@@ -334,20 +343,104 @@ class ServiceInstance(Instance):  # pylint: disable=too-many-instance-attributes
             service_subscription (ServiceSubscription): service subscription object
             subscriber_name (str): subscriber-name to filter customers by. Defaults to None.
             subscriber_type (str): subscriber-type to filter customers by. Defaults to None.
+            read_options (AaiReadOptions, optional): Options to request lighter service
+                instances representation. Defaults to None.
 
         """
-        filter_parameters: dict = cls.filter_none_key_values(
-            {
-                "service-type": service_type,
-            }
-        )
-        all_url: str = cls.get_all_url(service_subscription=service_subscription)
-        url: str = f"{all_url}?{urlencode(filter_parameters)}"
-        for service_instance in cls.send_message_json("GET",
-                                                      "get service instances",
-                                                      url).get("service-instance", []):
+        for service_instance in cls.read_objects(
+                cls.get_all_url(service_subscription=service_subscription),
+                "service-instance",
+                "get service instances",
+                {"service-type": service_type},
+                read_options):
             yield cls.create_from_api_response(service_subscription, service_instance)
 
+    @classmethod
+    def create_from_url(cls, url: str, api_response: Dict[str, Any]) -> "ServiceInstance":
+        """Create service instance using its url and API response.
+
+        Parent customer and service subscription are reconstructed from the url
+            without sending any request, so they have their identifiers only.
+            Use `Customer.get_by_global_customer_id` to get all customer's data.
+
+        Args:
+            url (str): Service instance url
+            api_response (Dict[str, Any]): Service Instance API response object
+
+        Raises:
+            ParameterError: Url is not a service instance one
+
+        Returns:
+            ServiceInstance: Service instance object
+
+        """
+        from .customer import Customer, ServiceSubscription  # pylint: disable=import-outside-toplevel, cyclic-import
+        match = SERVICE_INSTANCE_URL_REGEX.search(url)
+        if not match:
+            raise ParameterError(f"{url} is not a service instance url")
+        service_subscription: ServiceSubscription = ServiceSubscription(
+            customer=Customer(global_customer_id=unquote(match.group("global_customer_id")),
+                              subscriber_name=None,
+                              subscriber_type=None),
+            service_type=unquote(match.group("service_type")),
+            resource_version=None
+        )
+        return cls.create_from_api_response(service_subscription, api_response)
+
+    @classmethod
+    def get_by_url(cls, url: str) -> "ServiceInstance":
+        """Get service instance using its url, e.g. a relationship's related link.
+
+        Args:
+            url (str): Service instance url, with or without A&AI address
+
+        Returns:
+            ServiceInstance: Service instance object
+
+        """
+        full_url: str = url if url.startswith("http") else f"{cls.base_url}{url}"
+        return cls.create_from_url(url, cls.send_message_json("GET",
+                                                              "Get service instance",
+                                                              full_url))
+
+    @classmethod
+    def get_by_id(cls, instance_id: str) -> "ServiceInstance":
+        """Get service instance by its id without knowing customer and service subscription.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            instance_id (str): Service instance id
+
+        Raises:
+            ResourceNotFound: Service instance with given id does not exist
+
+        Returns:
+            ServiceInstance: Service instance object
+
+        """
+        return cls.create_from_url(*cls.get_node("service-instances",
+                                                 {"service-instance-id": instance_id}))
+
+    @classmethod
+    def get_by_name(cls, instance_name: str) -> "ServiceInstance":
+        """Get service instance by its name without knowing customer and service subscription.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            instance_name (str): Service instance name
+
+        Raises:
+            ResourceNotFound: Service instance with given name does not exist
+
+        Returns:
+            ServiceInstance: Service instance object
+
+        """
+        return cls.create_from_url(*cls.get_node("service-instances",
+                                                 {"service-instance-name": instance_name}))
+
     @property
     def url(self) -> str:
         """Service instance resource URL.
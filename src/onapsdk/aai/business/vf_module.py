@@ -13,13 +13,20 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Optional
+import re
+from typing import Optional, TYPE_CHECKING
+from urllib.parse import unquote
 
 from onapsdk.so.deletion import VfModuleDeletionRequest
 from onapsdk.exceptions import ResourceNotFound
 
 from .instance import Instance
 
+if TYPE_CHECKING:
+    from .vnf import VnfInstance  # pylint: disable=cyclic-import
+
+VNF_ID_URL_REGEX = re.compile(r"/network/generic-vnfs/generic-vnf/(?P<vnf_id>[^/]+)/vf-modules/")
+
 
 class VfModuleInstance(Instance):  # pylint: disable=too-many-instance-attributes
     """Vf module instance class."""
@@ -79,7 +86,9 @@ class VfModuleInstance(Instance):  # pylint: disable=too-many-instance-attribute
         """
         super().__init__(resource_version=resource_version, model_version_id=model_version_id,
                          model_invariant_id=model_invariant_id)
-        self.vnf_instance: "VnfInstance" = vnf_instance
+        self._vnf_instance: Optional["VnfInstance"] = None
+        self._vnf_id: Optional[str] = None
+        self.vnf_instance = vnf_instance
         self.vf_module_id: str = vf_module_id
         self.is_base_vf_module: bool = is_base_vf_module
         self.automated_assignment: bool = automated_assignment
@@ -130,6 +139,32 @@ class VfModuleInstance(Instance):  # pylint: disable=too-many-instance-attribute
         """
         return f"{self.vnf_instance.url}/vf-modules/vf-module/{self.vf_module_id}"
 
+    @property
+    def vnf_instance(self) -> "VnfInstance":
+        """Vnf instance which vf module instance belongs to.
+
+        Vf module instances got without their vnf instance (e.g. using `get_by_id`)
+            load it on first access.
+
+        Returns:
+            VnfInstance: Vnf instance
+
+        """
+        if self._vnf_instance is None and self._vnf_id:
+            from .vnf import VnfInstance  # pylint: disable=import-outside-toplevel, cyclic-import
+            self._vnf_instance = VnfInstance.get_by_id(self._vnf_id)
+        return self._vnf_instance
+
+    @vnf_instance.setter
+    def vnf_instance(self, vnf_instance: Optional["VnfInstance"]) -> None:
+        """Set vnf instance which vf module instance belongs to.
+
+        Args:
+            vnf_instance (Optional[VnfInstance]): Vnf instance
+
+        """
+        self._vnf_instance = vnf_instance
+
     @property
     def vf_module(self) -> "VfModule":
         """Vf module associated with that vf module instance.
@@ -185,6 +220,64 @@ class VfModuleInstance(Instance):  # pylint: disable=too-many-instance-attribute
             selflink=api_response.get("selflink")
         )
 
+    @classmethod
+    def create_from_node(cls, url: str, api_response: dict) -> "VfModuleInstance":
+        """Create vf module instance object using nodes API url and response.
+
+        Vnf instance id is read from the url, vnf instance itself is
+            loaded on first access.
+
+        Args:
+            url (str): Vf module instance url
+            api_response (dict): HTTP API response content
+
+        Returns:
+            VfModuleInstance: VfModuleInstance object
+
+        """
+        vf_module_instance: "VfModuleInstance" = cls.create_from_api_response(api_response, None)
+        match = VNF_ID_URL_REGEX.search(url)
+        if match:
+            vf_module_instance._vnf_id = unquote(match.group("vnf_id"))  # pylint: disable=protected-access
+        return vf_module_instance
+
+    @classmethod
+    def get_by_id(cls, vf_module_id: str) -> "VfModuleInstance":
+        """Get vf module instance by its id without knowing its vnf instance.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            vf_module_id (str): Vf module instance id
+
+        Raises:
+            ResourceNotFound: Vf module instance with given id does not exist
+
+        Returns:
+            VfModuleInstance: VfModuleInstance object
+
+        """
+        return cls.create_from_node(*cls.get_node("vf-modules", {"vf-module-id": vf_module_id}))
+
+    @classmethod
+    def get_by_name(cls, vf_module_name: str) -> "VfModuleInstance":
+        """Get vf module instance by its name without knowing its vnf instance.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            vf_module_name (str): Vf module instance name
+
+        Raises:
+            ResourceNotFound: Vf module instance with given name does not exist
+
+        Returns:
+            VfModuleInstance: VfModuleInstance object
+
+        """
+        return cls.create_from_node(*cls.get_node("vf-modules",
+                                                  {"vf-module-name": vf_module_name}))
+
     def delete(self, a_la_carte: bool = True) -> "VfModuleDeletionRequest":
         """Create deletion request.
 
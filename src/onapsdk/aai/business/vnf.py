@@ -21,11 +21,12 @@ from onapsdk.so.instantiation import VfModuleInstantiation, VnfInstantiation, So
     InstantiationParameter, VnfOperation
 from onapsdk.configuration import settings
 
-from .instance import Instance
+from ..aai_element import AaiReadOptions
+from .instance import Instance, ServiceInstanceChildMixin
 from .vf_module import VfModuleInstance
 
 
-class VnfInstance(Instance):  # pylint: disable=too-many-instance-attributes
+class VnfInstance(ServiceInstanceChildMixin, Instance):  # pylint: disable=too-many-instance-attributes
     """VNF Instance class."""
 
     def __init__(self,  # NOSONAR  # pylint: disable=too-many-arguments, too-many-locals
@@ -246,6 +247,26 @@ class VnfInstance(Instance):  # pylint: disable=too-many-instance-attributes
         """
         return f"{cls.base_url}{cls.api_version}/network/generic-vnfs/"
 
+    @classmethod
+    def get_all(cls, read_options: Optional[AaiReadOptions] = None) -> Iterator["VnfInstance"]:
+        """Get all vnf instances.
+
+        Service instance of each vnf instance is loaded on first access.
+
+        Args:
+            read_options (AaiReadOptions, optional): Options to request lighter vnf
+                instances representation, e.g. without vf modules and relationships.
+                Defaults to None.
+
+        Yields:
+            VnfInstance: Vnf instance
+
+        """
+        for vnf_data in cls.read_objects(cls.get_all_url(), "generic-vnf",
+                                         "Get all vnf instances",
+                                         read_options=read_options):
+            yield cls.create_from_node(vnf_data)
+
     @property
     def url(self) -> str:
         """Vnf instance url.
@@ -354,6 +375,44 @@ class VnfInstance(Instance):  # pylint: disable=too-many-instance-attributes
                    vlan_id_outer=api_response.get("vlan-id-outer"),
                    nm_profile_name=api_response.get("nm-profile-name"))
 
+    @classmethod
+    def get_by_id(cls, vnf_id: str) -> "VnfInstance":
+        """Get vnf instance by its id without knowing its service instance.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            vnf_id (str): Vnf instance id
+
+        Raises:
+            ResourceNotFound: Vnf instance with given id does not exist
+
+        Returns:
+            VnfInstance: VnfInstance object
+
+        """
+        _, api_response = cls.get_node("generic-vnfs", {"vnf-id": vnf_id})
+        return cls.create_from_node(api_response)
+
+    @classmethod
+    def get_by_name(cls, vnf_name: str) -> "VnfInstance":
+        """Get vnf instance by its name without knowing its service instance.
+
+        Uses A&AI nodes API, so only one request is sent.
+
+        Args:
+            vnf_name (str): Vnf instance name
+
+        Raises:
+            ResourceNotFound: Vnf instance with given name does not exist
+
+        Returns:
+            VnfInstance: VnfInstance object
+
+        """
+        _, api_response = cls.get_node("generic-vnfs", {"vnf-name": vnf_name})
+        return cls.create_from_node(api_response)
+
     def add_vf_module(self,  # pylint: disable=too-many-arguments
                       vf_module: "VfModule",
                       cloud_region: Optional["CloudRegion"] = None,
@@ -13,14 +13,13 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, Optional
-from urllib.parse import urlencode
+from typing import Dict, Iterator, Optional
 
 from onapsdk.msb.multicloud import Multicloud
 from onapsdk.utils.jinja import jinja_env
 from onapsdk.exceptions import ResourceNotFound
 
-from ..aai_element import AaiResource
+from ..aai_element import AaiReadOptions, AaiResource
 from ..mixins.link_to_complex import AaiResourceLinkToComplexMixin
 from ..mixins.link_to_project import AaiResourceLinkToProjectMixin
 from .complex import Complex
@@ -157,31 +156,32 @@ class CloudRegion(AaiResource, AaiResourceLinkToComplexMixin, AaiResourceLinkToP
                 cloud_owner: Optional[str] = None,
                 cloud_region_id: Optional[str] = None,
                 cloud_type: Optional[str] = None,
-                owner_defined_type: Optional[str] = None) -> Iterator["CloudRegion"]:
+                owner_defined_type: Optional[str] = None,
+                read_options: Optional[AaiReadOptions] = None) -> Iterator["CloudRegion"]:
         """Get all A&AI cloud regions.
 
         Cloud regions can be filtered by 4 parameters: cloud-owner,
         cloud-region-id, cloud-type and owner-defined-type.
 
+        Args:
+            read_options (AaiReadOptions, optional): Options to request lighter cloud
+                regions representation, e.g. without tenants and relationships.
+                Defaults to None.
+
         Yields:
             CloudRegion -- CloudRegion object. Can not yield anything
                 if cloud region with given filter parameters doesn't exist
 
         """
-        # Filter request parameters - use only these which are not None
-        filter_parameters: dict = cls.filter_none_key_values(
-            {
-                "cloud-owner": cloud_owner,
-                "cloud-region-id": cloud_region_id,
-                "cloud-type": cloud_type,
-                "owner-defined-type": owner_defined_type,
-            }
-        )
-        url: str = f"{cls.get_all_url()}?{urlencode(filter_parameters)}"
-        response_json: Dict[str, List[Dict[str, Any]]] = cls.send_message_json(
-            "GET", "get cloud regions", url
-        )
-        for cloud_region in response_json.get("cloud-region", []):  # typing: dict
+        filter_parameters: Dict[str, Optional[str]] = {
+            "cloud-owner": cloud_owner,
+            "cloud-region-id": cloud_region_id,
+            "cloud-type": cloud_type,
+            "owner-defined-type": owner_defined_type,
+        }
+        for cloud_region in cls.read_objects(cls.get_all_url(), "cloud-region",
+                                             "get cloud regions", filter_parameters,
+                                             read_options):
             yield CloudRegion(
                 cloud_owner=cloud_region["cloud-owner"],  # required
                 cloud_region_id=cloud_region["cloud-region-id"],  # required
@@ -200,12 +200,21 @@ class CloudRegion(AaiResource, AaiResourceLinkToComplexMixin, AaiResourceLinkToP
             )
 
     @classmethod
-    def get_by_id(cls, cloud_owner: str, cloud_region_id: str) -> "CloudRegion":
+    def get_by_id(cls,
+                  cloud_owner: str,
+                  cloud_region_id: str,
+                  read_options: Optional[AaiReadOptions] = None) -> "CloudRegion":
         """Get CloudRegion object by cloud_owner and cloud-region-id field value.
 
         This method calls A&AI cloud region API filtering them by cloud_owner and
         cloud-region-id field value.
 
+        Args:
+            cloud_owner (str): Cloud owner
+            cloud_region_id (str): Cloud region id
+            read_options (AaiReadOptions, optional): Options to request lighter cloud
+                region representation. Defaults to None.
+
         Raises:
             ResourceNotFound: Cloud region with given id does not exist.
 
@@ -214,7 +223,8 @@ class CloudRegion(AaiResource, AaiResourceLinkToComplexMixin, AaiResourceLinkToP
 
         """
         try:
-            return next(cls.get_all(cloud_owner=cloud_owner, cloud_region_id=cloud_region_id))
+            return next(cls.get_all(cloud_owner=cloud_owner, cloud_region_id=cloud_region_id,
+                                    read_options=read_options))
         except StopIteration as exc:
             msg = (
                 f'CloudRegion with {cloud_owner}, '
@@ -13,11 +13,10 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from typing import Optional, Any, Dict, Iterator
-from urllib.parse import urlencode
 
 from onapsdk.utils.jinja import jinja_env
 
-from ..aai_element import AaiResource
+from ..aai_element import AaiReadOptions, AaiResource
 from ..mixins.link_to_geo_region import AaiResourceLinkToGeoRegionMixin
 
 
@@ -268,7 +267,8 @@ class Complex(AaiResource, AaiResourceLinkToGeoRegionMixin):  # pylint: disable=
                 physical_location_id: Optional[str] = None,
                 data_center_code: Optional[str] = None,
                 complex_name: Optional[str] = None,
-                identity_url: Optional[str] = None) -> Iterator["Complex"]:
+                identity_url: Optional[str] = None,
+                read_options: Optional[AaiReadOptions] = None) -> Iterator["Complex"]:
         """Get all complexes from A&AI.
 
         Call A&AI API to get all complex objects.
@@ -280,24 +280,22 @@ class Complex(AaiResource, AaiResourceLinkToGeoRegionMixin):  # pylint: disable=
                 to identify a complex. Defaults to None.
             complex_name (str, optional): Gamma complex name for LCP instance. Defaults to None.
             identity_url (str, optional): URL of the keystone identity service. Defaults to None.
+            read_options (AaiReadOptions, optional): Options to request lighter complexes
+                representation. Defaults to None.
 
         Yields:
             Complex -- Complex object. Can not yield anything if any complex with given filter
                 parameters doesn't exist
 
         """
-        filter_parameters: dict = cls.filter_none_key_values(
-            {
-                "physical-location-id": physical_location_id,
-                "data-center-code": data_center_code,
-                "complex-name": complex_name,
-                "identity-url": identity_url,
-            }
-        )
-        url: str = f"{cls.get_all_url()}?{urlencode(filter_parameters)}"
-        for complex_json in cls.send_message_json("GET",
-                                                  "get cloud regions",
-                                                  url).get("complex", []):
+        filter_parameters: Dict[str, Optional[str]] = {
+            "physical-location-id": physical_location_id,
+            "data-center-code": data_center_code,
+            "complex-name": complex_name,
+            "identity-url": identity_url,
+        }
+        for complex_json in cls.read_objects(cls.get_all_url(), "complex", "get complexes",
+                                             filter_parameters, read_options):
             yield cls.create_from_api_response(complex_json)
 
     @classmethod
@@ -0,0 +1,310 @@
+"""A&AI desired state reconciler module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+from onapsdk.exceptions import ParameterError
+
+from .aai_element import AaiElement
+from .bulk import AaiBulk, AaiBulkRequest, AaiBulkResponse
+from .snapshot import SNAPSHOT_COLLECTIONS, AaiSnapshotExporter, AaiSnapshotRecord
+
+# Children collections which are stored inside their parent's representation
+# (e.g. when read with depth=all) and which are reconciled as separate objects:
+# parent object type -> (container name, child object type, child key)
+NESTED_COLLECTIONS: Dict[str, Tuple[Tuple[str, str, str], ...]] = {
+    "customer": (("service-subscriptions", "service-subscription", "service-type"),),
+    "cloud-region": (("tenants", "tenant", "tenant-id"),),
+}
+
+API_VERSION_PREFIX_REGEX = re.compile(r"^.*?/aai/v\d+")
+
+
+@dataclass
+class AaiObjectState:
+    """State of a single A&AI object.
+
+    Only the object's own (scalar) properties and its relationships are
+        stored. Children objects are represented by separate states.
+    """
+
+    uri: str
+    properties: Dict[str, Any]
+    relationships: List[Dict[str, Any]] = field(default_factory=list)
+    resource_version: Optional[str] = None
+
+    @staticmethod
+    def relationship_key(relationship: Dict[str, Any]) -> Tuple[str, str]:
+        """Get a key which identifies relationship.
+
+        Related links are compared without A&AI API version prefix, so relationships
+            read from A&AI match the desired ones written with relative links.
+
+        Args:
+            relationship (Dict[str, Any]): Relationship representation
+
+        Returns:
+            Tuple[str, str]: Relationship's related-to and related-link
+
+        """
+        return (relationship.get("related-to", ""),
+                API_VERSION_PREFIX_REGEX.sub("", relationship.get("related-link", "")))
+
+    @classmethod
+    def from_body(cls, uri: str, body: Dict[str, Any]) -> "AaiObjectState":
+        """Create object state from its A&AI representation.
+
+        Args:
+            uri (str): Object's uri
+            body (Dict[str, Any]): Object's A&AI representation
+
+        Returns:
+            AaiObjectState: Object's state
+
+        """
+        return cls(
+            uri=uri,
+            properties={key: value for key, value in body.items()
+                        if key != "resource-version" and not isinstance(value, (dict, list))},
+            relationships=body.get("relationship-list", {}).get("relationship", []),
+            resource_version=body.get("resource-version")
+        )
+
+
+def flatten(uri: str, body: Dict[str, Any], object_type: str) -> Iterator[AaiObjectState]:
+    """Split object representation into object's and its nested children's states.
+
+    Args:
+        uri (str): Object's uri
+        body (Dict[str, Any]): Object's A&AI representation
+        object_type (str): Object's A&AI type, e.g. "customer"
+
+    Yields:
+        AaiObjectState: Object or child state, parents first
+
+    """
+    yield AaiObjectState.from_body(uri, body)
+    for container, child_type, child_key in NESTED_COLLECTIONS.get(object_type, ()):
+        for child in body.get(container, {}).get(child_type, []):
+            child_uri: str = (f"{uri}/{container}/{child_type}/"
+                              f"{quote(str(child[child_key]), safe='')}")
+            yield from flatten(child_uri, child, child_type)
+
+
+def record_states(records: Iterable[AaiSnapshotRecord]) -> Iterator[AaiObjectState]:
+    """Get states of snapshot records' objects and their nested children.
+
+    Records with uris which don't belong to a top-level collection (e.g. a single
+        service subscription) are not split.
+
+    Args:
+        records (Iterable[AaiSnapshotRecord]): Snapshot records
+
+    Yields:
+        AaiObjectState: Object state
+
+    """
+    for record in records:
+        collection = SNAPSHOT_COLLECTIONS.get(record.collection)
+        if collection and record.uri == collection.object_uri(record.body):
+            yield from flatten(record.uri, record.body, collection.object_type)
+        else:
+            yield AaiObjectState.from_body(record.uri, record.body)
+
+
+def _depth(uri: str) -> int:
+    """Get uri depth, used to create parents before and delete them after children.
+
+    Args:
+        uri (str): Object's uri
+
+    Returns:
+        int: Number of uri segments
+
+    """
+    return uri.count("/")
+
+
+class AaiReconciler(AaiElement):
+    """A&AI desired state reconciler.
+
+    Compares a desired set of A&AI objects with the current state and
+        emits only A&AI bulk operations needed to get from one to another:
+
+     - objects which don't exist are created,
+     - objects with different properties are patched with the changed properties only,
+     - missing relationships are added and, optionally, unexpected ones deleted,
+     - objects which are not desired are deleted, if requested.
+
+    Objects which already are in the desired state don't generate any request,
+        so neither A&AI write load nor resource version churn is caused
+        by unchanged objects.
+    """
+
+    def __init__(self,
+                 desired: Iterable[AaiSnapshotRecord],
+                 delete_missing: bool = False,
+                 delete_extra_relationships: bool = False) -> None:
+        """Initialize reconciler.
+
+        Args:
+            desired (Iterable[AaiSnapshotRecord]): Desired objects. Nested children
+                (service subscriptions of customers, tenants of cloud regions) are
+                reconciled as separate objects.
+            delete_missing (bool, optional): Flag to determine if current objects
+                which are not desired should be deleted. Defaults to False.
+            delete_extra_relationships (bool, optional): Flag to determine if
+                relationships of desired objects which are not desired should
+                be deleted. Defaults to False.
+
+        """
+        super().__init__()
+        self.desired: Dict[str, AaiObjectState] = {state.uri: state
+                                                   for state in record_states(desired)}
+        self.delete_missing: bool = delete_missing
+        self.delete_extra_relationships: bool = delete_extra_relationships
+
+    @property
+    def collections(self) -> List[str]:
+        """Names of top-level collections which desired objects belong to.
+
+        Raises:
+            ParameterError: Desired object doesn't belong to any known collection
+
+        Returns:
+            List[str]: Collection names
+
+        """
+        names: Set[str] = set()
+        for uri in self.desired:
+            for name, collection in SNAPSHOT_COLLECTIONS.items():
+                if uri.startswith(f"{collection.path}/"):
+                    names.add(name)
+                    break
+            else:
+                raise ParameterError(f"{uri} does not belong to any known A&AI collection")
+        return sorted(names)
+
+    def current_records(self) -> Iterator[AaiSnapshotRecord]:
+        """Fetch current state of collections which desired objects belong to.
+
+        Yields:
+            AaiSnapshotRecord: Current object record
+
+        """
+        yield from AaiSnapshotExporter(collections=self.collections).records()
+
+    def _relationship_requests(self,
+                               desired: AaiObjectState,
+                               current: Optional[AaiObjectState]) -> Iterator[AaiBulkRequest]:
+        """Get requests which reconcile object relationships.
+
+        Args:
+            desired (AaiObjectState): Desired object state
+            current (AaiObjectState, optional): Current object state, None if
+                object doesn't exist
+
+        Yields:
+            AaiBulkRequest: Relationship request
+
+        """
+        current_relationships: Dict[Tuple[str, str], Dict[str, Any]] = {
+            AaiObjectState.relationship_key(relationship): relationship
+            for relationship in (current.relationships if current else [])
+        }
+        desired_keys: Set[Tuple[str, str]] = set()
+        for relationship in desired.relationships:
+            key: Tuple[str, str] = AaiObjectState.relationship_key(relationship)
+            desired_keys.add(key)
+            if key not in current_relationships:
+                yield AaiBulkRequest(action="put",
+                                     uri=f"{desired.uri}/relationship-list/relationship",
+                                     body=relationship)
+        if self.delete_extra_relationships:
+            for key, relationship in current_relationships.items():
+                if key not in desired_keys:
+                    yield AaiBulkRequest(action="delete",
+                                         uri=f"{desired.uri}/relationship-list/relationship",
+                                         body=relationship)
+
+    def plan(self,
+             current: Optional[Iterable[AaiSnapshotRecord]] = None) -> Iterator[AaiBulkRequest]:
+        """Get the minimal list of requests which reconcile current state with the desired one.
+
+        Objects are created parents first and deleted children first. Relationships
+            are added once all objects are created.
+
+        Args:
+            current (Iterable[AaiSnapshotRecord], optional): Current state, e.g. records
+                of a snapshot. Fetched from A&AI with paging if not set. Defaults to None.
+
+        Yields:
+            AaiBulkRequest: A&AI bulk request
+
+        """
+        if current is None:
+            current = self.current_records()
+        seen: Dict[str, AaiObjectState] = {}
+        patches: List[AaiBulkRequest] = []
+        deletes: List[AaiObjectState] = []
+        for current_state in record_states(current):
+            desired_state: Optional[AaiObjectState] = self.desired.get(current_state.uri)
+            if desired_state is None:
+                if self.delete_missing:
+                    deletes.append(current_state)
+                continue
+            seen[current_state.uri] = current_state
+            changed: Dict[str, Any] = {
+                key: value for key, value in desired_state.properties.items()
+                if current_state.properties.get(key) != value
+            }
+            if changed:
+                patches.append(AaiBulkRequest(action="patch", uri=current_state.uri,
+                                              body=changed))
+        for desired_state in sorted(self.desired.values(), key=lambda state: _depth(state.uri)):
+            if desired_state.uri not in seen:
+                yield AaiBulkRequest(action="put", uri=desired_state.uri,
+                                     body=desired_state.properties)
+        yield from patches
+        for desired_state in self.desired.values():
+            yield from self._relationship_requests(desired_state, seen.get(desired_state.uri))
+        for current_state in sorted(deletes, key=lambda state: _depth(state.uri), reverse=True):
+            yield AaiBulkRequest(
+                action="delete",
+                uri=f"{current_state.uri}?resource-version={current_state.resource_version}",
+                body={}
+            )
+
+    def reconcile(self,
+                  current: Optional[Iterable[AaiSnapshotRecord]] = None,
+                  aai_bulk: Optional[AaiBulk] = None) -> Iterator[AaiBulkResponse]:
+        """Reconcile A&AI with the desired state.
+
+        Planned requests are executed using A&AI bulk single transaction API,
+            in order.
+
+        Args:
+            current (Iterable[AaiSnapshotRecord], optional): Current state, e.g. records
+                of a snapshot. Fetched from A&AI with paging if not set. Defaults to None.
+            aai_bulk (AaiBulk, optional): Bulk object used to send requests.
+                New one is created if not set. Defaults to None.
+
+        Yields:
+            AaiBulkResponse: Bulk response
+
+        """
+        yield from (aai_bulk or AaiBulk()).single_transaction(self.plan(current))
@@ -0,0 +1,630 @@
+"""A&AI inventory snapshot module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import enum
+import gzip
+import json
+import mmap
+from dataclasses import dataclass
+from itertools import chain
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from more_itertools import chunked
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ModuleError, ParameterError, ResourceNotFound
+from onapsdk.utils.concurrency import bounded_map
+
+from .aai_element import AaiElement
+from .bulk import AaiBulk, AaiBulkRequest, AaiBulkResponse
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+GZIP_MAGIC_NUMBER: bytes = b"\x1f\x8b"
+
+
+@enum.unique
+class SnapshotFormat(enum.Enum):
+    """Snapshot file format."""
+
+    JSONL = "jsonl"
+    MSGPACK = "msgpack"
+
+
+@dataclass
+class AaiSnapshotCollection:
+    """A&AI top-level collection which can be stored in a snapshot.
+
+    `uri_keys` are the names of the object properties which build
+        the object's uri (in order), e.g. cloud-owner and cloud-region-id
+        for a cloud region.
+    """
+
+    name: str
+    path: str
+    object_type: str
+    uri_keys: Tuple[str, ...]
+
+    def object_uri(self, body: Dict[str, Any]) -> str:
+        """Get an uri of the collection object.
+
+        The uri is relative to the A&AI API version, like uris
+            used by A&AI bulk requests.
+
+        Args:
+            body (Dict[str, Any]): Object's A&AI representation
+
+        Returns:
+            str: Object's uri
+
+        """
+        keys: str = "/".join(quote(str(body[key]), safe="") for key in self.uri_keys)
+        return f"{self.path}/{self.object_type}/{keys}"
+
+
+SNAPSHOT_COLLECTIONS: Dict[str, AaiSnapshotCollection] = {
+    collection.name: collection for collection in (
+        AaiSnapshotCollection("customers", "/business/customers", "customer",
+                              ("global-customer-id",)),
+        AaiSnapshotCollection("cloud-regions", "/cloud-infrastructure/cloud-regions",
+                              "cloud-region", ("cloud-owner", "cloud-region-id")),
+        AaiSnapshotCollection("complexes", "/cloud-infrastructure/complexes", "complex",
+                              ("physical-location-id",)),
+        AaiSnapshotCollection("pnfs", "/network/pnfs", "pnf", ("pnf-name",)),
+        AaiSnapshotCollection("generic-vnfs", "/network/generic-vnfs", "generic-vnf",
+                              ("vnf-id",)),
+        AaiSnapshotCollection("models", "/service-design-and-creation/models", "model",
+                              ("model-invariant-id",)),
+    )
+}
+
+
+@dataclass
+class AaiSnapshotRecord:
+    """Single A&AI object stored in a snapshot."""
+
+    collection: str
+    uri: str
+    body: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get record's dictionary representation.
+
+        Returns:
+            Dict[str, Any]: Record as a dictionary
+
+        """
+        return {"collection": self.collection, "uri": self.uri, "body": self.body}
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "AaiSnapshotRecord":
+        """Create record from its dictionary representation.
+
+        Args:
+            record (Dict[str, Any]): Record as a dictionary
+
+        Returns:
+            AaiSnapshotRecord: Snapshot record
+
+        """
+        return cls(collection=record["collection"], uri=record["uri"], body=record["body"])
+
+
+def _check_format(snapshot_format: SnapshotFormat) -> None:
+    """Check if snapshot format can be used.
+
+    Args:
+        snapshot_format (SnapshotFormat): Snapshot format
+
+    Raises:
+        ModuleError: msgpack format requested but msgpack is not installed
+
+    """
+    if snapshot_format == SnapshotFormat.MSGPACK and msgpack is None:
+        raise ModuleError("msgpack snapshot format requires msgpack package to be installed")
+
+
+def _detect_format(path: str) -> SnapshotFormat:
+    """Detect snapshot format using the file name.
+
+    Args:
+        path (str): Snapshot file path
+
+    Returns:
+        SnapshotFormat: msgpack if file name contains ".msgpack", JSON lines otherwise
+
+    """
+    if ".msgpack" in path:
+        return SnapshotFormat.MSGPACK
+    return SnapshotFormat.JSONL
+
+
+def _open_snapshot(path: str) -> IO[bytes]:
+    """Open snapshot file for reading, compressed or not.
+
+    Args:
+        path (str): Snapshot file path
+
+    Returns:
+        IO[bytes]: Binary file object
+
+    """
+    with open(path, "rb") as snapshot_file:
+        compressed: bool = snapshot_file.read(2) == GZIP_MAGIC_NUMBER
+    if compressed:
+        return gzip.open(path, "rb")
+    return open(path, "rb")  # pylint: disable=consider-using-with
+
+
+def read_snapshot(path: str,
+                  snapshot_format: Optional[SnapshotFormat] = None) -> Iterator[AaiSnapshotRecord]:
+    """Read snapshot records one by one.
+
+    Compression is detected automatically. Only one record is kept in memory
+        at a time.
+
+    Args:
+        path (str): Snapshot file path
+        snapshot_format (SnapshotFormat, optional): Snapshot format. If not set
+            it's detected from the file name. Defaults to None.
+
+    Yields:
+        AaiSnapshotRecord: Snapshot record
+
+    """
+    snapshot_format = snapshot_format or _detect_format(path)
+    _check_format(snapshot_format)
+    with _open_snapshot(path) as snapshot_file:
+        if snapshot_format == SnapshotFormat.MSGPACK:
+            records: Iterable[Dict[str, Any]] = msgpack.Unpacker(snapshot_file, raw=False)
+        else:
+            records = (json.loads(line) for line in snapshot_file if line.strip())
+        for record in records:
+            yield AaiSnapshotRecord.from_dict(record)
+
+
+class AaiSnapshotExporter(AaiElement):
+    """A&AI snapshot exporter.
+
+    Walks A&AI top-level collections page by page and streams every object
+        (with its relationships and, by default, all nested children) into
+        a snapshot file. Pages are fetched concurrently, but only a bounded number of
+        them is kept in memory, so memory usage does not grow with the inventory size.
+    """
+
+    def __init__(self,
+                 collections: Optional[Iterable[str]] = None,
+                 page_size: int = settings.AAI_PAGE_SIZE,
+                 max_workers: int = settings.AAI_MAX_WORKERS,
+                 depth: str = "all") -> None:
+        """Initialize snapshot exporter.
+
+        Args:
+            collections (Iterable[str], optional): Names of collections to export,
+                keys of SNAPSHOT_COLLECTIONS. All of them are exported if not set.
+                Defaults to None.
+            page_size (int, optional): Number of objects fetched with one request.
+                Defaults to settings.AAI_PAGE_SIZE.
+            max_workers (int, optional): How many pages are fetched concurrently.
+                Defaults to settings.AAI_MAX_WORKERS.
+            depth (str, optional): A&AI depth query parameter. Defaults to "all".
+
+        Raises:
+            ParameterError: Unknown collection name
+
+        """
+        super().__init__()
+        collection_names: List[str] = list(collections or SNAPSHOT_COLLECTIONS)
+        unknown: List[str] = [name for name in collection_names
+                              if name not in SNAPSHOT_COLLECTIONS]
+        if unknown:
+            raise ParameterError(f"Unknown A&AI snapshot collections: {', '.join(unknown)}")
+        self.collections: List[AaiSnapshotCollection] = [SNAPSHOT_COLLECTIONS[name]
+                                                         for name in collection_names]
+        self.page_size: int = page_size
+        self.max_workers: int = max_workers
+        self.depth: str = depth
+
+    def _get_page(self,
+                  collection: AaiSnapshotCollection,
+                  page: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Get collection objects page.
+
+        Args:
+            collection (AaiSnapshotCollection): Collection to get page of
+            page (int): Page index, starts from 1
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Page objects and number of collection pages
+
+        """
+        query: str = urlencode({"depth": self.depth,
+                                "resultIndex": page,
+                                "resultSize": self.page_size})
+        try:
+            response = self.send_message(
+                "GET",
+                f"Get {collection.name} page {page}",
+                f"{self.base_url}{self.api_version}{collection.path}?{query}"
+            )
+        except ResourceNotFound:
+            self._logger.info("No %s objects on page %d", collection.name, page)
+            return [], 0
+        return (response.json().get(collection.object_type, []),
+                int(response.headers.get("total-pages", 1)))
+
+    def collection_records(self,
+                           collection: AaiSnapshotCollection) -> Iterator[AaiSnapshotRecord]:
+        """Iterate through all objects of a collection.
+
+        The first page is fetched to learn how many pages there are,
+            all others are fetched concurrently.
+
+        Args:
+            collection (AaiSnapshotCollection): Collection to iterate through
+
+        Yields:
+            AaiSnapshotRecord: Collection object record
+
+        """
+        first_page, total_pages = self._get_page(collection, 1)
+        pages: Iterator[List[Dict[str, Any]]] = bounded_map(
+            lambda page: self._get_page(collection, page)[0],
+            range(2, total_pages + 1),
+            self.max_workers
+        )
+        for page_objects in chain([first_page], pages):
+            for body in page_objects:
+                yield AaiSnapshotRecord(collection=collection.name,
+                                        uri=collection.object_uri(body),
+                                        body=body)
+
+    def records(self) -> Iterator[AaiSnapshotRecord]:
+        """Iterate through objects of all exported collections.
+
+        Yields:
+            AaiSnapshotRecord: Snapshot record
+
+        """
+        for collection in self.collections:
+            self._logger.info("Export %s collection", collection.name)
+            yield from self.collection_records(collection)
+
+    def export(self,
+               path: str,
+               snapshot_format: SnapshotFormat = SnapshotFormat.JSONL,
+               compress: bool = True) -> int:
+        """Export A&AI objects into a snapshot file.
+
+        JSON lines snapshot has one record per line, msgpack one has
+            a stream of packed records. Records are written as soon as
+            the page they belong to is fetched.
+
+        Args:
+            path (str): Snapshot file path
+            snapshot_format (SnapshotFormat, optional): Snapshot format.
+                Defaults to SnapshotFormat.JSONL.
+            compress (bool, optional): Flag to determine if snapshot should be gzip
+                compressed. Defaults to True.
+
+        Returns:
+            int: Number of exported objects
+
+        """
+        _check_format(snapshot_format)
+        exported: int = 0
+        with (gzip.open(path, "wb") if compress else open(path, "wb")) as snapshot_file:
+            for record in self.records():
+                if snapshot_format == SnapshotFormat.MSGPACK:
+                    snapshot_file.write(msgpack.packb(record.to_dict(), use_bin_type=True))
+                else:
+                    snapshot_file.write(json.dumps(record.to_dict(),
+                                                   separators=(",", ":")).encode("utf-8"))
+                    snapshot_file.write(b"\n")
+                exported += 1
+        self._logger.info("%d A&AI objects exported into %s", exported, path)
+        return exported
+
+
+def _strip_resource_version(body: Any) -> Any:
+    """Remove resource versions from the object and all its children.
+
+    Objects created by A&AI PUT requests can't have resource versions.
+
+    Args:
+        body (Any): Object representation
+
+    Returns:
+        Any: Object representation without resource versions
+
+    """
+    if isinstance(body, dict):
+        return {key: _strip_resource_version(value) for key, value in body.items()
+                if key != "resource-version"}
+    if isinstance(body, list):
+        return [_strip_resource_version(value) for value in body]
+    return body
+
+
+class AaiSnapshotImporter(AaiElement):
+    """A&AI snapshot importer.
+
+    Replays a snapshot through A&AI bulk API. Objects are created first and
+        relationships are added once all objects exist, so relationships
+        between snapshot objects don't depend on the order of records.
+        Bulk chunks are sent concurrently.
+    """
+
+    def __init__(self,
+                 aai_bulk: Optional[AaiBulk] = None,
+                 max_workers: int = settings.AAI_MAX_WORKERS) -> None:
+        """Initialize snapshot importer.
+
+        Args:
+            aai_bulk (AaiBulk, optional): Bulk object used to send requests.
+                Failed requests can be checked using its `failed_requests`.
+                New one is created if not set. Defaults to None.
+            max_workers (int, optional): How many bulk chunks are sent concurrently.
+                Defaults to settings.AAI_MAX_WORKERS.
+
+        """
+        super().__init__()
+        self.aai_bulk: AaiBulk = aai_bulk or AaiBulk()
+        self.max_workers: int = max_workers
+
+    @staticmethod
+    def object_requests(records: Iterable[AaiSnapshotRecord]) -> Iterator[AaiBulkRequest]:
+        """Create bulk requests which create snapshot objects.
+
+        Top-level relationships are removed, see `relationship_requests`.
+
+        Args:
+            records (Iterable[AaiSnapshotRecord]): Snapshot records
+
+        Yields:
+            AaiBulkRequest: Object creation request
+
+        """
+        for record in records:
+            body: Dict[str, Any] = _strip_resource_version(record.body)
+            body.pop("relationship-list", None)
+            yield AaiBulkRequest(action="put", uri=record.uri, body=body)
+
+    @staticmethod
+    def relationship_requests(records: Iterable[AaiSnapshotRecord]) -> Iterator[AaiBulkRequest]:
+        """Create bulk requests which add top-level relationships of snapshot objects.
+
+        Args:
+            records (Iterable[AaiSnapshotRecord]): Snapshot records
+
+        Yields:
+            AaiBulkRequest: Relationship creation request
+
+        """
+        for record in records:
+            for relationship in record.body.get("relationship-list", {}).get("relationship", []):
+                yield AaiBulkRequest(action="put",
+                                     uri=f"{record.uri}/relationship-list/relationship",
+                                     body=relationship)
+
+    def send_requests(self, aai_requests: Iterable[AaiBulkRequest]) -> Iterator[AaiBulkResponse]:
+        """Send bulk requests in concurrent chunks.
+
+        Args:
+            aai_requests (Iterable[AaiBulkRequest]): Requests to send
+
+        Yields:
+            AaiBulkResponse: Bulk response
+
+        """
+        for responses in bounded_map(
+                lambda requests_chunk: list(self.aai_bulk.single_transaction(requests_chunk)),
+                chunked(aai_requests, self.aai_bulk.chunk_size),
+                self.max_workers):
+            yield from responses
+
+    def import_snapshot(self,
+                        path: str,
+                        snapshot_format: Optional[SnapshotFormat] = None,
+                        with_relationships: bool = True) -> Iterator[AaiBulkResponse]:
+        """Import snapshot into A&AI.
+
+        Snapshot file is read twice (objects, then relationships) so it's never
+            loaded into memory at once.
+
+        Args:
+            path (str): Snapshot file path
+            snapshot_format (SnapshotFormat, optional): Snapshot format. If not set
+                it's detected from the file name. Defaults to None.
+            with_relationships (bool, optional): Flag to determine if top-level
+                relationships should be imported. Defaults to True.
+
+        Yields:
+            AaiBulkResponse: Bulk response
+
+        """
+        yield from self.send_requests(self.object_requests(read_snapshot(path, snapshot_format)))
+        if with_relationships:
+            yield from self.send_requests(
+                self.relationship_requests(read_snapshot(path, snapshot_format)))
+
+
+class AaiSnapshotReader:
+    """Memory-mapped snapshot reader.
+
+    Lets offline tools query an uncompressed JSON lines snapshot without
+        loading it: only records which are returned are decoded and the
+        uri index keeps nothing but line offsets.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open snapshot.
+
+        Args:
+            path (str): Uncompressed JSON lines snapshot file path
+
+        Raises:
+            ParameterError: Snapshot is compressed or is not a JSON lines one
+
+        """
+        if _detect_format(path) != SnapshotFormat.JSONL:
+            raise ParameterError("Only JSON lines snapshots can be memory-mapped")
+        self._file: IO[bytes] = open(path, "rb")  # pylint: disable=consider-using-with
+        if self._file.read(2) == GZIP_MAGIC_NUMBER:
+            self._file.close()
+            raise ParameterError("Compressed snapshots can't be memory-mapped, decompress it first")
+        self._file.seek(0, 2)
+        self._mmap: Optional[mmap.mmap] = mmap.mmap(self._file.fileno(), 0,
+                                                    access=mmap.ACCESS_READ) \
+            if self._file.tell() else None
+        self._uri_index: Optional[Dict[str, int]] = None
+
+    def __enter__(self) -> "AaiSnapshotReader":
+        """Enter the context manager.
+
+        Returns:
+            AaiSnapshotReader: Reader object
+
+        """
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Exit the context manager and close the snapshot."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Get number of snapshot records.
+
+        Returns:
+            int: Number of records
+
+        """
+        return len(self.uri_index)
+
+    def close(self) -> None:
+        """Close the snapshot."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _lines(self) -> Iterator[Tuple[int, bytes]]:
+        """Iterate through snapshot lines.
+
+        Yields:
+            Tuple[int, bytes]: Line offset and line content
+
+        """
+        if self._mmap is None:
+            return
+        offset: int = 0
+        size: int = len(self._mmap)
+        while offset < size:
+            end: int = self._mmap.find(b"\n", offset)
+            if end < 0:
+                end = size
+            line: bytes = self._mmap[offset:end]
+            if line.strip():
+                yield offset, line
+            offset = end + 1
+
+    def _record_at(self, offset: int) -> AaiSnapshotRecord:
+        """Decode record which starts at given offset.
+
+        Args:
+            offset (int): Record's line offset
+
+        Returns:
+            AaiSnapshotRecord: Snapshot record
+
+        """
+        end: int = self._mmap.find(b"\n", offset)
+        return AaiSnapshotRecord.from_dict(
+            json.loads(self._mmap[offset:end if end >= 0 else len(self._mmap)]))
+
+    @property
+    def uri_index(self) -> Dict[str, int]:
+        """Index of record offsets by uri.
+
+        Built on the first access with one pass over the snapshot.
+
+        Returns:
+            Dict[str, int]: Record offsets by uri
+
+        """
+        if self._uri_index is None:
+            self._uri_index = {json.loads(line)["uri"]: offset for offset, line in self._lines()}
+        return self._uri_index
+
+    def get(self, uri: str) -> AaiSnapshotRecord:
+        """Get record by object's uri.
+
+        Args:
+            uri (str): Object's uri
+
+        Raises:
+            ResourceNotFound: There is no object with given uri in the snapshot
+
+        Returns:
+            AaiSnapshotRecord: Snapshot record
+
+        """
+        try:
+            return self._record_at(self.uri_index[uri])
+        except KeyError as exc:
+            raise ResourceNotFound(f"{uri} not found in snapshot") from exc
+
+    def records(self, collection: Optional[str] = None) -> Iterator[AaiSnapshotRecord]:
+        """Iterate through snapshot records.
+
+        Records of other collections are skipped without being decoded.
+
+        Args:
+            collection (str, optional): Collection name to get records of. All
+                records are returned if not set. Defaults to None.
+
+        Yields:
+            AaiSnapshotRecord: Snapshot record
+
+        """
+        prefix: Optional[bytes] = json.dumps({"collection": collection},
+                                             separators=(",", ":"))[:-1].encode("utf-8") \
+            if collection else None
+        for _, line in self._lines():
+            if prefix is None or line.startswith(prefix):
+                yield AaiSnapshotRecord.from_dict(json.loads(line))
+
+    def find(self, collection: str, **properties: Any) -> Iterator[AaiSnapshotRecord]:
+        """Find records of a collection with given property values.
+
+        Property names can use underscores instead of dashes,
+            e.g. `find("pnfs", nf_role="router")`.
+
+        Args:
+            collection (str): Collection name
+            **properties: Property values which record has to match
+
+        Yields:
+            AaiSnapshotRecord: Matching snapshot record
+
+        """
+        expected: Dict[str, Any] = {key.replace("_", "-"): value
+                                    for key, value in properties.items()}
+        for record in self.records(collection):
+            if all(record.body.get(key) == value for key, value in expected.items()):
+                yield record
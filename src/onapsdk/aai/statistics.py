@@ -0,0 +1,227 @@
+"""A&AI inventory statistics module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ResourceNotFound
+from onapsdk.utils.cache import TtlCache
+from onapsdk.utils.concurrency import bounded_map
+
+from .aai_element import AaiElement, AaiReadOptions, AaiResource
+from .business.customer import Customer, ServiceSubscription
+from .business.pnf import PnfInstance
+from .business.vf_module import VfModuleInstance
+from .business.vnf import VnfInstance
+from .cloud_infrastructure import CloudRegion, Complex, Tenant
+
+# Classes counted by inventory report without any scope
+INVENTORY_CLASSES: Tuple[Type[AaiResource], ...] = (
+    CloudRegion, Complex, Customer, PnfInstance, VnfInstance
+)
+
+# Classes counted by inventory report for every object of scope class:
+# (counted class, scope class)
+SCOPED_CLASSES: Tuple[Tuple[Type[AaiResource], Type[AaiResource]], ...] = (
+    (Tenant, CloudRegion),
+    (ServiceSubscription, Customer),
+    (VfModuleInstance, VnfInstance)
+)
+
+# Options used to list objects which are the scopes of counts:
+# neither children nor relationships are needed
+SCOPE_READ_OPTIONS = AaiReadOptions(depth=0, nodes_only=True)
+
+
+@dataclass(frozen=True)
+class AaiCountQuery:
+    """Count of objects of given A&AI class.
+
+    Count can be limited to the children of scope object,
+        e.g. tenants of a cloud region.
+    """
+
+    resource_class: Type[AaiResource]
+    scope: Optional[AaiResource] = None
+
+    @property
+    def url(self) -> str:
+        """Url of counted collection, used as cache key.
+
+        Returns:
+            str: Collection url
+
+        """
+        if self.scope is None:
+            return self.resource_class.get_all_url()
+        return self.resource_class.get_all_url(self.scope)
+
+
+@dataclass
+class AaiStatisticsReport:
+    """A&AI inventory statistics report.
+
+    Counts are stored by counted class name. Scoped counts are additionally
+        stored by the scope object's url.
+    """
+
+    totals: Dict[str, int] = field(default_factory=dict)
+    scoped: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def add(self, query: AaiCountQuery, count: int) -> None:
+        """Add count to the report.
+
+        Scoped counts are added to their class total too.
+
+        Args:
+            query (AaiCountQuery): Count query
+            count (int): Number of objects
+
+        """
+        class_name: str = query.resource_class.__name__
+        self.totals[class_name] = self.totals.get(class_name, 0) + count
+        if query.scope is not None:
+            self.scoped.setdefault(class_name, {})[query.scope.url] = count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get report as a dictionary which can be serialized to JSON.
+
+        Returns:
+            Dict[str, Any]: Report dictionary
+
+        """
+        return {"totals": dict(self.totals),
+                "scoped": {class_name: dict(counts)
+                           for class_name, counts in self.scoped.items()}}
+
+
+class AaiInventoryStatistics(AaiElement):
+    """A&AI inventory statistics.
+
+    Counts many A&AI classes and scopes concurrently, using `format=count`
+        requests. Counts can be cached, so frequently refreshed statistics
+        don't send the same requests again until cached counts expire.
+    """
+
+    def __init__(self,
+                 max_workers: int = settings.AAI_MAX_WORKERS,
+                 cache_ttl: Optional[float] = None) -> None:
+        """Initialize statistics object.
+
+        Args:
+            max_workers (int, optional): Maximum number of concurrent count
+                requests. Defaults to settings.AAI_MAX_WORKERS.
+            cache_ttl (float, optional): Time in seconds for which counts are cached.
+                Counts are not cached if not set. Defaults to None.
+
+        """
+        super().__init__()
+        self.max_workers: int = max_workers
+        self.cache: Optional[TtlCache[int]] = TtlCache(cache_ttl) if cache_ttl else None
+
+    @staticmethod
+    def _send_count_request(query: AaiCountQuery) -> int:
+        """Send count request.
+
+        Empty collections, for which A&AI responds with 404, are counted as 0.
+
+        Args:
+            query (AaiCountQuery): Count query
+
+        Returns:
+            int: Number of objects
+
+        """
+        try:
+            if query.scope is None:
+                return query.resource_class.count()
+            return query.resource_class.count(query.scope)
+        except ResourceNotFound:
+            return 0
+
+    def count(self, query: AaiCountQuery) -> int:
+        """Count objects.
+
+        Args:
+            query (AaiCountQuery): Count query
+
+        Returns:
+            int: Number of objects
+
+        """
+        if self.cache is None:
+            return self._send_count_request(query)
+        return self.cache.get_or_set(query.url, lambda: self._send_count_request(query))
+
+    def counts(self, queries: Iterable[AaiCountQuery]) -> Iterator[Tuple[AaiCountQuery, int]]:
+        """Count objects of many queries concurrently.
+
+        Args:
+            queries (Iterable[AaiCountQuery]): Count queries
+
+        Yields:
+            Tuple[AaiCountQuery, int]: Count query and its number of objects,
+                in the queries order
+
+        """
+        yield from bounded_map(lambda query: (query, self.count(query)),
+                               queries,
+                               self.max_workers)
+
+    def report(self, queries: Iterable[AaiCountQuery]) -> AaiStatisticsReport:
+        """Count objects of many queries concurrently and create a report.
+
+        Args:
+            queries (Iterable[AaiCountQuery]): Count queries
+
+        Returns:
+            AaiStatisticsReport: Statistics report
+
+        """
+        report: AaiStatisticsReport = AaiStatisticsReport()
+        for query, count in self.counts(queries):
+            report.add(query, count)
+        return report
+
+    @staticmethod
+    def inventory_queries() -> Iterator[AaiCountQuery]:
+        """Get queries which count the whole inventory.
+
+        Top-level classes are counted as whole, tenants are counted for every cloud
+            region, service subscriptions for every customer and vf modules for
+            every vnf instance. Scope objects are listed without their children
+            and relationships.
+
+        Yields:
+            AaiCountQuery: Count query
+
+        """
+        for resource_class in INVENTORY_CLASSES:
+            yield AaiCountQuery(resource_class)
+        for resource_class, scope_class in SCOPED_CLASSES:
+            try:
+                for scope in scope_class.get_all(read_options=SCOPE_READ_OPTIONS):
+                    yield AaiCountQuery(resource_class, scope)
+            except ResourceNotFound:
+                continue
+
+    def inventory_report(self) -> AaiStatisticsReport:
+        """Create the whole inventory statistics report.
+
+        Returns:
+            AaiStatisticsReport: Statistics report
+
+        """
+        return self.report(self.inventory_queries())
@@ -25,6 +25,8 @@ AAI_URL                     = "https://aai.api.sparky.simpledemo.onap.org:30233"
 AAI_API_VERSION             = "v27"
 AAI_AUTH                    = "Basic QUFJOkFBSQ=="
 AAI_BULK_CHUNK              = 30
+AAI_PAGE_SIZE               = 500
+AAI_MAX_WORKERS             = 8
 CDS_URL                     = "http://portal.api.simpledemo.onap.org:30449"  # NOSONAR
 CDS_AUTH                    = ("ccsdkapps", "ccsdkapps")
 CPS_URL                     = "http://portal.api.simpledemo.onap.org:8080"  # NOSONAR
@@ -36,6 +38,21 @@ SDB_ONBOARDING_BE_URL       = "http://sdc-onboarding-be.onap.svc.cluster.local:8
 SDC_BE_URL                  = "https://sdc.api.be.simpledemo.onap.org:30204"
 SDC_FE_URL                  = "https://sdc.api.fe.simpledemo.onap.org:30207"
 SDC_AUTH                    = "Basic YWFpOktwOGJKNFNYc3pNMFdYbGhhazNlSGxjc2UyZ0F3ODR2YW9HR21KdlV5MlU="  # pylint: disable=line-too-long
+SDC_CATALOG_CACHE_TTL       = 60
+SDC_MAX_WORKERS             = 8
+SDC_CSAR_CACHE_DIR          = None
+SDC_CSAR_CACHE_MAX_SIZE     = 512 * 1024 * 1024
+SDC_ARTIFACT_UPLOAD_CHUNK_SIZE = 3 * 1024 * 1024
+SDC_PACKAGE_UPLOAD_CHUNK_SIZE = 1024 * 1024
+SDC_CSAR_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+SDC_PACKAGE_UPLOAD_RETRIES  = 3
+SDC_ONBOARDING_TIMEOUT      = 600
+SDC_ONBOARDING_POLL_INTERVAL = 2
+SDC_POLLING_INITIAL_DELAY   = 0.5
+SDC_POLLING_MAX_DELAY       = 10
+SDC_POLLING_MULTIPLIER      = 2
+SDC_POLLING_JITTER          = 0.1
+SDC_POLLING_TIMEOUT         = 300
 SDNC_URL                    = "https://sdnc.api.simpledemo.onap.org:30267"
 SDNC_AUTH                   = "Basic YWRtaW46S3A4Yko0U1hzek0wV1hsaGFrM2VIbGNzZTJnQXc4NHZhb0dHbUp2VXkyVQ=="  # pylint: disable=line-too-long
 SO_CATALOG_DB_ADAPTER_URL   = "http://so-catalog-db-adapter:8082"  # NOSONAR
@@ -102,6 +119,12 @@ SDC_SERVICE_DISTRIBUTION_DESIRED_STATE = {
     "policy-distribution-id": "DOWNLOAD_OK",
 }
 
+# SDC DISTRIBUTION STATUS NOTIFICATIONS
+# USED BY onapsdk.utils.distribution_watcher.DistributionWatcher
+SDC_DISTRIBUTION_STATUS_TOPIC = "SDC-DISTR-STATUS-TOPIC-AUTO"
+SDC_DISTRIBUTION_POLL_INTERVAL = 30
+SDC_DISTRIBUTION_TIMEOUT = 1800
+
 # KAFKA CONFIGURATION
 
 KAFKA_BOOTSTRAP_SERVERS = "onap-strimzi-kafka-bootstrap"
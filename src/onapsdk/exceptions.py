@@ -13,7 +13,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class SDKException(Exception):
@@ -108,6 +108,10 @@ class StatusError(SDKException):
     """Invalid status."""
 
 
+class PollingTimeout(StatusError):
+    """Expected status wasn't reached in time."""
+
+
 class ParameterError(SDKException):
     """Parameter does not satisfy requirements."""
 
@@ -129,3 +133,23 @@ class SettingsError(SDKException):
 
 class NoGuiError(SDKException):
     """No GUI available for this component."""
+
+
+class OnboardingError(SDKException):
+    """Onboarding of some objects failed."""
+
+
+class CompositionError(SDKException):
+    """Adding some resources into service composition failed."""
+
+    def __init__(self, message: str, errors: Dict[str, List[BaseException]]) -> None:
+        """Init composition error exception.
+
+        Args:
+            message (str): Error message
+            errors (Dict[str, List[BaseException]]): Errors by name of the resource
+                which couldn't be added, one for each failed attempt
+
+        """
+        super().__init__(message)
+        self.errors: Dict[str, List[BaseException]] = errors
@@ -22,15 +22,20 @@ from onapsdk.configuration import settings
 from onapsdk.exceptions import APIError, RequestError
 from onapsdk.onap_service import OnapService
 import onapsdk.constants as const
+from onapsdk.utils.cache import TtlCache
 from onapsdk.utils.jinja import jinja_env
 from onapsdk.utils.gui import GuiItem, GuiList
 
+from .catalog import SdcCatalog
+
 class SDC(OnapService, ABC):
     """Mother Class of all SDC elements."""
 
     server: str = "SDC"
     base_front_url = settings.SDC_FE_URL
     base_back_url = settings.SDC_BE_URL
+    # Catalog snapshots shared by all objects, stored by SDC class
+    _catalogs: TtlCache[SdcCatalog] = TtlCache(settings.SDC_CATALOG_CACHE_TTL)
 
     def __init__(self, name: Optional[str] = None) -> None:
         """Initialize SDC."""
@@ -186,50 +191,141 @@ class SDC(OnapService, ABC):
                           len(objects))
         return objects
 
+    @classmethod
+    def catalog(cls, refresh: bool = False) -> SdcCatalog:
+        """Get indexed snapshot of all objects of given class.
+
+        Snapshot is shared by all objects of the class and it's kept for
+            `SDC_CATALOG_CACHE_TTL` seconds. If that setting is 0 a new
+            snapshot is fetched on each call.
+
+        Args:
+            refresh (bool, optional): Flag to determine if new snapshot
+                should be fetched. Defaults to False.
+
+        Returns:
+            SdcCatalog: Catalog snapshot
+
+        """
+        if not settings.SDC_CATALOG_CACHE_TTL:
+            return SdcCatalog(cls.get_all())
+        SDC._catalogs.ttl = settings.SDC_CATALOG_CACHE_TTL
+        if refresh:
+            SDC._catalogs.invalidate(cls)
+        return SDC._catalogs.get_or_set(cls, lambda: SdcCatalog(cls.get_all()))
+
+    @classmethod
+    def find_in_catalog(cls, attribute: str, value: Any) -> Optional["SDC"]:
+        """Find object of given class with given unique attribute value.
+
+        If object is not found in the kept catalog snapshot, a new one is fetched
+            once, as object could be created after snapshot was taken.
+
+        Args:
+            attribute (str): Attribute name, e.g. "identifier" or "unique_uuid"
+            value (Any): Attribute value
+
+        Returns:
+            Optional[SDC]: Found object, None if there is no object with given value
+
+        """
+        found: Optional["SDC"] = cls.catalog().get_by(attribute, value)
+        if found is None and settings.SDC_CATALOG_CACHE_TTL:
+            found = cls.catalog(refresh=True).get_by(attribute, value)
+        return found
+
+    @classmethod
+    def invalidate_catalog(cls) -> None:
+        """Remove catalog snapshot of given class, so the next lookup fetches a new one."""
+        SDC._catalogs.invalidate(cls)
+
+    def _catalog_changed(self, created: Optional["SDC"] = None) -> None:
+        """Update catalog snapshot after local write.
+
+        Created objects are added to the snapshot as separate objects built from
+            the creation response, the same way as `get_all` ones, so later
+            changes of the object don't change the snapshot. Objects changed in
+            other way (e.g. by lifecycle action) are marked as stale.
+
+        Args:
+            created (Optional[SDC], optional): Object built from the creation
+                response, if object was created. Defaults to None.
+
+        """
+        catalog: Optional[SdcCatalog] = SDC._catalogs.get(type(self))
+        if catalog is None:
+            return
+        if created is not None:
+            catalog.add(created)
+        else:
+            catalog.mark_stale(self.name)
+
     def exists(self) -> bool:
         """
         Check if object already exists in SDC and update infos.
 
+        Object is looked for in the catalog snapshot, which is refreshed if
+            object was changed locally after the snapshot was taken. If object
+            is not found in the kept snapshot, a new one is fetched once, as
+            object could be created after snapshot was taken.
+
         Returns:
             True if exists, False either
 
         """
         self._logger.debug("check if %s %s exists in SDC",
                            type(self).__name__, self.name)
-        objects = self.get_all()
+        catalog: SdcCatalog = self.catalog()
+        refreshed: bool = not settings.SDC_CATALOG_CACHE_TTL
+        if not refreshed and catalog.is_stale(self.name):
+            catalog, refreshed = self.catalog(refresh=True), True
+
+        versioned_object: Optional["SDC"] = self._find_in_snapshot(catalog)
+        if versioned_object is None and not refreshed:
+            self._logger.debug("%s %s not found in catalog snapshot, fetching a new one",
+                               type(self).__name__, self.name)
+            versioned_object = self._find_in_snapshot(self.catalog(refresh=True))
+        if versioned_object is None:
+            return False
+
+        self._logger.info("%s found, updating information", type(self).__name__)
+        self._copy_object(versioned_object)
+        return True
+
+    def _find_in_snapshot(self, catalog: SdcCatalog) -> Optional["SDC"]:
+        """Find object in the catalog snapshot.
+
+        Args:
+            catalog (SdcCatalog): Catalog snapshot
+
+        Returns:
+            Optional[SDC]: Object with the version to use (filtered one or the
+                latest), None if it's not in the snapshot
 
+        """
         self._logger.debug("filtering objects of all versions to be %s",
                            self.name)
-        relevant_objects = list(filter(lambda obj: obj == self, objects))
+        relevant_objects = list(filter(lambda obj: obj == self, catalog.find_all(self.name)))
 
         if not relevant_objects:
 
             self._logger.info("%s %s doesn't exist in SDC",
                               type(self).__name__, self.name)
-            return False
+            return None
 
         if hasattr(self, 'version_filter') and self.version_filter is not None: # pylint: disable=no-member
 
             self._logger.debug("filtering %s objects by version %s",
                                self.name, self.version_filter) # pylint: disable=no-member
 
-            all_versioned = filter(
-                lambda obj: obj.version == self.version_filter, relevant_objects) # pylint: disable=no-member
-
-            try:
-                versioned_object = next(all_versioned)
-            except StopIteration:
+            versioned_object = catalog.find(self.name, self.version_filter) # pylint: disable=no-member
+            if versioned_object is None:
                 self._logger.info("Version %s of %s %s, doesn't exist in SDC",
                                   self.version_filter, type(self).__name__,  # pylint: disable=no-member
                                   self.name)
-                return False
-
-        else:
-            versioned_object = max(relevant_objects, key=self._get_mapped_version)
+            return versioned_object
 
-        self._logger.info("%s found, updating information", type(self).__name__)
-        self._copy_object(versioned_object)
-        return True
+        return max(relevant_objects, key=self._get_mapped_version)
 
     @classmethod
     def get_guis(cls) -> GuiList:
@@ -254,6 +350,8 @@ class SdcOnboardable(SDC, ABC):
 
     ACTION_TEMPLATE: str
     ACTION_METHOD: str
+    # Status of the object after its onboarding is finished
+    ONBOARDED_STATUS: str = const.CERTIFIED
 
     def __init__(self, name: Optional[str] = None) -> None:
         """Initialize the object."""
@@ -341,11 +439,45 @@ class SdcOnboardable(SDC, ABC):
             self.identifier = self._get_identifier_from_sdc(create_result)
             self._version = self._get_version_from_sdc(create_result)
             self.update_informations_from_sdc_creation(create_result)
+            self._catalog_changed(created=self._catalog_entry(create_result))
 
         else:
             self._logger.warning("%s %s is already created in SDC",
                                  type(self).__name__, self.name)
 
+    def _catalog_entry(self, create_result: Dict[str, Any]) -> Optional[SDC]:
+        """Build catalog snapshot entry of the created object.
+
+        Entry is imported from the creation response, the same way as objects
+            returned by `get_all`.
+
+        Args:
+            create_result (Dict[str, Any]): the result of the creation request
+
+        Returns:
+            Optional[SDC]: Created object entry, None if it can't be built
+                from the creation response
+
+        """
+        try:
+            return self.import_from_sdc(self._catalog_values(create_result))
+        except (KeyError, IndexError, TypeError):
+            self._logger.debug("Can't build catalog entry of %s %s from creation response",
+                               type(self).__name__, self.name)
+            return None
+
+    def _catalog_values(self, create_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Get values of the `get_all` result entry of the created object.
+
+        Args:
+            create_result (Dict[str, Any]): the result of the creation request
+
+        Returns:
+            Dict[str, Any]: Values to import the object from
+
+        """
+        return create_result
+
     def _action_to_sdc(self, action: str, action_type: Optional[str] = None,
                        **kwargs) -> Response:
         """
@@ -368,11 +500,13 @@ class SdcOnboardable(SDC, ABC):
         template = jinja_env().get_template(self.ACTION_TEMPLATE)
         data = template.render(action=action, const=const)
 
-        return self.send_message(self.ACTION_METHOD,
-                                 f"{action} {type(self).__name__}",
-                                 url,
-                                 data=data,
-                                 **kwargs)
+        response: Response = self.send_message(self.ACTION_METHOD,
+                                               f"{action} {type(self).__name__}",
+                                               url,
+                                               data=data,
+                                               **kwargs)
+        self._catalog_changed()
+        return response
 
     @abstractmethod
     def update_informations_from_sdc(self, details: Dict[str, Any]) -> None:
@@ -483,3 +617,13 @@ class SdcOnboardable(SDC, ABC):
             make SDC resource ready to use. It depends on the type of object
             but most of them needs to be created and submitted.
         """
+
+    @property
+    def onboarding_dependencies(self) -> List["SdcOnboardable"]:
+        """Objects which have to be onboarded before this one.
+
+        Returns:
+            List[SdcOnboardable]: Objects this one is created from, e.g. VSP vendor
+
+        """
+        return []
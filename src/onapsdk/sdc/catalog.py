@@ -0,0 +1,242 @@
+"""SDC catalog snapshot module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import time
+from threading import RLock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class SdcCatalog:
+    """Indexed snapshot of SDC catalog of one type.
+
+    Objects are indexed by name when snapshot is created. Indexes by
+        (name, version) and by other attributes (e.g. UUID) are built lazily,
+        on the first lookup, so versions are read only from the objects which
+        are really looked for.
+
+    Names of the objects changed by a local write which can't be reflected
+        in the snapshot (e.g. lifecycle action changing version) are marked
+        as stale, so the next lookup of such name refreshes the snapshot.
+    """
+
+    def __init__(self, objects: Iterable[Any]) -> None:
+        """Create catalog snapshot.
+
+        Args:
+            objects (Iterable[Any]): SDC objects of one type
+
+        """
+        self._lock: RLock = RLock()
+        self._by_name: Dict[str, List[Any]] = {}
+        self._by_name_version: Dict[Tuple[str, Any], Optional[Any]] = {}
+        self._by_attribute: Dict[str, Dict[Any, Any]] = {}
+        self._stale_names: Set[str] = set()
+        for obj in objects:
+            self._by_name.setdefault(obj.name, []).append(obj)
+
+    def __len__(self) -> int:
+        """Get number of catalog objects.
+
+        Returns:
+            int: Number of objects
+
+        """
+        return sum(len(objects) for objects in self._by_name.values())
+
+    def is_stale(self, name: str) -> bool:
+        """Check if objects with given name were changed locally after snapshot creation.
+
+        Args:
+            name (str): Object name
+
+        Returns:
+            bool: True if snapshot doesn't reflect given object, False otherwise
+
+        """
+        return name in self._stale_names
+
+    def mark_stale(self, name: str) -> None:
+        """Mark objects with given name as changed locally.
+
+        Args:
+            name (str): Object name
+
+        """
+        with self._lock:
+            self._stale_names.add(name)
+
+    def add(self, obj: Any) -> None:
+        """Add locally created object to the snapshot.
+
+        Args:
+            obj (Any): SDC object
+
+        """
+        with self._lock:
+            self._by_name.setdefault(obj.name, []).append(obj)
+            self._by_name_version = {key: value for key, value in self._by_name_version.items()
+                                     if key[0] != obj.name}
+            self._by_attribute = {}
+
+    def find_all(self, name: str) -> List[Any]:
+        """Get all versions of objects with given name.
+
+        Args:
+            name (str): Object name
+
+        Returns:
+            List[Any]: Objects with given name
+
+        """
+        return list(self._by_name.get(name, []))
+
+    def find(self, name: str, version: Any) -> Optional[Any]:
+        """Get object with given name and version.
+
+        Args:
+            name (str): Object name
+            version (Any): Object version
+
+        Returns:
+            Optional[Any]: Object, None if there is no object with given name and version
+
+        """
+        key: Tuple[str, Any] = (name, version)
+        with self._lock:
+            if key not in self._by_name_version:
+                self._by_name_version[key] = next(
+                    (obj for obj in self._by_name.get(name, []) if obj.version == version),
+                    None
+                )
+            return self._by_name_version[key]
+
+    def get_by(self, attribute: str, value: Any) -> Optional[Any]:
+        """Get object by the value of its unique attribute, e.g. UUID.
+
+        Index of given attribute is built on the first lookup.
+
+        Args:
+            attribute (str): Attribute name, e.g. "identifier" or "unique_uuid"
+            value (Any): Attribute value
+
+        Returns:
+            Optional[Any]: Object, None if there is no object with given attribute value
+
+        """
+        with self._lock:
+            if attribute not in self._by_attribute:
+                index: Dict[Any, Any] = {}
+                for objects in self._by_name.values():
+                    for obj in objects:
+                        index.setdefault(getattr(obj, attribute), obj)
+                self._by_attribute[attribute] = index
+            return self._by_attribute[attribute].get(value)
+
+
+class SdcScreen:
+    """Indexed snapshot of SDC catalog screen.
+
+    Screen lists the latest versions of all resources and services. Its entries
+        are indexed by UUID and by invariant UUID, per screen section (e.g.
+        "resources" or "services"), when snapshot is created. Dependencies of
+        entries, which list their other versions, are fetched on the first
+        lookup and kept in the snapshot.
+    """
+
+    def __init__(self, screen: Dict[str, Any]) -> None:
+        """Create screen snapshot.
+
+        Args:
+            screen (Dict[str, Any]): SDC catalog screen response
+
+        """
+        self._lock: RLock = RLock()
+        self._by_uuid: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_invariant_uuid: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._dependencies: Dict[str, List[Dict[str, Any]]] = {}
+        self.created_at: float = time.monotonic()
+        for section, entries in screen.items():
+            if not isinstance(entries, list):
+                continue
+            for entry in entries:
+                self._by_uuid[(section, entry.get("uuid"))] = entry
+                self._by_invariant_uuid.setdefault((section, entry.get("invariantUUID")),
+                                                   []).append(entry)
+
+    def __len__(self) -> int:
+        """Get number of screen entries.
+
+        Returns:
+            int: Number of entries
+
+        """
+        return len(self._by_uuid)
+
+    def find(self, section: str, invariant_uuid: str, uuid: str,
+             version: str) -> Optional[Dict[str, Any]]:
+        """Get screen entry of given version.
+
+        UUID is kept when a new minor version is checked out, so version is
+            compared too.
+
+        Args:
+            section (str): Screen section, e.g. "resources"
+            invariant_uuid (str): Entry invariant UUID
+            uuid (str): Entry UUID
+            version (str): Entry version
+
+        Returns:
+            Optional[Dict[str, Any]]: Screen entry, None if there is no such entry
+
+        """
+        entry: Optional[Dict[str, Any]] = self._by_uuid.get((section, uuid))
+        if (entry is None or entry.get("invariantUUID") != invariant_uuid
+                or entry.get("version") != version):
+            return None
+        return entry
+
+    def find_all(self, section: str, invariant_uuid: str) -> List[Dict[str, Any]]:
+        """Get screen entries with given invariant UUID.
+
+        Args:
+            section (str): Screen section, e.g. "resources"
+            invariant_uuid (str): Entry invariant UUID
+
+        Returns:
+            List[Dict[str, Any]]: Screen entries
+
+        """
+        return list(self._by_invariant_uuid.get((section, invariant_uuid), []))
+
+    def dependencies(self, unique_id: str,
+                     fetch: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Get dependencies of the screen entry.
+
+        Args:
+            unique_id (str): Entry unique ID
+            fetch (Callable[[], List[Dict[str, Any]]]): Function which fetches
+                dependencies, called on the first lookup of the entry (without
+                holding the lock, so other entries can be looked up meanwhile)
+
+        Returns:
+            List[Dict[str, Any]]: Entry dependencies
+
+        """
+        with self._lock:
+            dependencies: Optional[List[Dict[str, Any]]] = self._dependencies.get(unique_id)
+        if dependencies is None:
+            dependencies = fetch()
+            with self._lock:
+                dependencies = self._dependencies.setdefault(unique_id, dependencies)
+        return dependencies
@@ -137,7 +137,8 @@ class BaseCategory(SDC, ABC):  # pylint: disable=too-many-instance-attributes
         """Create category instance.
 
         Checks if category with given name exists and if it already
-            exists just returns category with given name.
+            exists just returns category with given name. Created category
+            is added into the catalog snapshot, so it's not fetched again.
 
         Returns:
             BaseCategory: Created category instance
@@ -146,12 +147,21 @@ class BaseCategory(SDC, ABC):  # pylint: disable=too-many-instance-attributes
         category_obj: "BaseCategory" = cls(name)
         if category_obj.exists():
             return category_obj
-        cls.send_message_json("POST",
-                              f"Create {name} {cls.category_name()}",
-                              cls._base_create_url(),
-                              data=json.dumps({"name": name}),
-                              headers=cls.headers())
-        category_obj.exists()
+        response: Any = cls.send_message_json("POST",
+                                              f"Create {name} {cls.category_name()}",
+                                              cls._base_create_url(),
+                                              data=json.dumps({"name": name}),
+                                              headers=cls.headers())
+        try:
+            created: "BaseCategory" = cls.import_from_sdc(response)
+        except (KeyError, TypeError):
+            cls._logger.debug("Created %s %s not returned, get all categories",
+                              cls.category_name(), name)
+            cls.invalidate_catalog()
+            category_obj.exists()
+            return category_obj
+        category_obj._copy_object(created)
+        category_obj._catalog_changed(created=created)
         return category_obj
 
     def _copy_object(self, obj: 'BaseCategory') -> None:
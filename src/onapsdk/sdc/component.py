@@ -13,7 +13,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from onapsdk.exceptions import ParameterError
 
 from onapsdk.sdc.properties import ComponentProperty
@@ -145,14 +145,34 @@ class Component:  # pylint: disable=too-many-instance-attributes
             f"Set {self.name} component property {property_obj.name} value",
             self.properties_value_url,
             data=jinja_env().get_template(\
-                "sdc_resource_component_set_property_value.json.j2").\
+                "sdc_resource_component_set_property_values.json.j2").\
                 render(
                     component=self,
-                    value=value,
-                    property=property_obj
+                    values=[(property_obj, value)]
                 )
         )
 
+    def set_property_values(self, values: Iterable[Tuple["ComponentProperty", Any]]) -> None:
+        """Set values of many component properties in one request.
+
+        Args:
+            values (Iterable[Tuple[ComponentProperty, Any]]): Component property objects
+                and values to set
+
+        """
+        values = list(values)
+        if not values:
+            return
+        self.sdc_resource.send_message_json(
+            "POST",
+            f"Set {self.name} component {len(values)} properties values",
+            self.properties_value_url,
+            data=jinja_env().get_template(
+                "sdc_resource_component_set_property_values.json.j2").render(
+                    component=self,
+                    values=values)
+        )
+
     def delete(self) -> None:
         """Delete component."""
         self.sdc_resource.send_message_json(
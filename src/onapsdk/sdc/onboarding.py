@@ -0,0 +1,222 @@
+"""SDC onboarding scheduler module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import OnboardingError, ParameterError, PollingTimeout, StatusError
+from onapsdk.sdc import SdcOnboardable
+from onapsdk.utils.polling import PollingPolicy, wait_until
+
+# Object type and name
+NodeKey = Tuple[str, str]
+
+
+class OnboardingScheduler:
+    """Onboard SDC objects concurrently, in the order of their dependencies.
+
+    Dependencies are taken from `onboarding_dependencies` of the objects
+        (Vendor -> VSP -> VF/PNF -> Service), also the ones which were not
+        given explicitly. Objects of the same type and name are onboarded once.
+        Each object is onboarded as soon as all its dependencies reach
+        their onboarded status, so independent branches run in parallel.
+        If an object fails, objects which depend on it are skipped and
+        the other ones are still onboarded.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self,
+                 resources: Iterable[SdcOnboardable],
+                 max_workers: int = settings.SDC_MAX_WORKERS) -> None:
+        """Build dependency graph of given objects.
+
+        Args:
+            resources (Iterable[SdcOnboardable]): Objects to onboard
+            max_workers (int, optional): Maximum number of objects onboarded at once.
+                Defaults to settings.SDC_MAX_WORKERS.
+
+        """
+        self.max_workers: int = max_workers
+        self.resources: Dict[NodeKey, SdcOnboardable] = {}
+        self.dependencies: Dict[NodeKey, Set[NodeKey]] = {}
+        self.failed: Dict[NodeKey, BaseException] = {}
+        self.skipped: Set[NodeKey] = set()
+        for resource in resources:
+            self._add(resource)
+
+    @staticmethod
+    def key(resource: SdcOnboardable) -> NodeKey:
+        """Get dependency graph node key of the object.
+
+        Args:
+            resource (SdcOnboardable): SDC object
+
+        Returns:
+            NodeKey: Object type and name
+
+        """
+        return type(resource).__name__, resource.name
+
+    def _add(self, resource: SdcOnboardable) -> NodeKey:
+        """Add object and its dependencies into dependency graph.
+
+        Args:
+            resource (SdcOnboardable): SDC object
+
+        Returns:
+            NodeKey: Object node key
+
+        """
+        key: NodeKey = self.key(resource)
+        if key not in self.resources:
+            self.resources[key] = resource
+            self.dependencies[key] = set()
+            self.dependencies[key] = {self._add(dependency)
+                                      for dependency in resource.onboarding_dependencies}
+        return key
+
+    @property
+    def stages(self) -> List[List[SdcOnboardable]]:
+        """Objects grouped by their depth in the dependency graph.
+
+        Objects of a stage depend only on the objects of the previous stages.
+
+        Raises:
+            ParameterError: Dependencies are cyclic
+
+        Returns:
+            List[List[SdcOnboardable]]: Stages of objects
+
+        """
+        stages: List[List[SdcOnboardable]] = []
+        placed: Set[NodeKey] = set()
+        while len(placed) < len(self.resources):
+            stage: List[NodeKey] = [key for key, dependencies in self.dependencies.items()
+                                    if key not in placed and dependencies <= placed]
+            if not stage:
+                raise ParameterError("Onboarding dependencies are cyclic")
+            placed.update(stage)
+            stages.append([self.resources[key] for key in stage])
+        return stages
+
+    @staticmethod
+    def _wait_onboarded(resource: SdcOnboardable) -> None:
+        """Wait until SDC reports the object in its onboarded status.
+
+        Status is polled with SDC polling policy, starting with
+            SDC_ONBOARDING_POLL_INTERVAL delay, at most for SDC_ONBOARDING_TIMEOUT seconds.
+
+        Args:
+            resource (SdcOnboardable): SDC object
+
+        Raises:
+            StatusError: Object hasn't reached its onboarded status in time
+
+        """
+        if resource.status == resource.ONBOARDED_STATUS:
+            return
+
+        def onboarded() -> bool:
+            resource._catalog_changed()  # pylint: disable=protected-access
+            resource.load()
+            return resource.status == resource.ONBOARDED_STATUS
+
+        policy: PollingPolicy = replace(PollingPolicy.from_settings(),
+                                        initial_delay=settings.SDC_ONBOARDING_POLL_INTERVAL,
+                                        timeout=settings.SDC_ONBOARDING_TIMEOUT)
+        try:
+            wait_until(onboarded, f"{resource} {resource.ONBOARDED_STATUS} status", policy=policy)
+        except PollingTimeout as exc:
+            raise StatusError(f"{resource} is in {resource.status} status "
+                              f"instead of {resource.ONBOARDED_STATUS}") from exc
+
+    def _onboard(self, resource: SdcOnboardable) -> None:
+        """Onboard the object and wait until it's ready to be used by its dependants.
+
+        Args:
+            resource (SdcOnboardable): SDC object
+
+        """
+        self._logger.info("Onboard %s", resource)
+        resource.onboard()
+        self._wait_onboarded(resource)
+        self._logger.info("%s onboarded", resource)
+
+    def _skip_dependants(self, pending: Set[NodeKey]) -> None:
+        """Skip pending objects which depend on failed or skipped ones.
+
+        Args:
+            pending (Set[NodeKey]): Objects which haven't been onboarded yet
+
+        """
+        while True:
+            not_onboarded: Set[NodeKey] = self.failed.keys() | self.skipped
+            blocked: Set[NodeKey] = {key for key in pending
+                                     if self.dependencies[key] & not_onboarded}
+            if not blocked:
+                return
+            for key in blocked:
+                self._logger.warning("Skip %s, its dependencies weren't onboarded",
+                                     self.resources[key])
+            self.skipped |= blocked
+            pending -= blocked
+
+    def run(self) -> List[SdcOnboardable]:
+        """Onboard all objects.
+
+        Raises:
+            ParameterError: Dependencies are cyclic
+            OnboardingError: Some objects couldn't be onboarded. Failures are
+                stored in `failed` and objects which weren't onboarded because of
+                them in `skipped`.
+
+        Returns:
+            List[SdcOnboardable]: Onboarded objects, in the order they were onboarded
+
+        """
+        _ = self.stages  # Check cycles before anything is onboarded
+        self.failed, self.skipped = {}, set()
+        onboarded: List[NodeKey] = []
+        pending: Set[NodeKey] = set(self.resources)
+        running: Dict[Future, NodeKey] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                self._skip_dependants(pending)
+                ready: List[NodeKey] = sorted(key for key in pending
+                                              if self.dependencies[key] <= set(onboarded))
+                for key in ready:
+                    pending.discard(key)
+                    running[executor.submit(self._onboard, self.resources[key])] = key
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    exc: Optional[BaseException] = future.exception()
+                    if exc is None:
+                        onboarded.append(key)
+                    else:
+                        self._logger.error("%s onboarding failed: %s", self.resources[key], exc)
+                        self.failed[key] = exc
+        if self.failed:
+            raise OnboardingError(
+                f"Onboarding of {len(self.failed)} objects failed: "
+                f"{', '.join(str(self.resources[key]) for key in self.failed)}. "
+                f"Skipped {len(self.skipped)} objects which depend on them."
+            ) from next(iter(self.failed.values()))
+        return [self.resources[key] for key in onboarded]
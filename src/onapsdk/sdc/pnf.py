@@ -15,6 +15,7 @@
 from typing import Optional, Dict, List, Union
 from onapsdk.exceptions import ParameterError
 
+from onapsdk.sdc import SdcOnboardable
 from onapsdk.sdc.sdc_resource import SdcResource
 from onapsdk.sdc.properties import NestedInput, Property
 import onapsdk.constants as const
@@ -60,6 +61,16 @@ class Pnf(SdcResource):
         self.vendor: Vendor = vendor
         self.vsp: Vsp = vsp
 
+    @property
+    def onboarding_dependencies(self) -> List[SdcOnboardable]:
+        """Objects which have to be onboarded before this one.
+
+        Returns:
+            List[SdcOnboardable]: Pnf vsp and vendor, if they were given
+
+        """
+        return [dependency for dependency in (self.vsp, self.vendor) if dependency]
+
     def create(self) -> None:
         """Create the PNF in SDC if not already existing."""
         if not self.vsp and not self.vendor:
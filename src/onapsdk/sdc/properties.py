@@ -15,7 +15,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from onapsdk.exceptions import ParameterError
+from onapsdk.exceptions import ParameterError, ResourceNotFound
 
 
 @dataclass
@@ -140,9 +140,8 @@ class Property:  # pylint: disable=too-many-instance-attributes, too-few-public-
         if not self.get_input_values:
             return None
         try:
-            return next(filter(lambda x: x.unique_id == self.get_input_values[0].get("inputId"),
-                               self.sdc_resource.inputs))
-        except StopIteration as exc:
+            return self.sdc_resource.get_input_by_id(self.get_input_values[0].get("inputId"))
+        except ResourceNotFound as exc:
             raise ParameterError("Property input does not exist") from exc
 
     @property
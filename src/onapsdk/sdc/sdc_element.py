@@ -193,6 +193,38 @@ class SdcElement(SdcOnboardable, ABC):
         """
         self.identifier = obj.identifier
 
+    def _catalog_values(self, create_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Get values of the `get_all` result entry of the created object.
+
+        Creation response has no element name, so it's taken from the object.
+
+        Args:
+            create_result (Dict[str, Any]): the result of the creation request
+
+        Returns:
+            Dict[str, Any]: Values to import the object from
+
+        """
+        return {"name": self.name, "id": self._get_identifier_from_sdc(create_result)}
+
+    def _catalog_entry(self, create_result: Dict[str, Any]) -> Optional["SdcElement"]:
+        """Build catalog snapshot entry of the created element.
+
+        Version of the created element is set too, so it's not loaded again.
+
+        Args:
+            create_result (Dict[str, Any]): the result of the creation request
+
+        Returns:
+            Optional[SdcElement]: Created element entry, None if it can't be built
+                from the creation response
+
+        """
+        entry: Optional["SdcElement"] = super()._catalog_entry(create_result)
+        if entry is not None:
+            entry.version = self._get_version_from_sdc(create_result)
+        return entry
+
     def _get_version_from_sdc(self, sdc_infos: Dict[str, Any]) -> str:
         """
         Get version from SDC results.
@@ -245,3 +277,4 @@ class SdcElement(SdcOnboardable, ABC):
             "Delete SDC element",
             self.delete_url
         )
+        self._catalog_changed()
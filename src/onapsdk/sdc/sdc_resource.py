@@ -1,4 +1,4 @@
-"""SDC Element module."""
+"""SDC Element module."""  # pylint: disable=too-many-lines
 #   Copyright 2022 Orange, Deutsche Telekom AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
@@ -13,21 +13,28 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 import logging
-from abc import ABC
-from typing import Any, Dict, Iterator, List, Optional, Union
-import base64
 import time
+from abc import ABC
+from functools import partial
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import onapsdk.constants as const
+from onapsdk.configuration import settings
 from onapsdk.exceptions import ParameterError, ResourceNotFound, StatusError
-from onapsdk.sdc import SdcOnboardable
+from onapsdk.sdc import SDC, SdcOnboardable
+from onapsdk.sdc.catalog import SdcScreen
 from onapsdk.sdc.category_management import ResourceCategory, ServiceCategory
 from onapsdk.sdc.component import Component
 from onapsdk.sdc.properties import Input, NestedInput, Property
+from onapsdk.utils.artifact_payload import ArtifactPayload
+from onapsdk.utils.cache import TtlCache
 from onapsdk.utils.headers_creator import (headers_sdc_creator,
                                            headers_sdc_tester,
                                            headers_sdc_artifact_upload)
+from onapsdk.utils.concurrency import bounded_map
 from onapsdk.utils.jinja import jinja_env
+from onapsdk.utils.polling import POLLING_METRICS, PollingPolicy, wait_until
 
 
 # For an unknown reason, pylint keeps seeing _unique_uuid and
@@ -39,6 +46,13 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
     ACTION_TEMPLATE = 'sdc_resource_action.json.j2'
     ACTION_METHOD = 'POST'
     headers = headers_sdc_creator(SdcOnboardable.headers)
+    # Metadata of components' SDC resources by component's actualComponentUid.
+    # Uid identifies a single version of SDC resource, so metadata are shared
+    # by all the resources in the process.
+    _components_metadata: Dict[str, Dict[str, Any]] = {}
+    # Catalog screen snapshots shared by all resources and services, by SDC user ID
+    _screens: TtlCache[SdcScreen] = TtlCache(settings.SDC_CATALOG_CACHE_TTL)
+    _screen_lock: Lock = Lock()
 
     def __init__(self, name: Optional[str] = None, version: Optional[str] = None, # pylint: disable=too-many-arguments
                  sdc_values: Optional[Dict[str, str]] = None,
@@ -53,9 +67,14 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
         self._resource_type: str = "resources"
         self._properties_to_add: List[Property] = properties or []
         self._inputs_to_add: Union[Property, NestedInput] = inputs or []
-        self._time_wait: int = 10
+        # Policy of waiting for lifecycle transitions, None to use settings
+        self.polling_policy: Optional[PollingPolicy] = None
         self._category_name: str = category
         self._subcategory_name: str = subcategory
+        # Unique identifier of resource version and its components
+        self._components: Optional[Tuple[Optional[str], List[Component]]] = None
+        # Inputs indexed by unique ID and by name, dropped when inputs are changed
+        self._inputs_index: Optional[Tuple[Dict[str, Input], Dict[str, Input]]] = None
         if sdc_values:
             self._logger.debug("SDC values given, using them")
             self.identifier = sdc_values['uuid']
@@ -107,41 +126,140 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
         """Load Object information from SDC."""
         self.exists()
 
-    def deep_load(self) -> None:  # NOSONAR
-        """Deep load Object informations from SDC."""
-        url = (
-            f"{self.base_front_url}/sdc1/feProxy/rest/v1/"
-            "screen?excludeTypes=VFCMT&excludeTypes=Configuration"
-        )
+    @classmethod
+    def screen(cls, headers: Dict[str, str],
+               refresh_before: Optional[float] = None) -> SdcScreen:
+        """Get indexed snapshot of SDC catalog screen.
+
+        Snapshot is shared by all resources and services of the process (one per
+            SDC user) and it's kept for `SDC_CATALOG_CACHE_TTL` seconds. It's fetched
+            once, also when many objects look for it concurrently. If that setting
+            is 0 a new snapshot is fetched on each call.
+
+        Args:
+            headers (Dict[str, str]): Headers of the screen request
+            refresh_before (Optional[float], optional): Monotonic time, cached snapshot
+                created before it is refreshed. Snapshot refreshed meanwhile by
+                another object is reused. Defaults to None, so cached snapshot
+                is used.
+
+        Returns:
+            SdcScreen: Screen snapshot
+
+        """
+        def fetch() -> SdcScreen:
+            return SdcScreen(cls.send_message_json(
+                "GET",
+                f"Deep Load {cls.__name__}",
+                (f"{cls.base_front_url}/sdc1/feProxy/rest/v1/"
+                 "screen?excludeTypes=VFCMT&excludeTypes=Configuration"),
+                headers=headers))
+
+        if not settings.SDC_CATALOG_CACHE_TTL:
+            return fetch()
+        SdcResource._screens.ttl = settings.SDC_CATALOG_CACHE_TTL
+        key: Optional[str] = headers.get("USER_ID")
+        with SdcResource._screen_lock:
+            cached: Optional[SdcScreen] = SdcResource._screens.get(key)
+            if cached is not None and (refresh_before is None
+                                       or cached.created_at >= refresh_before):
+                return cached
+            screen: SdcScreen = fetch()
+            SdcResource._screens.set(key, screen)
+            return screen
+
+    @classmethod
+    def invalidate_screen(cls) -> None:
+        """Remove catalog screen snapshots, so the next deep load fetches a new one."""
+        SdcResource._screens.invalidate()
+
+    def _catalog_changed(self, created: Optional["SDC"] = None) -> None:
+        """Update catalog snapshot after local write.
+
+        Lifecycle actions create new versions, which are listed in the catalog
+            screen with new unique IDs, so screen snapshots are removed too.
+
+        Args:
+            created (Optional[SDC], optional): Object built from the creation
+                response, if object was created. Defaults to None.
+
+        """
+        super()._catalog_changed(created)
+        if created is None:
+            self.invalidate_screen()
+
+    def deep_load(self) -> None:
+        """Deep load Object informations from SDC.
+
+        Object is looked for in the shared catalog screen snapshot, which is
+            refreshed once if object isn't there.
+        """
         headers = headers_sdc_creator(SdcResource.headers)
         if self.status == const.UNDER_CERTIFICATION:
             headers = headers_sdc_tester(SdcResource.headers)
+        requested_at: float = time.monotonic()
+        screen: SdcScreen = type(self).screen(headers)
+        if (not self._deep_load_from_screen(screen)
+                and screen.created_at < requested_at):
+            self._deep_load_from_screen(type(self).screen(headers,
+                                                          refresh_before=requested_at))
+
+    def _deep_load_from_screen(self, screen: SdcScreen) -> bool:
+        """Load Object informations from catalog screen snapshot.
+
+        Services of versions which are not listed in the screen are looked for
+            in the dependencies of their listed versions.
+
+        Args:
+            screen (SdcScreen): Catalog screen snapshot
+
+        Returns:
+            bool: True if object was found, False otherwise
+
+        """
+        resource: Optional[Dict[str, Any]] = screen.find(self._sdc_path(),
+                                                         self.unique_uuid,
+                                                         self.identifier,
+                                                         self.version)
+        if resource:
+            self._logger.debug("Resource %s found in %s list",
+                               resource["name"], self._sdc_path())
+            self.unique_identifier = resource["uniqueId"]
+            self._category_name = resource["categories"][0]["name"]
+            subcategories = resource["categories"][0].get("subcategories", [{}])
+            self._subcategory_name = None if subcategories is None else \
+                subcategories[0].get("name")
+            return True
+        if self._sdc_path() == "services":
+            for resource in screen.find_all(self._sdc_path(), self.unique_uuid):
+                for dependency in screen.dependencies(
+                        resource["uniqueId"],
+                        partial(self.send_message_json,
+                                "GET",
+                                "Get service dependecies",
+                                f"{self._base_create_url()}/services/"
+                                f"{resource['uniqueId']}/dependencies")):
+                    if dependency["version"] == self.version:
+                        self.unique_identifier = dependency["uniqueId"]
+                        return True
+        return False
+
+    @staticmethod
+    def deep_load_all(resources: Iterable["SdcResource"],
+                      max_workers: int = settings.SDC_MAX_WORKERS) -> None:
+        """Deep load many objects concurrently.
 
-        response = self.send_message_json("GET",
-                                          f"Deep Load {type(self).__name__}",
-                                          url,
-                                          headers=headers)
-
-        for resource in response[self._sdc_path()]:
-            if resource["invariantUUID"] == self.unique_uuid:
-                if resource["uuid"] == self.identifier:
-                    self._logger.debug("Resource %s found in %s list",
-                                       resource["name"], self._sdc_path())
-                    self.unique_identifier = resource["uniqueId"]
-                    self._category_name = resource["categories"][0]["name"]
-                    subcategories = resource["categories"][0].get("subcategories", [{}])
-                    self._subcategory_name = None if subcategories is None else \
-                        subcategories[0].get("name")
-                    return
-                if self._sdc_path() == "services":
-                    for dependency in self.send_message_json("GET",
-                                                             "Get service dependecies",
-                                                             f"{self._base_create_url()}/services/"
-                                                             f"{resource['uniqueId']}/"
-                                                             "dependencies"):
-                        if dependency["version"] == self.version:
-                            self.unique_identifier = dependency["uniqueId"]
-                            return
+        All of them use the same catalog screen snapshot, so it's fetched once
+            (unless `SDC_CATALOG_CACHE_TTL` setting is 0).
+
+        Args:
+            resources (Iterable[SdcResource]): Objects to deep load
+            max_workers (int, optional): Maximum number of objects loaded at once.
+                Defaults to settings.SDC_MAX_WORKERS.
+
+        """
+        for _ in bounded_map(lambda resource: resource.deep_load(), resources, max_workers):
+            pass
 
     def _generate_action_subpath(self, action: str) -> str:
         """
@@ -369,14 +487,42 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
         """Really submit the SDC Vf in order to enable it."""
         raise NotImplementedError("SDC is an abstract class")
 
+    def _wait_for_status_change(self, previous_status: Optional[str]) -> None:
+        """Wait until SDC finishes lifecycle transition from given status.
+
+        Known status is checked first, as most of lifecycle actions load
+            the object after they are done. SDC is polled only if status hasn't
+            changed yet.
+
+        Args:
+            previous_status (Optional[str]): Status before the transition
+
+        Raises:
+            PollingTimeout: Status hasn't changed before polling policy timeout
+
+        """
+        if self.status != previous_status:
+            return
+
+        def status_changed() -> bool:
+            self._catalog_changed()
+            self.load()
+            return self.status != previous_status
+
+        wait_until(status_changed,
+                   f"{type(self).__name__} {self.name} transition from {previous_status} status",
+                   policy=self.polling_policy)
+
     def _create_onboard_step(self) -> None:
-        self.create()
-        time.sleep(self._time_wait)
+        with POLLING_METRICS.measure():
+            self.create()
+        self._wait_for_status_change(None)
         self.onboard()
 
     def _certify_onboard_step(self) -> None:
-        self.certify()
-        time.sleep(self._time_wait)
+        with POLLING_METRICS.measure():
+            self.certify()
+        self._wait_for_status_change(const.CHECKED_IN)
         self.onboard()
 
     def onboard(self) -> None:
@@ -386,10 +532,10 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
         elif self.status == const.DRAFT:
             for property_to_add in self._properties_to_add:
                 self.add_property(property_to_add)
-            for input_to_add in self._inputs_to_add:
-                self.declare_input(input_to_add)
-            self.submit()
-            time.sleep(self._time_wait)
+            self.declare_inputs(self._inputs_to_add)
+            with POLLING_METRICS.measure():
+                self.submit()
+            self._wait_for_status_change(const.DRAFT)
             self.onboard()
         elif self.status == const.CHECKED_IN:
             self._certify_onboard_step()
@@ -562,6 +708,60 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                 _default_value=input_data.get("defaultValue")
             )
 
+    def _get_inputs_index(self, refresh: bool = False) -> Tuple[Dict[str, Input],
+                                                                Dict[str, Input]]:
+        """Get resource inputs indexed by unique ID and by name.
+
+        Index is built once and dropped when inputs are declared or their
+            default values are set.
+
+        Args:
+            refresh (bool, optional): Flag to determine if index should be built
+                again. Defaults to False.
+
+        Returns:
+            Tuple[Dict[str, Input], Dict[str, Input]]: Inputs by unique ID and inputs by name
+
+        """
+        if refresh or self._inputs_index is None:
+            inputs: List[Input] = list(self.inputs)
+            self._inputs_index = ({input_obj.unique_id: input_obj for input_obj in inputs},
+                                  {input_obj.name: input_obj for input_obj in inputs})
+        return self._inputs_index
+
+    @property
+    def inputs_map(self) -> Dict[str, Input]:
+        """SDC resource inputs by their names.
+
+        Inputs are taken from the index, so they are fetched once
+            for many lookups.
+
+        Returns:
+            Dict[str, Input]: Inputs by name
+
+        """
+        return dict(self._get_inputs_index()[1])
+
+    def _find_input(self, key: str, by_name: bool) -> Input:
+        """Find input in the index, refreshed once if input is not there.
+
+        Args:
+            key (str): Input name or unique ID
+            by_name (bool): Flag to determine if input is looked for by name
+
+        Raises:
+            ResourceNotFound: Resource doesn't have input with given key
+
+        Returns:
+            Input: Found input object
+
+        """
+        for refresh in (False, True):
+            input_obj: Optional[Input] = self._get_inputs_index(refresh)[by_name].get(key)
+            if input_obj is not None:
+                return input_obj
+        raise ResourceNotFound(f"SDC resource has no {key} input")
+
     def get_input(self, input_name: str) -> Input:
         """Get input by it's name.
 
@@ -575,17 +775,30 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
             Input: Found input object
 
         """
-        for input_obj in self.inputs:
-            if input_obj.name == input_name:
-                return input_obj
-        raise ResourceNotFound(f"SDC resource has no {input_name} input")
+        return self._find_input(input_name, by_name=True)
+
+    def get_input_by_id(self, unique_id: str) -> Input:
+        """Get input by it's unique ID.
+
+        Args:
+            unique_id (str): Input unique ID
+
+        Raises:
+            ResourceNotFound: Resource doesn't have input with given ID
+
+        Returns:
+            Input: Found input object
+
+        """
+        return self._find_input(unique_id, by_name=False)
 
     def add_deployment_artifact(self, artifact_type: str, artifact_label: str,
                                 artifact_name: str, artifact: str) -> None:
         """
         Add deployment artifact to resource.
 
-        Add deployment artifact to resource using payload data.
+        Add deployment artifact to resource using payload data. Artifact file
+            is streamed into request body, so it's not loaded into memory.
 
         Args:
             artifact_type (str): all SDC artifact types are supported (DCAE_*, HEAT_*, ...)
@@ -597,19 +810,17 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
             StatusError: Resource has not DRAFT status
 
         """
-        with open(artifact, 'rb') as artifact_file:
-            data = artifact_file.read()
-        artifact_string = base64.b64encode(data).decode('utf-8')
         if self.status != const.DRAFT:
             msg = "Can't add artifact to resource which is not in DRAFT status"
             raise StatusError(msg)
         self._logger.debug("Add deployment artifact to sdc resource")
-        my_data = jinja_env().get_template(
-            "sdc_resource_add_deployment_artifact.json.j2").\
-                render(artifact_name=artifact_name,
-                       artifact_label=artifact_label,
-                       artifact_type=artifact_type,
-                       b64_artifact=artifact_string)
+        my_data = ArtifactPayload(
+            jinja_env().get_template("sdc_resource_add_deployment_artifact.json.j2").render(
+                artifact_name=artifact_name,
+                artifact_label=artifact_label,
+                artifact_type=artifact_type,
+                b64_artifact=ArtifactPayload.PLACEHOLDER),
+            artifact)
         my_header = headers_sdc_artifact_upload(base_header=self.headers, data=my_data)
 
         self.send_message_json("POST",
@@ -618,30 +829,66 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                                data=my_data,
                                headers=my_header)
 
+    def _get_component_metadata(self, actual_component_uid: str) -> Dict[str, Any]:
+        """Get metadata of component's SDC resource.
+
+        Args:
+            actual_component_uid (str): Component's actualComponentUid
+
+        Returns:
+            Dict[str, Any]: SDC resource metadata
+
+        """
+        return self.send_message_json(
+            "GET",
+            f"Get {self.name} component's SDC resource metadata",
+            (f"{self.base_front_url}/sdc1/feProxy/rest/v1/catalog/resources/"
+             f"{actual_component_uid}/filteredDataByParams?include=metadata"))["metadata"]
+
+    def _load_components_metadata(self, actual_component_uids: Iterable[str]) -> None:
+        """Fetch metadata of components' SDC resources which were not fetched before.
+
+        Metadata are fetched concurrently, by at most settings.SDC_MAX_WORKERS requests.
+
+        Args:
+            actual_component_uids (Iterable[str]): Components' actualComponentUid values
+
+        """
+        missing_uids: List[str] = [uid for uid in dict.fromkeys(actual_component_uids)
+                                   if uid not in self._components_metadata]
+        for uid, metadata in zip(missing_uids, bounded_map(self._get_component_metadata,
+                                                           missing_uids,
+                                                           settings.SDC_MAX_WORKERS)):
+            self._components_metadata[uid] = metadata
+
     @property
     def components(self) -> Iterator[Component]:
         """Resource components.
 
-        Iterate resource components.
+        Iterate resource components. Components are fetched once per resource
+            version and metadata of their SDC resources once per process.
 
         Yields:
             Component: Resource component object
 
         """
-        for component_instance in self.send_message_json(\
+        if self._components is None or self._components[0] != self._unique_identifier:
+            component_instances: List[Dict[str, Any]] = self.send_message_json(\
                 "GET",
                 f"Get {self.name} resource inputs",
                 f"{self.resource_inputs_url}/filteredDataByParams?include=componentInstances"
-                ).get("componentInstances", []):
-            sdc_resource: "SdcResource" = SdcResource.import_from_sdc(self.send_message_json(\
-                "GET",
-                f"Get {self.name} component's SDC resource metadata",
-                (f"{self.base_front_url}/sdc1/feProxy/rest/v1/catalog/resources/"
-                 f"{component_instance['actualComponentUid']}/"
-                 "filteredDataByParams?include=metadata"))["metadata"])
-            yield Component.create_from_api_response(api_response=component_instance,
-                                                     sdc_resource=sdc_resource,
-                                                     parent_sdc_resource=self)
+                ).get("componentInstances", [])
+            self._load_components_metadata(component_instance["actualComponentUid"]
+                                           for component_instance in component_instances)
+            self._components = (self._unique_identifier, [
+                Component.create_from_api_response(
+                    api_response=component_instance,
+                    sdc_resource=SdcResource.import_from_sdc(
+                        self._components_metadata[component_instance["actualComponentUid"]]),
+                    parent_sdc_resource=self
+                ) for component_instance in component_instances
+            ])
+        yield from self._components[1]
 
     @property
     def category(self) -> Union[ResourceCategory, ServiceCategory]:
@@ -779,10 +1026,11 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                                f"Declare new input for {property_obj.name} property",
                                f"{self.resource_inputs_url}/create/inputs",
                                data=jinja_env().get_template(\
-                                   "sdc_resource_add_input.json.j2").\
+                                   "sdc_resource_add_inputs.json.j2").\
                                        render(\
                                            sdc_resource=self,
-                                           property=property_obj))
+                                           properties=[property_obj]))
+        self._inputs_index = None
 
     def declare_nested_input(self,
                              nested_input: NestedInput) -> None:
@@ -800,11 +1048,12 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                                f"Declare new input for {nested_input.input_obj.name} input",
                                f"{self.resource_inputs_url}/create/inputs",
                                data=jinja_env().get_template(\
-                                   "sdc_resource_add_nested_input.json.j2").\
+                                   "sdc_resource_add_nested_inputs.json.j2").\
                                        render(\
                                            sdc_resource=self,
                                            component=component,
-                                           input=nested_input.input_obj))
+                                           inputs=[nested_input.input_obj]))
+        self._inputs_index = None
 
     def declare_input(self, input_to_declare: Union[Property, NestedInput]) -> None:
         """Declare input for given property or nested input object.
@@ -829,6 +1078,63 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
         else:
             self.declare_nested_input(input_to_declare)
 
+    def declare_inputs(self, inputs_to_declare: Iterable[Union[Property, NestedInput]]) -> None:
+        """Declare inputs for many properties or nested input objects.
+
+        One request is sent for all resource's properties and one per component
+            for nested inputs, instead of one request per input. All objects are
+            checked before any request is sent.
+
+        Args:
+            inputs_to_declare (Iterable[Union[Property, NestedInput]]): Properties
+                to declare inputs or NestedInput objects
+
+        Raises:
+            ParameterError: if any of given properties is not SDC resource property
+            ResourceNotFound: if SDC resource of any nested input is not a component
+
+        """
+        own_properties: List[Property] = []
+        nested_inputs: Dict[str, List[Input]] = {}
+        for input_to_declare in inputs_to_declare:
+            if isinstance(input_to_declare, Property):
+                own_properties.append(input_to_declare)
+            else:
+                nested_inputs.setdefault(input_to_declare.sdc_resource.name, []).append(
+                    input_to_declare.input_obj)
+        if own_properties:
+            resource_properties: List[Property] = list(self.properties)
+            if any(property_obj not in resource_properties for property_obj in own_properties):
+                raise ParameterError("Given property is not SDC resource property")
+        components: Dict[str, Component] = {}
+        if nested_inputs:
+            components = {component.sdc_resource.name: component
+                          for component in self.components}
+            for component_name in nested_inputs:
+                if component_name not in components:
+                    raise ResourceNotFound(f"SDC resource {component_name} is not a component")
+
+        self._logger.debug("Declare %d resource properties and %d components inputs",
+                           len(own_properties), len(nested_inputs))
+        if own_properties:
+            self.send_message_json("POST",
+                                   f"Declare {len(own_properties)} new inputs for properties",
+                                   f"{self.resource_inputs_url}/create/inputs",
+                                   data=jinja_env().get_template(
+                                       "sdc_resource_add_inputs.json.j2").render(
+                                           sdc_resource=self,
+                                           properties=own_properties))
+        for component_name, inputs in nested_inputs.items():
+            self.send_message_json("POST",
+                                   f"Declare {len(inputs)} new inputs for {component_name} inputs",
+                                   f"{self.resource_inputs_url}/create/inputs",
+                                   data=jinja_env().get_template(
+                                       "sdc_resource_add_nested_inputs.json.j2").render(
+                                           sdc_resource=self,
+                                           component=components[component_name],
+                                           inputs=inputs))
+        self._inputs_index = None
+
     def add_property(self, property_to_add: Property) -> None:
         """Add property to resource.
 
@@ -874,14 +1180,41 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                                f"Set {property_obj.name} value to {value}",
                                self.add_property_url,
                                data=jinja_env().get_template(
-                                   "sdc_resource_set_property_value.json.j2").\
+                                   "sdc_resource_set_property_values.json.j2").\
                                     render(
                                         sdc_resource=self,
-                                        property=property_obj,
-                                        value=value
+                                        values=[(property_obj, value)]
                                     )
                                )
 
+    def set_property_values(self, values: Iterable[Tuple[Property, Any]]) -> None:
+        """Set values of many properties in one request.
+
+        Values of given Property objects are not changed, get properties
+            again to have objects with the new values.
+
+        Args:
+            values (Iterable[Tuple[Property, Any]]): Property objects and values to set
+
+        Raises:
+            ParameterError: if any of given properties is not the resource's property
+
+        """
+        values = list(values)
+        if not values:
+            return
+        resource_properties: List[Property] = list(self.properties)
+        if any(property_obj not in resource_properties for property_obj, _ in values):
+            raise ParameterError("Given property is not a resource's property")
+        self._logger.debug("Set %d properties values", len(values))
+        self.send_message_json("PUT",
+                               f"Set {len(values)} {self.name} properties values",
+                               self.add_property_url,
+                               data=jinja_env().get_template(
+                                   "sdc_resource_set_property_values.json.j2").render(
+                                       sdc_resource=self,
+                                       values=values))
+
     def set_input_default_value(self, input_obj: Input, default_value: Any) -> None:
         """Set input default value.
 
@@ -897,13 +1230,36 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                                f"Set {input_obj.name} default value to {default_value}",
                                self.set_input_default_value_url,
                                data=jinja_env().get_template(
-                                   "sdc_resource_set_input_default_value.json.j2").\
+                                   "sdc_resource_set_input_default_values.json.j2").\
                                     render(
                                         sdc_resource=self,
-                                        input=input_obj,
-                                        default_value=default_value
+                                        values=[(input_obj, default_value)]
                                     )
                                )
+        self._inputs_index = None
+
+    def set_input_default_values(self, values: Iterable[Tuple[Input, Any]]) -> None:
+        """Set default values of many inputs in one request.
+
+        Values of given Input objects are not changed, get inputs
+            again to have objects with the new default values.
+
+        Args:
+            values (Iterable[Tuple[Input, Any]]): Input objects and default values to set
+
+        """
+        values = list(values)
+        if not values:
+            return
+        self._logger.debug("Set %d inputs default values", len(values))
+        self.send_message_json("POST",
+                               f"Set {len(values)} {self.name} inputs default values",
+                               self.set_input_default_value_url,
+                               data=jinja_env().get_template(
+                                   "sdc_resource_set_input_default_values.json.j2").render(
+                                       sdc_resource=self,
+                                       values=values))
+        self._inputs_index = None
 
     def checkout(self) -> None:
         """Checkout SDC resource."""
@@ -946,6 +1302,7 @@ class SdcResource(SdcOnboardable, ABC):  # pylint: disable=too-many-instance-att
                                        f"Add {resource.origin_type} to {self.origin_type}",
                                        url,
                                        data=data)
+            self._components = None
             if result:
                 self._logger.info("Resource %s %s has been added on %s %s",
                                   resource.origin_type, resource.name,
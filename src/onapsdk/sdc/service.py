@@ -1,4 +1,4 @@
-"""Service module."""
+"""Service module."""  # pylint: disable=too-many-lines
 #   Copyright 2022 Orange, Deutsche Telekom AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
@@ -14,26 +14,33 @@
 #   limitations under the License.
 import base64
 import pathlib as Path
-import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from io import BytesIO, TextIOWrapper
-from os import makedirs
-from typing import Dict, List, Callable, Iterator, Optional, Type, Union, Any, BinaryIO
+import os
+from tempfile import TemporaryDirectory
+from typing import (Dict, List, Callable, Iterable, Iterator, Optional, Type, Union, Any,
+                    BinaryIO)
 from zipfile import ZipFile, BadZipFile
 
-import oyaml as yaml
 from requests import Response
 
 import onapsdk.constants as const
 from onapsdk.exceptions import (ParameterError, RequestError, ResourceNotFound,
-                                StatusError, ValidationError)
+                                StatusError)
+from onapsdk.sdc import SdcOnboardable
 from onapsdk.sdc.category_management import ServiceCategory
 from onapsdk.sdc.properties import NestedInput, Property
 from onapsdk.sdc.sdc_resource import SdcResource
 from onapsdk.utils.configuration import components_needing_distribution
+from onapsdk.utils.csar_cache import CsarCache
+from onapsdk.utils.csar_download import download_to_file, extract_entries, find_service_template
 from onapsdk.utils.headers_creator import headers_sdc_creator, headers_sdc_artifact_upload
 from onapsdk.utils.jinja import jinja_env
+from onapsdk.utils.polling import POLLING_METRICS
+from onapsdk.utils.service_model import (MODEL_TEMPLATE_SECTIONS, ModelNodeTemplate, ServiceModel,
+                                         load_template, tosca_type)
 
 
 @dataclass
@@ -50,11 +57,55 @@ class VfModule:  # pylint: disable=too-many-instance-attributes
     properties: Iterator[Property]
 
 
+class LazyComponent:
+    """Node template component descriptor.
+
+    If node template has no component, but it has a component loader, the
+        component is loaded on the first access, so node templates built from
+        the service model don't need any SDC request until their component is used.
+    """
+
+    ATTRIBUTE = "_component"
+
+    def __get__(self, node_template: Optional["NodeTemplate"],
+                owner: Optional[type] = None) -> Any:
+        """Get node template component, load it if it's not loaded yet.
+
+        Args:
+            node_template (Optional[NodeTemplate]): Node template, None for class access
+            owner (Optional[type], optional): Node template class. Defaults to None.
+
+        Returns:
+            Any: Component, the descriptor itself for class access
+
+        """
+        if node_template is None:
+            return self
+        component: Optional["Component"] = node_template.__dict__.get(self.ATTRIBUTE)
+        if component is None and node_template.component_loader is not None:
+            component = node_template.component_loader()
+            node_template.__dict__[self.ATTRIBUTE] = component
+        return component
+
+    def __set__(self, node_template: "NodeTemplate", component: Any) -> None:
+        """Set node template component.
+
+        Args:
+            node_template (NodeTemplate): Node template
+            component (Any): Component, the descriptor itself (dataclass default)
+                for no component
+
+        """
+        node_template.__dict__[self.ATTRIBUTE] = None if component is self else component
+
+
 @dataclass
 class NodeTemplate:  # pylint: disable=too-many-instance-attributes
     """Node template dataclass.
 
-    Base class for Vnf, Pnf and Network classes.
+    Base class for Vnf, Pnf and Network classes. Node templates of the service
+        are built from its model, their `component` is loaded from SDC only
+        if it's used (e.g. to get node template `properties`).
     """
 
     name: str
@@ -65,7 +116,9 @@ class NodeTemplate:  # pylint: disable=too-many-instance-attributes
     model_version: str
     model_customization_id: str
     model_instance_name: str
-    component: "Component"
+    component: Optional["Component"] = field(default=LazyComponent(), repr=False, compare=False)
+    component_loader: Optional[Callable[[], "Component"]] = field(default=None, repr=False,
+                                                                   compare=False)
 
     @property
     def properties(self) -> Iterator["Property"]:
@@ -128,6 +181,7 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
     """
 
     SERVICE_PATH = "services"
+    ONBOARDED_STATUS = const.DISTRIBUTED
 
     def __init__(self, name: Optional[str] = None,  # pylint: disable=too-many-arguments
                  version: Optional[str] = None,
@@ -179,11 +233,43 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
         self._resource_type: str = "services"
         self._tosca_model: Optional[bytes] = None
         self._tosca_template: Optional[str] = None
+        self._model: Optional[ServiceModel] = None
         self._vnfs: Optional[list] = None
         self._pnfs: Optional[list] = None
         self._networks: Optional[list] = None
         self._vf_modules: Optional[list] = None
 
+    @classmethod
+    def from_model(cls, model: ServiceModel, distributed: bool = True) -> "Service":
+        """Create service from its model snapshot.
+
+        Service name, model identifiers, instantiation type and node templates
+            are taken from the model, so the service can be used to instantiate
+            it with SO (e.g. from a model saved with `ServiceModel.save`) without
+            any SDC request. SDC components of its node templates are loaded
+            only if they're used.
+
+        Args:
+            model (ServiceModel): Service model
+            distributed (bool, optional): Flag to determine if service is distributed.
+                Defaults to True.
+
+        Returns:
+            Service: Service with given model
+
+        """
+        service: "Service" = cls(name=model.name)
+        service.identifier = model.model_version_id
+        service.unique_uuid = model.model_invariant_id
+        service._model = model  # pylint: disable=protected-access
+        if model.instantiation_type:
+            service._instantiation_type = ServiceInstantiationType(  # pylint: disable=protected-access
+                model.instantiation_type)
+        service._distributed = distributed  # pylint: disable=protected-access
+        if distributed:
+            service.status = const.DISTRIBUTED
+        return service
+
     @classmethod
     def get_by_unique_uuid(cls, unique_uuid: str) -> "Service":
         """Get the service model using unique uuid.
@@ -195,10 +281,9 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
             ResourceNotFound: No service with given unique_uuid exists
 
         """
-        services: List["Service"] = cls.get_all()
-        for service in services:
-            if service.unique_uuid == unique_uuid:
-                return service
+        service: Optional["Service"] = cls.find_in_catalog("unique_uuid", unique_uuid)
+        if service is not None:
+            return service
         raise ResourceNotFound("Service with given unique uuid doesn't exist")
 
     @classmethod
@@ -215,12 +300,21 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
             ResourceNotFound: Service with given identifier does not exist
 
         """
-        services: List["Service"] = cls.get_all()
-        for service in services:
-            if service.identifier == identifier:
-                return service
+        service: Optional["Service"] = cls.find_in_catalog("identifier", identifier)
+        if service is not None:
+            return service
         raise ResourceNotFound("Service with given identifier doesn't exist")
 
+    @property
+    def onboarding_dependencies(self) -> List[SdcOnboardable]:
+        """Objects which have to be onboarded before this one.
+
+        Returns:
+            List[SdcOnboardable]: Service resources
+
+        """
+        return list(self.resources)
+
     def onboard(self) -> None:
         """Onboard the Service in SDC.
 
@@ -238,8 +332,9 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
             if not any([self.resources, self._properties_to_add]):
                 raise ParameterError("No resources nor properties were given")
             self.declare_resources_and_properties()
-            self.checkin()
-            time.sleep(self._time_wait)
+            with POLLING_METRICS.measure():
+                self.checkin()
+            self._wait_for_status_change(const.DRAFT)
             self.onboard()
         elif self.status == const.CHECKED_IN:
             self._certify_onboard_step()
@@ -275,38 +370,94 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
     def tosca_template(self) -> str:
         """Service tosca template file.
 
-        Get tosca template from service tosca model bytes.
+        Get tosca template from service tosca model bytes, if they are already loaded.
+            Otherwise the model is streamed into a temporary file and only the service
+            template is extracted from it, so the whole CSAR is never held in memory.
+            If CSAR cache is configured (SDC_CSAR_CACHE_DIR setting) parsed template
+            and CSAR of certified service are read from and stored in it.
 
         Returns:
             str: Tosca template file
 
         """
-        if not self._tosca_template and self.tosca_model:
-            self._unzip_csar_file(BytesIO(self.tosca_model),
-                                  self._load_tosca_template)
+        if not self._tosca_template:
+            cache: Optional[CsarCache] = self._csar_cache()
+            if cache:
+                self._tosca_template = cache.get_template(self.identifier, self.version)
+            if not self._tosca_template:
+                if self._tosca_model:
+                    self._unzip_csar_file(BytesIO(self._tosca_model),
+                                          self._load_tosca_template)
+                else:
+                    self._unzip_streamed_csar(cache, self._load_tosca_template)
+                if cache and self._tosca_template:
+                    cache.put_template(self.identifier, self.version, self._tosca_template)
         return self._tosca_template
 
+    def _csar_cache(self) -> Optional[CsarCache]:
+        """Get CSAR cache for the service model.
+
+        Model of the service which isn't certified yet changes under the same
+            UUID and version, so it's not cached.
+
+        Returns:
+            Optional[CsarCache]: CSAR cache, None if it's not configured or
+                service isn't certified
+
+        """
+        cache: Optional[CsarCache] = CsarCache.from_settings()
+        if cache is None or self.status not in (const.CERTIFIED, const.DISTRIBUTED):
+            return None
+        return cache
+
     @property
     def tosca_model(self) -> bytes:
         """Service's tosca model file.
 
-        Send request to get service TOSCA model,
+        Send request to get service TOSCA model. If CSAR cache is configured
+            (SDC_CSAR_CACHE_DIR setting) model of certified service is read from
+            and stored in it.
 
         Returns:
             bytes: TOSCA model file bytes
 
         """
         if not self._tosca_model:
-            url = f"{self._base_url()}/services/{self.identifier}/toscaModel"
-            headers = self.headers.copy()
-            headers["Accept"] = "application/octet-stream"
-            self._tosca_model = self.send_message(
-                "GET",
-                f"Download Tosca Model for {self.name}",
-                url,
-                headers=headers).content
+            cache: Optional[CsarCache] = self._csar_cache()
+            if cache:
+                self._tosca_model = cache.get_csar(self.identifier, self.version)
+            if not self._tosca_model:
+                url = f"{self._base_url()}/services/{self.identifier}/toscaModel"
+                headers = self.headers.copy()
+                headers["Accept"] = "application/octet-stream"
+                self._tosca_model = self.send_message(
+                    "GET",
+                    f"Download Tosca Model for {self.name}",
+                    url,
+                    headers=headers).content
+                if cache:
+                    cache.put_csar(self.identifier, self.version, self._tosca_model)
         return self._tosca_model
 
+    @property
+    def model(self) -> ServiceModel:
+        """Service model snapshot.
+
+        Built once from the service TOSCA template, so node templates, VF modules,
+            inputs and their model identifiers are read without any other
+            SDC request. Only the template sections used by the model are loaded,
+            unless the whole template is already loaded. Service `vnfs`, `pnfs`
+            and `networks` used by SO instantiation are built from it. It can be
+            saved and used to create the service without SDC (see `from_model`).
+
+        Returns:
+            ServiceModel: Service model
+
+        """
+        if self._model is None:
+            self._model = ServiceModel.from_template(self._load_model_template() or {})
+        return self._model
+
     def create_node_template(self,
                              node_template_type: Type[NodeTemplate],
                              component: "Component") -> NodeTemplate:
@@ -364,13 +515,97 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
                     ))
         return node_template
 
+    def _get_component_by_customization_uuid(self, customization_uuid: str) -> "Component":
+        """Get service component with given customization UUID.
+
+        Args:
+            customization_uuid (str): Component customization UUID
+
+        Raises:
+            ResourceNotFound: Service has no component with given customization UUID
+
+        Returns:
+            Component: Service component
+
+        """
+        for component in self.components:
+            if component.customization_uuid == customization_uuid:
+                return component
+        raise ResourceNotFound(f"Service {self.name} has no component with "
+                               f"{customization_uuid} customization UUID")
+
+    def _node_template_from_model(self,
+                                  node_template_type: Type[NodeTemplate],
+                                  model_node_template: ModelNodeTemplate) -> NodeTemplate:
+        """Create a node template type object from the service model node template.
+
+        Model identifiers of the node template and its vf modules are taken from
+            the model, the SDC component is loaded only if it's used. Vf modules with
+            "vf_module_label" property equal to "base_template_dummy_ignore" are
+            ignored, as in `create_node_template`.
+
+        Args:
+            node_template_type (Type[NodeTemplate]): Node template class type
+            model_node_template (ModelNodeTemplate): Service model node template
+
+        Returns:
+            NodeTemplate: Node template object created from the model
+
+        """
+        node_template: NodeTemplate = node_template_type(
+            name=model_node_template.name,
+            node_template_type=model_node_template.node_type,
+            model_name=model_node_template.model_name,
+            model_version_id=model_node_template.model_version_id,
+            model_invariant_id=model_node_template.model_invariant_id,
+            model_version=model_node_template.model_version,
+            model_customization_id=model_node_template.model_customization_id,
+            model_instance_name=self.name,
+            component_loader=partial(self._get_component_by_customization_uuid,
+                                     model_node_template.model_customization_id)
+        )
+        if node_template_type is Vnf:
+            for group in model_node_template.groups:
+                if group.properties.get("vf_module_label") == "base_template_dummy_ignore":
+                    continue
+                node_template.vf_modules.append(VfModule(
+                    name=group.name,
+                    group_type=group.group_type,
+                    model_name=group.model_name,
+                    model_version_id=group.model_version_id,
+                    model_invariant_uuid=group.model_invariant_id,
+                    model_version=group.model_version,
+                    model_customization_id=group.model_customization_id,
+                    properties=(
+                        Property(name=name, property_type=tosca_type(value), value=value)
+                        for name, value in group.properties.items() if value
+                    )
+                ))
+        return node_template
+
+    def _node_templates(self,
+                        node_template_type: Type[NodeTemplate],
+                        origin_type: str) -> Iterator[NodeTemplate]:
+        """Create node template type objects of the model node templates with given origin type.
+
+        Args:
+            node_template_type (Type[NodeTemplate]): Node template class type
+            origin_type (str): Node templates origin type ("VF", "PNF" or "VL")
+
+        Yields:
+            NodeTemplate: Node template object created from the model
+
+        """
+        for model_node_template in self.model.node_templates:
+            if model_node_template.origin_type == origin_type:
+                yield self._node_template_from_model(node_template_type, model_node_template)
+
     def __has_component_type(self, origin_type: str) -> bool:
-        """Check if any of Service's component type is provided origin type.
+        """Check if any of Service's node templates type is provided origin type.
 
         In template generation is checked if Service has some types of components,
-            based on that blocks are added to the request template. It's not
-            the best option to get all components to check if at least one with
-            given type exists for conditional statement.
+            based on that blocks are added to the request template. Service model
+            is used, so no SDC components are requested for it.
 
         Args:
             origin_type (str): Type to check if any component exists.
@@ -380,7 +615,8 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
                 False otherwise
 
         """
-        return any((component.origin_type == origin_type for component in self.components))
+        return any(node_template.origin_type == origin_type
+                   for node_template in self.model.node_templates)
 
     @property
     def has_vnfs(self) -> bool:
@@ -401,7 +637,7 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
     def vnfs(self) -> Iterator[Vnf]:
         """Service Vnfs.
 
-        Load VNFs from components generator.
+        Load VNFs from the service model node templates.
         It creates a generator of the vf modules as well, but without
         vf modules which has "vf_module_label" property value equal
         to "base_template_dummy_ignore".
@@ -410,37 +646,31 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
             Iterator[Vnf]: Vnf objects iterator
 
         """
-        for component in self.components:
-            if component.origin_type == "VF":
-                yield self.create_node_template(Vnf, component)
+        return self._node_templates(Vnf, "VF")
 
     @property
     def pnfs(self) -> Iterator[Pnf]:
         """Service Pnfs.
 
-        Load PNFS from components generator.
+        Load PNFS from the service model node templates.
 
         Returns:
             Iterator[Pnf]: Pnf objects generator
 
         """
-        for component in self.components:
-            if component.origin_type == "PNF":
-                yield self.create_node_template(Pnf, component)
+        return self._node_templates(Pnf, "PNF")
 
     @property
     def networks(self) -> Iterator[Network]:
         """Service networks.
 
-        Load networks from service's components generator.
+        Load networks from the service model node templates.
 
         Returns:
             Iterator[Network]: Network objects generator
 
         """
-        for component in self.components:
-            if component.origin_type == "VL":
-                yield self.create_node_template(Network, component)
+        return self._node_templates(Network, "VL")
 
     @property
     def deployment_artifacts_url(self) -> str:
@@ -561,8 +791,7 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
             self.add_resource(resource)
         for property_to_add in self._properties_to_add:
             self.add_property(property_to_add)
-        for input_to_add in self._inputs_to_add:
-            self.declare_input(input_to_add)
+        self.declare_inputs(self._inputs_to_add)
 
     def checkin(self) -> None:
         """Checkin Service."""
@@ -607,28 +836,119 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
                                        const.DISTRIBUTE,
                                        headers=headers)
 
-    def get_tosca(self, paths) -> None:
-        """Get Service tosca files and save it."""
+    def _download_tosca_model(self, path: Union[str, os.PathLike],
+                              checksum: Optional[str] = None) -> bool:
+        """Stream service TOSCA model into a file.
+
+        Args:
+            path (Union[str, os.PathLike]): CSAR file path
+            checksum (Optional[str], optional): Expected SHA-256 hex digest of the CSAR.
+                Defaults to None, so it's not verified.
+
+        Raises:
+            ValidationError: CSAR checksum doesn't match the expected one
+
+        Returns:
+            bool: True if model was downloaded, False if there was no response
+
+        """
         url = f"{self._base_url()}/services/{self.identifier}/toscaModel"
         headers = self.headers.copy()
         headers["Accept"] = "application/octet-stream"
-        result = self.send_message("GET",
-                                   f"Download Tosca Model for {self.name}",
-                                   url,
-                                   headers=headers)
-        if result:
-            self._create_tosca_file(paths, result)
-
-    def _create_tosca_file(self, paths, result: Response) -> None:
-        """Create Service Tosca files from HTTP response."""
-        csar_filename = f"service-{self.name}-csar.csar"
-        makedirs(paths, exist_ok=True)
-        with open((paths + csar_filename), 'wb') as csar_file:
-            for chunk in result.iter_content(chunk_size=128):
-                csar_file.write(chunk)
+        result: Optional[Response] = self.send_message("GET",
+                                                       f"Download Tosca Model for {self.name}",
+                                                       url,
+                                                       headers=headers,
+                                                       stream=True)
+        if not result:
+            return False
+        with result:
+            download_to_file(result, path, checksum)
+        return True
+
+    def _unzip_streamed_csar(self,
+                             cache: Optional[CsarCache],
+                             function: Callable[[str, TextIOWrapper], None]) -> None:
+        """Perform an action on the service template, without loading the CSAR into memory.
+
+        Cached CSAR is used if there is one. Otherwise the model is downloaded into
+            a temporary file, which is stored in cache (if it's configured).
+
+        Args:
+            cache (Optional[CsarCache]): CSAR cache
+            function (Callable[[str, TextIOWrapper], None]): Action on the service template
+
+        """
+        csar_path: Optional[Path.Path] = cache.csar_path(self.identifier,
+                                                    self.version) if cache else None
+        if csar_path:
+            self._unzip_csar_file(str(csar_path), function)
+            return
+        with TemporaryDirectory() as tmp_dir:
+            csar_path = Path.Path(tmp_dir) / "service.csar"
+            if not self._download_tosca_model(csar_path):
+                return
+            self._unzip_csar_file(str(csar_path), function)
+            if cache:
+                cache.put_csar_file(self.identifier, self.version, csar_path)
+
+    def _load_model_template(self) -> Optional[Dict[str, Any]]:
+        """Load service template sections used by service model.
+
+        Whole template is used if it's already loaded or cached.
+
+        Returns:
+            Optional[Dict[str, Any]]: Service template, None if model couldn't
+                be downloaded
+
+        """
+        if self._tosca_template:
+            return self._tosca_template
+        cache: Optional[CsarCache] = self._csar_cache()
+        template: Optional[Dict[str, Any]] = cache.get_template(
+            self.identifier, self.version) if cache else None
+        if template:
+            return template
+
+        def load_model_sections(_service_template: str, template_file: TextIOWrapper) -> None:
+            nonlocal template
+            template = load_template(template_file.read(), MODEL_TEMPLATE_SECTIONS)
+
+        if self._tosca_model:
+            self._unzip_csar_file(BytesIO(self._tosca_model), load_model_sections)
+        else:
+            self._unzip_streamed_csar(cache, load_model_sections)
+        return template
+
+    def get_tosca(self, paths,
+                  entries: Optional[Iterable[str]] = None,
+                  checksum: Optional[str] = None) -> None:
+        """Get Service tosca files and save it.
+
+        CSAR is streamed into `service-{name}-csar.csar` file chunk by chunk. Then only
+            the service template is extracted from it into the working directory or,
+            if `entries` are given, only these entries are extracted into `paths`.
+
+        Args:
+            paths: Directory path prefix of the CSAR file
+            entries (Optional[Iterable[str]], optional): Names of CSAR entries to extract.
+                Defaults to None, so the service template is extracted.
+            checksum (Optional[str], optional): Expected SHA-256 hex digest of the CSAR.
+                Defaults to None, so it's not verified.
+
+        Raises:
+            ValidationError: CSAR checksum doesn't match the expected one,
+                CSAR has no service template or no given entries
+
+        """
+        csar_path: str = paths + f"service-{self.name}-csar.csar"
+        if not self._download_tosca_model(csar_path, checksum):
+            return
         try:
-            self._unzip_csar_file(paths + csar_filename,
-                                  self._write_csar_file)
+            if entries is None:
+                self._unzip_csar_file(csar_path, self._write_csar_file)
+            else:
+                extract_entries(csar_path, entries, paths)
         except BadZipFile as exc:
             self._logger.exception(exc)
 
@@ -726,6 +1046,20 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
         self.category_name = obj.category_name
         self.role = obj.role
 
+    def _catalog_values(self, create_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Get values of the `get_all` result entry of the created service.
+
+        Creation response has list of categories instead of the category name.
+
+        Args:
+            create_result (Dict[str, Any]): the result of the creation request
+
+        Returns:
+            Dict[str, Any]: Values to import the service from
+
+        """
+        return {**create_result, "category": create_result["categories"][0]["name"]}
+
     def _verify_distribute_to_sdc(self, desired_status: str,
                                   desired_action: str, **kwargs) -> None:
         self._verify_action_to_sdc(desired_status, desired_action,
@@ -785,21 +1119,8 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
             ValidationError: CSAR file has no service template
 
         """
-        folder = "Definitions"
-        prefix = "service-"
-        suffix = "-template.yml"
         with ZipFile(zip_file) as myzip:
-            service_template = None
-            for name in myzip.namelist():
-                if (name[-13:] == suffix
-                        and name[:20] == f"{folder}/{prefix}"):
-                    service_template = name
-
-            if not service_template:
-                msg = (f"CSAR file has no service template. "
-                       f"Valid path: {folder}/{prefix}*{suffix}")
-                raise ValidationError(msg)
-
+            service_template: str = find_service_template(myzip)
             with myzip.open(service_template) as template_file:
                 function(service_template, template_file)
 
@@ -815,7 +1136,7 @@ class Service(SdcResource):  # pylint: disable=too-many-instance-attributes, too
     def _load_tosca_template(self, _service_template: str,
                              template_file: TextIOWrapper) -> None:
         """Load Tosca template."""
-        self._tosca_template = yaml.safe_load(template_file.read())
+        self._tosca_template = load_template(template_file.read())
 
     @classmethod
     def _sdc_path(cls) -> None:
@@ -13,9 +13,10 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
 
 from onapsdk.exceptions import ParameterError
+from onapsdk.sdc import SdcOnboardable
 from onapsdk.sdc.properties import ComponentProperty, NestedInput, Property
 from onapsdk.sdc.sdc_resource import SdcResource
 from onapsdk.sdc.vendor import Vendor
@@ -93,6 +94,15 @@ class Vf(SdcResource):
             self._vendor = self.vsp.vendor
         return self._vendor
 
+    @property
+    def onboarding_dependencies(self) -> List[SdcOnboardable]:
+        """Objects which have to be onboarded before this one.
+
+        Returns:
+            List[SdcOnboardable]: Vf vsp and vendor, if they were given
+
+        """
+        return [dependency for dependency in (self.vsp, self._vendor) if dependency]
 
     def create(self) -> None:
         """Create the Vf in SDC if not already existing.
@@ -160,7 +170,44 @@ class Vf(SdcResource):
                               f"Declare new input for {input_to_declare.name} property",
                               f"{self.resource_inputs_url}/create/inputs",
                               data=jinja_env().get_template(\
-                                  "component_declare_input.json.j2").\
+                                  "component_declare_inputs.json.j2").\
                                       render(\
                                           component=input_to_declare.component,
-                                          property=input_to_declare))
+                                          properties=[input_to_declare]))
+            self._inputs_index = None
+
+    def declare_inputs(self,
+                       inputs_to_declare: Iterable[Union[Property, NestedInput,
+                                                         ComponentProperty]]) -> None:
+        """Declare inputs for many properties, nested inputs or component properties.
+
+        Component properties are declared with one request per component.
+
+        Args:
+            inputs_to_declare (Iterable[Union[Property, NestedInput, ComponentProperty]]):
+                Properties or ComponentProperties to declare inputs or NestedInput objects
+
+        Raises:
+            ParameterError: if any of given properties is not SDC resource property
+
+        """
+        other_inputs: List[Union[Property, NestedInput]] = []
+        component_properties: Dict[str, List[ComponentProperty]] = {}
+        for input_to_declare in inputs_to_declare:
+            if isinstance(input_to_declare, ComponentProperty):
+                component_properties.setdefault(input_to_declare.component.unique_id,
+                                                []).append(input_to_declare)
+            else:
+                other_inputs.append(input_to_declare)
+        super().declare_inputs(other_inputs)
+        for properties in component_properties.values():
+            component = properties[0].component
+            self.send_message("POST",
+                              f"Declare {len(properties)} new inputs for {component.name} "
+                              "component properties",
+                              f"{self.resource_inputs_url}/create/inputs",
+                              data=jinja_env().get_template(
+                                  "component_declare_inputs.json.j2").render(
+                                      component=component,
+                                      properties=properties))
+        self._inputs_index = None
@@ -17,12 +17,15 @@ from typing import Any, Optional
 from typing import BinaryIO
 from typing import Callable
 from typing import Dict
+from typing import List
 
 from onapsdk.exceptions import ParameterError
+from onapsdk.sdc import SdcOnboardable
 from onapsdk.sdc.sdc_element import SdcElement
 from onapsdk.sdc.vendor import Vendor
 import onapsdk.constants as const
 from onapsdk.utils.headers_creator import headers_sdc_creator
+from onapsdk.utils.multipart_upload import MultipartUpload, ProgressCallback, send_with_retries
 
 # Hard to do fewer attributes and still mapping SDC VSP object.
 class Vsp(SdcElement): # pylint: disable=too-many-instance-attributes
@@ -91,6 +94,16 @@ class Vsp(SdcElement): # pylint: disable=too-many-instance-attributes
         elif status == const.CERTIFIED:
             self.create_csar()
 
+    @property
+    def onboarding_dependencies(self) -> List[SdcOnboardable]:
+        """Objects which have to be onboarded before this one.
+
+        Returns:
+            List[SdcOnboardable]: Vsp vendor, if it was given
+
+        """
+        return [self._vendor] if self._vendor else []
+
     def create(self) -> None:
         """Create the Vsp in SDC if not already existing."""
         if self.vendor:
@@ -98,31 +111,43 @@ class Vsp(SdcElement): # pylint: disable=too-many-instance-attributes
                          name=self.name,
                          vendor=self.vendor)
 
-    def upload_package(self, package_to_upload: BinaryIO) -> None:
+    def upload_package(self, package_to_upload: BinaryIO,
+                       progress_callback: Optional[ProgressCallback] = None) -> None:
         """
         Upload given zip file into SDC as artifacts for this Vsp.
 
+        File is streamed from disk and upload is retried on transient failures.
+
         Args:
             package_to_upload (BinaryIO): the zip file to upload
+            progress_callback (ProgressCallback, optional): function called with
+                upload progress after each sent chunk. Defaults to None.
 
         """
         self._action("upload package",
                      const.DRAFT,
                      self._upload_action,
-                     package_to_upload=package_to_upload)
+                     package_to_upload=package_to_upload,
+                     progress_callback=progress_callback)
 
-    def update_package(self, package_to_upload: BinaryIO) -> None:
+    def update_package(self, package_to_upload: BinaryIO,
+                       progress_callback: Optional[ProgressCallback] = None) -> None:
         """
         Upload given zip file into SDC as artifacts for this Vsp.
 
+        File is streamed from disk and upload is retried on transient failures.
+
         Args:
             package_to_upload (BinaryIO): the zip file to upload
+            progress_callback (ProgressCallback, optional): function called with
+                upload progress after each sent chunk. Defaults to None.
 
         """
         self._action("update package",
                      const.COMMITED,
                      self._upload_action,
-                     package_to_upload=package_to_upload)
+                     package_to_upload=package_to_upload,
+                     progress_callback=progress_callback)
 
     def validate(self) -> None:
         """Validate the artifacts uploaded."""
@@ -187,19 +212,21 @@ class Vsp(SdcElement): # pylint: disable=too-many-instance-attributes
             return self.send_message_json('GET', 'get item version', url)
         return {}
 
-    def _upload_action(self, package_to_upload: BinaryIO) -> None:
+    def _upload_action(self, package_to_upload: BinaryIO,
+                       progress_callback: Optional[ProgressCallback] = None) -> None:
         """Do upload for real."""
         url = (f"{self._base_url()}/{Vsp._sdc_path()}/{self._version_path()}/"
                "orchestration-template-candidate")
+        data = MultipartUpload("upload", package_to_upload,
+                               progress_callback=progress_callback)
         headers = self.headers.copy()
-        headers.pop("Content-Type")
+        headers["Content-Type"] = data.content_type
         headers["Accept-Encoding"] = "gzip, deflate"
-        data = {'upload': package_to_upload}
-        self.send_message('POST',
-                          'upload ZIP for Vsp',
-                          url,
-                          headers=headers,
-                          files=data)
+        send_with_retries(lambda: self.send_message('POST',
+                                                    'upload ZIP for Vsp',
+                                                    url,
+                                                    headers=headers,
+                                                    data=data))
 
     def _validate_action(self) -> None:
         """Do validate for real."""
@@ -343,6 +370,19 @@ class Vsp(SdcElement): # pylint: disable=too-many-instance-attributes
         vsp.vendor = Vendor(name=values['properties']['vendorName'])
         return vsp
 
+    def _catalog_values(self, create_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Get values of the `get_all` result entry of the created VSP.
+
+        Args:
+            create_result (Dict[str, Any]): the result of the creation request
+
+        Returns:
+            Dict[str, Any]: Values to import the VSP from
+
+        """
+        return {**super()._catalog_values(create_result),
+                "properties": {"vendorName": self.vendor.name}}
+
     def _really_submit(self) -> None:
         """Really submit the SDC Vf in order to enable it.
 
@@ -373,4 +413,5 @@ class Vsp(SdcElement): # pylint: disable=too-many-instance-attributes
                                    "creationMethod": "major",
                                    "description": "New VSP version"
                                }))
+        self._catalog_changed()
         self.load()
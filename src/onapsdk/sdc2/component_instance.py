@@ -12,9 +12,10 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-from typing import TYPE_CHECKING, Any, Dict, Optional, Iterable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Iterable, Tuple
 from urllib.parse import urljoin
 
+from onapsdk.exceptions import ResourceNotFound  # type: ignore
 from onapsdk.sdc2.sdc import SDC
 from onapsdk.utils.jinja import jinja_env  # type: ignore
 
@@ -25,7 +26,7 @@ if TYPE_CHECKING:
 class ComponentInstanceInput(SDC):  # pylint: disable=too-many-instance-attributes
     """Component instance input class."""
 
-    SET_INPUT_VALUE_TEMPLATE = "sdc2_component_instance_input_set_value.json.j2"
+    SET_INPUT_VALUE_TEMPLATE = "sdc2_component_instance_input_set_values.json.j2"
 
     def __init__(self,  # pylint: disable=too-many-locals too-many-arguments
                  component_instance: "ComponentInstance",
@@ -135,7 +136,8 @@ class ComponentInstanceInput(SDC):  # pylint: disable=too-many-instance-attribut
     def value(self, value: Any) -> None:
         """Component instance's input value setter.
 
-        Call an API to set a value of component instances' input
+        Call an API to set a value of component instances' input.
+            Component instance's inputs index is invalidated.
 
         Args:
             value (Any): Any value which is going to be set
@@ -149,11 +151,11 @@ class ComponentInstanceInput(SDC):  # pylint: disable=too-many-instance-attribut
                      f"{self.component_instance.sdc_resource.unique_id}/resourceInstance/"
                      f"{self.component_instance.unique_id}/inputs")),
             data=jinja_env().get_template(self.SET_INPUT_VALUE_TEMPLATE).render(
-                component_instance_input=self,
-                value=value
+                values=[(self, value)]
             )
         )
         self._value = value
+        self.component_instance.invalidate_inputs()
 
 
 class ComponentInstance(SDC):  # pylint: disable=too-many-instance-attributes
@@ -213,6 +215,7 @@ class ComponentInstance(SDC):  # pylint: disable=too-many-instance-attributes
         self.tosca_component_name: str = tosca_component_name
         self.unique_id: str = unique_id
         self.sdc_resource: "SDCResource" = sdc_resource
+        self._inputs_map: Optional[Dict[str, ComponentInstanceInput]] = None
 
     @classmethod
     def create_from_api_response(cls,
@@ -265,6 +268,26 @@ class ComponentInstance(SDC):  # pylint: disable=too-many-instance-attributes
         ):
             yield ComponentInstanceInput.create_from_api_response(input_data, self)
 
+    @property
+    def inputs_map(self) -> Dict[str, ComponentInstanceInput]:
+        """Component instance's inputs by their names.
+
+        Inputs are fetched once and kept until any of them is set,
+            see `invalidate_inputs`.
+
+        Returns:
+            Dict[str, ComponentInstanceInput]: Inputs by name
+
+        """
+        if self._inputs_map is None:
+            self._inputs_map = {component_instance_input.name: component_instance_input
+                                for component_instance_input in self.inputs}
+        return self._inputs_map
+
+    def invalidate_inputs(self) -> None:
+        """Drop inputs map, so inputs are fetched again on the next lookup."""
+        self._inputs_map = None
+
     def get_input_by_name(self, input_name: str) -> Optional[ComponentInstanceInput]:
         """Get component's input by it's name.
 
@@ -276,7 +299,40 @@ class ComponentInstance(SDC):  # pylint: disable=too-many-instance-attributes
                 None if no input with given name found
 
         """
-        for component_instance_input in self.inputs:
-            if component_instance_input.name == input_name:
-                return component_instance_input
-        return None
+        return self.inputs_map.get(input_name)
+
+    def set_input_values(self, values: Dict[str, Any]) -> None:
+        """Set values of many component instance's inputs in one request.
+
+        Only values which differ from the current ones are sent. Inputs map
+            is invalidated, so inputs are fetched again with new values.
+
+        Args:
+            values (Dict[str, Any]): Values by input name
+
+        Raises:
+            ResourceNotFound: Component instance has no input with given name
+
+        """
+        changed: List[Tuple[ComponentInstanceInput, Any]] = []
+        for input_name, value in values.items():
+            component_instance_input: Optional[ComponentInstanceInput] = \
+                self.get_input_by_name(input_name)
+            if component_instance_input is None:
+                raise ResourceNotFound(f"Component instance {self.name} has no {input_name} input")
+            if component_instance_input.value != value:
+                changed.append((component_instance_input, value))
+        if not changed:
+            return
+        self.send_message_json(
+            "POST",
+            f"Set values of {len(changed)} {self.sdc_resource.name} resource inputs",
+            urljoin(self.base_back_url,
+                    (f"sdc2/rest/v1/catalog/{self.sdc_resource.catalog_type()}/"
+                     f"{self.sdc_resource.unique_id}/resourceInstance/"
+                     f"{self.unique_id}/inputs")),
+            data=jinja_env().get_template(ComponentInstanceInput.SET_INPUT_VALUE_TEMPLATE).render(
+                values=changed
+            )
+        )
+        self.invalidate_inputs()
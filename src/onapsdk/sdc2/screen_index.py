@@ -0,0 +1,219 @@
+"""SDC catalog screen index module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from dataclasses import dataclass
+from itertools import chain
+from threading import RLock
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urljoin
+
+from onapsdk.configuration import settings  # type: ignore
+from onapsdk.sdc2.sdc import SDC, ResoureTypeEnum
+from onapsdk.utils.cache import TtlCache  # type: ignore
+
+ScreenKey = Tuple[str, str]
+
+
+def version_key(version: str) -> Tuple[int, ...]:
+    """Get a key to compare SDC versions numerically, so "10.0" is higher than "9.0".
+
+    Args:
+        version (str): SDC version, e.g. "1.0"
+
+    Returns:
+        Tuple[int, ...]: Version numbers
+
+    """
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+@dataclass(frozen=True)
+class ScreenIndexEntry:
+    """The latest version of SDC catalog resource."""
+
+    name: str
+    version: str
+    unique_id: Optional[str] = None
+
+
+class SdcScreenIndex(SDC):
+    """Index of the latest versions of SDC catalog resources by resource type and name.
+
+    Index is shared by all resource types: one catalog screen request lists
+        all of them. Archived resources are listed only if resource is not
+        found among the active ones. Listings are kept for
+        `SDC_CATALOG_CACHE_TTL` seconds and updated by local changes
+        (creation, lifecycle operations, archiving and deletion).
+    """
+
+    def __init__(self) -> None:
+        """Initialize screen index."""
+        super().__init__(name="SDC screen index")
+        self._lock: RLock = RLock()
+        # archived flag -> listing index
+        self._screens: TtlCache[Dict[ScreenKey, ScreenIndexEntry]] = \
+            TtlCache(settings.SDC_CATALOG_CACHE_TTL)
+
+    @staticmethod
+    def _add_entry(screen: Dict[ScreenKey, ScreenIndexEntry],
+                   key: ScreenKey,
+                   entry: ScreenIndexEntry) -> None:
+        """Add entry into listing index if it's newer than the indexed one.
+
+        Args:
+            screen (Dict[ScreenKey, ScreenIndexEntry]): Listing index
+            key (ScreenKey): Resource type and name
+            entry (ScreenIndexEntry): Resource entry
+
+        """
+        indexed: Optional[ScreenIndexEntry] = screen.get(key)
+        if indexed is None or version_key(entry.version) >= version_key(indexed.version):
+            screen[key] = entry
+
+    @classmethod
+    def build(cls, response: Dict[str, Any]) -> Dict[ScreenKey, ScreenIndexEntry]:
+        """Index catalog listing response.
+
+        Args:
+            response (Dict[str, Any]): Catalog screen or archive API response
+
+        Returns:
+            Dict[ScreenKey, ScreenIndexEntry]: Listing index
+
+        """
+        screen: Dict[ScreenKey, ScreenIndexEntry] = {}
+        rough_data_iterable: Iterable[Tuple[Optional[str], Dict[str, Any]]] = chain(
+            ((rough_data.get("resourceType"), rough_data)
+             for rough_data in response.get("resources", [])),
+            ((ResoureTypeEnum.SERVICE.value, rough_data)
+             for rough_data in response.get("services", []))
+        )
+        for resource_type, rough_data in rough_data_iterable:
+            if resource_type is None:
+                continue
+            cls._add_entry(screen,
+                           (resource_type, rough_data["name"]),
+                           ScreenIndexEntry(name=rough_data["name"],
+                                            version=rough_data["version"],
+                                            unique_id=rough_data.get("uniqueId")))
+        return screen
+
+    def _fetch(self, archived: bool) -> Dict[ScreenKey, ScreenIndexEntry]:
+        """Fetch and index catalog listing.
+
+        Args:
+            archived (bool): Flag to determine if archived or active resources
+                should be listed
+
+        Returns:
+            Dict[ScreenKey, ScreenIndexEntry]: Listing index
+
+        """
+        if archived:
+            return self.build(self.send_message_json(
+                "GET",
+                "Get archived SDC resources",
+                urljoin(self.base_back_url, self.ARCHIVE_ENDPOINT)
+            ))
+        return self.build(self.send_message_json(
+            "GET",
+            "Get active SDC resources",
+            urljoin(self.base_back_url, self.SCREEN_ENDPOINT)
+        ))
+
+    def _screen(self,
+                archived: bool,
+                refresh: bool = False) -> Tuple[Dict[ScreenKey, ScreenIndexEntry], bool]:
+        """Get listing index.
+
+        Args:
+            archived (bool): Flag to determine if archived or active resources
+                listing should be returned
+            refresh (bool, optional): Flag to determine if listing should be fetched
+                even if it's cached. Defaults to False.
+
+        Returns:
+            Tuple[Dict[ScreenKey, ScreenIndexEntry], bool]: Listing index and flag
+                which determines if it was fetched by that call
+
+        """
+        self._screens.ttl = settings.SDC_CATALOG_CACHE_TTL
+        if not refresh:
+            screen: Optional[Dict[ScreenKey, ScreenIndexEntry]] = self._screens.get(archived)
+            if screen is not None:
+                return screen, False
+        screen = self._fetch(archived)
+        self._screens.set(archived, screen)
+        return screen, True
+
+    def find(self, resource_type: ResoureTypeEnum, name: str) -> Optional[ScreenIndexEntry]:
+        """Find the latest version of resource.
+
+        Active resources are looked up first. If resource is not found in cached
+            active resources listing, it's fetched again, as resource could be
+            created by someone else. Archived resources are looked up at last.
+
+        Args:
+            resource_type (ResoureTypeEnum): Resource type
+            name (str): Resource name
+
+        Returns:
+            Optional[ScreenIndexEntry]: Resource entry, None if resource doesn't exist
+
+        """
+        key: ScreenKey = (resource_type.value, name)
+        active, fetched = self._screen(archived=False)
+        entry: Optional[ScreenIndexEntry] = active.get(key)
+        if entry is None and not fetched:
+            entry = self._screen(archived=False, refresh=True)[0].get(key)
+        if entry is None:
+            entry = self._screen(archived=True)[0].get(key)
+        return entry
+
+    def add(self, resource_type: ResoureTypeEnum, entry: ScreenIndexEntry) -> None:
+        """Add locally created or changed resource version into cached active listing.
+
+        Args:
+            resource_type (ResoureTypeEnum): Resource type
+            entry (ScreenIndexEntry): Resource entry
+
+        """
+        with self._lock:
+            active: Optional[Dict[ScreenKey, ScreenIndexEntry]] = self._screens.get(False)
+            if active is not None:
+                self._add_entry(active, (resource_type.value, entry.name), entry)
+
+    def remove(self, resource_type: ResoureTypeEnum, name: str, archived: bool = False) -> None:
+        """Remove locally deleted or archived resource from cached active listing.
+
+        Cached archived listing is dropped if resource was archived, so it's
+            fetched on the next archived resources lookup.
+
+        Args:
+            resource_type (ResoureTypeEnum): Resource type
+            name (str): Resource name
+            archived (bool, optional): Flag to determine if resource was archived.
+                Defaults to False.
+
+        """
+        with self._lock:
+            active: Optional[Dict[ScreenKey, ScreenIndexEntry]] = self._screens.get(False)
+            if active is not None:
+                active.pop((resource_type.value, name), None)
+            if archived:
+                self._screens.invalidate(True)
+
+    def invalidate(self) -> None:
+        """Drop cached listings."""
+        self._screens.invalidate()
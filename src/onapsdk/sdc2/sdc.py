@@ -14,10 +14,11 @@
 #   limitations under the License.from onapsdk.sdc2.sdc import ResoureTypeEnum
 from abc import abstractmethod, ABC
 from enum import Enum
-from typing import Any, Iterator, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from onapsdk.configuration import settings  # type: ignore
 from onapsdk.onap_service import OnapService  # type: ignore
+from onapsdk.utils.cache import TtlCache  # type: ignore
 from onapsdk.utils.headers_creator import headers_sdc_creator  # type: ignore
 
 
@@ -89,9 +90,86 @@ class SDC(OnapService, ABC):
         return False
 
 
+class CatalogIndex:  # pylint: disable=too-few-public-methods
+    """All catalog objects of a class, indexed by their attributes.
+
+    Index of an attribute is built on its first lookup.
+    """
+
+    def __init__(self, objects: Iterable["SDCCatalog"]) -> None:
+        """Initialize catalog index.
+
+        Args:
+            objects (Iterable[SDCCatalog]): Catalog objects
+
+        """
+        self.objects: List["SDCCatalog"] = list(objects)
+        self._indexes: Dict[str, Dict[Any, "SDCCatalog"]] = {}
+
+    def find(self, attribute: str, value: Any) -> Optional["SDCCatalog"]:
+        """Find object with given attribute value.
+
+        Args:
+            attribute (str): Object attribute name
+            value (Any): Attribute value
+
+        Returns:
+            Optional[SDCCatalog]: Found object, None if there is no object with given value
+
+        """
+        if attribute not in self._indexes:
+            self._indexes[attribute] = {getattr(obj, attribute): obj for obj in self.objects}
+        return self._indexes[attribute].get(value)
+
+
 class SDCCatalog(SDC, ABC):
     """SDC Catalog abstract class."""
 
+    # Catalog indexes by class, shared by the whole process
+    _catalog_indexes: TtlCache[CatalogIndex] = TtlCache(settings.SDC_CATALOG_CACHE_TTL)
+
+    @classmethod
+    def catalog_index(cls, refresh: bool = False) -> CatalogIndex:
+        """Get index of all objects of given class.
+
+        Index is kept for `SDC_CATALOG_CACHE_TTL` seconds. If that setting
+            is 0 all objects are fetched on each call.
+
+        Args:
+            refresh (bool, optional): Flag to determine if objects should be
+                fetched again. Defaults to False.
+
+        Returns:
+            CatalogIndex: Catalog index
+
+        """
+        if not settings.SDC_CATALOG_CACHE_TTL:
+            return CatalogIndex(cls.get_all())
+        SDCCatalog._catalog_indexes.ttl = settings.SDC_CATALOG_CACHE_TTL
+        if refresh:
+            SDCCatalog._catalog_indexes.invalidate(cls)
+        return SDCCatalog._catalog_indexes.get_or_set(cls, lambda: CatalogIndex(cls.get_all()))
+
+    @classmethod
+    def find_in_catalog(cls, attribute: str, value: Any) -> Optional["SDCCatalog"]:
+        """Find object of given class with given attribute value.
+
+        If object is not found in the kept index, objects are fetched again once,
+            as it could be created after index was built.
+
+        Args:
+            attribute (str): Object attribute name
+            value (Any): Attribute value
+
+        Returns:
+            Optional[SDCCatalog]: Found object, None if there is no object with given value
+
+        """
+        found: Optional[SDCCatalog] = cls.catalog_index().find(attribute, value)
+        if found is None and settings.SDC_CATALOG_CACHE_TTL:
+            found = cls.catalog_index(refresh=True).find(attribute, value)
+        return found
+
     @classmethod
     @abstractmethod
     def get_all(cls) -> List["SDCCatalog"]:
@@ -14,7 +14,7 @@
 #   limitations under the License.from onapsdk.sdc2.sdc import ResoureTypeEnum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
 from onapsdk.exceptions import ResourceNotFound  # type: ignore
@@ -76,6 +76,9 @@ class SdcCategory(SDCCatalog, ABC):  # pylint: disable=too-many-instance-attribu
         self.category_type: Optional[str] = category_type
         self.version: Optional[str] = version
         self.display_name: Optional[str] = display_name
+        # Subcategories list and its index by subcategory name
+        self._subcategories_index: Optional[Tuple[List[SdcSubCategory],
+                                                  Dict[str, SdcSubCategory]]] = None
 
     def __repr__(self) -> str:
         """SDC resource description.
@@ -105,6 +108,8 @@ class SdcCategory(SDCCatalog, ABC):  # pylint: disable=too-many-instance-attribu
     def get_by_uniqe_id(cls, unique_id: str) -> "SdcCategory":
         """Get category by it's unique ID.
 
+        Categories are indexed once for all lookups, see `catalog_index`.
+
         Args:
             unique_id (str): Unique ID of a category
 
@@ -115,15 +120,17 @@ class SdcCategory(SDCCatalog, ABC):  # pylint: disable=too-many-instance-attribu
             SdcCategory: SDC category with given ID
 
         """
-        for category in cls.get_all():
-            if category.unique_id == unique_id:
-                return category
+        category: Optional[SdcCategory] = cls.find_in_catalog("unique_id", unique_id)
+        if category is not None:
+            return category
         raise ResourceNotFound(f"{cls.__name__} with unique id {unique_id} not found")
 
     @classmethod
     def get_by_name(cls, name: str) -> "SdcCategory":
         """Get category by name.
 
+        Categories are indexed once for all lookups, see `catalog_index`.
+
         Args:
             name (str): Category name
 
@@ -134,9 +141,9 @@ class SdcCategory(SDCCatalog, ABC):  # pylint: disable=too-many-instance-attribu
             SdcCategory: SDC category with given name
 
         """
-        for category in cls.get_all():
-            if category.name == name:
-                return category
+        category: Optional[SdcCategory] = cls.find_in_catalog("name", name)
+        if category is not None:
+            return category
         raise ResourceNotFound(f"{cls.__name__} with name {name} not found")
 
     @classmethod
@@ -209,10 +216,12 @@ class SdcCategory(SDCCatalog, ABC):  # pylint: disable=too-many-instance-attribu
         """
         if not self.subcategories:
             return None
-        for subcategory in self.subcategories:
-            if subcategory.name == subcategory_name:
-                return subcategory
-        return None
+        if self._subcategories_index is None or \
+                self._subcategories_index[0] is not self.subcategories:
+            self._subcategories_index = (self.subcategories,
+                                         {subcategory.name: subcategory
+                                          for subcategory in self.subcategories})
+        return self._subcategories_index[1].get(subcategory_name)
 
 
 class ServiceCategory(SdcCategory):
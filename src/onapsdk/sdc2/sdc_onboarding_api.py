@@ -1,7 +1,7 @@
 """SDC onboarding API module."""
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Iterator, Optional, Type, TypeVar
+from typing import Dict, Iterator, Optional, Tuple, Type, TypeVar
 from urllib.parse import urljoin
 
 from onapsdk.configuration import settings
@@ -141,6 +141,8 @@ class SdcOnboardingApiItem(SdcOnboardingApi, ABC):
     """Abstract SDC onboarding API Item class."""
 
     subclass_registry: dict = {}
+    # Item IDs by item type and name, filled by every item created from API response
+    _item_ids: Dict[Tuple[SdcOnboardingApiItemTypeEnum, str], str] = {}
     sdc_onboarding_api_item_action_template: str = "sdc2_action_onboarding_api_item.json.j2"
     sdc_onboarding_api_item_submit_template: str = "sdc2_action_onboarding_api_item_submit.json.j2"
 
@@ -191,6 +193,9 @@ class SdcOnboardingApiItem(SdcOnboardingApi, ABC):
                              api_response: dict) -> SdcOnboardingApiItemT:
         """Create an item from response.
 
+        Item ID is stored in the name index, so `get_by_name` can get
+            that item by its ID later.
+
         Args:
             api_response (dict): Item API response object.
 
@@ -199,6 +204,7 @@ class SdcOnboardingApiItem(SdcOnboardingApi, ABC):
 
         """
         subclass: Type[SdcOnboardingApiItemT] = cls.subclass_registry[cls.get_item_type()]
+        cls._item_ids[(cls.get_item_type(), api_response["name"])] = api_response["id"]
         return subclass(
             api_response["name"],
             api_response["type"],
@@ -306,6 +312,10 @@ class SdcOnboardingApiItem(SdcOnboardingApi, ABC):
     def get_by_name(cls: Type[SdcOnboardingApiItemT], name: str) -> SdcOnboardingApiItemT:
         """Get an item by name.
 
+        If item ID is known from the name index, only that item is requested.
+            All items are listed if it's not known or the indexed item was
+            deleted or renamed in the meantime.
+
         Args:
             name (str): Name to get an item by.
 
@@ -317,15 +327,28 @@ class SdcOnboardingApiItem(SdcOnboardingApi, ABC):
 
         """
         subclass: Type[SdcOnboardingApiItemT] = cls.subclass_registry[cls.get_item_type()]
+        index_key: Tuple[SdcOnboardingApiItemTypeEnum, str] = (cls.get_item_type(), name)
+        item_id: Optional[str] = cls._item_ids.pop(index_key, None)
+        if item_id is not None:
+            try:
+                indexed_item: SdcOnboardingApiItemT = subclass.create_from_response(
+                    subclass.get_raw_item(item_id))
+                if indexed_item.name == name:
+                    return indexed_item
+            except ResourceNotFound:
+                cls._logger.debug("Indexed %s %s item not found", name, cls.get_item_type())
         for item in subclass.get_all():
             if item.name == name:
                 return item
         raise ResourceNotFound(f"{subclass.get_item_type()} with {name} name not found")
 
     def update(self) -> None:
-        """Update an item status."""
-        updated_version: SdcOnboardingApiItem = self.get_by_name(self.name)
-        self.status = updated_version.status
+        """Update an item status.
+
+        Item is requested by its ID, so other items are not listed.
+
+        """
+        self.status = SdcOnboardingApiItemStatus(self.get_raw_item(self.item_id)["status"])
 
     def _action(self, item_action: SdcOnboardingApiItemAction) -> None:
         """Perform an item action.
@@ -398,3 +421,4 @@ class SdcOnboardingApiItem(SdcOnboardingApi, ABC):
             f"Delete {self.name} {self.get_item_type()}",
             self.url
         )
+        self._item_ids.pop((self.get_item_type(), self.name), None)
@@ -13,21 +13,24 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.from onapsdk.sdc2.sdc import ResoureTypeEnum
 from abc import ABC, abstractmethod
-from base64 import b64encode
 from enum import Enum, auto
 from itertools import chain
-from typing import Any, Dict, Iterable, Sequence, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Sequence, Optional
 from urllib.parse import urljoin
 
+from onapsdk.configuration import settings  # type: ignore
 from onapsdk.exceptions import ResourceNotFound  # type: ignore
 from onapsdk.sdc2.component_instance import ComponentInstance
+from onapsdk.sdc2.screen_index import ScreenIndexEntry, SdcScreenIndex
 from onapsdk.sdc2.sdc import SDC, ResoureTypeEnum, SDCCatalog
 from onapsdk.sdc2.sdc_user import SdcUser
+from onapsdk.utils.artifact_payload import ArtifactPayload  # type: ignore
 from onapsdk.utils.headers_creator import headers_sdc_artifact_upload  # type: ignore
 from onapsdk.utils.jinja import jinja_env  # type: ignore
 from onapsdk.sdc2.sdc_category import ResourceCategory, SdcSubCategory
 from onapsdk.sdc2.vendor import Vendor  # type: ignore
 from onapsdk.sdc2.vsp import Vsp  # type: ignore
+from onapsdk.utils.concurrency import bounded_map  # type: ignore
 
 
 class LifecycleOperation(Enum):  # pylint: disable=too-few-public-methods
@@ -61,6 +64,31 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
     """SDC resource class."""
 
     LIFECYCLE_OPERATION_TEMPLATE = "sdc2_resource_action.json.j2"
+    # Index of the latest resources versions, shared by all resource types
+    screen_index: SdcScreenIndex = SdcScreenIndex()
+    # Resource attributes which values are available in the catalog screen data,
+    # so resources can be listed without fetching their details:
+    # attribute name -> screen data key
+    ROUGH_DATA_ATTRIBUTES: Dict[str, str] = {
+        "name": "name",
+        "version": "version",
+        "archived": "archived",
+        "component_type": "componentType",
+        "icon": "icon",
+        "unique_id": "uniqueId",
+        "lifecycle_state": "lifecycleState",
+        "last_update_date": "lastUpdateDate",
+        "uuid": "uuid",
+        "invariant_uuid": "invariantUUID",
+        "system_name": "systemName",
+        "tags": "tags",
+        "last_updater_user_id": "lastUpdaterUserId",
+        "description": "description"
+    }
+    # Attributes which values are available only in the resource details, so
+    # accessing them on a resource created from the catalog screen data fetches
+    # the details
+    DETAIL_ATTRIBUTES: FrozenSet[str] = frozenset({"creation_data", "all_versions"})
 
     def __init__(self,  # pylint: disable=too-many-locals too-many-arguments
                  *,
@@ -107,6 +135,7 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
 
         """
         super().__init__(name)
+        self._init_private_attributes()
         self.version: Optional[str] = version
         self.archived: Optional[bool] = archived
         self.component_type: Optional[str] = component_type
@@ -133,6 +162,55 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
         """
         return f"{self.__class__.__name__.upper()}(name={self.name})"
 
+    def __getattr__(self, attribute: str) -> Any:
+        """Get resource attribute which is not available in the catalog screen data.
+
+        Called only if attribute is not set, what happens for resources created
+            from the catalog screen data. Resource details are fetched then only
+            if it's one of the `DETAIL_ATTRIBUTES` (or `ROUGH_DATA_ATTRIBUTES`
+            missing in the screen data) and the attribute is read from them.
+
+        Args:
+            attribute (str): Attribute name
+
+        Raises:
+            AttributeError: Resource has no such attribute
+
+        Returns:
+            Any: Attribute value
+
+        """
+        if (attribute not in self.DETAIL_ATTRIBUTES
+                and attribute not in self.ROUGH_DATA_ATTRIBUTES) or self.hydrated:
+            raise AttributeError(f"'{self.__class__.__name__}' object "
+                                 f"has no attribute '{attribute}'")
+        self.hydrate()
+        return getattr(self, attribute)
+
+    def _init_private_attributes(self) -> None:
+        """Set private attributes to their initial values.
+
+        Called by both `__init__` and `create_from_rough_data`.
+
+        """
+        self._rough: bool = False
+
+    @property
+    def hydrated(self) -> bool:
+        """Flag to determine if resource details were fetched.
+
+        Returns:
+            bool: False if resource was created from the catalog screen data
+                and its details were not fetched yet, True otherwise
+
+        """
+        return not self._rough
+
+    def hydrate(self) -> None:
+        """Fetch resource details if it was created from the catalog screen data."""
+        if not self.hydrated:
+            self._copy_object(self.get_by_name_and_version(self.name, self.version))
+
     def _copy_object(self, obj: 'SDCCatalog') -> None:
         """
         Copy relevant properties from object.
@@ -150,8 +228,10 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
     def get_by_name(cls, name: str) -> "SDCResource":
         """Get resource by name.
 
-        Filter all objects (archived and active) and get a latest one (with highest version)
-            which name is equal to one we are looking for.
+        Get the latest (with highest version) active resource which name is equal
+            to one we are looking for. Archived resources are looked up only if
+            there is no active one. Name and version of the latest resource are
+            looked up in the catalog screen index shared by all resource types.
 
         Args:
             name (str): Name of a resource
@@ -163,24 +243,11 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
             SDCResource: Resource with given name
 
         """
-        try:
-            searched_rough_data: Dict[str, Any] = next(
-                iter(
-                    sorted(
-                        filter(
-                            lambda obj: obj["name"] == name,
-                            cls._get_all_rough()),
-                        key=lambda obj: obj["version"],
-                    reverse=True)
-                )
-            )
-            return cls.get_by_name_and_version(
-                searched_rough_data["name"],
-                searched_rough_data["version"]
-            )
-        except StopIteration as exc:
+        entry: Optional[ScreenIndexEntry] = cls.screen_index.find(cls.resource_type(), name)
+        if entry is None:
             cls._logger.warning("%s %s doesn't exist in SDC", cls.__name__, name)
-            raise ResourceNotFound from exc
+            raise ResourceNotFound
+        return cls.get_by_name_and_version(entry.name, entry.version)
 
     def delete(self) -> None:
         """Delete resource."""
@@ -190,6 +257,7 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
             urljoin(self.base_back_url,
                     f"sdc2/rest/v1/catalog/{self.catalog_type()}/{self.unique_id}")
         )
+        self.screen_index.remove(self.resource_type(), self.name)
 
     def archive(self) -> None:
         """Archive resource."""
@@ -199,6 +267,7 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
             urljoin(self.base_back_url,
                     f"sdc2/rest/v1/catalog/{self.catalog_type()}/{self.unique_id}/archive")
         )
+        self.screen_index.remove(self.resource_type(), self.name, archived=True)
 
     @classmethod
     def _get_all_rough(cls) -> Iterable[Dict[str, Any]]:
@@ -212,15 +281,59 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
         return chain(cls._get_active_rough(), cls._get_archived_rough())
 
     @classmethod
-    def get_all(cls) -> Iterable["SDCResource"]:
+    def create_from_rough_data(cls, rough_data: Dict[str, Any]) -> "SDCResource":
+        """Create resource using the catalog screen data values only.
+
+        Attributes which are not available in the screen data are not set, resource
+            details are fetched on the first access to any of them.
+
+        Args:
+            rough_data (Dict[str, Any]): Catalog screen data dictionary
+
+        Returns:
+            SDCResource: Resource object
+
+        """
+        resource: "SDCResource" = cls.__new__(cls)
+        resource._init_private_attributes()  # pylint: disable=protected-access
+        resource._rough = True  # pylint: disable=protected-access
+        resource.__dict__.update({attribute: rough_data[key] for attribute, key in
+                                  cls.ROUGH_DATA_ATTRIBUTES.items() if key in rough_data})
+        if resource.__dict__.get("lifecycle_state"):
+            resource.lifecycle_state = LifecycleState(resource.lifecycle_state)
+        return resource
+
+    @classmethod
+    def get_all(cls,
+                hydrate: bool = False,
+                max_workers: int = settings.SDC_MAX_WORKERS) -> Iterable["SDCResource"]:
         """Get all resources iterator.
 
+        Resources are created from the catalog screen data, so listing them needs
+            no more than two requests. Details of a resource are fetched on the
+            first access to an attribute which is not available in the screen data.
+            If `hydrate` flag is set details of all resources are fetched while
+            listing, concurrently.
+
+        Args:
+            hydrate (bool, optional): Flag to determine if details of all resources
+                should be fetched. Defaults to False.
+            max_workers (int, optional): Maximum number of concurrent requests
+                fetching resources details. Defaults to settings.SDC_MAX_WORKERS.
+
         Yields:
             SDCResource: SDC resource
 
         """
-        for rough_data in cls._get_all_rough():
-            yield cls.get_by_name_and_version(rough_data["name"], rough_data["version"])
+        if not hydrate:
+            yield from map(cls.create_from_rough_data, cls._get_all_rough())
+            return
+        yield from bounded_map(
+            lambda rough_data: cls.get_by_name_and_version(rough_data["name"],
+                                                           rough_data["version"]),
+            cls._get_all_rough(),
+            max_workers
+        )
 
     @classmethod
     def _get_active_rough(cls) -> Iterable[Dict[str, Any]]:
@@ -393,6 +506,10 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
         self.lifecycle_state = api_response["lifecycleState"]
         self.last_updater_user_id = api_response["lastUpdaterUserId"]
         self.all_versions = api_response["allVersions"]
+        self.screen_index.add(self.resource_type(),
+                              ScreenIndexEntry(name=self.name,
+                                               version=self.version,
+                                               unique_id=self.unique_id))
 
     def lifecycle_operation(self, lifecycle_operation: LifecycleOperation) -> None:
         """Request lifecycle operation on an object.
@@ -424,7 +541,8 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
         """
         Add deployment artifact to resource.
 
-        Add deployment artifact to resource using payload data.
+        Add deployment artifact to resource using payload data. Artifact file
+            is streamed into request body, so it's not loaded into memory.
 
         Args:
             artifact_type (str): all SDC artifact types are supported (DCAE_*, HEAT_*, ...)
@@ -439,16 +557,15 @@ class SDCResource(SDCCatalog):  # pylint: disable=too-many-instance-attributes
         self._logger.debug("Add deployment artifact to %s %s",
                            self.__class__.__name__.upper(),
                            self.name)
-        with open(artifact_file_path, 'rb') as artifact_file:
-            data: bytes = artifact_file.read()
-        artifact_upload_payload = jinja_env().get_template(
-            "sdc2_add_deployment_artifact.json.j2").\
-                render(artifact_group_type=artifact_group_type,
-                       artifact_description=artifact_description,
-                       artifact_name=artifact_name,
-                       artifact_label=artifact_label,
-                       artifact_type=artifact_type,
-                       artifact_payload=b64encode(data).decode('utf-8'))
+        artifact_upload_payload = ArtifactPayload(
+            jinja_env().get_template("sdc2_add_deployment_artifact.json.j2").render(
+                artifact_group_type=artifact_group_type,
+                artifact_description=artifact_description,
+                artifact_name=artifact_name,
+                artifact_label=artifact_label,
+                artifact_type=artifact_type,
+                artifact_payload=ArtifactPayload.PLACEHOLDER),
+            artifact_file_path)
 
         self.send_message_json("POST",
                                ("Add deployment artifact to "
@@ -524,17 +641,27 @@ class SDCResourceCreateMixin(ABC):  # pylint: disable=too-few-public-methods
             SDCResource: Created SDC resource object
 
         """
-        return cls.create_from_api_response(cls.send_message_json(
+        resource: "SDCResource" = cls.create_from_api_response(cls.send_message_json(
             "POST",
             f"Create {cls.__name__.upper()} {name}",
             cls.CREATE_ENDPOINT,
             data=cls.get_create_payload(name=name, user=user, description=description, **kwargs)
         ))
+        SDCResource.screen_index.add(cls.resource_type(),
+                                     ScreenIndexEntry(name=resource.name,
+                                                      version=resource.version,
+                                                      unique_id=resource.unique_id))
+        return resource
 
 
 class SDCResourceTypeObject(SDCResource, ABC):  # pylint: disable=too-few-public-methods
     """SDC resource type object class."""
 
+    DETAIL_ATTRIBUTES: FrozenSet[str] = SDCResource.DETAIL_ATTRIBUTES | {
+        "category_nomalized_name",
+        "sub_category_nomalized_name"
+    }
+
     def __init__(self,  # pylint: disable=too-many-locals too-many-arguments
                  *,
                  name: str,
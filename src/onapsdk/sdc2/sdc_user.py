@@ -13,7 +13,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.from onapsdk.sdc2.sdc import ResoureTypeEnum
 from enum import Enum
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, Optional
 from urllib.parse import urljoin
 
 from onapsdk.exceptions import ResourceNotFound  # type: ignore
@@ -81,6 +81,8 @@ class SdcUser(SDCCatalog):  # pylint: disable=too-many-instance-attributes
     def get_by_user_id(cls, user_id: str) -> "SdcUser":
         """Get an user by it's ID.
 
+        Users are indexed once for all lookups, see `catalog_index`.
+
         Args:
             user_id (str): ID of user to get
 
@@ -91,9 +93,9 @@ class SdcUser(SDCCatalog):  # pylint: disable=too-many-instance-attributes
             SdcUser: SDC user with given ID.
 
         """
-        for user in cls.get_all():
-            if user.user_id == user_id:
-                return user
+        user: Optional[SdcUser] = cls.find_in_catalog("user_id", user_id)
+        if user is not None:
+            return user
         raise ResourceNotFound(f"{cls.__name__} with name {user_id} user ID not found")
 
     @classmethod
@@ -14,16 +14,22 @@
 #   limitations under the License.
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Iterable, Iterator, Sequence, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Sequence, Optional, Set
 from urllib.parse import urljoin
 from opentelemetry import trace
 
 from onapsdk.configuration import settings  # type: ignore
+from onapsdk.exceptions import CompositionError, SDKException  # type: ignore
+from onapsdk.sdc2.component_instance import ComponentInstance
 from onapsdk.sdc2.sdc import SDC, ResoureTypeEnum
 from onapsdk.sdc2.sdc_category import SdcCategory, ServiceCategory
-from onapsdk.sdc2.sdc_resource import SDCResource, SDCResourceCreateMixin
+from onapsdk.sdc2.sdc_resource import LifecycleState, SDCResource, SDCResourceCreateMixin
 from onapsdk.sdc2.sdc_user import SdcUser
+from onapsdk.utils.concurrency import bounded_map  # type: ignore
 from onapsdk.utils.jinja import jinja_env  # type: ignore
+from onapsdk.utils.csar_cache import CsarCache  # type: ignore
+from onapsdk.utils.service_model import (MODEL_TEMPLATE_SECTIONS, ServiceModel,
+                                          load_service_template)  # type: ignore
 
 tracer = trace.get_tracer(__name__)
 
@@ -210,12 +216,21 @@ class ServiceDistribution(SDC):
 
 
 
-class Service(SDCResource, SDCResourceCreateMixin):
+class Service(SDCResource, SDCResourceCreateMixin):  # pylint: disable=too-many-instance-attributes
     """SDC service class."""
 
     ADD_RESOURCE_TEMPLATE = "sdc2_add_resource.json.j2"
     CREATE_ENDPOINT = urljoin(SDC.base_back_url, "sdc2/rest/v1/catalog/services")
     CREATE_SERVICE_TEMPLATE = "sdc2_create_service.json.j2"
+    ROUGH_DATA_ATTRIBUTES: Dict[str, str] = {
+        **SDCResource.ROUGH_DATA_ATTRIBUTES,
+        "distribuition_status": "distributionStatus"
+    }
+    DETAIL_ATTRIBUTES: FrozenSet[str] = SDCResource.DETAIL_ATTRIBUTES | {
+        "actual_component_type",
+        "categories",
+        "instantiation_type"
+    }
 
     def __init__(self,  # pylint: disable=too-many-locals too-many-arguments
                  *,
@@ -292,6 +307,17 @@ class Service(SDCResource, SDCResourceCreateMixin):
         self.categories: Optional[Sequence[SdcCategory]] = categories
         self.instantiation_type: Optional[ServiceInstantiationType] = instantiation_type
 
+    def _init_private_attributes(self) -> None:
+        """Set private attributes to their initial values.
+
+        Service TOSCA model, template and model are not loaded yet.
+
+        """
+        super()._init_private_attributes()
+        self._tosca_model: Optional[bytes] = None
+        self._tosca_template: Optional[Dict[str, Any]] = None
+        self._model: Optional[ServiceModel] = None
+
     @classmethod
     def resource_type(cls) -> ResoureTypeEnum:
         """Service resource type enum value.
@@ -397,6 +423,96 @@ class Service(SDCResource, SDCResourceCreateMixin):
             description=description if description else "ONAP SDK Service",
             instantiation_type=instantiation_type)
 
+    def _csar_cache(self) -> Optional[CsarCache]:
+        """Get CSAR cache for the service model.
+
+        Model of the service which isn't certified yet changes under the same
+            UUID and version, so it's not cached.
+
+        Returns:
+            Optional[CsarCache]: CSAR cache, None if it's not configured or
+                service isn't certified
+
+        """
+        cache: Optional[CsarCache] = CsarCache.from_settings()
+        if (cache is None or not self.lifecycle_state
+                or LifecycleState(self.lifecycle_state) is not LifecycleState.CERTIFIED):
+            return None
+        return cache
+
+    @property
+    def tosca_model(self) -> bytes:
+        """Service TOSCA model CSAR file.
+
+        If CSAR cache is configured (SDC_CSAR_CACHE_DIR setting) model of certified
+            service is read from and stored in it.
+
+        Returns:
+            bytes: CSAR file content
+
+        """
+        if self._tosca_model is None:
+            cache: Optional[CsarCache] = self._csar_cache()
+            if cache:
+                self._tosca_model = cache.get_csar(self.uuid, self.version)
+            if self._tosca_model is None:
+                self._tosca_model = self.send_message(
+                    "GET",
+                    f"Download {self.name} TOSCA model",
+                    urljoin(self.base_back_url,
+                            f"sdc/v1/catalog/services/{self.uuid}/toscaModel"),
+                    headers={**self.headers, "Accept": "application/octet-stream"}
+                ).content
+                if cache:
+                    cache.put_csar(self.uuid, self.version, self._tosca_model)
+        return self._tosca_model
+
+    @property
+    def tosca_template(self) -> Dict[str, Any]:
+        """Service TOSCA template parsed from TOSCA model CSAR file.
+
+        If CSAR cache is configured (SDC_CSAR_CACHE_DIR setting) parsed template of
+            certified service is read from and stored in it.
+
+        Returns:
+            Dict[str, Any]: Service template
+
+        """
+        if self._tosca_template is None:
+            cache: Optional[CsarCache] = self._csar_cache()
+            if cache:
+                self._tosca_template = cache.get_template(self.uuid, self.version)
+            if self._tosca_template is None:
+                self._tosca_template = load_service_template(self.tosca_model)
+                if cache:
+                    cache.put_template(self.uuid, self.version, self._tosca_template)
+        return self._tosca_template
+
+    @property
+    def model(self) -> ServiceModel:
+        """Service model snapshot.
+
+        Built once from the service TOSCA template, so node templates, VF modules,
+            inputs and their model identifiers are read without any other
+            SDC request. Only the template sections used by the model are loaded,
+            unless the whole template is already loaded. It can be saved and used
+            to instantiate the service with SO without SDC requests, see
+            `onapsdk.sdc.service.Service.from_model`.
+
+        Returns:
+            ServiceModel: Service model
+
+        """
+        if self._model is None:
+            template: Optional[Dict[str, Any]] = self._tosca_template
+            cache: Optional[CsarCache] = self._csar_cache()
+            if template is None and cache:
+                template = cache.get_template(self.uuid, self.version)
+            if template is None:
+                template = load_service_template(self.tosca_model, MODEL_TEMPLATE_SECTIONS)
+            self._model = ServiceModel.from_template(template)
+        return self._model
+
     def add_resource(self, resource: SDCResource) -> None:
         """Add resource into service composition.
 
@@ -412,6 +528,58 @@ class Service(SDCResource, SDCResourceCreateMixin):
             data=jinja_env().get_template(self.ADD_RESOURCE_TEMPLATE).render(resource=resource)
         )
 
+    def add_resources(self,
+                      resources: Iterable[SDCResource],
+                      max_workers: int = settings.SDC_MAX_WORKERS) -> List[ComponentInstance]:
+        """Add many resources into service composition concurrently.
+
+        Different resources are added by at most `max_workers` threads at once.
+            SDC serializes changes of a component, so instances of the same
+            resource are added one after another, in the given order. All
+            resources are tried even if some of them fail. Service component
+            instances are listed before and after adding resources, so only
+            the instances added by this call are returned.
+
+        Args:
+            resources (Iterable[SDCResource]): Resources to be added into service
+            max_workers (int, optional): Maximum number of resources added at once.
+                Defaults to settings.SDC_MAX_WORKERS.
+
+        Raises:
+            CompositionError: Some resources couldn't be added. Lists of errors by
+                resource name are stored in its `errors` attribute.
+
+        Returns:
+            List[ComponentInstance]: Component instances added into service
+
+        """
+        resources_by_id: Dict[str, List[SDCResource]] = {}
+        for resource in resources:
+            resources_by_id.setdefault(resource.unique_id, []).append(resource)
+        existing: Set[str] = {component_instance.unique_id for component_instance
+                              in self.component_instances}
+        errors: Dict[str, List[BaseException]] = {}
+
+        def add_all(same_resources: List[SDCResource]) -> None:
+            for resource in same_resources:
+                try:
+                    self.add_resource(resource)
+                except SDKException as exc:
+                    self._logger.error("Adding resource %s into service %s failed: %s",
+                                       resource.name, self.name, exc)
+                    errors.setdefault(resource.name, []).append(exc)
+
+        for _ in bounded_map(add_all, resources_by_id.values(), max_workers):
+            pass
+        if errors:
+            raise CompositionError(
+                f"Adding of {sum(map(len, errors.values()))} resources into service "
+                f"{self.name} failed: {', '.join(errors)}", errors
+            ) from next(iter(errors.values()))[0]
+        return [component_instance for component_instance in self.component_instances
+                if component_instance.component_uid in resources_by_id
+                and component_instance.unique_id not in existing]
+
     def distribute(self, env: str = "PROD") -> None:
         """Distribute service.
 
@@ -1,11 +1,13 @@
 """SDC onboarding API vsp module."""
 from urllib.parse import urljoin
-from typing import BinaryIO
+from typing import BinaryIO, Optional
 
 from onapsdk.exceptions import ValidationError
 from onapsdk.sdc2.sdc_onboarding_api import SdcOnboardingApiItem, SdcOnboardingApiItemTypeEnum
 from onapsdk.sdc2.vendor import Vendor
 from onapsdk.utils.jinja import jinja_env  # type: ignore
+from onapsdk.utils.multipart_upload import (MultipartUpload, ProgressCallback,  # type: ignore
+                                            send_with_retries)
 
 
 class Vsp(SdcOnboardingApiItem):
@@ -102,19 +104,30 @@ class Vsp(SdcOnboardingApiItem):
             self.create_package()
         return self._csar_uuid
 
-    def upload_package(self, package: BinaryIO) -> None:
-        """Upload VSP package."""
+    def upload_package(self, package: BinaryIO,
+                       progress_callback: Optional[ProgressCallback] = None) -> None:
+        """Upload VSP package.
+
+        Package is streamed from disk and upload is retried on transient failures.
+
+        Args:
+            package (BinaryIO): VSP package file
+            progress_callback (Optional[ProgressCallback], optional): Function called
+                with upload progress after each sent chunk. Defaults to None.
+
+        """
         self._logger.info("Upload package")
+        upload = MultipartUpload("upload", package, progress_callback=progress_callback)
         headers = self.headers.copy()
-        headers.pop("Content-Type")
+        headers["Content-Type"] = upload.content_type
         headers["Accept-Encoding"] = "gzip, deflate"
-        self.send_message(
+        send_with_retries(lambda: self.send_message(
             "POST",
             f"Upload package for {self.name} VSP",
             urljoin(self.latest_version_url, "orchestration-template-candidate"),
             headers=headers,
-            files={'upload': package}
-        )
+            data=upload
+        ))
 
     def process_package(self, raise_on_failure: bool = False) -> None:
         """Process VSP package."""
@@ -16,7 +16,7 @@ import json
 from abc import ABC
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from onapsdk.configuration import settings
 from onapsdk.sdc.service import Service
@@ -25,7 +25,7 @@ from onapsdk.onap_service import OnapService
 from onapsdk.utils.headers_creator import headers_so_creator
 from onapsdk.utils.jinja import jinja_env
 from onapsdk.utils.mixins import WaitForFinishMixin
-from onapsdk.utils.tosca_file_handler import get_modules_list_from_tosca_file
+from onapsdk.utils.tosca_file_handler import ToscaTemplate
 from onapsdk.utils.gui import GuiItem, GuiList
 
 @dataclass
@@ -91,9 +91,20 @@ class SoElement(OnapService):
         return json.dumps(parsed, indent=4)
 
     @classmethod
-    def get_vf_model_info(cls, vf_model: str) -> str:
-        """Retrieve the VF model info From Tosca?."""
-        modules: Dict = get_modules_list_from_tosca_file(vf_model)
+    def get_vf_model_info(cls, vf_model: Union[str, ToscaTemplate]) -> str:
+        """Retrieve the VF model info From Tosca?.
+
+        Args:
+            vf_model (Union[str, ToscaTemplate]): TOSCA template serialized to JSON
+                or already parsed one
+
+        Returns:
+            str: VF modules model info serialized to JSON
+
+        """
+        if not isinstance(vf_model, ToscaTemplate):
+            vf_model = ToscaTemplate.from_json(vf_model)
+        modules: Dict = vf_model.get("topology_template.groups")
         template_service = jinja_env().get_template("vf_model_info.json.j2")
         parsed = json.loads(template_service.render(modules=modules))
         return json.dumps(parsed, indent=4)
@@ -0,0 +1,93 @@
+"""Streamed artifact upload payload module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import os
+from base64 import b64encode
+from typing import Iterator, Optional, Union
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ValidationError
+
+
+class ArtifactPayload:
+    """JSON artifact upload request body with base64 encoded artifact file streamed into it.
+
+    Request body is rendered with `PLACEHOLDER` in place of base64 encoded artifact.
+        Artifact file is read and encoded chunk by chunk each time payload
+        is iterated, so memory usage doesn't depend on the artifact size.
+        Payload can be iterated more than once: to compute Content-MD5 header
+        before the request is sent and to send it (also when it's retried).
+        Its length is known up front, so it's not sent with chunked encoding.
+    """
+
+    PLACEHOLDER = "@@ONAPSDK_ARTIFACT_PAYLOAD@@"
+
+    def __init__(self,
+                 body: str,
+                 artifact_file_path: Union[str, os.PathLike],
+                 chunk_size: Optional[int] = None) -> None:
+        """Initialize payload.
+
+        Args:
+            body (str): Request body rendered with `PLACEHOLDER` in place of the artifact
+            artifact_file_path (Union[str, os.PathLike]): Path to the artifact file
+            chunk_size (Optional[int], optional): Number of artifact file bytes read
+                at once, rounded down to multiple of 3. Defaults to None, so
+                SDC_ARTIFACT_UPLOAD_CHUNK_SIZE setting value is used.
+
+        Raises:
+            ValidationError: Request body has no placeholder
+
+        """
+        prefix, placeholder, suffix = body.partition(self.PLACEHOLDER)
+        if not placeholder:
+            raise ValidationError("Artifact upload request body has no artifact placeholder")
+        self.artifact_file_path: Union[str, os.PathLike] = artifact_file_path
+        self._prefix: bytes = prefix.encode("utf-8")
+        self._suffix: bytes = suffix.encode("utf-8")
+        chunk_size = chunk_size or settings.SDC_ARTIFACT_UPLOAD_CHUNK_SIZE
+        # Only the last chunk of the base64 encoded file can be padded
+        self.chunk_size: int = max(3, chunk_size - chunk_size % 3)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate through request body chunks.
+
+        Yields:
+            bytes: Request body chunk
+
+        """
+        yield self._prefix
+        with open(self.artifact_file_path, "rb") as artifact_file:
+            while chunk := artifact_file.read(self.chunk_size):
+                yield b64encode(chunk)
+        yield self._suffix
+
+    def __len__(self) -> int:
+        """Get request body length.
+
+        Returns:
+            int: Request body length, in bytes
+
+        """
+        artifact_size: int = os.path.getsize(self.artifact_file_path)
+        return len(self._prefix) + 4 * ((artifact_size + 2) // 3) + len(self._suffix)
+
+    def __repr__(self) -> str:
+        """Get payload representation, used when request body is logged.
+
+        Returns:
+            str: Payload representation
+
+        """
+        return f"ArtifactPayload({os.fspath(self.artifact_file_path)!r})"
@@ -0,0 +1,111 @@
+"""Cache helpers module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import time
+from threading import RLock
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+
+class TtlCache(Generic[ValueT]):
+    """Thread safe cache which entries expire after given time.
+
+    Entries are evicted lazily, when expired entry is read.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize cache.
+
+        Args:
+            ttl (float): Entry time to live, in seconds
+
+        """
+        self.ttl: float = ttl
+        self._entries: Dict[Hashable, Tuple[float, ValueT]] = {}
+        self._lock: RLock = RLock()
+
+    def __len__(self) -> int:
+        """Get number of cache entries, including the expired ones.
+
+        Returns:
+            int: Number of entries
+
+        """
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[ValueT]:
+        """Get cached value.
+
+        Args:
+            key (Hashable): Entry key
+
+        Returns:
+            Optional[ValueT]: Cached value, None if there is no entry or it's expired
+
+        """
+        with self._lock:
+            entry: Optional[Tuple[float, ValueT]] = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: ValueT) -> None:
+        """Store value in cache.
+
+        Args:
+            key (Hashable): Entry key
+            value (ValueT): Value to store
+
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], ValueT]) -> ValueT:
+        """Get cached value or create and store it if there is no valid entry.
+
+        Factory is called without holding the lock, so concurrent misses of the
+            same key can call it more than once.
+
+        Args:
+            key (Hashable): Entry key
+            factory (Callable[[], ValueT]): Function which creates the value
+
+        Returns:
+            ValueT: Cached or created value
+
+        """
+        value: Optional[ValueT] = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Remove entry from cache.
+
+        Args:
+            key (Hashable, optional): Entry key. All entries are removed if not set.
+                Defaults to None.
+
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
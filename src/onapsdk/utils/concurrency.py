@@ -0,0 +1,55 @@
+"""Concurrency helpers module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, TypeVar
+
+ArgumentT = TypeVar("ArgumentT")
+ResultT = TypeVar("ResultT")
+
+
+def bounded_map(function: Callable[[ArgumentT], ResultT],
+                iterable: Iterable[ArgumentT],
+                max_workers: int) -> Iterator[ResultT]:
+    """Map function over iterable using a bounded thread pool.
+
+    Unlike `ThreadPoolExecutor.map` the iterable is consumed lazily: at most
+        `max_workers` calls are in flight at any time, so a long (or infinite)
+        generator never gets fully materialized. Results are yielded in the
+        order of the input.
+
+    With `max_workers` lower than 2 the function is called sequentially
+        in the caller's thread.
+
+    Args:
+        function (Callable[[ArgumentT], ResultT]): Function to call
+        iterable (Iterable[ArgumentT]): Function arguments
+        max_workers (int): Maximum number of concurrent calls
+
+    Yields:
+        ResultT: Function call result
+
+    """
+    if max_workers < 2:
+        yield from map(function, iterable)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future] = deque()
+        for argument in iterable:
+            pending.append(executor.submit(function, argument))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
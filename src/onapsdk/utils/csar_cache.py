@@ -0,0 +1,250 @@
+"""SDC CSAR on-disk cache module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import logging
+import os
+import pickle  # nosec
+import shutil
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from onapsdk.configuration import settings
+
+
+class CsarCache:
+    """On-disk cache of SDC CSAR files and their parsed service templates.
+
+    Entries are keyed by service UUID and version. They identify immutable
+        service model only once service is certified (model of draft service
+        changes under the same UUID and version), so only certified services
+        are cached and entries never need to be refreshed. Each entry is stored
+        as two files: the raw CSAR and the pickled service template, which is
+        loaded much faster than the template is unzipped and parsed again.
+
+    Files are written atomically, so the cache can be shared by parallel processes.
+        The least recently used files are evicted when the cache size exceeds
+        the limit. Cache directory must be trusted, as pickled templates are
+        loaded from it.
+    """
+
+    CSAR_SUFFIX = ".csar"
+    TEMPLATE_SUFFIX = ".pickle"
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, directory: Union[str, Path], max_size: int) -> None:
+        """Initialize cache.
+
+        Args:
+            directory (Union[str, Path]): Cache directory, created if it doesn't exist
+            max_size (int): Maximum cache size, in bytes
+
+        """
+        self.directory: Path = Path(directory)
+        self.max_size: int = max_size
+
+    @classmethod
+    def from_settings(cls) -> Optional["CsarCache"]:
+        """Create cache configured by settings.
+
+        Returns:
+            Optional[CsarCache]: Cache in SDC_CSAR_CACHE_DIR directory limited to
+                SDC_CSAR_CACHE_MAX_SIZE bytes, None if cache directory is not set
+
+        """
+        if not settings.SDC_CSAR_CACHE_DIR:
+            return None
+        return cls(settings.SDC_CSAR_CACHE_DIR, settings.SDC_CSAR_CACHE_MAX_SIZE)
+
+    def _path(self, uuid: str, version: str, suffix: str) -> Path:
+        """Get path of entry file.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+            suffix (str): File suffix
+
+        Returns:
+            Path: Entry file path
+
+        """
+        return self.directory / f"{sha256(f'{uuid}:{version}'.encode()).hexdigest()}{suffix}"
+
+    def _read(self, path: Path) -> Optional[bytes]:
+        """Read entry file and mark it as recently used.
+
+        Args:
+            path (Path): Entry file path
+
+        Returns:
+            Optional[bytes]: File content, None if file doesn't exist
+
+        """
+        try:
+            content: bytes = path.read_bytes()
+            os.utime(path)
+            return content
+        except OSError:
+            return None
+
+    def _write(self, path: Path, content: Union[bytes, Path]) -> None:
+        """Write entry file atomically and evict the least recently used files.
+
+        Args:
+            path (Path): Entry file path
+            content (Union[bytes, Path]): File content, or path of the file to copy
+                it from chunk by chunk
+
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as tmp_file:
+                if isinstance(content, Path):
+                    with content.open("rb") as source_file:
+                        shutil.copyfileobj(source_file, tmp_file)
+                else:
+                    tmp_file.write(content)
+            os.replace(tmp_file.name, path)
+        except OSError as exc:
+            self._logger.warning("Can't write %s into CSAR cache: %s", path.name, exc)
+            return
+        self.evict()
+
+    @property
+    def size(self) -> int:
+        """Cache size.
+
+        Returns:
+            int: Size of all cache entries, in bytes
+
+        """
+        return sum(path.stat().st_size for path in self._entries())
+
+    def _entries(self) -> List[Path]:
+        """Get cache entries files.
+
+        Returns:
+            List[Path]: Entries files paths
+
+        """
+        if not self.directory.is_dir():
+            return []
+        return [path for path in self.directory.iterdir()
+                if path.suffix in (self.CSAR_SUFFIX, self.TEMPLATE_SUFFIX)]
+
+    def evict(self) -> None:
+        """Remove the least recently used files until cache size doesn't exceed the limit."""
+        entries: List[Tuple[Path, os.stat_result]] = []
+        for path in self._entries():
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue
+        size: int = sum(stat.st_size for _, stat in entries)
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if size <= self.max_size:
+                break
+            try:
+                path.unlink()
+                size -= stat.st_size
+            except OSError:
+                continue
+
+    def get_csar(self, uuid: str, version: str) -> Optional[bytes]:
+        """Get cached CSAR.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+
+        Returns:
+            Optional[bytes]: CSAR file content, None if it's not cached
+
+        """
+        return self._read(self._path(uuid, version, self.CSAR_SUFFIX))
+
+    def put_csar(self, uuid: str, version: str, csar: bytes) -> None:
+        """Store CSAR in cache.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+            csar (bytes): CSAR file content
+
+        """
+        self._write(self._path(uuid, version, self.CSAR_SUFFIX), csar)
+
+    def csar_path(self, uuid: str, version: str) -> Optional[Path]:
+        """Get path of cached CSAR, so it can be read without loading it into memory.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+
+        Returns:
+            Optional[Path]: CSAR file path, None if it's not cached
+
+        """
+        path: Path = self._path(uuid, version, self.CSAR_SUFFIX)
+        try:
+            os.utime(path)
+            return path
+        except OSError:
+            return None
+
+    def put_csar_file(self, uuid: str, version: str, csar_path: Path) -> None:
+        """Store CSAR file in cache.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+            csar_path (Path): Path of the CSAR file to copy into cache
+
+        """
+        self._write(self._path(uuid, version, self.CSAR_SUFFIX), csar_path)
+
+    def get_template(self, uuid: str, version: str) -> Optional[Dict[str, Any]]:
+        """Get cached parsed service template.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+
+        Returns:
+            Optional[Dict[str, Any]]: Service template, None if it's not cached
+                or can't be loaded
+
+        """
+        content: Optional[bytes] = self._read(self._path(uuid, version, self.TEMPLATE_SUFFIX))
+        if content is None:
+            return None
+        try:
+            return pickle.loads(content)  # nosec
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError):
+            self._logger.warning("Can't load cached service %s %s template", uuid, version)
+            return None
+
+    def put_template(self, uuid: str, version: str, template: Dict[str, Any]) -> None:
+        """Store parsed service template in cache.
+
+        Args:
+            uuid (str): Service UUID
+            version (str): Service version
+            template (Dict[str, Any]): Service template
+
+        """
+        self._write(self._path(uuid, version, self.TEMPLATE_SUFFIX),
+                    pickle.dumps(template, protocol=pickle.HIGHEST_PROTOCOL))
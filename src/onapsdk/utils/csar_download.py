@@ -0,0 +1,137 @@
+"""Streamed CSAR download module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import logging
+import os
+import time
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Iterable, List, Optional, Union
+from zipfile import ZipFile
+
+from requests import Response
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ValidationError
+
+SERVICE_TEMPLATE_FOLDER = "Definitions"
+SERVICE_TEMPLATE_PREFIX = "service-"
+SERVICE_TEMPLATE_SUFFIX = "-template.yml"
+
+
+def download_to_file(response: Response,
+                     path: Union[str, os.PathLike],
+                     checksum: Optional[str] = None,
+                     chunk_size: Optional[int] = None) -> str:
+    """Write streamed response body into a file.
+
+    Body is written chunk by chunk into a temporary file next to the target one,
+        which replaces the target only when the whole body was received and its
+        checksum is valid, so memory usage doesn't depend on the file size and
+        no partial file is left behind.
+
+    Args:
+        response (Response): Response of request sent with `stream=True`
+        path (Union[str, os.PathLike]): Target file path, its directory is created
+            if it doesn't exist
+        checksum (Optional[str], optional): Expected SHA-256 hex digest of the body.
+            Defaults to None, so it's not verified.
+        chunk_size (Optional[int], optional): Number of bytes read at once. Defaults
+            to None, so SDC_CSAR_DOWNLOAD_CHUNK_SIZE setting value is used.
+
+    Raises:
+        ValidationError: Body checksum doesn't match the expected one
+
+    Returns:
+        str: SHA-256 hex digest of the body
+
+    """
+    target: Path = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    digest = sha256()
+    size: int = 0
+    started_at: float = time.monotonic()
+    with NamedTemporaryFile(dir=target.parent, suffix=".tmp", delete=False) as tmp_file:
+        try:
+            for chunk in response.iter_content(
+                    chunk_size=chunk_size or settings.SDC_CSAR_DOWNLOAD_CHUNK_SIZE):
+                tmp_file.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+    if checksum and digest.hexdigest() != checksum.lower():
+        os.unlink(tmp_file.name)
+        raise ValidationError(f"{target.name} checksum {digest.hexdigest()} "
+                              f"doesn't match expected {checksum}")
+    os.replace(tmp_file.name, target)
+    logging.getLogger(__name__).info("Downloaded %d bytes into %s in %.1f s",
+                                     size, target.name, time.monotonic() - started_at)
+    return digest.hexdigest()
+
+
+def find_service_template(csar: ZipFile) -> str:
+    """Get name of the service template entry of the CSAR.
+
+    Only the central directory of the CSAR is read, the entry isn't extracted.
+
+    Args:
+        csar (ZipFile): CSAR file
+
+    Raises:
+        ValidationError: CSAR file has no service template
+
+    Returns:
+        str: Service template entry name
+
+    """
+    service_template: Optional[str] = None
+    for name in csar.namelist():
+        if (name.startswith(f"{SERVICE_TEMPLATE_FOLDER}/{SERVICE_TEMPLATE_PREFIX}")
+                and name.endswith(SERVICE_TEMPLATE_SUFFIX)):
+            service_template = name
+    if not service_template:
+        raise ValidationError(f"CSAR file has no service template. Valid path: "
+                              f"{SERVICE_TEMPLATE_FOLDER}/{SERVICE_TEMPLATE_PREFIX}*"
+                              f"{SERVICE_TEMPLATE_SUFFIX}")
+    return service_template
+
+
+def extract_entries(csar: Union[str, os.PathLike, BinaryIO],
+                    names: Iterable[str],
+                    directory: Union[str, os.PathLike]) -> List[Path]:
+    """Extract only given entries of the CSAR.
+
+    Args:
+        csar (Union[str, os.PathLike, BinaryIO]): CSAR file or its path
+        names (Iterable[str]): Names of entries to extract
+        directory (Union[str, os.PathLike]): Directory to extract entries into,
+            entries paths are kept
+
+    Raises:
+        ValidationError: CSAR file has no entry of given name
+
+    Returns:
+        List[Path]: Paths of extracted files
+
+    """
+    with ZipFile(csar) as csar_file:
+        names = list(names)
+        available: List[str] = csar_file.namelist()
+        if missing := [name for name in names if name not in available]:
+            raise ValidationError(f"CSAR file has no {', '.join(missing)} entries")
+        return [Path(csar_file.extract(name, directory)) for name in names]
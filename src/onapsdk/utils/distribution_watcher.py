@@ -0,0 +1,331 @@
+"""SDC distribution notifications watcher module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import json
+import logging
+import threading
+import time
+from queue import Empty, Queue
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from onapsdk.configuration import settings
+from onapsdk.dmaap.dmaap import Dmaap
+from onapsdk.exceptions import RequestError
+from onapsdk.kafka.onap_kafka import Consumer
+
+# Reported statuses which mean that component reached its desired status
+SATISFYING_STATUSES: Dict[str, Set[str]] = {
+    "DOWNLOAD_OK": {"DOWNLOAD_OK", "ALREADY_DOWNLOADED", "DEPLOY_OK", "ALREADY_DEPLOYED"},
+    "DEPLOY_OK": {"DEPLOY_OK", "ALREADY_DEPLOYED"}
+}
+ERROR_STATUSES: Set[str] = {"DOWNLOAD_ERROR", "DEPLOY_ERROR", "COMPONENT_DONE_ERROR"}
+# Delay before DMaaP is asked for events again if there were none, in seconds
+DMAAP_IDLE_DELAY = 1.0
+
+
+class DmaapSubscriber(threading.Thread):
+    """Thread which puts events of DMaaP topic into the queue."""
+
+    def __init__(self,
+                 topic: str,
+                 basic_auth: Dict[str, str],
+                 record_queue: Queue) -> None:
+        """Initialize subscriber.
+
+        Args:
+            topic (str): DMaaP topic
+            basic_auth (Dict[str, str]): for example:{ 'username': 'bob', 'password': 'secret' }
+            record_queue (Queue): The queue to store received events
+
+        """
+        super().__init__(daemon=True)
+        self.stop_event: threading.Event = threading.Event()
+        self.topic: str = topic
+        self.basic_auth: Dict[str, str] = basic_auth
+        self.record_queue: Queue = record_queue
+
+    def stop(self) -> None:
+        """Stop the subscriber thread."""
+        self.stop_event.set()
+
+    def run(self) -> None:
+        """Get topic events until subscriber is stopped."""
+        while not self.stop_event.is_set():
+            try:
+                events: Any = Dmaap.get_events_for_topic(self.topic, self.basic_auth)
+            except RequestError as exc:
+                logging.getLogger(__name__).warning("Can't get %s events: %s", self.topic, exc)
+                self.stop_event.wait(settings.SDC_DISTRIBUTION_POLL_INTERVAL)
+                continue
+            if not events:
+                self.stop_event.wait(DMAAP_IDLE_DELAY)
+                continue
+            for event in events:
+                self.record_queue.put(event)
+
+
+class DistributionWatcher:
+    """Track SDC distributions of many services using distribution status notifications.
+
+    Components which get distributed service models publish their download and deploy
+        statuses on SDC distribution status topic. Watcher subscribes the topic
+        (using Kafka or DMaaP) and keeps statuses reported by each component for each
+        distribution, so services are known to be distributed as soon as the last
+        component reports, without SDC being polled. SDC is still polled every
+        SDC_DISTRIBUTION_POLL_INTERVAL seconds, in case notifications are not available.
+
+    Use it as a context manager, so subscription is stopped when it's not needed anymore:
+
+        with DistributionWatcher.from_kafka(username, password) as watcher:
+            for service in services:
+                service.distribute()
+            watcher.wait_distributed(services)
+
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, subscribers: Iterable[threading.Thread] = (),
+                 record_queue: Optional[Queue] = None) -> None:
+        """Initialize watcher.
+
+        Args:
+            subscribers (Iterable[threading.Thread], optional): Threads which put
+                notifications into the record queue. Defaults to no subscribers,
+                so only SDC polling is used.
+            record_queue (Optional[Queue], optional): Queue of notifications.
+                Defaults to None, so a new queue is created.
+
+        """
+        self.record_queue: Queue = record_queue or Queue()
+        self.subscribers: List[threading.Thread] = list(subscribers)
+        self._statuses: Dict[str, Dict[str, Set[str]]] = {}
+        self._condition: threading.Condition = threading.Condition()
+        self._events_count: int = 0
+        self._stop_event: threading.Event = threading.Event()
+        self._dispatcher: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_kafka(cls, username: str, password: str,
+                   topic: Optional[str] = None) -> "DistributionWatcher":
+        """Create watcher which gets notifications from Kafka.
+
+        Args:
+            username (str): The username for Kafka authentication
+            password (str): The password for Kafka authentication
+            topic (Optional[str], optional): Distribution status topic. Defaults to None,
+                so SDC_DISTRIBUTION_STATUS_TOPIC setting value is used.
+
+        Returns:
+            DistributionWatcher: Distribution watcher
+
+        """
+        record_queue: Queue = Queue()
+        consumer: Consumer = Consumer(username, password,
+                                      topic or settings.SDC_DISTRIBUTION_STATUS_TOPIC,
+                                      record_queue)
+        consumer.daemon = True
+        return cls([consumer], record_queue)
+
+    @classmethod
+    def from_dmaap(cls, basic_auth: Dict[str, str],
+                   topic: Optional[str] = None) -> "DistributionWatcher":
+        """Create watcher which gets notifications from DMaaP.
+
+        Args:
+            basic_auth (Dict[str, str]): for example:{ 'username': 'bob', 'password': 'secret' }
+            topic (Optional[str], optional): Distribution status topic. Defaults to None,
+                so SDC_DISTRIBUTION_STATUS_TOPIC setting value is used.
+
+        Returns:
+            DistributionWatcher: Distribution watcher
+
+        """
+        record_queue: Queue = Queue()
+        return cls([DmaapSubscriber(topic or settings.SDC_DISTRIBUTION_STATUS_TOPIC,
+                                    basic_auth, record_queue)],
+                   record_queue)
+
+    def start(self) -> None:
+        """Start subscribers and notifications processing."""
+        if self._dispatcher is not None:
+            return
+        self._stop_event.clear()
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+        for subscriber in self.subscribers:
+            subscriber.start()
+
+    def stop(self) -> None:
+        """Stop subscribers and notifications processing."""
+        for subscriber in self.subscribers:
+            subscriber.stop()
+        self._stop_event.set()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+            self._dispatcher = None
+
+    def __enter__(self) -> "DistributionWatcher":
+        """Start watcher.
+
+        Returns:
+            DistributionWatcher: Started watcher
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Stop watcher."""
+        self.stop()
+
+    def _dispatch(self) -> None:
+        """Process notifications from the queue until watcher is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                notification: Any = self.record_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            self.handle_notification(notification)
+
+    def handle_notification(self, notification: Union[str, bytes, Dict[str, Any]]) -> None:
+        """Store component status reported by distribution status notification.
+
+        Args:
+            notification (Union[str, bytes, Dict[str, Any]]): Distribution status notification
+
+        """
+        try:
+            if isinstance(notification, (str, bytes)):
+                notification = json.loads(notification)
+            distribution_id: str = notification["distributionID"]
+            component: str = notification["consumerID"]
+            status: str = notification["status"]
+        except (ValueError, TypeError, KeyError):
+            self._logger.debug("Skip invalid distribution notification: %r", notification)
+            return
+        self._logger.debug("Component %s reported %s status of %s distribution",
+                           component, status, distribution_id)
+        with self._condition:
+            self._statuses.setdefault(distribution_id, {}).setdefault(component, set()).add(status)
+            self._events_count += 1
+            self._condition.notify_all()
+
+    def component_statuses(self, distribution_id: str) -> Dict[str, Set[str]]:
+        """Get statuses reported by components for the distribution.
+
+        Args:
+            distribution_id (str): Distribution ID
+
+        Returns:
+            Dict[str, Set[str]]: Statuses reported by each component
+
+        """
+        with self._condition:
+            return {component: set(statuses) for component, statuses
+                    in self._statuses.get(distribution_id, {}).items()}
+
+    def distribution_result(self, distribution_id: str) -> Optional[bool]:
+        """Get result of the distribution known from notifications.
+
+        Only components listed in SDC_SERVICE_DISTRIBUTION_DESIRED_STATE setting are checked.
+
+        Args:
+            distribution_id (str): Distribution ID
+
+        Returns:
+            Optional[bool]: True if all components reached their desired status, False if
+                any of them reported an error, None if there are components which haven't
+                reported yet
+
+        """
+        statuses: Dict[str, Set[str]] = self.component_statuses(distribution_id)
+        result: Optional[bool] = True
+        for component, desired_status in settings.SDC_SERVICE_DISTRIBUTION_DESIRED_STATE.items():
+            reported: Set[str] = statuses.get(component, set())
+            if reported & SATISFYING_STATUSES.get(desired_status, {desired_status}):
+                continue
+            if reported & ERROR_STATUSES:
+                self._logger.error("Distribution %s failed on %s", distribution_id, component)
+                return False
+            result = None
+        return result
+
+    @staticmethod
+    def distribution_id(service: Any) -> Optional[str]:
+        """Get ID of the latest distribution of the service.
+
+        Args:
+            service (Any): onapsdk.sdc.service.Service or onapsdk.sdc2.service.Service object
+
+        Returns:
+            Optional[str]: Distribution ID, None if service wasn't distributed yet
+
+        """
+        if hasattr(service, "latest_distribution"):
+            latest_distribution: Any = service.latest_distribution
+            return latest_distribution.distribution_id if latest_distribution else None
+        return service.distribution_id
+
+    def wait_distributed(self, services: Iterable[Any],
+                         timeout: Optional[float] = None) -> bool:
+        """Wait until services are distributed.
+
+        Method returns as soon as results of all distributions are known. They are
+            taken from notifications, and also from SDC, which is polled every
+            SDC_DISTRIBUTION_POLL_INTERVAL seconds (starting right away).
+
+        Args:
+            services (Iterable[Any]): onapsdk.sdc.service.Service or
+                onapsdk.sdc2.service.Service objects
+            timeout (Optional[float], optional): Maximum waiting time, in seconds.
+                Defaults to None, so SDC_DISTRIBUTION_TIMEOUT setting value is used.
+
+        Returns:
+            bool: True if all services were distributed successfully, False if
+                any distribution failed or wasn't finished in time
+
+        """
+        deadline: float = time.monotonic() + (
+            settings.SDC_DISTRIBUTION_TIMEOUT if timeout is None else timeout)
+        pending: List[Any] = list(services)
+        distribution_ids: Dict[int, Optional[str]] = {}
+        succeeded: bool = True
+        next_poll: float = time.monotonic()
+        while pending:
+            with self._condition:
+                events_count: int = self._events_count
+            if time.monotonic() >= next_poll:
+                pending = [service for service in pending if not service.distributed]
+                for service in pending:
+                    if distribution_ids.get(id(service)) is None:
+                        distribution_ids[id(service)] = self.distribution_id(service)
+                next_poll = time.monotonic() + settings.SDC_DISTRIBUTION_POLL_INTERVAL
+            for service in list(pending):
+                if (distribution_id := distribution_ids.get(id(service))) is None:
+                    continue
+                result: Optional[bool] = self.distribution_result(distribution_id)
+                if result is not None:
+                    pending.remove(service)
+                    succeeded = succeeded and result
+            remaining: float = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            with self._condition:
+                self._condition.wait_for(lambda: self._events_count != events_count,
+                                         timeout=min(remaining, next_poll - time.monotonic()))
+        if pending:
+            self._logger.error("Distribution of %d services wasn't finished in time",
+                               len(pending))
+        return succeeded and not pending
@@ -12,7 +12,7 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-from typing import Optional, Dict
+from typing import Dict, Iterable, Optional, Union
 from uuid import uuid4
 import base64
 import hashlib
@@ -207,13 +207,15 @@ def headers_sdnc_creator(base_header: Dict[str, str]) -> Dict[str, str]:
     return headers
 
 
-def headers_sdc_artifact_upload(base_header: Dict[str, str], data: str) -> Dict[str, str]:
+def headers_sdc_artifact_upload(base_header: Dict[str, str],
+                                data: Union[str, Iterable[bytes]]) -> Dict[str, str]:
     """
     Create the right headers for sdc artifact upload.
 
     Args:
         base_header (Dict[str, str]): the base header to use
-        data (str): payload data used to create an md5 content header
+        data (Union[str, Iterable[bytes]]): payload data used to create an md5 content header.
+            Streamed payload (e.g. ArtifactPayload) is hashed chunk by chunk.
 
     Returns:
         Dict[str, str]: the needed headers
@@ -223,8 +225,13 @@ def headers_sdc_artifact_upload(base_header: Dict[str, str], data: str) -> Dict[
     headers["Accept"] = "application/json, text/plain, */*"
     headers["Accept-Encoding"] = "gzip, deflate, br"
     headers["Content-Type"] = "application/json; charset=UTF-8"
-    md5_content = hashlib.new('md5', data.encode('UTF-8'),        # nosec  # NOSONAR
-                              usedforsecurity=False).hexdigest()  # nosec
+    md5 = hashlib.new('md5', usedforsecurity=False)  # nosec  # NOSONAR
+    if isinstance(data, str):
+        md5.update(data.encode('UTF-8'))
+    else:
+        for chunk in data:
+            md5.update(chunk)
+    md5_content = md5.hexdigest()
     content = base64.b64encode(md5_content.encode('ascii')).decode('UTF-8')
     headers["Content-MD5"] = content
     return headers
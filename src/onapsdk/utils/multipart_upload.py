@@ -0,0 +1,211 @@
+"""Streamed multipart file upload module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import logging
+import os
+import time
+from dataclasses import dataclass
+from io import SEEK_END
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+from uuid import uuid4
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import APIError, ConnectionFailed
+
+TRANSIENT_STATUS_CODES = (502, 503, 504)
+
+
+@dataclass(frozen=True)
+class UploadProgress:
+    """Upload progress snapshot."""
+
+    sent: int
+    total: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Average upload throughput.
+
+        Returns:
+            float: Bytes sent per second
+
+        """
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def done(self) -> bool:
+        """Check if the whole request body was sent.
+
+        Returns:
+            bool: True if upload is finished, False otherwise
+
+        """
+        return self.sent >= self.total
+
+
+ProgressCallback = Callable[[UploadProgress], None]
+
+
+class MultipartUpload:  # pylint: disable=too-many-instance-attributes
+    """multipart/form-data request body with one file streamed from disk.
+
+    File is read chunk by chunk when the body is iterated, so memory usage
+        doesn't depend on the file size. Each iteration starts from the
+        file position the upload was created with, so the same body can be
+        sent again when upload is retried. Body length is known up front, so
+        it's not sent with chunked encoding.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 field_name: str,
+                 file: BinaryIO,
+                 filename: Optional[str] = None,
+                 chunk_size: Optional[int] = None,
+                 progress_callback: Optional[ProgressCallback] = None) -> None:
+        """Initialize upload.
+
+        Args:
+            field_name (str): Form field name
+            file (BinaryIO): Seekable file to upload
+            filename (Optional[str], optional): File name sent in the form. Defaults to None,
+                so the name of the file is used (the same way as requests does).
+            chunk_size (Optional[int], optional): Number of file bytes read at once.
+                Defaults to None, so SDC_PACKAGE_UPLOAD_CHUNK_SIZE setting value is used.
+            progress_callback (Optional[ProgressCallback], optional): Function called
+                with upload progress after each chunk is sent. Defaults to None.
+
+        """
+        self.file: BinaryIO = file
+        self.chunk_size: int = chunk_size or settings.SDC_PACKAGE_UPLOAD_CHUNK_SIZE
+        self.progress_callback: Optional[ProgressCallback] = progress_callback
+        self.progress: Optional[UploadProgress] = None
+        if filename is None:
+            name: Any = getattr(file, "name", None)
+            filename = (os.path.basename(name) if isinstance(name, str) and name[:1] != "<"
+                        else field_name)
+        boundary: str = uuid4().hex
+        self.content_type: str = f"multipart/form-data; boundary={boundary}"
+        self._header: bytes = (f"--{boundary}\r\n"
+                               f'Content-Disposition: form-data; name="{field_name}"; '
+                               f'filename="{filename}"\r\n\r\n').encode("utf-8")
+        self._footer: bytes = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        self._start: Optional[int] = None
+
+    @property
+    def start(self) -> int:
+        """File position the upload starts from.
+
+        Returns:
+            int: File position
+
+        """
+        if self._start is None:
+            self._start = self.file.tell()
+        return self._start
+
+    def __len__(self) -> int:
+        """Get request body length.
+
+        Returns:
+            int: Request body length, in bytes
+
+        """
+        start: int = self.start
+        file_size: int = self.file.seek(0, SEEK_END)
+        self.file.seek(start)
+        return len(self._header) + file_size - start + len(self._footer)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate through request body chunks.
+
+        Progress callback is called after each chunk.
+
+        Yields:
+            bytes: Request body chunk
+
+        """
+        total: int = len(self)
+        sent: int = 0
+        started_at: float = time.monotonic()
+
+        def report(chunk: bytes) -> None:
+            nonlocal sent
+            sent += len(chunk)
+            self.progress = UploadProgress(sent=sent, total=total,
+                                           elapsed=time.monotonic() - started_at)
+            if self.progress_callback:
+                self.progress_callback(self.progress)
+
+        self.file.seek(self.start)
+        yield self._header
+        report(self._header)
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+            report(chunk)
+        yield self._footer
+        report(self._footer)
+        self._logger.info("Uploaded %d bytes in %.1f s (%.1f MB/s)", sent,
+                          self.progress.elapsed, self.progress.throughput / 1024 / 1024)
+
+    def __repr__(self) -> str:
+        """Get upload representation, used when request body is logged.
+
+        Returns:
+            str: Upload representation
+
+        """
+        return f"MultipartUpload({self.content_type!r})"
+
+
+def send_with_retries(send: Callable[[], Any],
+                      retries: Optional[int] = None,
+                      backoff: float = 1.0) -> Any:
+    """Send request again on transient failure.
+
+    Connection failures and 502, 503 and 504 responses are transient. Request
+        body has to be re-iterable, e.g. MultipartUpload.
+
+    Args:
+        send (Callable[[], Any]): Function which sends request
+        retries (Optional[int], optional): Number of retries. Defaults to None, so
+            SDC_PACKAGE_UPLOAD_RETRIES setting value is used.
+        backoff (float, optional): Delay before the first retry, doubled for each
+            next one, in seconds. Defaults to 1.0.
+
+    Raises:
+        ConnectionFailed: Connection failed and there are no more retries
+        APIError: Error response received and there are no more retries
+
+    Returns:
+        Any: Value returned by `send`
+
+    """
+    if retries is None:
+        retries = settings.SDC_PACKAGE_UPLOAD_RETRIES
+    attempt: int = 0
+    while True:
+        try:
+            return send()
+        except (ConnectionFailed, APIError) as exc:
+            if (attempt >= retries or (isinstance(exc, APIError) and
+                                       exc.response_status_code not in TRANSIENT_STATUS_CODES)):
+                raise
+            delay: float = backoff * 2 ** attempt
+            attempt += 1
+            logging.getLogger(__name__).warning(
+                "Upload failed (%s), retry %d of %d in %.1f s", exc, attempt, retries, delay)
+            time.sleep(delay)
@@ -0,0 +1,174 @@
+"""Readiness polling module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Iterator, Optional
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import PollingTimeout
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """Delays between polls and polling deadline.
+
+    Delay starts with `initial_delay` and is multiplied by `multiplier` after
+        each poll, up to `max_delay`. Each delay is randomly changed by up to
+        `jitter` fraction of it, so parallel pollers don't poll at once.
+    """
+
+    initial_delay: float = 0.5
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
+    timeout: float = 300.0
+
+    @classmethod
+    def from_settings(cls) -> "PollingPolicy":
+        """Create policy configured by SDC_POLLING_* settings.
+
+        Returns:
+            PollingPolicy: Polling policy
+
+        """
+        return cls(initial_delay=settings.SDC_POLLING_INITIAL_DELAY,
+                   max_delay=settings.SDC_POLLING_MAX_DELAY,
+                   multiplier=settings.SDC_POLLING_MULTIPLIER,
+                   jitter=settings.SDC_POLLING_JITTER,
+                   timeout=settings.SDC_POLLING_TIMEOUT)
+
+    def delays(self) -> Iterator[float]:
+        """Iterate through delays between polls.
+
+        Yields:
+            float: Delay before the next poll, in seconds
+
+        """
+        delay: float = self.initial_delay
+        while True:
+            yield max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))  # nosec
+            delay = min(delay * self.multiplier, self.max_delay)
+
+
+class PollingMetrics:
+    """Time spent on waiting for SDC and on working with it.
+
+    Metrics are updated by all threads, `POLLING_METRICS` instance is shared
+        by the whole process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self._lock: Lock = Lock()
+        self.waiting: float = 0.0
+        self.working: float = 0.0
+        self.polls: int = 0
+
+    def add_waiting(self, seconds: float) -> None:
+        """Add time spent on waiting between polls.
+
+        Args:
+            seconds (float): Waiting time, in seconds
+
+        """
+        with self._lock:
+            self.waiting += seconds
+
+    def add_working(self, seconds: float, polls: int = 0) -> None:
+        """Add time spent on requests and checks.
+
+        Args:
+            seconds (float): Working time, in seconds
+            polls (int, optional): Number of polls done in that time. Defaults to 0.
+
+        """
+        with self._lock:
+            self.working += seconds
+            self.polls += polls
+
+    @contextmanager
+    def measure(self, polls: int = 0) -> Iterator[None]:
+        """Measure working time of the code block.
+
+        Args:
+            polls (int, optional): Number of polls done by the block. Defaults to 0.
+
+        """
+        started_at: float = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_working(time.monotonic() - started_at, polls)
+
+    def reset(self) -> None:
+        """Reset all metrics."""
+        with self._lock:
+            self.waiting, self.working, self.polls = 0.0, 0.0, 0
+
+    def __repr__(self) -> str:
+        """Get metrics representation.
+
+        Returns:
+            str: Metrics representation
+
+        """
+        return (f"PollingMetrics(waiting={self.waiting:.1f}s, "
+                f"working={self.working:.1f}s, polls={self.polls})")
+
+
+POLLING_METRICS = PollingMetrics()
+
+
+def wait_until(condition: Callable[[], bool],
+               description: str,
+               policy: Optional[PollingPolicy] = None,
+               metrics: Optional[PollingMetrics] = None) -> None:
+    """Poll until condition is met.
+
+    Condition is checked at once and then after each delay of the policy,
+        so function returns as soon as condition is met.
+
+    Args:
+        condition (Callable[[], bool]): Function which checks the actual state
+        description (str): Awaited state description, used in logs and errors
+        policy (Optional[PollingPolicy], optional): Polling policy. Defaults to None,
+            so policy configured by settings is used.
+        metrics (Optional[PollingMetrics], optional): Metrics to update.
+            Defaults to None, so `POLLING_METRICS` are updated.
+
+    Raises:
+        PollingTimeout: Condition wasn't met before policy timeout
+
+    """
+    policy = policy or PollingPolicy.from_settings()
+    metrics = metrics or POLLING_METRICS
+    logger: logging.Logger = logging.getLogger(__name__)
+    deadline: float = time.monotonic() + policy.timeout
+    delays: Iterator[float] = policy.delays()
+    while True:
+        with metrics.measure(polls=1):
+            if condition():
+                return
+        remaining: float = deadline - time.monotonic()
+        if remaining <= 0:
+            raise PollingTimeout(f"{description} wasn't reached in {policy.timeout} s")
+        delay: float = min(next(delays), remaining)
+        logger.debug("Waiting %.1f s for %s", delay, description)
+        time.sleep(delay)
+        metrics.add_waiting(delay)
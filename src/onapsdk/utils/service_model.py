@@ -0,0 +1,645 @@
+"""Service model module."""
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import json
+import re
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Collection, Dict, Iterator, Mapping, Optional, Tuple, Union
+from zipfile import ZipFile
+
+from yaml import MappingNode, Node, ScalarNode
+try:
+    from yaml import CSafeLoader as TemplateLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as TemplateLoader  # type: ignore
+
+from onapsdk.exceptions import ValidationError
+
+SERVICE_TEMPLATE_REGEX = re.compile(r"^Definitions/service-.*-template\.yml$")
+VF_MODULE_GROUP_TYPE = "org.openecomp.groups.VfModule"
+# Template sections read by ServiceModel: top level section -> its subsections (None for all)
+TemplateSections = Mapping[str, Optional[Collection[str]]]
+MODEL_TEMPLATE_SECTIONS: TemplateSections = MappingProxyType({
+    "metadata": None,
+    "topology_template": ("node_templates", "groups", "inputs")
+})
+
+
+def _frozen(mapping: Optional[Mapping[str, Any]] = None) -> Mapping[str, Any]:
+    """Get read-only view of a mapping.
+
+    Args:
+        mapping (Optional[Mapping[str, Any]], optional): Mapping. Defaults to None,
+            so an empty mapping is returned.
+
+    Returns:
+        Mapping[str, Any]: Read-only mapping
+
+    """
+    return MappingProxyType(dict(mapping or {}))
+
+
+def _select_sections(node: Node, sections: Optional[Collection[str]]) -> Node:
+    """Get a copy of YAML mapping node with given keys only.
+
+    Args:
+        node (Node): YAML node
+        sections (Optional[Collection[str]]): Keys to keep. If it's a mapping, its values
+            are the keys to keep in the nested mappings. None to keep the whole node.
+
+    Returns:
+        Node: Node with given keys only
+
+    """
+    if sections is None or not isinstance(node, MappingNode):
+        return node
+    return MappingNode(
+        node.tag,
+        [(key, _select_sections(value, sections.get(key.value)
+                                if isinstance(sections, Mapping) else None))
+         for key, value in node.value
+         if isinstance(key, ScalarNode) and key.value in sections],
+        node.start_mark,
+        node.end_mark,
+        flow_style=node.flow_style
+    )
+
+
+def load_template(content: Union[bytes, str],
+                  sections: Optional[TemplateSections] = None) -> Dict[str, Any]:
+    """Load TOSCA template YAML.
+
+    libyaml based loader is used if it's available. Whole document is parsed, but
+        only given sections are converted into Python objects, which is the most
+        time consuming part of loading. Mappings keep the document keys order.
+
+    Args:
+        content (Union[bytes, str]): Template YAML
+        sections (Optional[TemplateSections], optional): Top level sections to load
+            with their subsections to load (None for all of them). Defaults to None,
+            so the whole template is loaded.
+
+    Returns:
+        Dict[str, Any]: Template, empty dictionary if YAML document is empty
+
+    """
+    loader: TemplateLoader = TemplateLoader(content)
+    try:
+        node: Optional[Node] = loader.get_single_node()
+        if node is None:
+            return {}
+        return loader.construct_document(_select_sections(node, sections))
+    finally:
+        loader.dispose()
+
+
+def load_service_template(csar: bytes,
+                          sections: Optional[TemplateSections] = None) -> Dict[str, Any]:
+    """Load service TOSCA template from service CSAR.
+
+    Args:
+        csar (bytes): Service CSAR file content
+        sections (Optional[TemplateSections], optional): Template sections to load.
+            Defaults to None, so the whole template is loaded.
+
+    Raises:
+        ValidationError: CSAR file has no service template
+
+    Returns:
+        Dict[str, Any]: Service template
+
+    """
+    with ZipFile(BytesIO(csar)) as csar_file:
+        for name in csar_file.namelist():
+            if SERVICE_TEMPLATE_REGEX.match(name):
+                with csar_file.open(name) as template_file:
+                    return load_template(template_file.read(), sections)
+    raise ValidationError("CSAR file has no service template. "
+                          "Valid path: Definitions/service-*-template.yml")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize node template name the way SDC does in group names.
+
+    Args:
+        name (str): Node template name, e.g. "ubuntu16_VF 0"
+
+    Returns:
+        str: Normalized name, e.g. "ubuntu16_vf0"
+
+    """
+    return re.sub(r"[^\w]", "", name).lower()
+
+
+def tosca_type(value: Any) -> str:
+    """Get TOSCA type of the template property value.
+
+    Args:
+        value (Any): Property value
+
+    Returns:
+        str: TOSCA type, "string" for the values of other types
+
+    """
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, (list, tuple)):
+        return "list"
+    if isinstance(value, Mapping):
+        return "map"
+    return "string"
+
+
+@dataclass(frozen=True)
+class ModelGroup:  # pylint: disable=too-many-instance-attributes
+    """Service model group, e.g. VF module."""
+
+    name: str
+    group_type: str
+    model_name: Optional[str] = None
+    model_version_id: Optional[str] = None
+    model_invariant_id: Optional[str] = None
+    model_version: Optional[str] = None
+    model_customization_id: Optional[str] = None
+    properties: Mapping[str, Any] = field(default_factory=_frozen)
+
+    def __hash__(self) -> int:
+        """Get group hash.
+
+        Properties mapping isn't hashable, so group is hashed by its name and model UUIDs.
+
+        Returns:
+            int: Group hash
+
+        """
+        return hash((self.name, self.model_version_id, self.model_customization_id))
+
+    @classmethod
+    def from_template(cls, name: str, template: Dict[str, Any]) -> "ModelGroup":
+        """Create group from its TOSCA template.
+
+        Args:
+            name (str): Group name
+            template (Dict[str, Any]): Group TOSCA template
+
+        Returns:
+            ModelGroup: Group
+
+        """
+        metadata: Dict[str, Any] = template.get("metadata") or {}
+        return cls(name=name,
+                   group_type=template.get("type", ""),
+                   model_name=metadata.get("vfModuleModelName"),
+                   model_version_id=metadata.get("vfModuleModelUUID"),
+                   model_invariant_id=metadata.get("vfModuleModelInvariantUUID"),
+                   model_version=metadata.get("vfModuleModelVersion"),
+                   model_customization_id=metadata.get("vfModuleModelCustomizationUUID"),
+                   properties=_frozen(template.get("properties")))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get group as a dictionary which can be serialized to JSON.
+
+        Returns:
+            Dict[str, Any]: Group dictionary
+
+        """
+        return {"name": self.name,
+                "group_type": self.group_type,
+                "model_name": self.model_name,
+                "model_version_id": self.model_version_id,
+                "model_invariant_id": self.model_invariant_id,
+                "model_version": self.model_version,
+                "model_customization_id": self.model_customization_id,
+                "properties": dict(self.properties)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelGroup":
+        """Create group from its dictionary.
+
+        Args:
+            data (Dict[str, Any]): Group dictionary
+
+        Returns:
+            ModelGroup: Group
+
+        """
+        return cls(**{**data, "properties": _frozen(data.get("properties"))})
+
+
+@dataclass(frozen=True)
+class ModelNodeTemplate:  # pylint: disable=too-many-instance-attributes
+    """Service model node template, e.g. VNF, PNF or network."""
+
+    name: str
+    node_type: str
+    origin_type: Optional[str] = None
+    model_name: Optional[str] = None
+    model_version_id: Optional[str] = None
+    model_invariant_id: Optional[str] = None
+    model_version: Optional[str] = None
+    model_customization_id: Optional[str] = None
+    properties: Mapping[str, Any] = field(default_factory=_frozen)
+    groups: Tuple[ModelGroup, ...] = ()
+
+    def __hash__(self) -> int:
+        """Get node template hash.
+
+        Properties mapping isn't hashable, so node template is hashed by its name
+            and model UUIDs.
+
+        Returns:
+            int: Node template hash
+
+        """
+        return hash((self.name, self.model_version_id, self.model_customization_id))
+
+    @classmethod
+    def from_template(cls,
+                      name: str,
+                      template: Dict[str, Any],
+                      groups: Tuple[ModelGroup, ...] = ()) -> "ModelNodeTemplate":
+        """Create node template from its TOSCA template.
+
+        Args:
+            name (str): Node template name
+            template (Dict[str, Any]): Node template TOSCA template
+            groups (Tuple[ModelGroup, ...], optional): Node template groups. Defaults to ().
+
+        Returns:
+            ModelNodeTemplate: Node template
+
+        """
+        metadata: Dict[str, Any] = template.get("metadata") or {}
+        return cls(name=name,
+                   node_type=template.get("type", ""),
+                   origin_type=metadata.get("type"),
+                   model_name=metadata.get("name"),
+                   model_version_id=metadata.get("UUID"),
+                   model_invariant_id=metadata.get("invariantUUID"),
+                   model_version=metadata.get("version"),
+                   model_customization_id=metadata.get("customizationUUID"),
+                   properties=_frozen(template.get("properties")),
+                   groups=groups)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get node template as a dictionary which can be serialized to JSON.
+
+        Returns:
+            Dict[str, Any]: Node template dictionary
+
+        """
+        return {"name": self.name,
+                "node_type": self.node_type,
+                "origin_type": self.origin_type,
+                "model_name": self.model_name,
+                "model_version_id": self.model_version_id,
+                "model_invariant_id": self.model_invariant_id,
+                "model_version": self.model_version,
+                "model_customization_id": self.model_customization_id,
+                "properties": dict(self.properties),
+                "groups": [group.to_dict() for group in self.groups]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelNodeTemplate":
+        """Create node template from its dictionary.
+
+        Args:
+            data (Dict[str, Any]): Node template dictionary
+
+        Returns:
+            ModelNodeTemplate: Node template
+
+        """
+        return cls(**{**data,
+                      "properties": _frozen(data.get("properties")),
+                      "groups": tuple(ModelGroup.from_dict(group)
+                                      for group in data.get("groups", []))})
+
+
+@dataclass(frozen=True)
+class ModelInput:
+    """Service model input."""
+
+    name: str
+    input_type: Optional[str] = None
+    default: Any = None
+    description: Optional[str] = None
+    required: bool = False
+
+    def __hash__(self) -> int:
+        """Get input hash.
+
+        Default value can be a mapping or a list, so input is hashed by its name and type.
+
+        Returns:
+            int: Input hash
+
+        """
+        return hash((self.name, self.input_type))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get input as a dictionary which can be serialized to JSON.
+
+        Returns:
+            Dict[str, Any]: Input dictionary
+
+        """
+        return {"name": self.name,
+                "input_type": self.input_type,
+                "default": self.default,
+                "description": self.description,
+                "required": self.required}
+
+
+@dataclass(frozen=True)
+class ServiceModel:  # pylint: disable=too-many-instance-attributes
+    """Read-only snapshot of service model, built once from service TOSCA template.
+
+    It contains service, node templates and groups model identifiers, node
+        templates properties and service inputs, so they can be read (or saved
+        and loaded from a file) without SDC. Node templates and groups are
+        indexed by name and by their model (version, invariant and customization)
+        UUIDs. Snapshots are compared and hashed by value, mappings in them
+        are read-only views. SDC service VNFs, PNFs, networks and VF modules
+        used by SO instantiation are built from it.
+    """
+
+    name: str
+    model_version_id: Optional[str] = None
+    model_invariant_id: Optional[str] = None
+    instantiation_type: Optional[str] = None
+    metadata: Mapping[str, Any] = field(default_factory=_frozen)
+    node_templates: Tuple[ModelNodeTemplate, ...] = ()
+    groups: Tuple[ModelGroup, ...] = ()
+    inputs: Tuple[ModelInput, ...] = ()
+    _by_name: Mapping[str, Union[ModelNodeTemplate, ModelGroup]] = field(
+        init=False, repr=False, compare=False)
+    _by_uuid: Mapping[str, Union[ModelNodeTemplate, ModelGroup]] = field(
+        init=False, repr=False, compare=False)
+    _inputs_by_name: Mapping[str, ModelInput] = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        """Get service model hash.
+
+        Metadata mapping isn't hashable, so model is hashed by its name and model UUIDs.
+
+        Returns:
+            int: Service model hash
+
+        """
+        return hash((self.name, self.model_version_id, self.model_invariant_id))
+
+    def __post_init__(self) -> None:
+        """Build indexes."""
+        by_name: Dict[str, Union[ModelNodeTemplate, ModelGroup]] = {}
+        by_uuid: Dict[str, Union[ModelNodeTemplate, ModelGroup]] = {}
+        for item in (*self.node_templates, *self.groups):
+            by_name.setdefault(item.name, item)
+            for uuid in (item.model_customization_id,
+                         item.model_version_id,
+                         item.model_invariant_id):
+                if uuid:
+                    by_uuid.setdefault(uuid, item)
+        object.__setattr__(self, "_by_name", MappingProxyType(by_name))
+        object.__setattr__(self, "_by_uuid", MappingProxyType(by_uuid))
+        object.__setattr__(self, "_inputs_by_name",
+                           MappingProxyType({model_input.name: model_input
+                                             for model_input in self.inputs}))
+
+    @classmethod
+    def from_template(cls, template: Dict[str, Any]) -> "ServiceModel":
+        """Create service model from service TOSCA template.
+
+        VF modules groups are assigned to the node templates which normalized name
+            is their name prefix.
+
+        Args:
+            template (Dict[str, Any]): Service TOSCA template
+
+        Returns:
+            ServiceModel: Service model
+
+        """
+        metadata: Dict[str, Any] = template.get("metadata") or {}
+        topology_template: Dict[str, Any] = template.get("topology_template") or {}
+        groups: Tuple[ModelGroup, ...] = tuple(
+            ModelGroup.from_template(name, group_template) for name, group_template in
+            (topology_template.get("groups") or {}).items()
+        )
+        node_groups: Dict[str, Tuple[ModelGroup, ...]] = {}
+        for group in groups:
+            if group.group_type == VF_MODULE_GROUP_TYPE:
+                node_name: str = group.name.split("..", maxsplit=1)[0]
+                node_groups[node_name] = node_groups.get(node_name, ()) + (group,)
+        return cls(
+            name=metadata.get("name", ""),
+            model_version_id=metadata.get("UUID"),
+            model_invariant_id=metadata.get("invariantUUID"),
+            instantiation_type=metadata.get("instantiationType"),
+            metadata=_frozen(metadata),
+            node_templates=tuple(
+                ModelNodeTemplate.from_template(
+                    name, node_template, node_groups.get(normalize_name(name), ()))
+                for name, node_template in
+                (topology_template.get("node_templates") or {}).items()
+            ),
+            groups=groups,
+            inputs=tuple(
+                ModelInput(name=name,
+                           input_type=input_template.get("type"),
+                           default=input_template.get("default"),
+                           description=input_template.get("description"),
+                           required=bool(input_template.get("required", False)))
+                for name, input_template in (topology_template.get("inputs") or {}).items()
+            )
+        )
+
+    @classmethod
+    def from_csar(cls, csar: bytes) -> "ServiceModel":
+        """Create service model from service CSAR.
+
+        Only the template sections used by the model are loaded.
+
+        Args:
+            csar (bytes): Service CSAR file content
+
+        Raises:
+            ValidationError: CSAR file has no service template
+
+        Returns:
+            ServiceModel: Service model
+
+        """
+        return cls.from_template(load_service_template(csar, MODEL_TEMPLATE_SECTIONS))
+
+    def _filter_origin_type(self, origin_type: str) -> Iterator[ModelNodeTemplate]:
+        """Iterate through node templates of given origin type.
+
+        Args:
+            origin_type (str): Origin type, e.g. "VF"
+
+        Yields:
+            ModelNodeTemplate: Node template
+
+        """
+        yield from (node_template for node_template in self.node_templates
+                    if node_template.origin_type == origin_type)
+
+    @property
+    def vnfs(self) -> Tuple[ModelNodeTemplate, ...]:
+        """Service model VNFs.
+
+        Returns:
+            Tuple[ModelNodeTemplate, ...]: VF node templates
+
+        """
+        return tuple(self._filter_origin_type("VF"))
+
+    @property
+    def pnfs(self) -> Tuple[ModelNodeTemplate, ...]:
+        """Service model PNFs.
+
+        Returns:
+            Tuple[ModelNodeTemplate, ...]: PNF node templates
+
+        """
+        return tuple(self._filter_origin_type("PNF"))
+
+    @property
+    def networks(self) -> Tuple[ModelNodeTemplate, ...]:
+        """Service model networks.
+
+        Returns:
+            Tuple[ModelNodeTemplate, ...]: VL node templates
+
+        """
+        return tuple(self._filter_origin_type("VL"))
+
+    @property
+    def vf_modules(self) -> Tuple[ModelGroup, ...]:
+        """Service model VF modules.
+
+        Returns:
+            Tuple[ModelGroup, ...]: VF module groups
+
+        """
+        return tuple(group for group in self.groups if group.group_type == VF_MODULE_GROUP_TYPE)
+
+    def get_by_name(self, name: str) -> Optional[Union[ModelNodeTemplate, ModelGroup]]:
+        """Get node template or group by its name.
+
+        Args:
+            name (str): Node template or group name
+
+        Returns:
+            Optional[Union[ModelNodeTemplate, ModelGroup]]: Node template or group,
+                None if there is no such one
+
+        """
+        return self._by_name.get(name)
+
+    def get_by_uuid(self, uuid: str) -> Optional[Union[ModelNodeTemplate, ModelGroup]]:
+        """Get node template or group by its model customization, version or invariant UUID.
+
+        Args:
+            uuid (str): Model UUID
+
+        Returns:
+            Optional[Union[ModelNodeTemplate, ModelGroup]]: Node template or group,
+                None if there is no such one
+
+        """
+        return self._by_uuid.get(uuid)
+
+    def get_input(self, name: str) -> Optional[ModelInput]:
+        """Get service input by its name.
+
+        Args:
+            name (str): Input name
+
+        Returns:
+            Optional[ModelInput]: Input, None if there is no such one
+
+        """
+        return self._inputs_by_name.get(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get service model as a dictionary which can be serialized to JSON.
+
+        Returns:
+            Dict[str, Any]: Service model dictionary
+
+        """
+        return {"name": self.name,
+                "model_version_id": self.model_version_id,
+                "model_invariant_id": self.model_invariant_id,
+                "instantiation_type": self.instantiation_type,
+                "metadata": dict(self.metadata),
+                "node_templates": [node_template.to_dict()
+                                   for node_template in self.node_templates],
+                "groups": [group.to_dict() for group in self.groups],
+                "inputs": [model_input.to_dict() for model_input in self.inputs]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServiceModel":
+        """Create service model from its dictionary.
+
+        Args:
+            data (Dict[str, Any]): Service model dictionary
+
+        Returns:
+            ServiceModel: Service model
+
+        """
+        return cls(name=data["name"],
+                   model_version_id=data.get("model_version_id"),
+                   model_invariant_id=data.get("model_invariant_id"),
+                   instantiation_type=data.get("instantiation_type"),
+                   metadata=_frozen(data.get("metadata")),
+                   node_templates=tuple(ModelNodeTemplate.from_dict(node_template)
+                                        for node_template in data.get("node_templates", [])),
+                   groups=tuple(ModelGroup.from_dict(group) for group in data.get("groups", [])),
+                   inputs=tuple(ModelInput(**model_input)
+                                for model_input in data.get("inputs", [])))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save service model into JSON file.
+
+        Args:
+            path (Union[str, Path]): File path
+
+        """
+        with open(path, "w", encoding="utf-8") as model_file:
+            json.dump(self.to_dict(), model_file, default=str)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ServiceModel":
+        """Load service model from JSON file.
+
+        Args:
+            path (Union[str, Path]): File path
+
+        Returns:
+            ServiceModel: Service model
+
+        """
+        with open(path, encoding="utf-8") as model_file:
+            return cls.from_dict(json.load(model_file))
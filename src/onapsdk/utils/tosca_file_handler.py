@@ -15,16 +15,159 @@
 import json
 import string
 import secrets
-from typing import Any, Dict, List
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from onapsdk.exceptions import ValidationError
 
+
+class ToscaTemplate:
+    """TOSCA template parsed once, with indexed topology template sections.
+
+    Node templates are indexed by type, groups by type and inputs by name,
+        so lookups don't go through the whole template again. Template
+        parsed from a JSON string is shared by all `from_json` calls with
+        the same string, so its content must not be modified.
+    """
+
+    def __init__(self, template: Dict[str, Any]) -> None:
+        """Index TOSCA template.
+
+        Args:
+            template (Dict[str, Any]): Parsed TOSCA template
+
+        """
+        self.template: Dict[str, Any] = template
+        topology_template: Dict[str, Any] = template.get("topology_template") or {}
+        self.node_templates: Dict[str, Dict[str, Any]] = \
+            topology_template.get("node_templates") or {}
+        self.groups: Dict[str, Dict[str, Any]] = topology_template.get("groups") or {}
+        self.inputs: Dict[str, Dict[str, Any]] = topology_template.get("inputs") or {}
+        self._node_templates_by_type: Dict[str, List[str]] = {}
+        for name, node_template in self.node_templates.items():
+            self._node_templates_by_type.setdefault(node_template.get("type"), []).append(name)
+        self._groups_by_type: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for name, group in self.groups.items():
+            self._groups_by_type.setdefault(group.get("type"), {})[name] = group
+        self._node_templates_by_type_prefix: Dict[str, List[str]] = {}
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def from_json(cls, model: str) -> "ToscaTemplate":
+        """Parse TOSCA template serialized to JSON.
+
+        Parsed templates of the recently used strings are reused.
+
+        Args:
+            model (str): TOSCA template serialized to JSON
+
+        Returns:
+            ToscaTemplate: Parsed template
+
+        """
+        return cls(json.loads(model))
+
+    def get(self, parameter: str) -> Any:
+        """Get the value of a given parameter.
+
+        Parameter must be given in string format with dots, e.g. "metadata.name".
+            Parameters with dots in their names have to use "..", e.g.
+            "topology_template.groups.ubuntu16_vf0..Ubuntu16Vf..base_ubuntu16..module-0"
+
+        Args:
+            parameter (str): Parameter path
+
+        Raises:
+            ValidationError: parameter not defined
+
+        Returns:
+            Any: the value of the parameter
+
+        """
+        value: Any = self.template
+        # Workaround for the .. within the params in the yaml file
+        ugly_param = parameter.replace("..", "##")
+        for element in ugly_param.split("."):
+            value = value.get(element.replace("##", ".."))
+            if value is None:
+                msg = f"{element} in the {parameter} is not in YAML config file."
+                raise ValidationError(msg)
+        return value
+
+    def get_node_templates_by_type_prefix(self, type_prefix: str) -> List[str]:
+        """Get names of node templates which types start with given prefix.
+
+        Args:
+            type_prefix (str): Node type prefix, e.g. "org.openecomp.resource.vf"
+
+        Returns:
+            List[str]: Node templates names, in template order
+
+        """
+        if type_prefix not in self._node_templates_by_type_prefix:
+            self._node_templates_by_type_prefix[type_prefix] = [
+                name for name, node_template in self.node_templates.items()
+                if str(node_template.get("type")).startswith(type_prefix)
+            ]
+        return self._node_templates_by_type_prefix[type_prefix]
+
+    def get_node_templates_by_type(self, node_type: str) -> List[str]:
+        """Get names of node templates of given type.
+
+        Args:
+            node_type (str): Node type
+
+        Returns:
+            List[str]: Node templates names, in template order
+
+        """
+        return self._node_templates_by_type.get(node_type, [])
+
+    def get_groups_by_type(self, group_type: str) -> Dict[str, Dict[str, Any]]:
+        """Get groups of given type.
+
+        Args:
+            group_type (str): Group type, e.g. "org.openecomp.groups.VfModule"
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Groups by name
+
+        """
+        return self._groups_by_type.get(group_type, {})
+
+    def get_input(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get template input.
+
+        Args:
+            name (str): Input name
+
+        Returns:
+            Optional[Dict[str, Any]]: Input definition, None if there is no such input
+
+        """
+        return self.inputs.get(name)
+
+    def get_vf_list(self) -> List[str]:
+        """Get the list of Vfs.
+
+        Returns:
+            List[str]: Names of VF node templates without instance number
+
+        """
+        return [str(node).split(" ", maxsplit=1)[0]
+                for node in self.get_node_templates_by_type_prefix("org.openecomp.resource.vf")]
+
+
 def get_parameter_from_yaml(parameter: str, config_file: str) -> Any:
     """Get the value of a given parameter in file.yaml.
 
     Parameter must be given in string format with dots
     Example: general.openstack.image_name
 
+    Parsed template is shared with other calls, so a copy of the value is
+    returned and modifying it doesn't change the template.
+
     Args:
         parameter (str):
         config_file (str): configuration yaml file formtatted as string
@@ -36,17 +179,7 @@ def get_parameter_from_yaml(parameter: str, config_file: str) -> Any:
         the value of the parameter
 
     """
-    value = json.loads(config_file)
-
-    # Workaround for the .. within the params in the yaml file
-    ugly_param = parameter.replace("..", "##")
-    for element in ugly_param.split("."):
-        value = value.get(element.replace("##", ".."))
-        if value is None:
-            msg = f"{element} in the {parameter} is not in YAML config file."
-            raise ValidationError(msg)
-
-    return value
+    return deepcopy(ToscaTemplate.from_json(config_file).get(parameter))
 
 def get_vf_list_from_tosca_file(model: str) -> List:
     """Get the list of Vfs of a VNF based on the tosca file.
@@ -59,20 +192,7 @@ def get_vf_list_from_tosca_file(model: str) -> List:
         list: a list of Vfs
 
     """
-    newlist = []
-    node_list = get_parameter_from_yaml(
-        "topology_template.node_templates", model)
-
-    for node in node_list:
-        value = get_parameter_from_yaml(
-            "topology_template.node_templates." + node + ".type",
-            model)
-        if "org.openecomp.resource.vf" in value:
-            print(node, value)
-            if node not in newlist:
-                search_value = str(node).split(" ", maxsplit=1)[0]
-                newlist.append(search_value)
-    return newlist
+    return ToscaTemplate.from_json(model).get_vf_list()
 
 def get_modules_list_from_tosca_file(model: str) -> Dict:
     """Get the list of modules from tosca file.
@@ -0,0 +1,44 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import pytest
+
+from onapsdk.configuration import settings
+from onapsdk.sdc import SDC
+from onapsdk.sdc.sdc_resource import SdcResource
+from onapsdk.sdc2.sdc import SDCCatalog
+from onapsdk.sdc2.sdc_onboarding_api import SdcOnboardingApiItem
+from onapsdk.sdc2.sdc_resource import SDCResource
+
+
+@pytest.fixture(autouse=True)
+def disable_sdc_catalog_cache(monkeypatch):
+    """Fetch SDC catalog and sdc2 catalog screen on each lookup.
+
+    Tests mock the catalog content differently, even within one test, so snapshots
+        (also sdc catalog screen and sdc2 categories and users indexes) can't be shared. Tests of the
+        catalog cache enable it explicitly. Components metadata and onboarding items IDs memoized by other tests
+        are dropped too.
+    """
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 0)
+    SDC._catalogs.invalidate()
+    SDCResource.screen_index.invalidate()
+    SDCCatalog._catalog_indexes.invalidate()
+    SdcResource._components_metadata.clear()
+    SdcResource._screens.invalidate()
+    SdcOnboardingApiItem._item_ids.clear()
+    yield
+    SDC._catalogs.invalidate()
+    SdcResource._screens.invalidate()
+    SDCResource.screen_index.invalidate()
+    SDCCatalog._catalog_indexes.invalidate()
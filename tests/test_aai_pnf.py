@@ -222,4 +222,24 @@ def test_put_in_aai_failure(mock_send_message):
                                serial_number="test_serial_number",
                                in_maint=False)
     with pytest.raises(ConnectionFailed):
-        pnf_instance.put_in_aai()
\ No newline at end of file
+        pnf_instance.put_in_aai()
+
+@mock.patch.object(ServiceInstance, "get_by_url")
+@mock.patch.object(PnfInstance, "send_message_json")
+def test_pnf_get_by_name_and_id(mock_send_message_json, mock_get_by_url):
+    mock_send_message_json.return_value = {
+        "results": [{"url": "/aai/v27/network/pnfs/pnf/blablabla", "pnf": PNF_INSTANCE}]
+    }
+    pnf_instance = PnfInstance.get_by_name("blablabla")
+    assert "/nodes/pnfs?pnf-name=blablabla" in mock_send_message_json.call_args[0][2]
+    assert pnf_instance.pnf_name == "blablabla"
+    mock_get_by_url.assert_not_called()
+    assert pnf_instance.service_instance == mock_get_by_url.return_value
+    mock_get_by_url.assert_called_once()
+
+    pnf_instance = PnfInstance.get_by_id("546b282b-2ff7-41a4-9329-55c9a2888477")
+    assert "pnf-id=546b282b-2ff7-41a4-9329-55c9a2888477" in mock_send_message_json.call_args[0][2]
+
+    mock_send_message_json.side_effect = ResourceNotFound
+    with pytest.raises(ResourceNotFound):
+        PnfInstance.get_by_name("blablabla")
@@ -0,0 +1,136 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from unittest import mock
+
+import pytest
+
+from onapsdk.aai.bulk import AaiBulk
+from onapsdk.aai.reconciler import AaiObjectState, AaiReconciler
+from onapsdk.aai.snapshot import AaiSnapshotExporter, AaiSnapshotRecord
+from onapsdk.exceptions import ParameterError
+
+
+COMPLEX_RELATIONSHIP = {
+    "related-to": "complex",
+    "related-link": "/cloud-infrastructure/complexes/complex/c1",
+    "relationship-data": [{"relationship-key": "complex.physical-location-id",
+                           "relationship-value": "c1"}]
+}
+
+CURRENT = [
+    AaiSnapshotRecord("customers", "/business/customers/customer/cust1", {
+        "global-customer-id": "cust1",
+        "subscriber-name": "old",
+        "subscriber-type": "INFRA",
+        "resource-version": "1",
+        "service-subscriptions": {"service-subscription": [
+            {"service-type": "st1", "resource-version": "2"},
+            {"service-type": "st2", "resource-version": "3"},
+        ]}
+    }),
+    AaiSnapshotRecord("cloud-regions", "/cloud-infrastructure/cloud-regions/cloud-region/o/r", {
+        "cloud-owner": "o",
+        "cloud-region-id": "r",
+        "in-maint": False,
+        "resource-version": "4",
+        "relationship-list": {"relationship": [
+            {"related-to": "complex",
+             "related-link": "/aai/v27/cloud-infrastructure/complexes/complex/c1",
+             "relationship-data": []},
+            {"related-to": "project",
+             "related-link": "/aai/v27/business/projects/project/p1",
+             "relationship-data": []},
+        ]},
+        "tenants": {"tenant": [{"tenant-id": "t1", "tenant-name": "t1",
+                                "resource-version": "5"}]}
+    }),
+]
+
+DESIRED = [
+    AaiSnapshotRecord("customers", "/business/customers/customer/cust1", {
+        "global-customer-id": "cust1",
+        "subscriber-name": "new",
+        "subscriber-type": "INFRA",
+        "service-subscriptions": {"service-subscription": [{"service-type": "st1"},
+                                                           {"service-type": "st3"}]}
+    }),
+    AaiSnapshotRecord("cloud-regions", "/cloud-infrastructure/cloud-regions/cloud-region/o/r", {
+        "cloud-owner": "o",
+        "cloud-region-id": "r",
+        "in-maint": False,
+        "relationship-list": {"relationship": [COMPLEX_RELATIONSHIP]},
+        "tenants": {"tenant": [{"tenant-id": "t1", "tenant-name": "t1"}]}
+    }),
+    AaiSnapshotRecord("complexes", "/cloud-infrastructure/complexes/complex/c1", {
+        "physical-location-id": "c1"
+    }),
+]
+
+
+def test_object_state_relationship_key():
+    assert AaiObjectState.relationship_key(
+        {"related-to": "a", "related-link": "https://aai:8443/aai/v27/x/y"}) == ("a", "/x/y")
+
+
+def test_plan_minimal():
+    requests = list(AaiReconciler(DESIRED).plan(CURRENT))
+    assert [(request.action, request.uri, request.body) for request in requests] == [
+        ("put", "/cloud-infrastructure/complexes/complex/c1", {"physical-location-id": "c1"}),
+        ("put", "/business/customers/customer/cust1/service-subscriptions/"
+                "service-subscription/st3", {"service-type": "st3"}),
+        ("patch", "/business/customers/customer/cust1", {"subscriber-name": "new"}),
+    ]
+
+
+def test_plan_delete_missing_and_extra_relationships():
+    requests = list(AaiReconciler(DESIRED, delete_missing=True,
+                                  delete_extra_relationships=True).plan(CURRENT))
+    assert [(request.action, request.uri) for request in requests][3:] == [
+        ("delete", "/cloud-infrastructure/cloud-regions/cloud-region/o/r/"
+                   "relationship-list/relationship"),
+        ("delete", "/business/customers/customer/cust1/service-subscriptions/"
+                   "service-subscription/st2?resource-version=3"),
+    ]
+    assert requests[3].body["related-to"] == "project"
+
+
+def test_plan_unchanged():
+    assert list(AaiReconciler(CURRENT).plan(CURRENT)) == []
+
+
+def test_plan_new_objects_relationships():
+    requests = list(AaiReconciler(DESIRED).plan([]))
+    uris = [request.uri for request in requests]
+    assert uris.index("/business/customers/customer/cust1") < \
+        uris.index("/business/customers/customer/cust1/service-subscriptions/"
+                   "service-subscription/st1")
+    assert requests[-1].action == "put"
+    assert requests[-1].uri == ("/cloud-infrastructure/cloud-regions/cloud-region/o/r/"
+                                "relationship-list/relationship")
+    assert requests[-1].body == COMPLEX_RELATIONSHIP
+
+
+def test_collections():
+    assert AaiReconciler(DESIRED).collections == ["cloud-regions", "complexes", "customers"]
+    with pytest.raises(ParameterError):
+        AaiReconciler([AaiSnapshotRecord("other", "/other/o/1", {})]).collections
+
+
+@mock.patch.object(AaiSnapshotExporter, "records")
+@mock.patch.object(AaiBulk, "single_transaction")
+def test_reconcile(mock_single_transaction, mock_records):
+    mock_records.return_value = iter(CURRENT)
+    mock_single_transaction.side_effect = lambda aai_requests: iter(list(aai_requests))
+    assert len(list(AaiReconciler(DESIRED).reconcile())) == 3
+    mock_records.assert_called_once()
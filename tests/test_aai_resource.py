@@ -15,7 +15,7 @@
 import pytest
 from unittest import mock
 
-from onapsdk.aai.aai_element import AaiResource, Relationship
+from onapsdk.aai.aai_element import AaiReadOptions, AaiResource, AaiResponseFormat, Relationship
 from onapsdk.exceptions import RequestError, ResourceNotFound, RelationshipNotFound
 from onapsdk.utils.gui import GuiList
 
@@ -58,3 +58,51 @@ def test_get_guis(send_message_mock):
     assert type(gui_results) == GuiList
     assert gui_results.guis[0].url == send_message_mock.return_value.url
     assert gui_results.guis[0].status == send_message_mock.return_value.status_code
+
+
+def test_aai_read_options_query_parameters():
+    assert AaiReadOptions().query_parameters == {}
+    assert AaiReadOptions(response_format=AaiResponseFormat.SIMPLE,
+                          depth=0,
+                          nodes_only=True).query_parameters == {"format": "simple",
+                                                                "depth": "0",
+                                                                "nodes-only": ""}
+
+
+def test_aai_read_options_objects():
+    cloud_region = {"cloud-owner": "owner", "cloud-region-id": "region"}
+    assert list(AaiReadOptions().objects({"cloud-region": [cloud_region]},
+                                         "cloud-region")) == [cloud_region]
+    for response_format in (AaiResponseFormat.RESOURCE, AaiResponseFormat.RESOURCE_AND_URL):
+        assert list(AaiReadOptions(response_format=response_format).objects(
+            {"results": [{"url": "/aai/v27/cloud-region", "cloud-region": cloud_region}]},
+            "cloud-region")) == [cloud_region]
+    simple = list(AaiReadOptions(response_format=AaiResponseFormat.SIMPLE).objects(
+        {"results": [{"id": "1",
+                      "node-type": "cloud-region",
+                      "url": "/aai/v27/cloud-region",
+                      "properties": cloud_region,
+                      "related-to": [{"id": "2",
+                                      "node-type": "complex",
+                                      "relationship-label": "org.onap.relationships.inventory.LocatedIn",
+                                      "url": "/aai/v27/complex"}]}]},
+        "cloud-region"))
+    assert simple == [{**cloud_region,
+                       "relationship-list": {"relationship": [
+                           {"related-to": "complex",
+                            "relationship-label": "org.onap.relationships.inventory.LocatedIn",
+                            "related-link": "/aai/v27/complex"}
+                       ]}}]
+    assert list(AaiReadOptions(response_format=AaiResponseFormat.RAW).objects(
+        {"results": [{"properties": cloud_region}]}, "cloud-region")) == [cloud_region]
+
+
+@mock.patch.object(AaiResource, "send_message_json")
+def test_aai_resource_read_objects(mock_send_message_json):
+    mock_send_message_json.return_value = {"results": [{"properties": {"pnf-name": "test"}}]}
+    assert list(AaiResource.read_objects(
+        "http://aai/pnfs", "pnf", "Get pnfs", {"pnf-name": "test", "pnf-id": None},
+        AaiReadOptions(response_format=AaiResponseFormat.SIMPLE, depth=0)
+    )) == [{"pnf-name": "test"}]
+    mock_send_message_json.assert_called_once_with(
+        "GET", "Get pnfs", "http://aai/pnfs?pnf-name=test&format=simple&depth=0")
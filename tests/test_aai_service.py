@@ -16,7 +16,8 @@ from unittest import mock
 
 import pytest
 
-from onapsdk.aai.aai_element import AaiElement, AaiResource, Relationship
+from onapsdk.aai.aai_element import (AaiElement, AaiReadOptions, AaiResource,
+                                     AaiResponseFormat, Relationship)
 from onapsdk.aai.cloud_infrastructure import (
     CloudRegion,
     Complex,
@@ -483,6 +484,22 @@ def test_cloud_regions(mock_send):
     assert len(cloud_regions) == 1
 
 
+@mock.patch.object(AaiElement, 'send_message_json')
+def test_cloud_regions_read_options(mock_send):
+    """Test get cloud regions from A&AI using lighter representation."""
+    mock_send.return_value = {"results": [{"id": "1",
+                                           "node-type": "cloud-region",
+                                           "url": "/aai/v27/cloud-infrastructure/cloud-regions/cloud-region/OPNFV/RegionOne",
+                                           "properties": CLOUD_REGION["cloud-region"][0]}]}
+    cloud_region = next(CloudRegion.get_all(cloud_owner="OPNFV",
+                                            read_options=AaiReadOptions(
+                                                response_format=AaiResponseFormat.SIMPLE,
+                                                depth=0)))
+    assert mock_send.call_args[0][2].endswith("cloud-regions?cloud-owner=OPNFV&format=simple&depth=0")
+    assert cloud_region.cloud_owner == "OPNFV"
+    assert cloud_region.complex_name == "Cruguil"
+
+
 @mock.patch.object(CloudRegion, "send_message")
 def test_cloud_region_creation(mock_send):
     """Test cloud region creation"""
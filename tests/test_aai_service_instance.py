@@ -19,7 +19,7 @@ from onapsdk.aai.aai_element import AaiElement
 from onapsdk.aai.business import ServiceInstance
 from onapsdk.so.deletion import ServiceDeletionRequest
 from onapsdk.so.instantiation import NetworkInstantiation, VnfInstantiation
-from onapsdk.exceptions import StatusError
+from onapsdk.exceptions import ParameterError, ResourceNotFound, StatusError
 
 from src.onapsdk.so.instantiation import NetworkDetails
 
@@ -300,3 +300,63 @@ def test_service_deletion_request(mock_service_deletion_send_message):
     si.delete_from_aai()
     mock_service_deletion_send_message.assert_called()
     assert mock_service_deletion_send_message.call_count == 2
+
+
+SERVICE_INSTANCE_URL = ("/aai/v27/business/customers/customer/test%20customer"
+                        "/service-subscriptions/service-subscription/test_service_type"
+                        "/service-instances/service-instance/test_service_instance_id")
+
+SERVICE_INSTANCE_NODES = {
+    "results": [
+        {
+            "url": SERVICE_INSTANCE_URL,
+            "service-instance": {
+                "service-instance-id": "test_service_instance_id",
+                "service-instance-name": "test_service_instance_name",
+                "resource-version": "1"
+            }
+        }
+    ]
+}
+
+
+@mock.patch.object(ServiceInstance, "send_message_json")
+def test_service_instance_get_by_id(mock_send_message_json):
+    mock_send_message_json.return_value = SERVICE_INSTANCE_NODES
+    si = ServiceInstance.get_by_id("test_service_instance_id")
+    assert mock_send_message_json.call_count == 1
+    assert "/nodes/service-instances?service-instance-id=test_service_instance_id" \
+        "&format=resource_and_url" in mock_send_message_json.call_args[0][2]
+    assert si.instance_id == "test_service_instance_id"
+    assert si.instance_name == "test_service_instance_name"
+    assert si.service_subscription.service_type == "test_service_type"
+    assert si.service_subscription.customer.global_customer_id == "test customer"
+    assert si.url.endswith("/service-instances/service-instance/test_service_instance_id")
+
+
+@mock.patch.object(ServiceInstance, "send_message_json")
+def test_service_instance_get_by_name(mock_send_message_json):
+    mock_send_message_json.return_value = SERVICE_INSTANCE_NODES
+    si = ServiceInstance.get_by_name("test_service_instance_name")
+    assert "service-instance-name=test_service_instance_name" in \
+        mock_send_message_json.call_args[0][2]
+    assert si.instance_id == "test_service_instance_id"
+
+    mock_send_message_json.return_value = {"results": []}
+    with pytest.raises(ResourceNotFound):
+        ServiceInstance.get_by_name("test_service_instance_name")
+
+    mock_send_message_json.side_effect = ResourceNotFound
+    with pytest.raises(ResourceNotFound):
+        ServiceInstance.get_by_name("test_service_instance_name")
+
+
+@mock.patch.object(ServiceInstance, "send_message_json")
+def test_service_instance_get_by_url(mock_send_message_json):
+    mock_send_message_json.return_value = SERVICE_INSTANCE_NODES["results"][0]["service-instance"]
+    si = ServiceInstance.get_by_url(SERVICE_INSTANCE_URL)
+    assert mock_send_message_json.call_args[0][2] == \
+        f"{ServiceInstance.base_url}{SERVICE_INSTANCE_URL}"
+    assert si.instance_id == "test_service_instance_id"
+    with pytest.raises(ParameterError):
+        ServiceInstance.get_by_url("/aai/v27/network/generic-vnfs/generic-vnf/test")
@@ -0,0 +1,163 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import gzip
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import pytest
+
+from onapsdk.aai.bulk import AaiBulk
+from onapsdk.aai.snapshot import AaiSnapshotExporter, AaiSnapshotImporter, AaiSnapshotReader, \
+    AaiSnapshotRecord, SnapshotFormat, SNAPSHOT_COLLECTIONS, read_snapshot
+from onapsdk.exceptions import ModuleError, ParameterError, ResourceNotFound
+
+
+def page_response(object_type, objects, total_pages):
+    response = mock.MagicMock()
+    response.json.return_value = {object_type: objects}
+    response.headers = {"total-pages": str(total_pages)}
+    return response
+
+
+PNF_PAGES = [
+    page_response("pnf", [{"pnf-name": "pnf-1", "in-maint": False, "resource-version": "1",
+                           "relationship-list": {"relationship": [
+                               {"related-to": "complex",
+                                "related-link": "/aai/v27/cloud-infrastructure/complexes/complex/c1",
+                                "relationship-data": []}]}}], 2),
+    page_response("pnf", [{"pnf-name": "pnf 2", "in-maint": True, "nf-role": "router"}], 2),
+]
+COMPLEX_PAGE = page_response("complex", [{"physical-location-id": "c1"}], 1)
+
+
+def test_snapshot_collection_uri():
+    assert SNAPSHOT_COLLECTIONS["cloud-regions"].object_uri(
+        {"cloud-owner": "owner", "cloud-region-id": "region/1"}) == \
+        "/cloud-infrastructure/cloud-regions/cloud-region/owner/region%2F1"
+
+
+def test_exporter_unknown_collection():
+    with pytest.raises(ParameterError):
+        AaiSnapshotExporter(collections=["pnfs", "unknown"])
+
+
+@mock.patch.object(AaiSnapshotExporter, "send_message")
+def test_exporter_records(mock_send_message):
+    mock_send_message.side_effect = [*PNF_PAGES, ResourceNotFound("no complexes")]
+    exporter = AaiSnapshotExporter(collections=["pnfs", "complexes"], page_size=1)
+    records = list(exporter.records())
+    assert [record.uri for record in records] == ["/network/pnfs/pnf/pnf-1",
+                                                  "/network/pnfs/pnf/pnf%202"]
+    assert all(record.collection == "pnfs" for record in records)
+    assert mock_send_message.call_count == 3
+    assert "resultIndex=2" in mock_send_message.call_args_list[1][0][2]
+    assert "resultSize=1" in mock_send_message.call_args_list[1][0][2]
+    assert "depth=all" in mock_send_message.call_args_list[1][0][2]
+
+
+@mock.patch.object(AaiSnapshotExporter, "send_message")
+def test_export_and_read_jsonl(mock_send_message):
+    with TemporaryDirectory() as tmpdirname:
+        for compress in (True, False):
+            mock_send_message.side_effect = [*PNF_PAGES, COMPLEX_PAGE]
+            path = os.path.join(tmpdirname, f"snapshot-{compress}.jsonl")
+            assert AaiSnapshotExporter(collections=["pnfs", "complexes"]).export(
+                path, compress=compress) == 3
+            with open(path, "rb") as snapshot_file:
+                assert (snapshot_file.read(2) == b"\x1f\x8b") == compress
+            records = list(read_snapshot(path))
+            assert [record.collection for record in records] == ["pnfs", "pnfs", "complexes"]
+            assert records[1].body["in-maint"] is True
+
+
+def test_msgpack_format():
+    with TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, "snapshot.msgpack")
+        with mock.patch("onapsdk.aai.snapshot.msgpack", None):
+            with pytest.raises(ModuleError):
+                AaiSnapshotExporter().export(path, SnapshotFormat.MSGPACK)
+            with pytest.raises(ModuleError):
+                list(read_snapshot(path))
+        packer = mock.MagicMock()
+        packer.packb.return_value = b"packed"
+        packer.Unpacker.return_value = iter([{"collection": "pnfs", "uri": "/uri", "body": {}}])
+        with mock.patch("onapsdk.aai.snapshot.msgpack", packer), \
+                mock.patch.object(AaiSnapshotExporter, "send_message") as mock_send_message:
+            mock_send_message.side_effect = [*PNF_PAGES]
+            AaiSnapshotExporter(collections=["pnfs"]).export(path, SnapshotFormat.MSGPACK)
+            assert packer.packb.call_count == 2
+            assert list(read_snapshot(path)) == [AaiSnapshotRecord("pnfs", "/uri", {})]
+
+
+@mock.patch.object(AaiBulk, "send_message_json")
+def test_import_snapshot(mock_send_message_json):
+    mock_send_message_json.return_value = {"operation-responses": [
+        {"action": "put", "uri": "uri", "response-status-code": 201, "response-body": None}
+    ]}
+    with TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, "snapshot.jsonl")
+        with gzip.open(path, "wb") as snapshot_file:
+            for page in PNF_PAGES:
+                for body in page.json()["pnf"]:
+                    snapshot_file.write(json.dumps(AaiSnapshotRecord(
+                        "pnfs", SNAPSHOT_COLLECTIONS["pnfs"].object_uri(body), body).to_dict()
+                    ).encode() + b"\n")
+        importer = AaiSnapshotImporter(aai_bulk=AaiBulk(chunk_size=1), max_workers=2)
+        responses = list(importer.import_snapshot(path))
+        assert len(responses) == 3
+        assert mock_send_message_json.call_count == 3
+        object_bodies = [json.loads(call[1]["data"])["operations"][0]["body"]
+                         for call in mock_send_message_json.call_args_list[:2]]
+        assert {"pnf-name": "pnf-1", "in-maint": False} in object_bodies
+        relationship_operations = json.loads(mock_send_message_json.call_args_list[2][1]["data"])
+        assert relationship_operations["operations"][0]["uri"] == \
+            "/network/pnfs/pnf/pnf-1/relationship-list/relationship"
+
+        mock_send_message_json.reset_mock()
+        list(importer.import_snapshot(path, with_relationships=False))
+        assert mock_send_message_json.call_count == 2
+
+
+def test_snapshot_reader():
+    with TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, "snapshot.jsonl")
+        with open(path, "w", encoding="utf-8") as snapshot_file:
+            for record in (AaiSnapshotRecord("pnfs", "/network/pnfs/pnf/p1", {"nf-role": "r"}),
+                           AaiSnapshotRecord("pnfs", "/network/pnfs/pnf/p2", {"nf-role": "s"}),
+                           AaiSnapshotRecord("complexes", "/c/c1", {"nf-role": "r"})):
+                snapshot_file.write(json.dumps(record.to_dict(), separators=(",", ":")) + "\n")
+        with AaiSnapshotReader(path) as reader:
+            assert len(reader) == 3
+            assert reader.get("/network/pnfs/pnf/p2").body == {"nf-role": "s"}
+            assert reader.get("/c/c1").collection == "complexes"
+            with pytest.raises(ResourceNotFound):
+                reader.get("/not/existing")
+            assert len(list(reader.records())) == 3
+            assert [r.uri for r in reader.records("complexes")] == ["/c/c1"]
+            assert [r.uri for r in reader.find("pnfs", nf_role="r")] == ["/network/pnfs/pnf/p1"]
+
+        empty_path = os.path.join(tmpdirname, "empty.jsonl")
+        open(empty_path, "w").close()
+        with AaiSnapshotReader(empty_path) as reader:
+            assert len(reader) == 0
+
+        compressed_path = os.path.join(tmpdirname, "snapshot.jsonl.gz")
+        with gzip.open(compressed_path, "wb") as snapshot_file:
+            snapshot_file.write(b"{}")
+        with pytest.raises(ParameterError):
+            AaiSnapshotReader(compressed_path)
+        with pytest.raises(ParameterError):
+            AaiSnapshotReader(os.path.join(tmpdirname, "snapshot.msgpack"))
@@ -0,0 +1,108 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from unittest import mock
+
+from onapsdk.aai.business import Customer, PnfInstance, ServiceSubscription, VnfInstance
+from onapsdk.aai.cloud_infrastructure import CloudRegion, Complex, Tenant
+from onapsdk.aai.statistics import (AaiCountQuery, AaiInventoryStatistics,
+                                    AaiStatisticsReport, SCOPE_READ_OPTIONS)
+from onapsdk.exceptions import ResourceNotFound
+
+
+def cloud_region(cloud_region_id):
+    return CloudRegion(cloud_owner="owner", cloud_region_id=cloud_region_id,
+                       orchestration_disabled=False, in_maint=False)
+
+
+def test_count_query_url():
+    assert AaiCountQuery(CloudRegion).url == CloudRegion.get_all_url()
+    region = cloud_region("region")
+    assert AaiCountQuery(Tenant, region).url == Tenant.get_all_url(region)
+
+
+def test_statistics_report():
+    report = AaiStatisticsReport()
+    report.add(AaiCountQuery(CloudRegion), 2)
+    report.add(AaiCountQuery(Tenant, cloud_region("region1")), 3)
+    report.add(AaiCountQuery(Tenant, cloud_region("region2")), 4)
+    assert report.to_dict() == {
+        "totals": {"CloudRegion": 2, "Tenant": 7},
+        "scoped": {"Tenant": {cloud_region("region1").url: 3,
+                              cloud_region("region2").url: 4}}
+    }
+
+
+@mock.patch.object(CloudRegion, "send_message_json")
+def test_statistics_count(mock_send_message_json):
+    mock_send_message_json.return_value = {"results": [{"cloud-region": 5}]}
+    statistics = AaiInventoryStatistics()
+    assert statistics.count(AaiCountQuery(CloudRegion)) == 5
+    assert statistics.count(AaiCountQuery(CloudRegion)) == 5
+    assert mock_send_message_json.call_count == 2
+    assert mock_send_message_json.call_args[0][2].endswith("cloud-regions?format=count")
+
+    mock_send_message_json.side_effect = ResourceNotFound
+    assert statistics.count(AaiCountQuery(CloudRegion)) == 0
+
+
+@mock.patch.object(CloudRegion, "send_message_json")
+def test_statistics_count_cache(mock_send_message_json):
+    mock_send_message_json.return_value = {"results": [{"cloud-region": 5}]}
+    statistics = AaiInventoryStatistics(cache_ttl=60)
+    assert statistics.count(AaiCountQuery(CloudRegion)) == 5
+    assert statistics.count(AaiCountQuery(CloudRegion)) == 5
+    mock_send_message_json.assert_called_once()
+    statistics.cache.invalidate()
+    assert statistics.count(AaiCountQuery(CloudRegion)) == 5
+    assert mock_send_message_json.call_count == 2
+
+
+@mock.patch.object(AaiInventoryStatistics, "_send_count_request")
+def test_statistics_report_concurrent(mock_send_count_request):
+    mock_send_count_request.side_effect = lambda query: len(query.url)
+    queries = [AaiCountQuery(CloudRegion)] + \
+        [AaiCountQuery(Tenant, cloud_region(f"region{i}")) for i in range(10)]
+    statistics = AaiInventoryStatistics(max_workers=4)
+    assert [query for query, _ in statistics.counts(queries)] == queries
+    report = statistics.report(queries)
+    assert report.totals["CloudRegion"] == len(CloudRegion.get_all_url())
+    assert len(report.scoped["Tenant"]) == 10
+    assert report.totals["Tenant"] == sum(len(query.url) for query in queries[1:])
+
+
+@mock.patch.object(VnfInstance, "get_all")
+@mock.patch.object(Customer, "get_all")
+@mock.patch.object(CloudRegion, "get_all")
+def test_statistics_inventory_queries(mock_cloud_regions, mock_customers, mock_vnfs):
+    region = cloud_region("region")
+    customer = Customer("customer", "subscriber", "type")
+    mock_cloud_regions.return_value = iter([region])
+    mock_customers.return_value = iter([customer])
+    mock_vnfs.side_effect = ResourceNotFound
+    queries = list(AaiInventoryStatistics.inventory_queries())
+    assert queries == [AaiCountQuery(CloudRegion), AaiCountQuery(Complex),
+                       AaiCountQuery(Customer), AaiCountQuery(PnfInstance),
+                       AaiCountQuery(VnfInstance), AaiCountQuery(Tenant, region),
+                       AaiCountQuery(ServiceSubscription, customer)]
+    mock_cloud_regions.assert_called_once_with(read_options=SCOPE_READ_OPTIONS)
+
+
+@mock.patch.object(AaiInventoryStatistics, "inventory_queries")
+@mock.patch.object(AaiInventoryStatistics, "_send_count_request")
+def test_statistics_inventory_report(mock_send_count_request, mock_inventory_queries):
+    mock_inventory_queries.return_value = iter([AaiCountQuery(CloudRegion),
+                                                AaiCountQuery(Complex)])
+    mock_send_count_request.return_value = 1
+    assert AaiInventoryStatistics().inventory_report().totals == {"CloudRegion": 1,
+                                                                  "Complex": 1}
@@ -81,3 +81,40 @@ def test_vnf_vf_module():
 def test_vf_module_instance_count(mock_send_message_json):
     mock_send_message_json.return_value = COUNT
     assert VfModuleInstance.count(vnf_instance=mock.MagicMock()) == 1
+
+
+VF_MODULE_NODES = {
+    "results": [
+        {
+            "url": ("/aai/v27/network/generic-vnfs/generic-vnf/test_vnf_id"
+                    "/vf-modules/vf-module/test_vf_module_id"),
+            "vf-module": {
+                "vf-module-id": "test_vf_module_id",
+                "vf-module-name": "test_vf_module_name",
+                "is-base-vf-module": True,
+                "automated-assignment": False
+            }
+        }
+    ]
+}
+
+
+@mock.patch("onapsdk.aai.business.vnf.VnfInstance.get_by_id")
+@mock.patch.object(VfModuleInstance, "send_message_json")
+def test_vf_module_get_by_id(mock_send_message_json, mock_vnf_get_by_id):
+    mock_send_message_json.return_value = VF_MODULE_NODES
+    vf_module = VfModuleInstance.get_by_id("test_vf_module_id")
+    assert "/nodes/vf-modules?vf-module-id=test_vf_module_id" in \
+        mock_send_message_json.call_args[0][2]
+    assert vf_module.vf_module_id == "test_vf_module_id"
+    mock_vnf_get_by_id.assert_not_called()
+    assert vf_module.vnf_instance == mock_vnf_get_by_id.return_value
+    assert vf_module.vnf_instance == mock_vnf_get_by_id.return_value
+    mock_vnf_get_by_id.assert_called_once_with("test_vnf_id")
+
+    vf_module = VfModuleInstance.get_by_name("test_vf_module_name")
+    assert "vf-module-name=test_vf_module_name" in mock_send_message_json.call_args[0][2]
+
+    mock_send_message_json.return_value = {"results": []}
+    with pytest.raises(ResourceNotFound):
+        VfModuleInstance.get_by_name("test_vf_module_name")
@@ -17,6 +17,7 @@ from unittest import mock
 
 import pytest
 
+from onapsdk.aai.aai_element import AaiReadOptions, Relationship
 from onapsdk.aai.business import ServiceInstance, VnfInstance, PnfInstance, VfModuleInstance
 from onapsdk.so.deletion import VnfDeletionRequest
 from onapsdk.so.instantiation import VfModuleInstantiation, VnfInstantiation, SoService
@@ -460,3 +461,75 @@ def test_build_so_input(mock_send_message):
 def test_vnf_instance_mock(mock_send_message_json):
     mock_send_message_json.return_value = COUNT
     assert VnfInstance.count() == 17
+
+
+VNF_INSTANCE_NODES = {
+    "results": [
+        {
+            "url": "/aai/v27/network/generic-vnfs/generic-vnf/6d644ab5-254d-4a49-98fe-0f481c099f1a",
+            "generic-vnf": {
+                **VNF_INSTANCE,
+                "relationship-list": {
+                    "relationship": [
+                        {
+                            "related-to": "service-instance",
+                            "related-link": ("/aai/v27/business/customers/customer/test"
+                                             "/service-subscriptions/service-subscription/test"
+                                             "/service-instances/service-instance/test_si")
+                        }
+                    ]
+                }
+            }
+        }
+    ]
+}
+
+
+@mock.patch.object(ServiceInstance, "get_by_url")
+@mock.patch.object(VnfInstance, "send_message_json")
+def test_vnf_get_by_id(mock_send_message_json, mock_get_by_url):
+    mock_send_message_json.return_value = VNF_INSTANCE_NODES
+    vnf = VnfInstance.get_by_id("6d644ab5-254d-4a49-98fe-0f481c099f1a")
+    assert mock_send_message_json.call_count == 1
+    assert "/nodes/generic-vnfs?vnf-id=6d644ab5-254d-4a49-98fe-0f481c099f1a" in \
+        mock_send_message_json.call_args[0][2]
+    assert vnf.vnf_id == "6d644ab5-254d-4a49-98fe-0f481c099f1a"
+    mock_get_by_url.assert_not_called()
+    assert vnf.service_instance == mock_get_by_url.return_value
+    assert vnf.service_instance == mock_get_by_url.return_value
+    mock_get_by_url.assert_called_once_with(
+        VNF_INSTANCE_NODES["results"][0]["generic-vnf"]["relationship-list"]["relationship"][0]["related-link"])
+
+
+@mock.patch.object(VnfInstance, "send_message_json")
+def test_vnf_get_by_name(mock_send_message_json):
+    mock_send_message_json.return_value = VNF_INSTANCE_NODES
+    vnf = VnfInstance.get_by_name("Python_ONAP_SDK_vnf_instance")
+    assert "vnf-name=Python_ONAP_SDK_vnf_instance" in mock_send_message_json.call_args[0][2]
+    assert vnf.vnf_name == VNF_INSTANCE["vnf-name"]
+
+    mock_send_message_json.return_value = {"results": []}
+    with pytest.raises(ResourceNotFound):
+        VnfInstance.get_by_name("Python_ONAP_SDK_vnf_instance")
+
+
+@mock.patch.object(ServiceInstance, "get_by_url")
+@mock.patch.object(VnfInstance, "relationships", new_callable=mock.PropertyMock)
+@mock.patch.object(VnfInstance, "send_message_json")
+def test_vnf_get_all_nodes_only(mock_send_message_json, mock_relationships, mock_get_by_url):
+    mock_send_message_json.return_value = {"generic-vnf": [
+        {key: value for key, value in VNF_INSTANCE.items() if key != "relationship-list"}
+    ]}
+    vnf = next(VnfInstance.get_all(read_options=AaiReadOptions(nodes_only=True)))
+    assert mock_send_message_json.call_args[0][2].endswith("/network/generic-vnfs/?nodes-only=")
+    assert vnf.vnf_id == VNF_INSTANCE["vnf-id"]
+    mock_relationships.return_value = [
+        Relationship(related_to="service-instance",
+                     related_link="/aai/v27/business/test_service_instance",
+                     relationship_data=[])
+    ]
+    mock_relationships.assert_not_called()
+    assert vnf.service_instance == mock_get_by_url.return_value
+    assert vnf.service_instance == mock_get_by_url.return_value
+    mock_relationships.assert_called_once()
+    mock_get_by_url.assert_called_once_with("/aai/v27/business/test_service_instance")
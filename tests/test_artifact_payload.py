@@ -0,0 +1,62 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import json
+from base64 import b64encode
+
+import pytest
+import requests
+
+from onapsdk.exceptions import ValidationError
+from onapsdk.utils.artifact_payload import ArtifactPayload
+from onapsdk.utils.headers_creator import headers_sdc_artifact_upload
+
+BODY = '{"artifactName": "test.zip", "payloadData": "%s"}'
+
+
+@pytest.mark.parametrize("artifact_size", [0, 1, 2, 3, 10, 1000])
+def test_artifact_payload(tmp_path, artifact_size):
+    artifact = bytes(range(256)) * 4
+    artifact_path = tmp_path / "test.zip"
+    artifact_path.write_bytes(artifact[:artifact_size])
+    payload = ArtifactPayload(BODY % ArtifactPayload.PLACEHOLDER, artifact_path, chunk_size=10)
+    assert payload.chunk_size == 9
+    expected_body = BODY % b64encode(artifact[:artifact_size]).decode("utf-8")
+
+    body = b"".join(payload)
+    assert body == expected_body.encode("utf-8")
+    assert json.loads(body)["payloadData"] == b64encode(artifact[:artifact_size]).decode("utf-8")
+    assert len(payload) == len(body)
+    assert b"".join(payload) == body  # Payload can be iterated more than once
+    assert max(len(chunk) for chunk in list(payload)[1:-1] or [b""]) <= 12
+    assert headers_sdc_artifact_upload({}, payload)["Content-MD5"] == \
+        headers_sdc_artifact_upload({}, expected_body)["Content-MD5"]
+
+
+def test_artifact_payload_request(tmp_path):
+    artifact_path = tmp_path / "test.zip"
+    artifact_path.write_bytes(b"Hello world!")
+    payload = ArtifactPayload(BODY % ArtifactPayload.PLACEHOLDER, artifact_path)
+    assert repr(payload) == f"ArtifactPayload({str(artifact_path)!r})"
+
+    request = requests.Request("POST", "http://sdc.onap", data=payload).prepare()
+    assert request.body is payload
+    assert request.headers["Content-Length"] == str(len(payload))
+    assert "Transfer-Encoding" not in request.headers
+
+
+def test_artifact_payload_no_placeholder(tmp_path):
+    with pytest.raises(ValidationError):
+        ArtifactPayload(BODY % "", tmp_path / "test.zip")
+    assert ArtifactPayload(BODY % ArtifactPayload.PLACEHOLDER,
+                           tmp_path / "test.zip", chunk_size=1).chunk_size == 3
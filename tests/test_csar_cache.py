@@ -0,0 +1,153 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import os
+from collections import OrderedDict
+from pathlib import Path
+from unittest import mock
+
+import onapsdk.constants as const
+from onapsdk.configuration import settings
+from onapsdk.sdc.service import Service
+from onapsdk.sdc2.service import Service as Sdc2Service
+from onapsdk.utils.csar_cache import CsarCache
+
+CSAR_PATH = Path(__file__).resolve().parent / "data" / "test.csar"
+
+
+def test_csar_cache_from_settings(monkeypatch, tmp_path):
+    assert CsarCache.from_settings() is None
+    monkeypatch.setattr(settings, "SDC_CSAR_CACHE_DIR", str(tmp_path))
+    cache = CsarCache.from_settings()
+    assert cache.directory == tmp_path
+    assert cache.max_size == settings.SDC_CSAR_CACHE_MAX_SIZE
+
+
+def test_csar_cache_csar(tmp_path):
+    cache = CsarCache(tmp_path / "cache", 1024)
+    assert cache.get_csar("uuid", "1.0") is None
+    assert cache.size == 0
+    cache.put_csar("uuid", "1.0", b"csar")
+    assert cache.get_csar("uuid", "1.0") == b"csar"
+    assert cache.get_csar("uuid", "2.0") is None
+    assert cache.get_csar("other_uuid", "1.0") is None
+    assert cache.size == 4
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_csar_cache_csar_file(tmp_path):
+    cache = CsarCache(tmp_path / "cache", 1024)
+    assert cache.csar_path("uuid", "1.0") is None
+    source = tmp_path / "source.csar"
+    source.write_bytes(b"csar")
+    cache.put_csar_file("uuid", "1.0", source)
+    assert cache.csar_path("uuid", "1.0").read_bytes() == b"csar"
+    assert cache.get_csar("uuid", "1.0") == b"csar"
+    assert source.exists()
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_csar_cache_template(tmp_path):
+    cache = CsarCache(tmp_path, 1024)
+    template = OrderedDict([("metadata", {"name": "test"}), ("topology_template", {})])
+    assert cache.get_template("uuid", "1.0") is None
+    cache.put_template("uuid", "1.0", template)
+    loaded = cache.get_template("uuid", "1.0")
+    assert loaded == template
+    assert list(loaded) == ["metadata", "topology_template"]
+
+    next(tmp_path.glob(f"*{CsarCache.TEMPLATE_SUFFIX}")).write_bytes(b"not a pickle")
+    assert cache.get_template("uuid", "1.0") is None
+
+
+def test_csar_cache_eviction(tmp_path):
+    cache = CsarCache(tmp_path, 250)
+    for idx in range(3):
+        cache.put_csar(f"uuid_{idx}", "1.0", bytes(100))
+        path = cache._path(f"uuid_{idx}", "1.0", CsarCache.CSAR_SUFFIX)
+        os.utime(path, (idx, idx))
+    cache.evict()
+    assert cache.size == 200
+    assert cache.get_csar("uuid_0", "1.0") is None
+    assert cache.get_csar("uuid_1", "1.0") is not None
+
+    # Read entry is marked as recently used, so the other one is evicted
+    cache.put_csar("uuid_3", "1.0", bytes(100))
+    assert cache.size == 200
+    assert cache.get_csar("uuid_1", "1.0") is not None
+    assert cache.get_csar("uuid_2", "1.0") is None
+    assert cache.get_csar("uuid_3", "1.0") is not None
+
+
+@mock.patch.object(Service, "send_message")
+def test_service_tosca_cache(mock_send_message, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "SDC_CSAR_CACHE_DIR", str(tmp_path))
+    mock_send_message.return_value.iter_content.return_value = [CSAR_PATH.read_bytes()]
+
+    service = Service(name="test")
+    service.identifier = "test_uuid"
+    service.version = "1.0"
+    service.status = const.CERTIFIED
+    template = service.tosca_template
+    assert template["metadata"]["name"]
+    mock_send_message.assert_called_once()
+    assert mock_send_message.call_args.kwargs["stream"] is True
+
+    other_service = Service(name="test")
+    other_service.identifier = "test_uuid"
+    other_service.version = "1.0"
+    other_service.status = const.DISTRIBUTED
+    assert other_service.tosca_template == template
+    assert other_service.tosca_model == CSAR_PATH.read_bytes()
+    mock_send_message.assert_called_once()
+
+    newer_service = Service(name="test")
+    newer_service.identifier = "test_uuid"
+    newer_service.version = "2.0"
+    newer_service.status = const.CERTIFIED
+    newer_service.tosca_template
+    assert mock_send_message.call_count == 2
+
+
+@mock.patch.object(Service, "send_message")
+def test_service_draft_not_cached(mock_send_message, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "SDC_CSAR_CACHE_DIR", str(tmp_path))
+    mock_send_message.return_value.iter_content.return_value = [CSAR_PATH.read_bytes()]
+    mock_send_message.return_value.content = CSAR_PATH.read_bytes()
+    for status in (const.DRAFT, const.CHECKED_IN):
+        service = Service(name="test")
+        service.identifier = "test_uuid"
+        service.version = "1.0"
+        service.status = status
+        assert service.tosca_template["metadata"]["name"]
+        assert service.tosca_model == CSAR_PATH.read_bytes()
+    assert mock_send_message.call_count == 4
+    assert not list(tmp_path.iterdir())
+
+
+@mock.patch.object(Sdc2Service, "send_message")
+def test_sdc2_service_tosca_cache(mock_send_message, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "SDC_CSAR_CACHE_DIR", str(tmp_path))
+    mock_send_message.return_value.content = CSAR_PATH.read_bytes()
+    draft = Sdc2Service(name="test", uuid="test_uuid", version="1.0",
+                        lifecycle_state="NOT_CERTIFIED_CHECKOUT")
+    assert draft.tosca_template["metadata"]["name"]
+    mock_send_message.assert_called_once()
+    assert not list(tmp_path.iterdir())
+
+    for _ in range(2):
+        service = Sdc2Service(name="test", uuid="test_uuid", version="1.0",
+                              lifecycle_state="CERTIFIED")
+        assert service.tosca_template["metadata"]["name"]
+    assert mock_send_message.call_count == 2
+    assert list(tmp_path.iterdir())
@@ -0,0 +1,79 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from hashlib import sha256
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+import pytest
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ValidationError
+from onapsdk.utils.csar_download import download_to_file, extract_entries, find_service_template
+
+DATA_PATH = Path(__file__).resolve().parent / "data"
+
+
+def test_download_to_file(tmp_path):
+    response = mock.MagicMock()
+    response.iter_content.return_value = [b"first", b"second"]
+    target = tmp_path / "directory" / "test.csar"
+    digest = download_to_file(response, target)
+    assert digest == sha256(b"firstsecond").hexdigest()
+    assert target.read_bytes() == b"firstsecond"
+    response.iter_content.assert_called_once_with(
+        chunk_size=settings.SDC_CSAR_DOWNLOAD_CHUNK_SIZE)
+
+    response.iter_content.return_value = [b"other"]
+    assert download_to_file(response, target, checksum=sha256(b"other").hexdigest(),
+                            chunk_size=10) == sha256(b"other").hexdigest()
+    assert target.read_bytes() == b"other"
+    response.iter_content.assert_called_with(chunk_size=10)
+    assert [path.name for path in target.parent.iterdir()] == ["test.csar"]
+
+
+def test_download_to_file_invalid(tmp_path):
+    response = mock.MagicMock()
+    response.iter_content.return_value = [b"content"]
+    with pytest.raises(ValidationError):
+        download_to_file(response, tmp_path / "test.csar", checksum="0" * 64)
+    assert not list(tmp_path.iterdir())
+
+    response.iter_content.side_effect = IOError
+    with pytest.raises(IOError):
+        download_to_file(response, tmp_path / "test.csar")
+    assert not list(tmp_path.iterdir())
+
+
+def test_find_service_template():
+    with ZipFile(DATA_PATH / "test.csar") as csar:
+        assert find_service_template(csar) == "Definitions/service-Vboxvnf-template.yml"
+    with ZipFile(DATA_PATH / "bad_no_service.csar") as csar:
+        with pytest.raises(ValidationError):
+            find_service_template(csar)
+
+
+def test_extract_entries(tmp_path):
+    paths = extract_entries(DATA_PATH / "test.csar",
+                            ["csar.meta", "Definitions/service-Vboxvnf-template.yml"],
+                            tmp_path)
+    assert paths == [tmp_path / "csar.meta",
+                     tmp_path / "Definitions" / "service-Vboxvnf-template.yml"]
+    assert all(path.is_file() for path in paths)
+    assert sorted(path.name for path in (tmp_path / "Definitions").iterdir()) == [
+        "service-Vboxvnf-template.yml"]
+
+    with pytest.raises(ValidationError):
+        extract_entries(DATA_PATH / "test.csar", ["csar.meta", "missing"], tmp_path / "other")
+    assert not (tmp_path / "other").exists()
@@ -0,0 +1,136 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import json
+import threading
+from unittest import mock
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ConnectionFailed
+from onapsdk.kafka.onap_kafka import Consumer
+from onapsdk.utils.distribution_watcher import DistributionWatcher, DmaapSubscriber
+
+
+def notification(distribution_id, component, status):
+    return json.dumps({"distributionID": distribution_id, "consumerID": component,
+                       "timestamp": 1, "artifactURL": "/sdc/v1/catalog/services/test",
+                       "status": status, "errorReason": None})
+
+
+def notify_all(watcher, distribution_id, status="DOWNLOAD_OK"):
+    for component in settings.SDC_SERVICE_DISTRIBUTION_DESIRED_STATE:
+        watcher.handle_notification(notification(distribution_id, component, status))
+
+
+def test_distribution_watcher_handle_notification():
+    watcher = DistributionWatcher()
+    watcher.handle_notification("not a json")
+    watcher.handle_notification({"distributionID": "123"})
+    assert watcher.component_statuses("123") == {}
+    assert watcher.distribution_result("123") is None
+
+    watcher.handle_notification(notification("123", "SO-sdc-controller", "DOWNLOAD_OK"))
+    watcher.handle_notification(notification("123", "SO-sdc-controller", "DEPLOY_OK").encode())
+    assert watcher.component_statuses("123") == {
+        "SO-sdc-controller": {"DOWNLOAD_OK", "DEPLOY_OK"}}
+    assert watcher.distribution_result("123") is None
+
+    for component in ("aai-model-loader", "sdnc-sdc-listener"):
+        watcher.handle_notification(notification("123", component, "DEPLOY_OK"))
+    assert watcher.distribution_result("123") is None
+    watcher.handle_notification(notification("123", "policy-distribution-id",
+                                             "DOWNLOAD_ERROR"))
+    assert watcher.distribution_result("123") is False
+    watcher.handle_notification(notification("123", "policy-distribution-id",
+                                             "ALREADY_DOWNLOADED"))
+    assert watcher.distribution_result("123") is True
+
+
+def test_distribution_watcher_distribution_id():
+    sdc_service = mock.Mock(spec=["distribution_id"], distribution_id="123")
+    assert DistributionWatcher.distribution_id(sdc_service) == "123"
+    sdc2_service = mock.Mock(spec=["latest_distribution"])
+    sdc2_service.latest_distribution.distribution_id = "456"
+    assert DistributionWatcher.distribution_id(sdc2_service) == "456"
+    sdc2_service.latest_distribution = None
+    assert DistributionWatcher.distribution_id(sdc2_service) is None
+
+
+def test_distribution_watcher_wait_distributed_notifications():
+    services = [mock.Mock(spec=["distribution_id", "distributed"], distribution_id=str(i),
+                          distributed=False) for i in range(3)]
+    watcher = DistributionWatcher()
+    notify_all(watcher, "0")
+    with watcher:
+        timer = threading.Timer(0.1, lambda: [notify_all(watcher, distribution_id)
+                                              for distribution_id in ("1", "2")])
+        timer.start()
+        assert watcher.wait_distributed(services, timeout=10)
+        timer.join()
+
+    notify_all(watcher, "2", "DEPLOY_ERROR")
+    watcher.handle_notification(notification("2", "SO-sdc-controller", "DOWNLOAD_ERROR"))
+    services = [mock.Mock(spec=["distribution_id", "distributed"], distribution_id=str(i),
+                          distributed=False) for i in range(3, 5)]
+    notify_all(watcher, "3")
+    watcher.handle_notification(notification("4", "SO-sdc-controller", "DOWNLOAD_ERROR"))
+    assert not watcher.wait_distributed(services, timeout=10)
+
+
+def test_distribution_watcher_wait_distributed_polling(monkeypatch):
+    monkeypatch.setattr(settings, "SDC_DISTRIBUTION_POLL_INTERVAL", 0.05)
+    service = mock.Mock(spec=["distribution_id"], distribution_id=None)
+    type(service).distributed = mock.PropertyMock(side_effect=[False, False, True])
+    assert DistributionWatcher().wait_distributed([service], timeout=10)
+
+    service = mock.Mock(spec=["distribution_id", "distributed"], distribution_id="123",
+                        distributed=False)
+    assert not DistributionWatcher().wait_distributed([service], timeout=0.1)
+
+
+@mock.patch("onapsdk.utils.distribution_watcher.Dmaap.get_events_for_topic")
+def test_distribution_watcher_from_dmaap(mock_get_events, monkeypatch):
+    monkeypatch.setattr(settings, "SDC_DISTRIBUTION_POLL_INTERVAL", 0.01)
+    basic_auth = {"username": "bob", "password": "secret"}
+    events = [ConnectionFailed("no connection"),
+              [notification("123", component, "DOWNLOAD_OK")
+               for component in settings.SDC_SERVICE_DISTRIBUTION_DESIRED_STATE]]
+
+    def get_events(*_):
+        event = events.pop(0) if events else []
+        if isinstance(event, Exception):
+            raise event
+        return event
+
+    mock_get_events.side_effect = get_events
+    watcher = DistributionWatcher.from_dmaap(basic_auth)
+    assert isinstance(watcher.subscribers[0], DmaapSubscriber)
+    service = mock.Mock(spec=["distribution_id", "distributed"], distribution_id="123",
+                        distributed=False)
+    with watcher:
+        assert watcher.wait_distributed([service], timeout=10)
+    mock_get_events.assert_any_call(settings.SDC_DISTRIBUTION_STATUS_TOPIC, basic_auth)
+
+
+@mock.patch("onapsdk.kafka.onap_kafka.KafkaConsumer")
+def test_distribution_watcher_from_kafka(mock_kafka_consumer):
+    mock_kafka_consumer.return_value.__iter__.side_effect = lambda: iter(
+        [mock.Mock(value=notification("123", component, "DOWNLOAD_OK").encode())
+         for component in settings.SDC_SERVICE_DISTRIBUTION_DESIRED_STATE])
+    watcher = DistributionWatcher.from_kafka("user", "password", "TOPIC")
+    assert isinstance(watcher.subscribers[0], Consumer)
+    service = mock.Mock(spec=["distribution_id", "distributed"], distribution_id="123",
+                        distributed=False)
+    with watcher:
+        assert watcher.wait_distributed([service], timeout=10)
+    mock_kafka_consumer.return_value.subscribe.assert_called_once_with(["TOPIC"])
@@ -0,0 +1,101 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from io import BytesIO
+from unittest import mock
+
+import pytest
+import requests
+
+from onapsdk.exceptions import APIError, ConnectionFailed
+from onapsdk.utils.multipart_upload import MultipartUpload, UploadProgress, send_with_retries
+
+
+def test_multipart_upload_body(tmp_path):
+    package_path = tmp_path / "package.zip"
+    package_path.write_bytes(bytes(range(256)) * 10)
+    with open(package_path, "rb") as package:
+        expected = requests.Request("POST", "http://sdc.onap", files={"upload": package}).prepare()
+        package.seek(0)
+        upload = MultipartUpload("upload", package, chunk_size=1000)
+        boundary = upload.content_type.split("boundary=")[1]
+        expected_boundary = expected.headers["Content-Type"].split("boundary=")[1]
+        body = b"".join(upload)
+        assert body == expected.body.replace(expected_boundary.encode(), boundary.encode())
+        assert len(upload) == len(body)
+        # Body can be sent again, e.g. when upload is retried
+        assert b"".join(upload) == body
+
+        request = requests.Request("POST", "http://sdc.onap", data=upload).prepare()
+        assert request.body is upload
+        assert request.headers["Content-Length"] == str(len(body))
+        assert "Transfer-Encoding" not in request.headers
+
+
+def test_multipart_upload_file_position():
+    package = BytesIO(b"headerdata")
+    package.seek(6)
+    upload = MultipartUpload("upload", package)
+    assert b"\r\n\r\ndata\r\n" in b"".join(upload)
+    assert b"\r\n\r\ndata\r\n" in b"".join(upload)
+    assert b'filename="upload"' in b"".join(upload)
+    assert b'filename="test.zip"' in b"".join(MultipartUpload("upload", package, "test.zip"))
+
+
+def test_multipart_upload_progress():
+    progress_callback = mock.MagicMock()
+    upload = MultipartUpload("upload", BytesIO(bytes(2500)), chunk_size=1000,
+                             progress_callback=progress_callback)
+    assert upload.progress is None
+    b"".join(upload)
+    assert progress_callback.call_count == 5
+    progress = [call.args[0] for call in progress_callback.call_args_list]
+    assert [item.sent - progress[0].sent for item in progress[1:4]] == [1000, 2000, 2500]
+    assert not progress[-2].done
+    assert progress[-1] == upload.progress
+    assert upload.progress.done
+    assert upload.progress.sent == upload.progress.total == len(upload)
+    assert UploadProgress(sent=100, total=100, elapsed=2.0).throughput == 50.0
+    assert UploadProgress(sent=0, total=100, elapsed=0.0).throughput == 0.0
+
+
+@mock.patch("onapsdk.utils.multipart_upload.time.sleep")
+def test_send_with_retries(mock_sleep):
+    upload = MultipartUpload("upload", BytesIO(b"data"))
+    bodies = []
+
+    def send():
+        bodies.append(b"".join(upload))
+        if len(bodies) == 1:
+            raise ConnectionFailed("Connection reset")
+        if len(bodies) == 2:
+            raise APIError("Bad gateway", response_status_code=502)
+        return "response"
+
+    assert send_with_retries(send) == "response"
+    assert len(bodies) == 3
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    mock_sleep.reset_mock()
+    send_mock = mock.MagicMock(side_effect=APIError("Bad request", response_status_code=400))
+    with pytest.raises(APIError):
+        send_with_retries(send_mock)
+    send_mock.assert_called_once()
+    mock_sleep.assert_not_called()
+
+    send_mock = mock.MagicMock(side_effect=ConnectionFailed("Connection reset"))
+    with pytest.raises(ConnectionFailed):
+        send_with_retries(send_mock, retries=2, backoff=0.5)
+    assert send_mock.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
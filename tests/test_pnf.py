@@ -321,10 +321,9 @@ def test_onboard_new_pnf(mock_create, mock_submit, mock_certify, mock_load):
     mock_status = Pnf.status.getter(getter_mock)
     with mock.patch.object(Pnf, 'status', mock_status):
         getter_mock.side_effect = [None, const.APPROVED, const.APPROVED,
-                                   const.APPROVED, const.APPROVED]
+                                   const.APPROVED, const.APPROVED, const.APPROVED]
         vsp = Vsp()
         pnf = Pnf(vsp=vsp)
-        pnf._time_wait = 0
         pnf.onboard()
         mock_create.assert_called_once()
         mock_submit.assert_not_called()
@@ -340,9 +339,9 @@ def test_onboard_pnf_submit(mock_create, mock_submit, mock_certify, mock_load):
     mock_status = Pnf.status.getter(getter_mock)
     with mock.patch.object(Pnf, 'status', mock_status):
         getter_mock.side_effect = [const.DRAFT, const.DRAFT, const.APPROVED,
-                                   const.APPROVED, const.APPROVED, const.APPROVED]
+                                   const.APPROVED, const.APPROVED, const.APPROVED,
+                                   const.APPROVED, const.APPROVED]
         pnf = Pnf()
-        pnf._time_wait = 0
         pnf.onboard()
         mock_create.assert_not_called()
         mock_submit.assert_called_once()
@@ -359,9 +358,8 @@ def test_onboard_pnf_certify(mock_create, mock_submit, mock_certify, mock_load):
     with mock.patch.object(Pnf, 'status', mock_status):
         getter_mock.side_effect = [const.CHECKED_IN, const.CHECKED_IN, const.CHECKED_IN,
                                    const.APPROVED, const.APPROVED, const.APPROVED,
-                                   const.APPROVED]
+                                   const.APPROVED, const.APPROVED]
         pnf = Pnf()
-        pnf._time_wait = 0
         pnf.onboard()
         mock_create.assert_not_called()
         mock_submit.assert_not_called()
@@ -381,7 +379,6 @@ def test_onboard_pnf_load(mock_create, mock_submit, mock_certify, mock_load):
                                    const.APPROVED, const.APPROVED,
                                    const.APPROVED]
         pnf = Pnf()
-        pnf._time_wait = 0
         pnf.onboard()
         mock_create.assert_not_called()
         mock_submit.assert_not_called()
@@ -397,14 +394,14 @@ def test_onboard_whole_pnf_vsp(mock_certify, mock_create, mock_submit, mock_load
     getter_mock = mock.Mock(wraps=Pnf.status.fget)
     mock_status = Pnf.status.getter(getter_mock)
     with mock.patch.object(Pnf, 'status', mock_status):
-        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT,
+        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT, const.DRAFT,
                                    const.CHECKED_IN, const.CHECKED_IN, const.CHECKED_IN,
+                                   const.CHECKED_IN, const.CERTIFIED, const.CERTIFIED,
                                    const.CERTIFIED, const.CERTIFIED, const.CERTIFIED,
-                                   const.CERTIFIED, const.APPROVED, const.APPROVED,
-                                   const.APPROVED, const.APPROVED]
+                                   const.APPROVED, const.APPROVED, const.APPROVED,
+                                   const.APPROVED]
         vsp = Vsp()
         pnf = Pnf(vsp=vsp)
-        pnf._time_wait = 0
         pnf.onboard()
         mock_create.assert_called_once()
         mock_submit.assert_called_once()
@@ -420,14 +417,14 @@ def test_onboard_whole_pnf_vendor(mock_certify, mock_create, mock_submit, mock_l
     getter_mock = mock.Mock(wraps=Pnf.status.fget)
     mock_status = Pnf.status.getter(getter_mock)
     with mock.patch.object(Pnf, 'status', mock_status):
-        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT,
+        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT, const.DRAFT,
                                    const.CHECKED_IN, const.CHECKED_IN, const.CHECKED_IN,
+                                   const.CHECKED_IN, const.CERTIFIED, const.CERTIFIED,
                                    const.CERTIFIED, const.CERTIFIED, const.CERTIFIED,
-                                   const.CERTIFIED, const.APPROVED, const.APPROVED,
-                                   const.APPROVED, const.APPROVED]
+                                   const.APPROVED, const.APPROVED, const.APPROVED,
+                                   const.APPROVED]
         vendor = Vendor()
         pnf = Pnf(vendor=vendor)
-        pnf._time_wait = 0
         pnf.onboard()
         mock_create.assert_called_once()
         mock_submit.assert_called_once()
@@ -0,0 +1,100 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from itertools import islice
+from unittest import mock
+
+import pytest
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import PollingTimeout, StatusError
+from onapsdk.utils.polling import POLLING_METRICS, PollingMetrics, PollingPolicy, wait_until
+
+
+def test_polling_policy_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SDC_POLLING_TIMEOUT", 30)
+    policy = PollingPolicy.from_settings()
+    assert policy.initial_delay == settings.SDC_POLLING_INITIAL_DELAY
+    assert policy.max_delay == settings.SDC_POLLING_MAX_DELAY
+    assert policy.multiplier == settings.SDC_POLLING_MULTIPLIER
+    assert policy.jitter == settings.SDC_POLLING_JITTER
+    assert policy.timeout == 30
+
+
+def test_polling_policy_delays():
+    policy = PollingPolicy(initial_delay=1, max_delay=5, multiplier=2, jitter=0)
+    assert list(islice(policy.delays(), 5)) == [1, 2, 4, 5, 5]
+
+    policy = PollingPolicy(initial_delay=1, max_delay=5, multiplier=2, jitter=0.5)
+    for delay, expected in zip(policy.delays(), [1, 2, 4, 5, 5]):
+        assert expected * 0.5 <= delay <= expected * 1.5
+
+
+@mock.patch("onapsdk.utils.polling.time.sleep")
+def test_wait_until(mock_sleep):
+    metrics = PollingMetrics()
+    condition = mock.Mock(return_value=True)
+    wait_until(condition, "ready", metrics=metrics)
+    condition.assert_called_once()
+    mock_sleep.assert_not_called()
+    assert metrics.polls == 1
+    assert metrics.waiting == 0
+
+    condition = mock.Mock(side_effect=[False, False, True])
+    wait_until(condition, "ready",
+               policy=PollingPolicy(initial_delay=1, multiplier=3, jitter=0), metrics=metrics)
+    assert condition.call_count == 3
+    assert mock_sleep.call_args_list == [mock.call(1), mock.call(3)]
+    assert metrics.polls == 4
+    assert metrics.waiting == 4
+    assert metrics.working >= 0
+
+    metrics.reset()
+    assert (metrics.waiting, metrics.working, metrics.polls) == (0, 0, 0)
+
+
+@mock.patch("onapsdk.utils.polling.time.sleep")
+def test_wait_until_timeout(mock_sleep):
+    condition = mock.Mock(return_value=False)
+    with pytest.raises(PollingTimeout) as exc:
+        wait_until(condition, "ready", policy=PollingPolicy(timeout=0))
+    assert isinstance(exc.value, StatusError)
+    condition.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_wait_until_delay_limited_by_deadline():
+    clock = [0.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    with mock.patch("onapsdk.utils.polling.time.monotonic", lambda: clock[0]), \
+            mock.patch("onapsdk.utils.polling.time.sleep", side_effect=sleep) as mock_sleep:
+        with pytest.raises(PollingTimeout):
+            wait_until(mock.Mock(return_value=False), "ready",
+                       policy=PollingPolicy(initial_delay=8, jitter=0, timeout=10),
+                       metrics=PollingMetrics())
+    assert mock_sleep.call_args_list == [mock.call(8), mock.call(2)]
+
+
+def test_polling_metrics_measure():
+    metrics = PollingMetrics()
+    with pytest.raises(ValueError):
+        with metrics.measure(polls=1):
+            raise ValueError
+    assert metrics.polls == 1
+    assert metrics.working >= 0
+    metrics.add_waiting(1.5)
+    assert repr(metrics) == f"PollingMetrics(waiting=1.5s, working={metrics.working:.1f}s, polls=1)"
+    assert isinstance(POLLING_METRICS, PollingMetrics)
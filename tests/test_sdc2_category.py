@@ -56,6 +56,32 @@ def test_service_category_get_by_name(mock_get_all):
         assert ServiceCategory.get_by_name(f"name_{i}") is not None
 
 
+@patch("onapsdk.sdc2.sdc_category.ResourceCategory.get_all")
+@patch("onapsdk.sdc2.sdc_category.ServiceCategory.get_all")
+def test_category_catalog_index(mock_service_get_all, mock_resource_get_all, monkeypatch):
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 60)
+    TestCategory = namedtuple("TestCategory", ["name", "unique_id"])
+    mock_service_get_all.return_value = [TestCategory(f"name_{i}", f"unique_id_{i}")
+                                         for i in range(10)]
+    mock_resource_get_all.return_value = [TestCategory("resource_name", "resource_unique_id")]
+    for i in range(10):
+        assert ServiceCategory.get_by_name(f"name_{i}").unique_id == f"unique_id_{i}"
+        assert ServiceCategory.get_by_uniqe_id(f"unique_id_{i}").name == f"name_{i}"
+    mock_service_get_all.assert_called_once()
+    assert ResourceCategory.get_by_name("resource_name").unique_id == "resource_unique_id"
+    mock_resource_get_all.assert_called_once()
+
+    # Categories are fetched again once if category is not found
+    mock_service_get_all.return_value.append(TestCategory("new_name", "new_unique_id"))
+    assert ServiceCategory.get_by_name("new_name").unique_id == "new_unique_id"
+    assert mock_service_get_all.call_count == 2
+    with raises(ResourceNotFound):
+        ServiceCategory.get_by_name("test_name")
+    assert mock_service_get_all.call_count == 3
+    assert ServiceCategory.get_by_name("name_0") is not None
+    assert mock_service_get_all.call_count == 3
+
+
 def test_service_category_create_from_api_response():
     api_response = {
         "name": str(uuid4()),
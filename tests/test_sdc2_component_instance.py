@@ -6,7 +6,10 @@ from sys import maxsize
 from unittest.mock import MagicMock, patch, PropertyMock
 from uuid import uuid4
 
+import pytest
+
 from onapsdk.configuration import settings
+from onapsdk.exceptions import ResourceNotFound
 from onapsdk.sdc2.component_instance import ComponentInstance, ComponentInstanceInput
 
 
@@ -116,14 +119,17 @@ def test_get_component_input_by_name(mock_inputs):
 
     Input = namedtuple("Input", ["name"])
     mock_inputs.return_value = [Input("test_name")]
+    ci.invalidate_inputs()
     assert ci.get_input_by_name("test_name") is not None
 
     mock_inputs.return_value = [Input(f"test_name_{i}") for i in range(10**2)]
+    ci.invalidate_inputs()
     assert ci.get_input_by_name("test_name") is None
 
-    mock_inputs.return_value = [Input(f"test_name_{i}") for i in range(10**2)]
+    mock_inputs.reset_mock()
     for i in range(10**2):
         assert ci.get_input_by_name(f"test_name_{i}") is not None
+    mock_inputs.assert_not_called()
 
 
 def test_component_instance_input_create_from_api_response():
@@ -201,3 +207,68 @@ def test_component_instance_input_set_value(mock_send_message_json):
     assert data[0]["uniqueId"] == cii.unique_id
     assert data[0]["value"] == "!23"
     assert data[0]["toscaPresentation"]["ownerId"] == component_instance_mock.unique_id
+    component_instance_mock.invalidate_inputs.assert_called_once()
+
+
+@patch("onapsdk.sdc2.component_instance.ComponentInstance.send_message_json")
+@patch("onapsdk.sdc2.component_instance.ComponentInstance.inputs", new_callable=PropertyMock)
+def test_component_instance_set_input_values(mock_inputs, mock_send_message_json):
+    sdc_resource_mock = MagicMock(unique_id="mockUid")
+    sdc_resource_mock.name = "mocked sdc resource"
+    sdc_resource_mock.catalog_type.return_value = "mocked"
+    ci = ComponentInstance(
+        actual_component_uid=str(uuid4()),
+        component_name=str(uuid4()),
+        component_uid=str(uuid4()),
+        component_version=str(uuid4()),
+        creation_time=randint(0, maxsize),
+        customization_uuid=str(uuid4()),
+        icon=str(uuid4()),
+        invariant_name=str(uuid4()),
+        is_proxy=bool(randint(0, 1)),
+        modification_time=randint(0, maxsize),
+        name=str(uuid4()),
+        normalized_name=str(uuid4()),
+        origin_type=str(uuid4()),
+        sdc_resource=sdc_resource_mock,
+        tosca_component_name=str(uuid4()),
+        unique_id="ciUid"
+    )
+    mock_inputs.return_value = [
+        ComponentInstanceInput(
+            component_instance=ci,
+            name=f"input_{i}",
+            definition=False,
+            hidden=False,
+            required=False,
+            password=False,
+            immutable=False,
+            mapped_to_component_property=False,
+            is_declared_list_input=False,
+            user_created=False,
+            get_input_property=False,
+            empty=False,
+            unique_id=f"input_uid_{i}",
+            input_type="string",
+            value="old" if i % 2 else None
+        ) for i in range(10)
+    ]
+
+    with pytest.raises(ResourceNotFound):
+        ci.set_input_values({"input_0": "new", "missing": "new"})
+    mock_send_message_json.assert_not_called()
+
+    ci.set_input_values({"input_1": "old", "input_3": "old"})
+    mock_send_message_json.assert_not_called()
+
+    ci.set_input_values({f"input_{i}": "new" for i in range(10)} | {"input_1": "old"})
+    mock_send_message_json.assert_called_once()
+    method, _, url = mock_send_message_json.mock_calls[0].args
+    data = loads(mock_send_message_json.mock_calls[0].kwargs["data"])
+    assert method == "POST"
+    assert url == f"{settings.SDC_BE_URL}/sdc2/rest/v1/catalog/mocked/mockUid/resourceInstance/ciUid/inputs"
+    assert [item["name"] for item in data] == [f"input_{i}" for i in range(10) if i != 1]
+    assert all(item["value"] == "new" and item["parentUniqueId"] == "ciUid" for item in data)
+    assert mock_inputs.call_count == 1
+    ci.get_input_by_name("input_0")
+    assert mock_inputs.call_count == 2
@@ -42,52 +42,43 @@ def test_get_all_rough(mock_get_archived, mock_get_active):
     mock_get_active.assert_called_once()
 
 
-@patch("onapsdk.sdc2.pnf.Pnf._get_all_rough")
+@patch("onapsdk.sdc2.screen_index.SdcScreenIndex.send_message_json")
 @patch("onapsdk.sdc2.pnf.Pnf.get_by_name_and_version")
-def test_get_by_name(mock_get_by_name_and_version, mock_get_all_rough):
-    mock_get_all_rough.return_value = []
+def test_get_by_name(mock_get_by_name_and_version, mock_send_message_json):
+    mock_send_message_json.return_value = {}
     with raises(ResourceNotFound):
         Pnf.get_by_name("test_1")
+    assert mock_send_message_json.call_count == 2
 
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        }
-    ]
-    with raises(ResourceNotFound):
-        Pnf.get_by_name("test_1")
-
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "1.0"
-        }
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"resources": [{"name": "not_test_1", "version": "1.0", "resourceType": "PNF"}]},
+        {"resources": [{"name": "test_1", "version": "1.0", "resourceType": "PNF"}]}
     ]
     Pnf.get_by_name("test_1")
     mock_get_by_name_and_version.assert_called_once_with("test_1", "1.0")
+    assert mock_send_message_json.call_count == 2
 
     mock_get_by_name_and_version.reset_mock()
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "2.0"
-        }
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"resources": [
+            {"name": "not_test_1", "version": "1.0", "resourceType": "PNF"},
+            {"name": "test_1", "version": "9.0", "resourceType": "PNF"},
+            {"name": "test_1", "version": "10.0", "resourceType": "PNF"}
+        ]}
     ]
     Pnf.get_by_name("test_1")
-    mock_get_by_name_and_version.assert_called_once_with("test_1", "2.0")
+    mock_get_by_name_and_version.assert_called_once_with("test_1", "10.0")
+    mock_send_message_json.assert_called_once()
+
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"resources": [{"name": "test_1", "version": "1.0", "resourceType": "VFC"}]},
+        {"resources": []}
+    ]
+    with raises(ResourceNotFound):
+        Pnf.get_by_name("test_1")
 
 
 @patch("onapsdk.sdc2.pnf.Pnf.send_message")
@@ -125,7 +116,7 @@ def test_get_all(mock_get_by_name_and_version, mock_get_all_rough):
             "version": "1.0"
         }
     ]
-    list(Pnf.get_all())
+    list(Pnf.get_all(hydrate=True))
     mock_get_by_name_and_version.assert_called_once_with("test_pnf_1", "1.0")
 
     mock_get_by_name_and_version.reset_mock()
@@ -135,7 +126,7 @@ def test_get_all(mock_get_by_name_and_version, mock_get_all_rough):
             "version": f"{idx}.0"
         } for idx in range(100)
     )
-    list(Pnf.get_all())
+    list(Pnf.get_all(hydrate=True))
     assert len(mock_get_by_name_and_version.mock_calls) == 100
 
 
@@ -0,0 +1,124 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from unittest.mock import patch
+
+import pytest
+
+from onapsdk.configuration import settings
+from onapsdk.sdc2.pnf import Pnf
+from onapsdk.sdc2.screen_index import ScreenIndexEntry, SdcScreenIndex, version_key
+from onapsdk.sdc2.sdc import ResoureTypeEnum
+from onapsdk.sdc2.service import Service
+from onapsdk.sdc2.vf import Vf
+
+
+SCREEN = {
+    "resources": [
+        {"name": "vf", "version": "1.0", "uniqueId": "vf_1", "resourceType": "VF"},
+        {"name": "vf", "version": "2.0", "uniqueId": "vf_2", "resourceType": "VF"},
+        {"name": "pnf", "version": "1.0", "uniqueId": "pnf_1", "resourceType": "PNF"},
+        {"name": "no_type", "version": "1.0"}
+    ],
+    "services": [
+        {"name": "service", "version": "1.1", "uniqueId": "service_1"}
+    ]
+}
+
+
+@pytest.fixture
+def screen_index(monkeypatch):
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 60)
+    return SdcScreenIndex()
+
+
+def test_version_key():
+    assert version_key("10.0") > version_key("9.0")
+    assert version_key("1.1") > version_key("1.0")
+    assert version_key("1.x") == (1, 0)
+
+
+def test_build():
+    screen = SdcScreenIndex.build(SCREEN)
+    assert len(screen) == 3
+    assert screen[("VF", "vf")] == ScreenIndexEntry("vf", "2.0", "vf_2")
+    assert screen[("PNF", "pnf")].unique_id == "pnf_1"
+    assert screen[("SERVICE", "service")].version == "1.1"
+
+
+@patch.object(SdcScreenIndex, "send_message_json")
+def test_find_shared_screen(mock_send_message_json, screen_index):
+    mock_send_message_json.return_value = SCREEN
+    assert screen_index.find(ResoureTypeEnum.VF, "vf").version == "2.0"
+    assert screen_index.find(ResoureTypeEnum.PNF, "pnf").version == "1.0"
+    assert screen_index.find(ResoureTypeEnum.SERVICE, "service").version == "1.1"
+    mock_send_message_json.assert_called_once()
+    _, _, url = mock_send_message_json.mock_calls[0].args
+    assert url.endswith(SdcScreenIndex.SCREEN_ENDPOINT)
+
+
+@patch.object(SdcScreenIndex, "send_message_json")
+def test_find_missing(mock_send_message_json, screen_index):
+    mock_send_message_json.side_effect = [
+        SCREEN,
+        {"resources": [{"name": "vf", "version": "1.0", "resourceType": "VF"}]},
+        {"resources": [{"name": "archived_vf", "version": "3.0", "resourceType": "VF"}]}
+    ]
+    screen_index.find(ResoureTypeEnum.VF, "vf")
+    assert screen_index.find(ResoureTypeEnum.VF, "archived_vf").version == "3.0"
+    assert mock_send_message_json.call_count == 3
+    _, _, url = mock_send_message_json.mock_calls[1].args
+    assert url.endswith(SdcScreenIndex.SCREEN_ENDPOINT)
+    _, _, url = mock_send_message_json.mock_calls[2].args
+    assert url.endswith(SdcScreenIndex.ARCHIVE_ENDPOINT)
+
+    assert screen_index.find(ResoureTypeEnum.VF, "vf").version == "1.0"
+    assert mock_send_message_json.call_count == 3
+
+
+@patch.object(SdcScreenIndex, "send_message_json")
+def test_local_changes(mock_send_message_json, screen_index):
+    mock_send_message_json.return_value = SCREEN
+    screen_index.find(ResoureTypeEnum.VF, "vf")
+
+    screen_index.add(ResoureTypeEnum.VF, ScreenIndexEntry("vf", "2.1", "vf_3"))
+    screen_index.add(ResoureTypeEnum.VF, ScreenIndexEntry("vf", "1.1", "vf_4"))
+    screen_index.add(ResoureTypeEnum.VF, ScreenIndexEntry("new_vf", "0.1", "new_vf_1"))
+    assert screen_index.find(ResoureTypeEnum.VF, "vf").unique_id == "vf_3"
+    assert screen_index.find(ResoureTypeEnum.VF, "new_vf").unique_id == "new_vf_1"
+    mock_send_message_json.assert_called_once()
+
+    screen_index.remove(ResoureTypeEnum.PNF, "pnf")
+    assert screen_index.find(ResoureTypeEnum.PNF, "pnf").version == "1.0"
+    assert mock_send_message_json.call_count == 2
+
+    screen_index.invalidate()
+    screen_index.find(ResoureTypeEnum.PNF, "pnf")
+    assert mock_send_message_json.call_count == 3
+
+
+@patch.object(SdcScreenIndex, "send_message_json")
+@patch.object(Pnf, "get_by_name_and_version")
+@patch.object(Vf, "get_by_name_and_version")
+@patch.object(Service, "get_by_name_and_version")
+def test_resources_share_index(mock_service_get, mock_vf_get, mock_pnf_get,
+                               mock_send_message_json, monkeypatch):
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 60)
+    mock_send_message_json.return_value = SCREEN
+    Vf.get_by_name("vf")
+    Pnf.get_by_name("pnf")
+    Service.get_by_name("service")
+    mock_vf_get.assert_called_once_with("vf", "2.0")
+    mock_pnf_get.assert_called_once_with("pnf", "1.0")
+    mock_service_get.assert_called_once_with("service", "1.1")
+    mock_send_message_json.assert_called_once()
@@ -1,6 +1,7 @@
 
 import json
 from collections import namedtuple
+from pathlib import Path
 from random import choice, randint
 from sys import maxsize
 from tempfile import NamedTemporaryFile
@@ -10,7 +11,7 @@ from uuid import uuid4
 from pytest import raises
 
 from onapsdk.configuration import settings
-from onapsdk.exceptions import ResourceNotFound
+from onapsdk.exceptions import APIError, CompositionError, ResourceNotFound
 from onapsdk.sdc2.sdc_resource import LifecycleState, LifecycleOperation
 from onapsdk.sdc2.service import ServiceInstantiationType, Service, ResoureTypeEnum, ServiceDistribution
 
@@ -39,52 +40,35 @@ def test_get_all_rough(mock_get_archived, mock_get_active):
     mock_get_active.assert_called_once()
 
 
-@patch("onapsdk.sdc2.service.Service._get_all_rough")
+@patch("onapsdk.sdc2.screen_index.SdcScreenIndex.send_message_json")
 @patch("onapsdk.sdc2.service.Service.get_by_name_and_version")
-def test_get_by_name(mock_get_by_name_and_version, mock_get_all_rough):
-    mock_get_all_rough.return_value = []
-    with raises(ResourceNotFound):
-        Service.get_by_name("test_1")
-
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        }
-    ]
+def test_get_by_name(mock_get_by_name_and_version, mock_send_message_json):
+    mock_send_message_json.return_value = {}
     with raises(ResourceNotFound):
         Service.get_by_name("test_1")
+    assert mock_send_message_json.call_count == 2
 
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "1.0"
-        }
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"services": [{"name": "not_test_1", "version": "1.0"}]},
+        {"services": [{"name": "test_1", "version": "1.0"}]}
     ]
     Service.get_by_name("test_1")
     mock_get_by_name_and_version.assert_called_once_with("test_1", "1.0")
+    assert mock_send_message_json.call_count == 2
 
     mock_get_by_name_and_version.reset_mock()
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "2.0"
-        }
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"services": [
+            {"name": "not_test_1", "version": "1.0"},
+            {"name": "test_1", "version": "9.0"},
+            {"name": "test_1", "version": "10.0"}
+        ]}
     ]
     Service.get_by_name("test_1")
-    mock_get_by_name_and_version.assert_called_once_with("test_1", "2.0")
+    mock_get_by_name_and_version.assert_called_once_with("test_1", "10.0")
+    mock_send_message_json.assert_called_once()
 
 
 @patch("onapsdk.sdc2.service.Service.send_message")
@@ -122,7 +106,7 @@ def test_get_all(mock_get_by_name_and_version, mock_get_all_rough):
             "version": "1.0"
         }
     ]
-    list(Service.get_all())
+    list(Service.get_all(hydrate=True))
     mock_get_by_name_and_version.assert_called_once_with("test_service_1", "1.0")
 
     mock_get_by_name_and_version.reset_mock()
@@ -132,10 +116,64 @@ def test_get_all(mock_get_by_name_and_version, mock_get_all_rough):
             "version": f"{idx}.0"
         } for idx in range(100)
     )
-    list(Service.get_all())
+    list(Service.get_all(hydrate=True))
     assert len(mock_get_by_name_and_version.mock_calls) == 100
 
 
+@patch("onapsdk.sdc2.service.Service._get_all_rough")
+@patch("onapsdk.sdc2.service.Service.get_by_name_and_version")
+def test_get_all_lazy(mock_get_by_name_and_version, mock_get_all_rough):
+    mock_get_all_rough.return_value = [
+        {
+            "name": "test_service_1",
+            "version": "1.0",
+            "distributionStatus": "DISTRIBUTED"
+        }
+    ]
+    service, = Service.get_all()
+    assert service.distribuition_status == "DISTRIBUTED"
+    mock_get_by_name_and_version.assert_not_called()
+
+    mock_get_by_name_and_version.return_value = Service(
+        name="test_service_1",
+        version="1.0",
+        instantiation_type=ServiceInstantiationType.MACRO
+    )
+    assert service.instantiation_type == ServiceInstantiationType.MACRO
+    mock_get_by_name_and_version.assert_called_once_with("test_service_1", "1.0")
+
+
+@patch("onapsdk.sdc2.service.Service._get_all_rough")
+@patch("onapsdk.sdc2.service.Service.get_by_name_and_version")
+def test_get_all_lazy_unknown_attribute(mock_get_by_name_and_version, mock_get_all_rough):
+    mock_get_all_rough.return_value = [
+        {
+            "name": "test_service_1",
+            "version": "1.0",
+            "distributionStatus": "DISTRIBUTED"
+        }
+    ]
+    service, = Service.get_all()
+    assert not service.hydrated
+    assert service._tosca_model is None
+    assert service._tosca_template is None
+    assert service._model is None
+    assert not hasattr(service, "unknown_attribute")
+    assert not hasattr(service, "_unknown_attribute")
+    assert not hasattr(service, "__deepcopy__")
+    assert getattr(service, "__length_hint__", None) is None
+    mock_get_by_name_and_version.assert_not_called()
+
+    mock_get_by_name_and_version.return_value = Service(name="test_service_1",
+                                                        version="1.0",
+                                                        uuid="1234")
+    assert service.uuid == "1234"
+    assert service.hydrated
+    mock_get_by_name_and_version.assert_called_once_with("test_service_1", "1.0")
+    assert not hasattr(service, "unknown_attribute")
+    mock_get_by_name_and_version.assert_called_once()
+
+
 @patch("onapsdk.sdc2.service.Service.send_message_json")
 def test_get_active_rough(mock_send_message_json):
     mock_send_message_json.return_value = {"resources": []}
@@ -426,6 +464,56 @@ def test_add_resource(mock_send_message):
     assert data["icon"] == mock_resource.icon
 
 
+@patch("onapsdk.sdc2.service.Service.component_instances", new_callable=PropertyMock)
+@patch("onapsdk.sdc2.service.Service.add_resource")
+def test_add_resources(mock_add_resource, mock_component_instances):
+    s = Service(name="test_service", unique_id=str(uuid4()))
+    resources = []
+    for i in range(10):
+        mock_resource = MagicMock(unique_id=f"resource_{i % 3}")
+        mock_resource.name = f"resource_{i}"
+        resources.append(mock_resource)
+    existing_instance = MagicMock(component_uid="resource_0", unique_id="instance_0")
+    mock_component_instances.side_effect = [
+        [existing_instance],
+        [
+            existing_instance,
+            MagicMock(component_uid="resource_0", unique_id="instance_1"),
+            MagicMock(component_uid="other_resource", unique_id="instance_2"),
+            MagicMock(component_uid="resource_2", unique_id="instance_3")
+        ]
+    ]
+    component_instances = s.add_resources(resources, max_workers=3)
+    assert mock_add_resource.call_count == 10
+    added = [call.args[0] for call in mock_add_resource.mock_calls]
+    for unique_id in ("resource_0", "resource_1", "resource_2"):
+        assert [resource for resource in added if resource.unique_id == unique_id] == \
+            [resource for resource in resources if resource.unique_id == unique_id]
+    assert mock_component_instances.call_count == 2
+    assert [ci.unique_id for ci in component_instances] == ["instance_1", "instance_3"]
+
+    mock_add_resource.reset_mock()
+    mock_component_instances.reset_mock()
+    mock_component_instances.side_effect = None
+    mock_component_instances.return_value = []
+    resources.append(resources[3])
+    errors = []
+
+    def add_resource(resource):
+        if resource.name == "resource_3":
+            errors.append(APIError("Adding failed"))
+            raise errors[-1]
+
+    mock_add_resource.side_effect = add_resource
+    with raises(CompositionError) as exc:
+        s.add_resources(resources, max_workers=3)
+    assert exc.value.errors == {"resource_3": errors}
+    assert len(errors) == 2
+    assert exc.value.__cause__ is errors[0]
+    assert mock_add_resource.call_count == 11
+    mock_component_instances.assert_called_once()
+
+
 @patch("onapsdk.sdc2.service.Service.send_message_json")
 @patch("onapsdk.sdc2.service.Service.update")
 def test_distribute(mock_update, mock_send_message_json):
@@ -706,3 +794,21 @@ def test_service_distribution_distributon_status_list_with_errors(mock_send_mess
     sd._distribution_status_list = None
     assert len(sd.distribution_status_list) == 1
     assert sd.distribution_status_list[0].failed
+
+
+@patch("onapsdk.sdc2.service.Service.send_message")
+def test_service_tosca_model_and_model(mock_send_message):
+    with open(Path(__file__).resolve().parent / "data" / "test.csar", "rb") as csar_file:
+        mock_send_message.return_value.content = csar_file.read()
+    service = Service(name="test_service", uuid="test_service_uuid")
+    model = service.model
+    assert model.vnfs
+    assert service._tosca_template is None
+    assert service.model is model
+    assert service.tosca_model == mock_send_message.return_value.content
+    mock_send_message.assert_called_once()
+    method, _, url = mock_send_message.mock_calls[0].args
+    assert method == "GET"
+    assert url.endswith("sdc/v1/catalog/services/test_service_uuid/toscaModel")
+    assert mock_send_message.mock_calls[0].kwargs["headers"]["Accept"] == "application/octet-stream"
+
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 from pytest import raises
 
+from onapsdk.configuration import settings
 from onapsdk.exceptions import ResourceNotFound
 from onapsdk.sdc2.sdc_user import SdcUser
 
@@ -38,6 +39,19 @@ def test_get_by_user_id(mock_get_all):
     assert SdcUser.get_by_user_id("test_user") is not None
 
 
+@patch("onapsdk.sdc2.sdc_user.SdcUser.get_all")
+def test_get_by_user_id_index(mock_get_all, monkeypatch):
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 60)
+    TestUser = namedtuple("TestUser", ["user_id"])
+    mock_get_all.return_value = [TestUser(f"user_{i}") for i in range(10)]
+    for i in range(10):
+        assert SdcUser.get_by_user_id(f"user_{i}").user_id == f"user_{i}"
+    mock_get_all.assert_called_once()
+    with raises(ResourceNotFound):
+        SdcUser.get_by_user_id("test_user")
+    assert mock_get_all.call_count == 2
+
+
 def test_create_from_api_response():
     api_response = {
         "userId": str(uuid4()),
@@ -1,7 +1,7 @@
 
 from unittest.mock import MagicMock, patch, PropertyMock
 from onapsdk.exceptions import ResourceNotFound
-from onapsdk.sdc2.sdc_onboarding_api import SdcOnboardingApiItemAction, SdcOnboardingApiItemVersionAction
+from onapsdk.sdc2.sdc_onboarding_api import SdcOnboardingApiItemAction, SdcOnboardingApiItemStatus, SdcOnboardingApiItemVersionAction
 from onapsdk.sdc2.vendor import Vendor, SdcOnboardingApiItemTypeEnum
 
 from pytest import raises
@@ -105,6 +105,57 @@ def test_vendor_get_by_name(mock_get_all):
     assert v.name == "test_name"
 
 
+def vendor_raw_item(item_id, name, status="ACTIVE"):
+    return {"name": name, "type": "vlm", "id": item_id, "description": "test_desc",
+            "owner": "cs0008", "status": status, "properties": {}}
+
+
+@patch("onapsdk.sdc2.vendor.Vendor.get_raw_item")
+@patch("onapsdk.sdc2.vendor.Vendor.get_raw_items")
+def test_vendor_get_by_name_index(mock_get_raw_items, mock_get_raw_item):
+    mock_get_raw_items.return_value = [vendor_raw_item(str(i), f"vendor_{i}") for i in range(10)]
+    assert Vendor.get_by_name("vendor_5").item_id == "5"
+    mock_get_raw_items.assert_called_once()
+
+    # Known item is requested by its ID
+    mock_get_raw_items.reset_mock()
+    mock_get_raw_item.return_value = vendor_raw_item("3", "vendor_3")
+    assert Vendor.get_by_name("vendor_3").item_id == "3"
+    mock_get_raw_item.assert_called_once_with("3")
+    mock_get_raw_items.assert_not_called()
+
+    # Renamed or deleted items are looked for in all items
+    mock_get_raw_item.return_value = vendor_raw_item("3", "renamed")
+    mock_get_raw_items.return_value = [vendor_raw_item("11", "vendor_3")]
+    assert Vendor.get_by_name("vendor_3").item_id == "11"
+    mock_get_raw_items.assert_called_once()
+
+    mock_get_raw_items.reset_mock()
+    mock_get_raw_item.side_effect = ResourceNotFound
+    mock_get_raw_items.return_value = []
+    with raises(ResourceNotFound):
+        Vendor.get_by_name("vendor_3")
+    mock_get_raw_items.assert_called_once()
+
+
+@patch("onapsdk.sdc2.vendor.Vendor.send_message")
+@patch("onapsdk.sdc2.vendor.Vendor.get_raw_items")
+@patch("onapsdk.sdc2.vendor.Vendor.get_raw_item")
+def test_vendor_update_and_delete(mock_get_raw_item, mock_get_raw_items, mock_send_message):
+    v = Vendor.create_from_response(vendor_raw_item("123", "test"))
+    mock_get_raw_item.return_value = vendor_raw_item("123", "test", "ARCHIVED")
+    v.update()
+    mock_get_raw_item.assert_called_once_with("123")
+    mock_get_raw_items.assert_not_called()
+    assert v.status == SdcOnboardingApiItemStatus.ARCHIVED
+
+    v.delete()
+    mock_get_raw_items.return_value = []
+    with raises(ResourceNotFound):
+        Vendor.get_by_name("test")
+    mock_get_raw_item.assert_called_once()
+
+
 @patch("onapsdk.sdc2.vendor.Vendor.send_message_json")
 @patch("onapsdk.sdc2.sdc_onboarding_api.SdcOnboardingApiItemVersion.create_from_api_response")
 def test_vendor_versions(mock_create_from_api, mock_send_message_json):
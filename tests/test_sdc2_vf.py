@@ -42,52 +42,43 @@ def test_get_all_rough(mock_get_archived, mock_get_active):
     mock_get_active.assert_called_once()
 
 
-@patch("onapsdk.sdc2.vf.Vf._get_all_rough")
+@patch("onapsdk.sdc2.screen_index.SdcScreenIndex.send_message_json")
 @patch("onapsdk.sdc2.vf.Vf.get_by_name_and_version")
-def test_get_by_name(mock_get_by_name_and_version, mock_get_all_rough):
-    mock_get_all_rough.return_value = []
-    with raises(ResourceNotFound):
-        Vf.get_by_name("test_1")
-
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        }
-    ]
+def test_get_by_name(mock_get_by_name_and_version, mock_send_message_json):
+    mock_send_message_json.return_value = {}
     with raises(ResourceNotFound):
         Vf.get_by_name("test_1")
+    assert mock_send_message_json.call_count == 2
 
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "1.0"
-        }
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"resources": [{"name": "not_test_1", "version": "1.0", "resourceType": "VF"}]},
+        {"resources": [{"name": "test_1", "version": "1.0", "resourceType": "VF"}]}
     ]
     Vf.get_by_name("test_1")
     mock_get_by_name_and_version.assert_called_once_with("test_1", "1.0")
+    assert mock_send_message_json.call_count == 2
 
     mock_get_by_name_and_version.reset_mock()
-    mock_get_all_rough.return_value = [
-        {
-            "name": "not_test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "1.0"
-        },
-        {
-            "name": "test_1",
-            "version": "2.0"
-        }
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"resources": [
+            {"name": "not_test_1", "version": "1.0", "resourceType": "VF"},
+            {"name": "test_1", "version": "9.0", "resourceType": "VF"},
+            {"name": "test_1", "version": "10.0", "resourceType": "VF"}
+        ]}
     ]
     Vf.get_by_name("test_1")
-    mock_get_by_name_and_version.assert_called_once_with("test_1", "2.0")
+    mock_get_by_name_and_version.assert_called_once_with("test_1", "10.0")
+    mock_send_message_json.assert_called_once()
+
+    mock_send_message_json.reset_mock()
+    mock_send_message_json.side_effect = [
+        {"resources": [{"name": "test_1", "version": "1.0", "resourceType": "VFC"}]},
+        {"resources": []}
+    ]
+    with raises(ResourceNotFound):
+        Vf.get_by_name("test_1")
 
 
 @patch("onapsdk.sdc2.vf.Vf.send_message")
@@ -125,7 +116,7 @@ def test_get_all(mock_get_by_name_and_version, mock_get_all_rough):
             "version": "1.0"
         }
     ]
-    list(Vf.get_all())
+    list(Vf.get_all(hydrate=True))
     mock_get_by_name_and_version.assert_called_once_with("test_vf_1", "1.0")
 
     mock_get_by_name_and_version.reset_mock()
@@ -135,10 +126,67 @@ def test_get_all(mock_get_by_name_and_version, mock_get_all_rough):
             "version": f"{idx}.0"
         } for idx in range(100)
     )
-    list(Vf.get_all())
+    list(Vf.get_all(hydrate=True))
     assert len(mock_get_by_name_and_version.mock_calls) == 100
 
 
+@patch("onapsdk.sdc2.vf.Vf._get_all_rough")
+@patch("onapsdk.sdc2.vf.Vf.get_by_name_and_version")
+def test_get_all_lazy(mock_get_by_name_and_version, mock_get_all_rough):
+    mock_get_all_rough.return_value = [
+        {
+            "name": "test_vf_1",
+            "version": "1.0",
+            "uniqueId": "test_vf_1_unique_id",
+            "lifecycleState": "CERTIFIED",
+            "resourceType": "VF"
+        }
+    ]
+    vf, = Vf.get_all()
+    assert not vf.hydrated
+    assert vf.name == "test_vf_1"
+    assert vf.version == "1.0"
+    assert vf.unique_id == "test_vf_1_unique_id"
+    assert vf.lifecycle_state == LifecycleState.CERTIFIED
+    assert vf == Vf(name="test_vf_1")
+    mock_get_by_name_and_version.assert_not_called()
+
+    mock_get_by_name_and_version.return_value = Vf(
+        name="test_vf_1",
+        version="1.0",
+        unique_id="test_vf_1_unique_id",
+        uuid="test_vf_1_uuid",
+        description="test_vf_1_description"
+    )
+    assert vf.uuid == "test_vf_1_uuid"
+    assert vf.hydrated
+    assert vf.description == "test_vf_1_description"
+    mock_get_by_name_and_version.assert_called_once_with("test_vf_1", "1.0")
+    with raises(AttributeError):
+        vf.not_existing_attribute
+    mock_get_by_name_and_version.assert_called_once()
+
+    vf.hydrate()
+    mock_get_by_name_and_version.assert_called_once()
+
+
+@patch("onapsdk.sdc2.vf.Vf._get_all_rough")
+@patch("onapsdk.sdc2.vf.Vf.get_by_name_and_version")
+def test_get_all_hydrate_concurrently(mock_get_by_name_and_version, mock_get_all_rough):
+    mock_get_all_rough.return_value = (
+        {
+            "name": f"test_vf_{idx}",
+            "version": "1.0"
+        } for idx in range(20)
+    )
+    mock_get_by_name_and_version.side_effect = lambda name, version: Vf(name=name,
+                                                                        version=version)
+    vfs = list(Vf.get_all(hydrate=True, max_workers=4))
+    assert [vf.name for vf in vfs] == [f"test_vf_{idx}" for idx in range(20)]
+    assert all(vf.hydrated for vf in vfs)
+    assert len(mock_get_by_name_and_version.mock_calls) == 20
+
+
 @patch("onapsdk.sdc2.vf.Vf.send_message_json")
 def test_get_active_rough(mock_send_message_json):
     mock_send_message_json.return_value = {"resources": []}
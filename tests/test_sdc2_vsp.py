@@ -1,6 +1,6 @@
-
 from unittest.mock import MagicMock, patch, PropertyMock
-from onapsdk.exceptions import ValidationError
+from onapsdk.exceptions import ConnectionFailed, ValidationError
+from onapsdk.utils.multipart_upload import MultipartUpload
 from onapsdk.sdc2.vsp import Vsp, SdcOnboardingApiItemTypeEnum
 
 from pytest import raises
@@ -41,6 +41,15 @@ def test_vsp_upload_package(mock_latest_version, mock_send_message):
               properties={})
     vsp.upload_package(MagicMock())
     mock_send_message.assert_called_once()
+    upload = mock_send_message.call_args.kwargs["data"]
+    assert isinstance(upload, MultipartUpload)
+    assert mock_send_message.call_args.kwargs["headers"]["Content-Type"] == upload.content_type
+
+    mock_send_message.reset_mock()
+    mock_send_message.side_effect = [ConnectionFailed("Connection reset"), MagicMock()]
+    with patch("onapsdk.utils.multipart_upload.time.sleep"):
+        vsp.upload_package(MagicMock())
+    assert mock_send_message.call_count == 2
 
 
 @patch("onapsdk.sdc2.vsp.Vsp.send_message_json")
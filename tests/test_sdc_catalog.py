@@ -0,0 +1,319 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from unittest import mock
+
+import pytest
+
+from onapsdk.configuration import settings
+from onapsdk.exceptions import ResourceNotFound
+from onapsdk.sdc.catalog import SdcCatalog, SdcScreen
+from onapsdk.sdc.sdc_resource import SdcResource
+from onapsdk.sdc.service import Service
+from onapsdk.sdc.vendor import Vendor
+from onapsdk.sdc.vf import Vf
+
+
+@pytest.fixture
+def catalog_cache(monkeypatch):
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 60)
+
+
+def vf(name, version, uuid):
+    resource = Vf(name=name, sdc_values={"uuid": uuid,
+                                         "version": version,
+                                         "invariantUUID": f"invariant-{name}",
+                                         "lifecycleState": "CERTIFIED"})
+    resource.unique_identifier = f"unique-{uuid}"
+    return resource
+
+
+def test_sdc_catalog_indexes():
+    vf_1 = vf("one", "1.0", "uuid-1")
+    vf_2 = vf("one", "2.0", "uuid-2")
+    vf_3 = vf("two", "1.0", "uuid-3")
+    catalog = SdcCatalog([vf_1, vf_2, vf_3])
+    assert len(catalog) == 3
+    assert catalog.find_all("one") == [vf_1, vf_2]
+    assert catalog.find_all("three") == []
+    assert catalog.find("one", "2.0") is vf_2
+    assert catalog.find("one", "3.0") is None
+    assert catalog.get_by("identifier", "uuid-3") is vf_3
+    assert catalog.get_by("unique_uuid", "invariant-one") is vf_1
+    assert catalog.get_by("identifier", "uuid-4") is None
+
+    vf_4 = vf("one", "3.0", "uuid-4")
+    catalog.add(vf_4)
+    assert catalog.find("one", "3.0") is vf_4
+    assert catalog.get_by("identifier", "uuid-4") is vf_4
+
+    assert not catalog.is_stale("one")
+    catalog.mark_stale("one")
+    assert catalog.is_stale("one")
+    assert not catalog.is_stale("two")
+
+
+@mock.patch.object(Vf, "get_all")
+def test_sdc_catalog_not_cached(mock_get_all):
+    mock_get_all.return_value = [vf("one", "1.0", "uuid-1")]
+    assert Vf(name="one").exists()
+    assert Vf(name="one").exists()
+    assert mock_get_all.call_count == 2
+
+
+@mock.patch.object(Vf, "get_all")
+def test_sdc_catalog_cached(mock_get_all, catalog_cache):
+    mock_get_all.return_value = [vf("one", "1.0", "uuid-1"), vf("one", "2.0", "uuid-2")]
+    vf_1 = Vf(name="one")
+    assert vf_1.exists()
+    assert vf_1.identifier == "uuid-2"
+    vf_2 = Vf(name="one", version="1.0")
+    assert vf_2.exists()
+    assert vf_2.identifier == "uuid-1"
+    mock_get_all.assert_called_once()
+
+    # missing objects are looked for once more in a new snapshot
+    assert not Vf(name="one", version="3.0").exists()
+    assert mock_get_all.call_count == 2
+    assert not Vf(name="two").exists()
+    assert mock_get_all.call_count == 3
+
+    Vf.invalidate_catalog()
+    assert Vf(name="one").exists()
+    assert mock_get_all.call_count == 4
+
+
+@mock.patch.object(Vf, "get_all")
+def test_sdc_catalog_cached_created_outside(mock_get_all, catalog_cache):
+    mock_get_all.return_value = [vf("one", "1.0", "uuid-1")]
+    assert Vf(name="one").exists()
+    mock_get_all.assert_called_once()
+
+    # objects created outside of this process during the snapshot TTL
+    mock_get_all.return_value = [vf("one", "1.0", "uuid-1"), vf("one", "2.0", "uuid-2"),
+                                 vf("two", "1.0", "uuid-3")]
+    vf_2 = Vf(name="two")
+    assert vf_2.exists()
+    assert vf_2.identifier == "uuid-3"
+    assert mock_get_all.call_count == 2
+    vf_1 = Vf(name="one", version="2.0")
+    assert vf_1.exists()
+    assert vf_1.identifier == "uuid-2"
+    assert mock_get_all.call_count == 2
+
+
+@mock.patch.object(Vendor, "get_all")
+@mock.patch.object(Vendor, "send_message_json")
+@mock.patch.object(Vendor, "send_message")
+def test_sdc_catalog_local_writes(mock_send_message, mock_send_message_json, mock_get_all,
+                                  catalog_cache):
+    mock_get_all.return_value = []
+    mock_send_message_json.return_value = {"itemId": "1234", "version": {"id": "5678"}}
+    vendor = Vendor(name="vendor")
+    vendor.create()
+    # missing vendor is looked for once more in a new snapshot before creation
+    assert mock_get_all.call_count == 2
+    mock_send_message_json.assert_called_once()
+
+    # created vendor is added to the snapshot, as an object built from the response
+    catalog_vendor, = Vendor.catalog().find_all("vendor")
+    assert catalog_vendor is not vendor
+    vendor.identifier = "changed"
+    other_vendor = Vendor(name="vendor")
+    assert other_vendor.exists()
+    assert other_vendor.identifier == "1234"
+    assert mock_get_all.call_count == 2
+
+    # lifecycle action makes the snapshot stale for that vendor
+    vendor.submit()
+    mock_send_message.assert_called_once()
+    mock_get_all.return_value = [vendor]
+    assert Vendor(name="vendor").exists()
+    assert mock_get_all.call_count == 3
+    assert Vendor(name="vendor").exists()
+    assert mock_get_all.call_count == 3
+
+
+@mock.patch.object(Service, "get_all")
+def test_service_get_by_uuid_cached(mock_get_all, catalog_cache):
+    service = Service(name="service", sdc_values={"uuid": "uuid-1",
+                                                   "version": "1.0",
+                                                   "invariantUUID": "invariant-1",
+                                                   "lifecycleState": "CERTIFIED",
+                                                   "distributionStatus": "DISTRIBUTED",
+                                                   "category": "Network Service"})
+    mock_get_all.return_value = [service]
+    assert Service.get_by_unique_uuid("invariant-1") is service
+    assert Service.get_by_identifier("uuid-1") is service
+    mock_get_all.assert_called_once()
+    with pytest.raises(ResourceNotFound):
+        Service.get_by_identifier("uuid-2")
+    assert mock_get_all.call_count == 2
+
+
+@mock.patch.object(Service, "get_all")
+def test_service_get_by_uuid_created_outside(mock_get_all, catalog_cache):
+    mock_get_all.return_value = []
+    Service.catalog()
+    mock_get_all.assert_called_once()
+
+    # service created outside of this process during the snapshot TTL
+    service = Service(name="service", sdc_values={"uuid": "uuid-1",
+                                                   "version": "1.0",
+                                                   "invariantUUID": "invariant-1",
+                                                   "lifecycleState": "CERTIFIED",
+                                                   "distributionStatus": "DISTRIBUTED",
+                                                   "category": "Network Service"})
+    service.unique_identifier = "unique-1"
+    mock_get_all.return_value = [service]
+    assert Service.get_by_unique_uuid("invariant-1") is service
+    assert mock_get_all.call_count == 2
+    assert Service.get_by_identifier("uuid-1") is service
+    assert Service(name="service").exists()
+    assert mock_get_all.call_count == 2
+
+
+def test_catalog_entry_from_creation_response():
+    service = Service(name="service")
+    entry = service._catalog_entry({"uuid": "uuid-1",
+                                    "version": "0.1",
+                                    "invariantUUID": "invariant-1",
+                                    "lifecycleState": "NOT_CERTIFIED_CHECKOUT",
+                                    "distributionStatus": "DISTRIBUTION_NOT_APPROVED",
+                                    "categories": [{"name": "Network Service"}],
+                                    "name": "service"})
+    assert entry is not service
+    assert entry.identifier == "uuid-1"
+    assert entry.category_name == "Network Service"
+    assert service._catalog_entry({"uuid": "uuid-1", "categories": []}) is None
+    assert Vf(name="vf")._catalog_entry({"name": "vf"}) is None
+
+
+SCREEN = {
+    "resources": [
+        {"uuid": "uuid-1", "invariantUUID": "invariant-1", "uniqueId": "unique-1",
+         "version": "1.0", "name": "vf_1", "categories": [{"name": "category",
+                                         "subcategories": [{"name": "subcategory"}]}]},
+        {"uuid": "uuid-2", "invariantUUID": "invariant-2", "uniqueId": "unique-2",
+         "version": "1.0", "name": "vf_2", "categories": [{"name": "category", "subcategories": None}]}
+    ],
+    "services": [
+        {"uuid": "uuid-3", "invariantUUID": "invariant-3", "uniqueId": "unique-3",
+         "version": "2.0", "name": "service", "categories": [{"name": "Network Service"}]}
+    ]
+}
+
+
+def deep_loadable(resource_class, uuid, invariant_uuid, version="1.0"):
+    return resource_class(name="test", sdc_values={"uuid": uuid,
+                                                   "version": version,
+                                                   "invariantUUID": invariant_uuid,
+                                                   "lifecycleState": "CERTIFIED",
+                                                   "distributionStatus": "DISTRIBUTED",
+                                                   "category": "Network Service"})
+
+
+def test_sdc_screen_indexes():
+    screen = SdcScreen(SCREEN)
+    assert len(screen) == 3
+    assert screen.find("resources", "invariant-1", "uuid-1", "1.0")["uniqueId"] == "unique-1"
+    assert screen.find("resources", "invariant-1", "uuid-1", "1.1") is None
+    assert screen.find("resources", "invariant-2", "uuid-1", "1.0") is None
+    assert screen.find("services", "invariant-1", "uuid-1", "1.0") is None
+    assert [entry["uuid"] for entry in screen.find_all("services", "invariant-3")] == ["uuid-3"]
+    assert screen.find_all("resources", "invariant-3") == []
+
+    fetch = mock.Mock(return_value=[{"version": "1.0", "uniqueId": "unique-3-1"}])
+    assert screen.dependencies("unique-3", fetch) == fetch.return_value
+    assert screen.dependencies("unique-3", fetch) == fetch.return_value
+    fetch.assert_called_once()
+
+
+@mock.patch.object(SdcResource, "send_message_json")
+def test_deep_load_screen_cached(mock_send_message_json, catalog_cache):
+    mock_send_message_json.return_value = SCREEN
+    vf_1 = deep_loadable(Vf, "uuid-1", "invariant-1")
+    vf_2 = deep_loadable(Vf, "uuid-2", "invariant-2")
+    service = deep_loadable(Service, "uuid-3", "invariant-3", "2.0")
+    SdcResource.deep_load_all([vf_1, vf_2, service], max_workers=3)
+    mock_send_message_json.assert_called_once()
+    assert vf_1.unique_identifier == "unique-1"
+    assert (vf_1._category_name, vf_1._subcategory_name) == ("category", "subcategory")
+    assert vf_2.unique_identifier == "unique-2"
+    assert vf_2._subcategory_name is None
+    assert service.unique_identifier == "unique-3"
+    assert service._category_name == "Network Service"
+
+    # Object created after snapshot was taken refreshes it once
+    mock_send_message_json.return_value = {"resources": SCREEN["resources"] + [
+        {"uuid": "uuid-4", "invariantUUID": "invariant-4", "uniqueId": "unique-4",
+         "version": "1.0", "name": "vf_4", "categories": [{"name": "category"}]}]}
+    vf_4 = deep_loadable(Vf, "uuid-4", "invariant-4")
+    assert vf_4.unique_identifier == "unique-4"
+    assert mock_send_message_json.call_count == 2
+    assert deep_loadable(Vf, "uuid-1", "invariant-1").unique_identifier == "unique-1"
+    assert mock_send_message_json.call_count == 2
+
+    # Object which isn't in the fresh snapshot doesn't refresh it again
+    assert deep_loadable(Vf, "uuid-5", "invariant-5").unique_identifier is None
+    assert mock_send_message_json.call_count == 3
+
+
+@mock.patch.object(SdcResource, "send_message_json")
+def test_deep_load_service_dependencies_cached(mock_send_message_json, catalog_cache):
+    dependencies = [{"version": "1.0", "uniqueId": "unique-3-1"},
+                    {"version": "2.0", "uniqueId": "unique-3"}]
+    mock_send_message_json.side_effect = [SCREEN, dependencies]
+    assert deep_loadable(Service, "uuid-3-1", "invariant-3").unique_identifier == "unique-3-1"
+    assert deep_loadable(Service, "uuid-3-1", "invariant-3").unique_identifier == "unique-3-1"
+    assert mock_send_message_json.call_count == 2
+    assert mock_send_message_json.call_args.args[2].endswith("/services/unique-3/dependencies")
+
+
+@mock.patch.object(SdcResource, "send_message_json")
+def test_deep_load_new_version(mock_send_message_json, catalog_cache):
+    mock_send_message_json.return_value = SCREEN
+    assert deep_loadable(Vf, "uuid-1", "invariant-1").unique_identifier == "unique-1"
+    mock_send_message_json.assert_called_once()
+
+    # Checked out version keeps UUID, cached entry of the previous version isn't used
+    mock_send_message_json.return_value = {"resources": [
+        dict(SCREEN["resources"][0], version="1.1", uniqueId="unique-1-1")]}
+    assert deep_loadable(Vf, "uuid-1", "invariant-1", "1.1").unique_identifier == "unique-1-1"
+    assert mock_send_message_json.call_count == 2
+
+    # Lifecycle action removes screen snapshots
+    mock_send_message_json.return_value = SCREEN
+    vf_1 = deep_loadable(Vf, "uuid-1", "invariant-1")
+    vf_1._catalog_changed()
+    assert vf_1.unique_identifier == "unique-1"
+    assert mock_send_message_json.call_count == 3
+    vf_1._catalog_changed(created=deep_loadable(Vf, "uuid-1", "invariant-1"))
+    assert deep_loadable(Vf, "uuid-1", "invariant-1").unique_identifier == "unique-1"
+    assert mock_send_message_json.call_count == 3
+
+
+@mock.patch.object(SdcResource, "send_message_json")
+def test_deep_load_all_refreshes_once(mock_send_message_json, catalog_cache):
+    mock_send_message_json.return_value = SCREEN
+    assert deep_loadable(Vf, "uuid-1", "invariant-1").unique_identifier == "unique-1"
+    mock_send_message_json.return_value = {"resources": SCREEN["resources"] + [
+        {"uuid": f"uuid-new-{idx}", "invariantUUID": f"invariant-new-{idx}",
+         "uniqueId": f"unique-new-{idx}", "version": "1.0", "name": f"vf_new_{idx}",
+         "categories": [{"name": "category"}]} for idx in range(8)]}
+    resources = [deep_loadable(Vf, f"uuid-new-{idx}", f"invariant-new-{idx}")
+                 for idx in range(8)]
+    SdcResource.deep_load_all(resources, max_workers=8)
+    assert [resource._unique_identifier for resource in resources] == [
+        f"unique-new-{idx}" for idx in range(8)]
+    assert mock_send_message_json.call_count == 2
@@ -15,6 +15,7 @@
 from unittest import mock
 
 import pytest
+from onapsdk.configuration import settings
 from onapsdk.exceptions import APIError, ResourceNotFound
 
 from onapsdk.sdc.category_management import ResourceCategory, ServiceCategory
@@ -305,6 +306,29 @@ def test_resource_category_create(mock_send_message_json):
     assert not rc.type
     ResourceCategory.create(name="New category")
 
+@mock.patch.object(ResourceCategory, "send_message_json")
+def test_resource_category_create_updates_catalog(mock_send_message_json, monkeypatch):
+    monkeypatch.setattr(settings, "SDC_CATALOG_CACHE_TTL", 60)
+    # missing category is looked for once more in a new snapshot before creation
+    mock_send_message_json.side_effect = [CATEGORIES, CATEGORIES, {
+        "name": "New category",
+        "normalizedName": "new category",
+        "uniqueId": "resourceNewCategory.new category",
+        "icons": None,
+        "subcategories": None,
+        "version": None,
+        "ownerId": None,
+        "empty": False,
+        "type": None
+    }]
+    rc = ResourceCategory.create(name="New category")
+    assert rc.unique_id == "resourceNewCategory.new category"
+    assert mock_send_message_json.call_count == 3
+    rc = ResourceCategory.get(name="New category")
+    assert rc.unique_id == "resourceNewCategory.new category"
+    assert ResourceCategory.get(name="Network Connectivity")
+    assert mock_send_message_json.call_count == 3
+
 @mock.patch.object(ServiceCategory, "send_message_json")
 def test_service_category_exists(mock_send_message_json):
 
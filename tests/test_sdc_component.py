@@ -11,9 +11,11 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import json
 from unittest import mock
 
 from onapsdk.sdc.component import Component
+from onapsdk.sdc.properties import ComponentProperty
 
 
 def test_sdc_component_delete():
@@ -42,3 +44,38 @@ def test_sdc_component_delete():
         "Delete test_component component",
         f"http://test.onap.org/resourceInstance/{component.unique_id}"
     )
+
+
+def test_sdc_component_set_property_values():
+    mock_sdc_resource = mock.MagicMock()
+    mock_parent_sdc_resource = mock.MagicMock()
+    mock_parent_sdc_resource.resource_inputs_url = "http://test.onap.org"
+    component = Component(
+        created_from_csar=False,
+        actual_component_uid="123",
+        unique_id="456",
+        normalized_name="789",
+        name="test_component",
+        origin_type="test-origin-type",
+        customization_uuid="098",
+        component_uid="765",
+        component_version="432",
+        tosca_component_name="test-tosca-component-name",
+        component_name="test-component-name",
+        sdc_resource=mock_sdc_resource,
+        parent_sdc_resource=mock_parent_sdc_resource,
+        group_instances=None
+    )
+    component.set_property_values([])
+    mock_sdc_resource.send_message_json.assert_not_called()
+    component.set_property_values([
+        (ComponentProperty("1", "string", "prop1", component), "a"),
+        (ComponentProperty("2", "integer", "prop2", component), 2)
+    ])
+    mock_sdc_resource.send_message_json.assert_called_once()
+    method, _, url = mock_sdc_resource.send_message_json.call_args[0]
+    assert method == "POST"
+    assert url == component.properties_value_url
+    data = json.loads(mock_sdc_resource.send_message_json.call_args[1]["data"])
+    assert [(item["uniqueId"], item["value"]) for item in data] == [("123.prop1", "a"),
+                                                                    ("123.prop2", "2")]
@@ -0,0 +1,133 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from threading import Barrier, Lock
+from unittest import mock
+
+import pytest
+
+import onapsdk.constants as const
+from onapsdk.configuration import settings
+from onapsdk.exceptions import OnboardingError, ParameterError, StatusError
+from onapsdk.sdc.onboarding import OnboardingScheduler
+from onapsdk.sdc.pnf import Pnf
+from onapsdk.sdc.service import Service
+from onapsdk.sdc.vendor import Vendor
+from onapsdk.sdc.vf import Vf
+from onapsdk.sdc.vsp import Vsp
+
+
+def catalog():
+    vendor = Vendor(name="vendor")
+    vsp = Vsp(name="vsp", vendor=vendor)
+    vf_1 = Vf(name="vf_1", vsp=vsp)
+    vf_2 = Vf(name="vf_2", vsp=vsp, vendor=Vendor(name="vendor"))
+    pnf = Pnf(name="pnf", vendor=vendor)
+    service = Service(name="service", resources=[vf_1, vf_2, pnf])
+    return vendor, vsp, vf_1, vf_2, pnf, service
+
+
+def names(resources):
+    return sorted(resource.name for resource in resources)
+
+
+def test_onboarding_scheduler_dependencies():
+    vendor, vsp, vf_1, vf_2, pnf, service = catalog()
+    scheduler = OnboardingScheduler([service])
+    assert len(scheduler.resources) == 6
+    assert scheduler.resources[("Vendor", "vendor")] is vendor
+    assert scheduler.dependencies[("Vf", "vf_2")] == {("Vsp", "vsp"), ("Vendor", "vendor")}
+    assert scheduler.dependencies[("Service", "service")] == {
+        ("Vf", "vf_1"), ("Vf", "vf_2"), ("Pnf", "pnf")}
+    assert [names(stage) for stage in scheduler.stages] == [
+        ["vendor"], ["pnf", "vsp"], ["vf_1", "vf_2"], ["service"]]
+
+    scheduler.dependencies[("Vendor", "vendor")] = {("Service", "service")}
+    with pytest.raises(ParameterError):
+        scheduler.stages
+    with pytest.raises(ParameterError):
+        scheduler.run()
+
+
+@mock.patch.object(OnboardingScheduler, "_wait_onboarded")
+def test_onboarding_scheduler_run(mock_wait_onboarded):
+    vendor, vsp, vf_1, vf_2, pnf, service = catalog()
+    lock = Lock()
+    events = []
+    # Both VFs have to be onboarded at the same time to pass the barrier
+    vf_barrier = Barrier(2, timeout=5)
+
+    def onboard(resource):
+        with lock:
+            events.append(("start", resource.name))
+        if isinstance(resource, Vf):
+            vf_barrier.wait()
+        with lock:
+            events.append(("end", resource.name))
+
+    with mock.patch.object(Vendor, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Vsp, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Vf, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Pnf, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Service, "onboard", autospec=True, side_effect=onboard):
+        onboarded = OnboardingScheduler([service, vf_2, vendor], max_workers=4).run()
+
+    assert names(onboarded) == ["pnf", "service", "vendor", "vf_1", "vf_2", "vsp"]
+    assert onboarded[0] is vendor and onboarded[-1] is service
+    assert mock_wait_onboarded.call_count == 6
+    for dependant, dependency in [("vsp", "vendor"), ("pnf", "vendor"), ("vf_1", "vsp"),
+                                  ("vf_2", "vsp"), ("service", "vf_1"), ("service", "vf_2"),
+                                  ("service", "pnf")]:
+        assert events.index(("end", dependency)) < events.index(("start", dependant))
+
+
+@mock.patch.object(OnboardingScheduler, "_wait_onboarded")
+def test_onboarding_scheduler_failure(_):
+    vendor, vsp, vf_1, vf_2, pnf, service = catalog()
+    onboarded = []
+
+    def onboard(resource):
+        if resource.name == "vf_1":
+            raise StatusError("VF onboarding failed")
+        onboarded.append(resource.name)
+
+    scheduler = OnboardingScheduler([service])
+    with mock.patch.object(Vendor, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Vsp, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Vf, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Pnf, "onboard", autospec=True, side_effect=onboard), \
+            mock.patch.object(Service, "onboard", autospec=True, side_effect=onboard):
+        with pytest.raises(OnboardingError) as exc:
+            scheduler.run()
+    assert isinstance(exc.value.__cause__, StatusError)
+    assert sorted(onboarded) == ["pnf", "vendor", "vf_2", "vsp"]
+    assert list(scheduler.failed) == [("Vf", "vf_1")]
+    assert scheduler.skipped == {("Service", "service")}
+
+
+@mock.patch("onapsdk.utils.polling.time.sleep")
+def test_onboarding_scheduler_wait_onboarded(mock_sleep, monkeypatch):
+    resource = mock.MagicMock(ONBOARDED_STATUS=const.CERTIFIED)
+    type(resource).status = mock.PropertyMock(
+        side_effect=[const.CHECKED_IN, const.CHECKED_IN, const.CERTIFIED])
+    OnboardingScheduler._wait_onboarded(resource)
+    assert resource.load.call_count == 2
+    assert mock_sleep.call_count == 1
+    assert mock_sleep.call_args[0][0] == pytest.approx(settings.SDC_ONBOARDING_POLL_INTERVAL,
+                                                       rel=settings.SDC_POLLING_JITTER)
+
+    resource = mock.MagicMock(ONBOARDED_STATUS=const.DISTRIBUTED)
+    type(resource).status = mock.PropertyMock(return_value=const.CERTIFIED)
+    monkeypatch.setattr(settings, "SDC_ONBOARDING_TIMEOUT", 0)
+    with pytest.raises(StatusError):
+        OnboardingScheduler._wait_onboarded(resource)
@@ -12,13 +12,14 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import json
 from unittest import mock
 import logging
 
 import pytest
 
 import onapsdk.constants as const
-from onapsdk.exceptions import ParameterError, RequestError, ResourceNotFound
+from onapsdk.exceptions import ParameterError, PollingTimeout, RequestError, ResourceNotFound
 from onapsdk.onap_service import OnapService
 from onapsdk.sdc.component import Component
 from onapsdk.sdc.properties import ComponentProperty, Input, NestedInput, Property
@@ -27,6 +28,7 @@ from onapsdk.sdc.service import Service
 from onapsdk.sdc.vf import Vf
 from onapsdk.utils.headers_creator import headers_sdc_tester
 from onapsdk.utils.headers_creator import headers_sdc_creator
+from onapsdk.utils.polling import PollingPolicy
 
 
 COMPONENT_PROPERTIES = [
@@ -150,7 +152,7 @@ def test__deep_load_response_OK(mock_send, mock_created):
     vf.unique_uuid = "1234"
     vf._version = "4567"
     vf._status = const.CHECKED_IN
-    mock_send.return_value = {'resources': [{'uuid': '5689', 'name': 'test', 'uniqueId': '71011', 'invariantUUID': '1234', 'categories': [{'name': 'test', 'subcategories': [{'name': 'test_subcategory'}]}]}]}
+    mock_send.return_value = {'resources': [{'uuid': '5689', 'name': 'test', 'uniqueId': '71011', 'invariantUUID': '1234', 'version': '4567', 'categories': [{'name': 'test', 'subcategories': [{'name': 'test_subcategory'}]}]}]}
     vf.deep_load()
     assert vf.unique_identifier == "71011"
     assert vf._category_name == "test"
@@ -168,7 +170,7 @@ def test__deep_load_response_OK_dependency(mock_send, mock_created):
     vf.unique_uuid = "1234"
     vf._version = "4567"
     vf._status = const.CHECKED_IN
-    mock_send.side_effect = [{'services': [{'uuid': '5689', 'name': 'test', 'uniqueId': '71011', 'invariantUUID': '1234', 'categories': [{'name': 'test', 'subcategories': [{'name': 'test_subcategory'}]}]}]}, [{'version': '4567', 'uniqueId': '71011'}]]
+    mock_send.side_effect = [{'services': [{'uuid': '5689', 'name': 'test', 'uniqueId': '71011', 'invariantUUID': '1234', 'version': '4567', 'categories': [{'name': 'test', 'subcategories': [{'name': 'test_subcategory'}]}]}]}, [{'version': '4567', 'uniqueId': '71011'}]]
     vf.deep_load()
     assert vf.unique_identifier == "71011"
 
@@ -197,7 +199,7 @@ def test__deep_load_response_OK_under_cert(mock_send, mock_created):
     vf.unique_uuid = "1234"
     vf._version = "4567"
     vf._status = const.UNDER_CERTIFICATION
-    mock_send.return_value = {'resources': [{'uuid': '5689', 'name': 'test', 'uniqueId': '71011', 'invariantUUID': '1234', 'categories': [{'name': 'test', 'subcategories': [{'name': 'test_subcategory'}]}]}]}
+    mock_send.return_value = {'resources': [{'uuid': '5689', 'name': 'test', 'uniqueId': '71011', 'invariantUUID': '1234', 'version': '4567', 'categories': [{'name': 'test', 'subcategories': [{'name': 'test_subcategory'}]}]}]}
     vf.deep_load()
     assert vf.unique_identifier == "71011"
     assert vf._category_name == "test"
@@ -360,6 +362,111 @@ def test_get_input(mock_inputs):
     with pytest.raises(ResourceNotFound):
         sdc_resource.get_input("test3")
 
+@mock.patch.object(SdcResource, "send_message_json")
+@mock.patch.object(SdcResource, "inputs", new_callable=mock.PropertyMock)
+def test_inputs_index(mock_inputs, mock_send_json):
+    sdc_resource = SdcResource(name="test")
+    sdc_resource.unique_identifier = "toto"
+    input_obj = Input(unique_id="123", input_type="integer", name="test",
+                      sdc_resource=sdc_resource)
+    mock_inputs.return_value = [input_obj]
+    assert sdc_resource.get_input("test") is input_obj
+    assert sdc_resource.get_input_by_id("123") is input_obj
+    assert sdc_resource.inputs_map == {"test": input_obj}
+    assert mock_inputs.call_count == 1
+
+    # Missing input is looked for once again in refreshed inputs
+    new_input = Input(unique_id="321", input_type="string", name="test2",
+                      sdc_resource=sdc_resource)
+    mock_inputs.return_value = [input_obj, new_input]
+    assert sdc_resource.get_input_by_id("321") is new_input
+    assert mock_inputs.call_count == 2
+    with pytest.raises(ResourceNotFound):
+        sdc_resource.get_input_by_id("999")
+    assert mock_inputs.call_count == 3
+
+    # Index is dropped when inputs are changed
+    sdc_resource.set_input_default_values([(input_obj, 1), (new_input, "abc")])
+    mock_send_json.assert_called_once()
+    assert json.loads(mock_send_json.call_args[1]["data"]) == [
+        {"defaultValue": "1", "name": "test", "type": "integer", "uniqueId": "123"},
+        {"defaultValue": "abc", "name": "test2", "type": "string", "uniqueId": "321"}
+    ]
+    sdc_resource.get_input("test")
+    assert mock_inputs.call_count == 4
+
+    mock_send_json.reset_mock()
+    sdc_resource.set_input_default_values([])
+    mock_send_json.assert_not_called()
+
+@mock.patch.object(SdcResource, "send_message_json")
+@mock.patch.object(SdcResource, "properties", new_callable=mock.PropertyMock)
+def test_set_property_values(mock_properties, mock_send_json):
+    sdc_resource = SdcResource(name="test")
+    sdc_resource.unique_identifier = "toto"
+    prop1 = Property(name="test1", property_type="string")
+    prop2 = Property(name="test2", property_type="integer")
+    mock_properties.return_value = [prop1, prop2]
+    with pytest.raises(ParameterError):
+        sdc_resource.set_property_values([(prop1, "a"),
+                                          (Property(name="test3", property_type="string"), 1)])
+    mock_send_json.assert_not_called()
+
+    mock_properties.reset_mock()
+    sdc_resource.set_property_values([(prop1, "a"), (prop2, 2)])
+    mock_send_json.assert_called_once()
+    method, _, url = mock_send_json.call_args[0]
+    assert method == "PUT"
+    assert url == sdc_resource.add_property_url
+    data = json.loads(mock_send_json.call_args[1]["data"])
+    assert [(item["name"], item["value"]) for item in data] == [("test1", "a"), ("test2", "2")]
+    assert mock_properties.call_count == 1
+
+@mock.patch.object(SdcResource, "send_message_json")
+@mock.patch.object(SdcResource, "components", new_callable=mock.PropertyMock)
+@mock.patch.object(SdcResource, "properties", new_callable=mock.PropertyMock)
+@mock.patch.object(SdcResource, "resource_inputs_url", new_callable=mock.PropertyMock)
+def test_declare_inputs(mock_resource_inputs, mock_properties, mock_components, mock_send_json):
+    sdc_resource = SdcResource(name="test")
+    sdc_resource.unique_identifier = "toto"
+    sdc_resource._inputs_index = ({}, {})
+    mock_resource_inputs.return_value = "http://inputs"
+    prop1 = Property(name="test1", property_type="string")
+    prop2 = Property(name="test2", property_type="integer")
+    mock_properties.return_value = [prop1, prop2]
+    vf1, vf2 = Vf(name="vf1"), Vf(name="vf2")
+    component1, component2 = mock.MagicMock(unique_id="c1"), mock.MagicMock(unique_id="c2")
+    component1.sdc_resource, component2.sdc_resource = vf1, vf2
+    mock_components.return_value = [component1, component2]
+
+    with pytest.raises(ParameterError):
+        sdc_resource.declare_inputs([Property(name="test3", property_type="string")])
+    with pytest.raises(ResourceNotFound):
+        sdc_resource.declare_inputs([NestedInput(sdc_resource=Vf(name="vf3"),
+                                                 input_obj=mock.MagicMock())])
+    mock_send_json.assert_not_called()
+
+    mock_properties.reset_mock()
+    mock_components.reset_mock()
+    input1 = Input(unique_id="i1", input_type="string", name="input1", sdc_resource=vf1)
+    input2 = Input(unique_id="i2", input_type="string", name="input2", sdc_resource=vf1)
+    input3 = Input(unique_id="i3", input_type="string", name="input3", sdc_resource=vf2)
+    sdc_resource.declare_inputs([prop1, NestedInput(vf1, input1), prop2,
+                                 NestedInput(vf2, input3), NestedInput(vf1, input2)])
+    assert mock_send_json.call_count == 3
+    assert mock_properties.call_count == 1
+    assert mock_components.call_count == 1
+    own, nested_vf1, nested_vf2 = [json.loads(call[1]["data"])
+                                   for call in mock_send_json.call_args_list]
+    assert [prop["name"] for prop in own["serviceProperties"]["toto"]] == ["test1", "test2"]
+    assert [inp["name"] for inp in nested_vf1["componentInstanceInputsMap"]["c1"]] == \
+        ["input1", "input2"]
+    assert [inp["name"] for inp in nested_vf2["componentInstanceInputsMap"]["c2"]] == \
+        ["input3"]
+    assert all(call[0][2] == "http://inputs/create/inputs"
+               for call in mock_send_json.call_args_list)
+    assert sdc_resource._inputs_index is None
+
 @mock.patch.object(SdcResource, "components", new_callable=mock.PropertyMock)
 def test_get_component(mock_components):
     sdc_resource = SdcResource()
@@ -485,3 +592,24 @@ def test_sdc_resource_certify(mock_action_to_sdc):
     sdc_resource = SdcResource()
     sdc_resource.certify()
     mock_action_to_sdc.assert_called_once_with(const.CERTIFY, "lifecycleState")
+
+@mock.patch("onapsdk.utils.polling.time.sleep")
+@mock.patch.object(SdcResource, "load")
+def test_sdc_resource_wait_for_status_change(mock_load, mock_sleep):
+    sdc_resource = SdcResource()
+    sdc_resource._status = const.CHECKED_IN
+    sdc_resource._identifier = "12345"
+    sdc_resource._wait_for_status_change(const.DRAFT)
+    mock_load.assert_not_called()
+
+    statuses = iter([const.CHECKED_IN, const.CERTIFIED])
+    mock_load.side_effect = lambda: setattr(sdc_resource, "_status", next(statuses))
+    sdc_resource._wait_for_status_change(const.CHECKED_IN)
+    assert mock_load.call_count == 2
+    assert mock_sleep.call_count == 1
+    assert sdc_resource.status == const.CERTIFIED
+
+    mock_load.side_effect = None
+    sdc_resource.polling_policy = PollingPolicy(timeout=0)
+    with pytest.raises(PollingTimeout):
+        sdc_resource._wait_for_status_change(const.CERTIFIED)
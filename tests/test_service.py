@@ -13,6 +13,9 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import base64
+import json
+from hashlib import sha256
 from os import path
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -27,6 +30,7 @@ from onapsdk.sdc.component import Component
 from onapsdk.sdc.properties import ComponentProperty, Property
 from onapsdk.sdc.service import Service, ServiceInstantiationType
 from onapsdk.sdc.sdc_resource import SdcResource
+from onapsdk.utils import service_model
 from onapsdk.utils.headers_creator import headers_sdc_operator
 from onapsdk.utils.headers_creator import headers_sdc_creator
 
@@ -517,7 +521,7 @@ def test_get_tosca_no_result(mock_send):
     mock_send.assert_called_once_with(
         'GET', 'Download Tosca Model for ONAP-test-Service',
         'https://sdc.api.be.simpledemo.onap.org:30204/sdc/v1/catalog/services/12/toscaModel',
-        headers=headers)
+        headers=headers, stream=True)
     assert not path.exists('/tmp/tosca_files')
 
 
@@ -561,6 +565,26 @@ def test_get_tosca_result_no_service_in_csar(requests_mock):
     with pytest.raises(ValidationError):
         svc.get_tosca('new/directory')
 
+def test_get_tosca_entries_and_checksum(requests_mock, tmp_path):
+    file_content = Path('tests/data/test.csar').read_bytes()
+    requests_mock.get(
+        'https://sdc.api.be.simpledemo.onap.org:30204/sdc/v1/catalog/services/12/toscaModel',
+        content=file_content)
+    svc = Service()
+    svc.identifier = "12"
+    with pytest.raises(ValidationError):
+        svc.get_tosca(f"{tmp_path}/", checksum="0" * 64)
+    assert not list(tmp_path.iterdir())
+
+    with pytest.raises(ValidationError):
+        svc.get_tosca(f"{tmp_path}/", entries=["Definitions/missing.yml"])
+
+    svc.get_tosca(f"{tmp_path}/", entries=["TOSCA-Metadata/TOSCA.meta"],
+                  checksum=sha256(file_content).hexdigest().upper())
+    assert (tmp_path / "service-ONAP-test-Service-csar.csar").read_bytes() == file_content
+    assert (tmp_path / "TOSCA-Metadata" / "TOSCA.meta").is_file()
+    assert not (tmp_path / "Definitions").exists()
+
 @mock.patch.object(Service, 'send_message_json')
 def test_distributed_api_error(mock_send):
     mock_send.side_effect = ResourceNotFound
@@ -732,7 +756,6 @@ def test_onboard_new_service(mock_create, mock_add_resource,
                                 const.DISTRIBUTED, const.DISTRIBUTED,
                                 const.DISTRIBUTED, None]
         service = Service()
-        service._time_wait = 0
         service.onboard()
         mock_create.assert_called_once()
         mock_add_resource.assert_not_called()
@@ -747,7 +770,6 @@ def test_onboard_new_service(mock_create, mock_add_resource,
 def test_onboard_invalid_status(mock_status):
     mock_status.return_value = False
     service = Service()
-    service._time_wait = 0
     with pytest.raises(StatusError) as err:
         service.onboard()
     assert err.type == StatusError
@@ -773,7 +795,6 @@ def test_onboard_service_no_resources(mock_create,
                                 const.DISTRIBUTED, const.DISTRIBUTED,
                                 const.DISTRIBUTED, const.DISTRIBUTED, None]
         service = Service()
-        service._time_wait = 0
         with pytest.raises(ParameterError):
             service.onboard()
             mock_create.assert_not_called()
@@ -806,7 +827,6 @@ def test_onboard_service_resources(mock_create, mock_add_resource,
                                const.DISTRIBUTED, const.DISTRIBUTED, None]
         resource = SdcResource()
         service = Service(resources=[resource])
-        service._time_wait = 0
         service.onboard()
         mock_create.assert_not_called()
         mock_add_resource.assert_called_once_with(resource)
@@ -841,7 +861,6 @@ def test_onboard_service_several_resources(mock_create,
         resource1 = SdcResource()
         resource2 = SdcResource()
         service = Service(resources=[resource1, resource2])
-        service._time_wait = 0
         service.onboard()
         mock_create.assert_not_called()
         calls = [mock.call(resource1), mock.call(resource2)]
@@ -871,8 +890,6 @@ def test_onboard_service_certifi(mock_create,
     mock_status = Service.status.getter(getter_mock)
     with mock.patch.object(Service, 'status', mock_status):
         getter_mock.side_effect = [const.CHECKED_IN,
-                               const.CHECKED_IN,
-                               const.CHECKED_IN,
                                const.CHECKED_IN,
                                const.CHECKED_IN,
                                const.DISTRIBUTED, const.DISTRIBUTED,
@@ -880,7 +897,6 @@ def test_onboard_service_certifi(mock_create,
                                const.DISTRIBUTED, const.DISTRIBUTED,
                                const.DISTRIBUTED, None]
         service = Service()
-        service._time_wait = 0
         service.onboard()
         mock_create.assert_not_called()
         mock_add_resource.assert_not_called()
@@ -911,7 +927,6 @@ def test_onboard_service_distribute(mock_create,
                                const.DISTRIBUTED, const.DISTRIBUTED,
                                const.DISTRIBUTED, const.DISTRIBUTED, None]
         service = Service()
-        service._time_wait = 0
         service.onboard()
         mock_create.assert_not_called()
         mock_add_resource.assert_not_called()
@@ -932,9 +947,10 @@ def test_onboard_whole_service(mock_create,
     getter_mock = mock.Mock(wraps=Service.status.fget)
     mock_status = Service.status.getter(getter_mock)
     with mock.patch.object(Service, 'status', mock_status):
-        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT,const.CHECKED_IN,
+        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT, const.DRAFT,
                                const.CHECKED_IN, const.CHECKED_IN,
-                               const.CERTIFIED, const.CERTIFIED,
+                               const.CHECKED_IN, const.CHECKED_IN,
+                               const.CERTIFIED, const.CERTIFIED, const.CERTIFIED,
                                const.CERTIFIED, const.CERTIFIED,
                                const.CERTIFIED, const.CERTIFIED,
                                const.DISTRIBUTED, const.DISTRIBUTED,
@@ -943,7 +959,6 @@ def test_onboard_whole_service(mock_create,
                                const.DISTRIBUTED, None]
         resource = SdcResource()
         service = Service(resources=[resource])
-        service._time_wait = 0
         service.onboard()
         mock_create.assert_called_once()
         mock_add_resource.assert_called_once_with(resource)
@@ -951,227 +966,112 @@ def test_onboard_whole_service(mock_create,
         mock_certify.assert_called_once()
         mock_distribute.assert_called_once()
 
-@mock.patch("onapsdk.sdc.service.Service.send_message_json")
-@mock.patch("onapsdk.sdc.service.SdcResource.import_from_sdc")
-@mock.patch("onapsdk.sdc.service.Service.resource_inputs_url", new_callable=mock.PropertyMock)
-def test_vnf_vf_modules_one(mock_service_resource_inputs_url, mock_import_from_sdc, mock_send_message_json):
-    """Test parsing TOSCA file with one VNF which has associated one VFmodule"""
+def service_with_template(template_name: str) -> Service:
+    """Create service with TOSCA template loaded from tests data."""
     service = Service(name="test")
-    mock_send_message_json.side_effect = [{
-        "componentInstances": [{
-            "actualComponentUid": "123",
-            "originType": "VF",
-            "name": "ubuntu16_VF 0",
-            "toscaComponentName": "org.openecomp.resource.vf.Ubuntu16Vf",
-            "createdFromCsar": False,
-            "uniqueId": "123",
-            "normalizedName": "123",
-            "customizationUUID": "123",
-            "componentUid": "123",
-            "componentVersion": "123",
-            "componentName": "123",
-            "groupInstances": [
-                {
-                    "name": "ubuntu16_vf0..Ubuntu16Vf..base_ubuntu16..module-0",
-                    "type": "org.openecomp.groups.VfModule",
-                    "groupName": "Ubuntu16Vf..base_ubuntu16..module-0",
-                    "groupUUID": "ed041b38-63fc-486d-9d4d-4e2531bc7e54",
-                    "invariantUUID": "f47c3a9b-6a5f-4d1a-8a0b-b7f56ebb9a90",
-                    "version": "1",
-                    "customizationUUID": "d946ea06-ec4b-4ed2-921a-117e1379b913",
-                    "properties": [
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": "val",
-                            "description": "12234",
-                        },
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": None,
-                            "description": "12234",
-                        }
-                    ]
-                }
-            ]
-        }]
-    }, MagicMock()
-    ]
+    service._tosca_template = service_model.load_template(
+        Path(f"tests/data/service-{template_name}-template.yml").read_bytes())
+    return service
+
+
+@mock.patch.object(Service, "send_message_json")
+def test_vnf_vf_modules_one(mock_send_message_json):
+    """Test parsing TOSCA file with one VNF which has associated one VFmodule"""
+    service = service_with_template("Ubuntu16")
     vnfs = list(service.vnfs)
     assert len(vnfs) == 1
     vnf = vnfs[0]
     assert vnf.name == "ubuntu16_VF 0"
     assert vnf.node_template_type == "org.openecomp.resource.vf.Ubuntu16Vf"
+    assert vnf.model_customization_id == "1066c03b-0aab-43b3-a661-7543de231e7c"
+    assert vnf.model_instance_name == "test"
     assert vnf.vf_modules
-    assert vnf.vf_modules[0].name == "ubuntu16_vf0..Ubuntu16Vf..base_ubuntu16..module-0"
-    assert len(list(vnf.vf_modules[0].properties)) == 1
+    vf_module = vnf.vf_modules[0]
+    assert vf_module.name == "ubuntu16_vf0..Ubuntu16Vf..base_ubuntu16..module-0"
+    assert vf_module.group_type == "org.openecomp.groups.VfModule"
+    assert vf_module.model_name == "Ubuntu16Vf..base_ubuntu16..module-0"
+    group = service.model.get_by_name(vf_module.name)
+    assert vf_module.model_version_id == group.model_version_id
+    assert vf_module.model_invariant_uuid == group.model_invariant_id
+    assert vf_module.model_customization_id == group.model_customization_id
+    properties = {prop.name: prop for prop in vf_module.properties}
+    assert properties["vf_module_label"].value == "base_ubuntu16"
+    assert properties["vf_module_label"].property_type == "string"
+    assert properties["isBase"].property_type == "boolean"
+    assert all(prop.value for prop in properties.values())
+    mock_send_message_json.assert_not_called()
 
-@mock.patch("onapsdk.sdc.service.Service.send_message_json")
-@mock.patch("onapsdk.sdc.service.SdcResource.import_from_sdc")
-@mock.patch("onapsdk.sdc.service.Service.resource_inputs_url", new_callable=mock.PropertyMock)
-def test_pnf_modules_one(mock_service_resource_inputs_url, mock_import_from_sdc, mock_send_message_json):
+@mock.patch.object(Service, "send_message_json")
+def test_pnf_modules_one(mock_send_message_json):
     """Test parsing TOSCA file with one PNF which has associated one PNFmodule"""
-    service = Service(name="test")
-    mock_send_message_json.side_effect = [{
-        "componentInstances": [{
-            "actualComponentUid": "123",
-            "originType": "PNF",
-            "name": "test_pnf_vsp 0",
-            "toscaComponentName": "org.openecomp.resource.pnf.TestPnfVsp",
-            "createdFromCsar": False,
-            "uniqueId": "123",
-            "normalizedName": "123",
-            "customizationUUID": "123",
-            "componentUid": "123",
-            "componentVersion": "123",
-            "componentName": "123",
-            "groupInstances": None
-        }]
-    }, MagicMock()
-    ]
+    service = service_with_template("TestPnfVsp")
     pnfs = list(service.pnfs)
     assert len(pnfs) == 1
     pnf = pnfs[0]
     assert pnf.name == "test_pnf_vsp 0"
     assert pnf.node_template_type == "org.openecomp.resource.pnf.TestPnfVsp"
+    assert pnf.model_customization_id == "dc0627b2-cdb6-40a7-8510-3ee70d98ce66"
+    mock_send_message_json.assert_not_called()
 
-@mock.patch("onapsdk.sdc.service.Service.send_message_json")
-@mock.patch("onapsdk.sdc.service.SdcResource.import_from_sdc")
-@mock.patch("onapsdk.sdc.service.Service.resource_inputs_url", new_callable=mock.PropertyMock)
-def test_vnf_vf_modules_two(mock_service_resource_inputs_url, mock_import_from_sdc, mock_send_message_json):
+def test_vnf_vf_modules_two():
     """Test parsing TOSCA file with two VNF which has associated one VFmodule"""
-    service = Service(name="test")
-    mock_send_message_json.side_effect = [{
-        "componentInstances": [{
-            "actualComponentUid": "123",
-            "originType": "VF",
-            "name": "vFWCL_vPKG-vf 0",
-            "toscaComponentName": "org.openecomp.resource.vf.VfwclVpkgVf",
-            "createdFromCsar": False,
-            "uniqueId": "123",
-            "normalizedName": "123",
-            "customizationUUID": "123",
-            "componentUid": "123",
-            "componentVersion": "123",
-            "componentName": "123",
-            "groupInstances": [
-                {
-                    "name": "vfwcl_vpkgvf0..VfwclVpkgVf..base_vpkg..module-0",
-                    "type": "org.openecomp.groups.VfModule",
-                    "groupName": "Ubuntu16Vf..base_ubuntu16..module-0",
-                    "groupUUID": "ed041b38-63fc-486d-9d4d-4e2531bc7e54",
-                    "invariantUUID": "f47c3a9b-6a5f-4d1a-8a0b-b7f56ebb9a90",
-                    "version": "1",
-                    "customizationUUID": "d946ea06-ec4b-4ed2-921a-117e1379b913",
-                    "properties": [
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": "val",
-                            "description": "12234",
-                        },
-                        {
-                            "name": "333",
-                            "type": "test type",
-                            "value": "val",
-                            "description": "12234",
-                        },
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": None,
-                            "description": "12234",
-                        }
-                    ]
-                },
-                {
-                    "name": "vfwcl_vpkgvf0..base_template_dummy_ignore..base_vpkg..module-0",
-                    "type": "org.openecomp.groups.VfModule",
-                    "groupName": "Ubuntu16Vf..base_ubuntu16..module-0",
-                    "groupUUID": "ed041b38-63fc-486d-9d4d-4e2531bc7e54",
-                    "invariantUUID": "f47c3a9b-6a5f-4d1a-8a0b-b7f56ebb9a90",
-                    "version": "1",
-                    "customizationUUID": "d946ea06-ec4b-4ed2-921a-117e1379b913",
-                    "properties": [
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": "val",
-                            "description": "12234",
-                        },
-                        {
-                            "name": "333",
-                            "type": "test type",
-                            "value": "val",
-                            "description": "12234",
-                        },
-                        {
-                            "name": "vf_module_label",
-                            "type": "test type",
-                            "value": "base_template_dummy_ignore",
-                            "description": "12234",
-                        }
-                    ]
-                }
-            ]
-        },
-        {
-            "actualComponentUid": "123",
-            "originType": "VF",
-            "name": "vFWCL_vFWSNK-vf 0",
-            "toscaComponentName": "org.openecomp.resource.vf.VfwclVfwsnkVf",
-            "createdFromCsar": False,
-            "uniqueId": "123",
-            "normalizedName": "123",
-            "customizationUUID": "123",
-            "componentUid": "123",
-            "componentVersion": "123",
-            "componentName": "123",
-            "groupInstances": [
-                {
-                    "name": "vfwcl_vfwsnkvf0..VfwclVfwsnkVf..base_vfw..module-0",
-                    "type": "org.openecomp.groups.VfModule",
-                    "groupName": "Ubuntu16Vf..base_ubuntu16..module-0",
-                    "groupUUID": "ed041b38-63fc-486d-9d4d-4e2531bc7e54",
-                    "invariantUUID": "f47c3a9b-6a5f-4d1a-8a0b-b7f56ebb9a90",
-                    "version": "1",
-                    "customizationUUID": "d946ea06-ec4b-4ed2-921a-117e1379b913",
-                    "properties": [
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": "val",
-                            "description": "12234",
-                        },
-                        {
-                            "name": "123",
-                            "type": "test type",
-                            "value": None,
-                            "description": "12234",
-                        }
-                    ]
-                }
-            ]
-        }]
-    }, MagicMock(), MagicMock()
-    ]
+    service = service_with_template("Foo")
     vnfs = list(service.vnfs)
     assert len(vnfs) == 2
     vnf = vnfs[0]
     assert vnf.name == "vFWCL_vPKG-vf 0"
     assert vnf.node_template_type == "org.openecomp.resource.vf.VfwclVpkgVf"
-    assert vnf.vf_modules
     assert len(vnf.vf_modules) == 1
     assert vnf.vf_modules[0].name == "vfwcl_vpkgvf0..VfwclVpkgVf..base_vpkg..module-0"
-    assert len(list(vnf.vf_modules[0].properties)) == 2
 
     vnf = vnfs[1]
     assert vnf.name == "vFWCL_vFWSNK-vf 0"
     assert vnf.node_template_type == "org.openecomp.resource.vf.VfwclVfwsnkVf"
-    assert vnf.vf_modules
+    assert len(vnf.vf_modules) == 1
     assert vnf.vf_modules[0].name == "vfwcl_vfwsnkvf0..VfwclVfwsnkVf..base_vfw..module-0"
-    assert len(list(vnf.vf_modules[0].properties)) == 1
+
+def test_vnf_vf_modules_dummy_ignore():
+    """Test vf modules with base_template_dummy_ignore label are ignored"""
+    group = service_model.ModelGroup(
+        name="vfwcl_vpkgvf0..VfwclVpkgVf..base_vpkg..module-0",
+        group_type="org.openecomp.groups.VfModule",
+        properties={"vf_module_label": "base_vpkg", "min_vf_module_instances": 1,
+                    "initial_count": None})
+    dummy_group = service_model.ModelGroup(
+        name="vfwcl_vpkgvf0..base_template_dummy_ignore..base_vpkg..module-0",
+        group_type="org.openecomp.groups.VfModule",
+        properties={"vf_module_label": "base_template_dummy_ignore"})
+    service = Service(name="test")
+    service._model = service_model.ServiceModel(
+        name="test",
+        node_templates=(service_model.ModelNodeTemplate(
+            name="vFWCL_vPKG-vf 0",
+            node_type="org.openecomp.resource.vf.VfwclVpkgVf",
+            origin_type="VF",
+            groups=(group, dummy_group)),),
+        groups=(group, dummy_group))
+    vnf = next(service.vnfs)
+    assert len(vnf.vf_modules) == 1
+    assert vnf.vf_modules[0].name == group.name
+    properties = list(vnf.vf_modules[0].properties)
+    assert [(prop.name, prop.property_type) for prop in properties] == \
+        [("vf_module_label", "string"), ("min_vf_module_instances", "integer")]
+
+@mock.patch.object(Service, "components", new_callable=PropertyMock)
+def test_node_template_component_lazy_load(mock_components):
+    """Test node template component is loaded from SDC only if it's used"""
+    component = MagicMock(customization_uuid="1066c03b-0aab-43b3-a661-7543de231e7c")
+    mock_components.return_value = iter([MagicMock(customization_uuid="other"), component])
+    service = service_with_template("Ubuntu16")
+    vnf = next(service.vnfs)
+    mock_components.assert_not_called()
+    assert vnf.component is component
+    assert vnf.properties is component.properties
+    mock_components.assert_called_once()
+
+    mock_components.return_value = iter([])
+    with pytest.raises(ResourceNotFound):
+        next(service.vnfs).component
 
 
 @mock.patch.object(Service, 'send_message_json')
@@ -1236,46 +1136,40 @@ def test_add_artifact_to_service(mock_send_message, mock_load):
     assert description == "Add deployment artifact for ONAP-test-Service sdc resource"
     assert url == ("https://sdc.api.fe.simpledemo.onap.org:30207/sdc1/feProxy/rest/v1/catalog/services/"
                     f"{svc.unique_identifier}/artifacts")
+    post_call = next(call for call in mock_send_message.call_args_list if call.args[0] == "POST")
+    assert json.loads(b"".join(post_call.kwargs["data"]))["payloadData"] == \
+        base64.b64encode(mycbapath.read_bytes()).decode("utf-8")
+    assert post_call.kwargs["headers"]["Content-MD5"]
 
-@mock.patch("onapsdk.sdc.service.Service.send_message_json")
-@mock.patch("onapsdk.sdc.service.SdcResource.import_from_sdc")
-@mock.patch("onapsdk.sdc.service.Service.resource_inputs_url", new_callable=mock.PropertyMock)
-def test_service_networks(mock_service_resource_inputs_url, mock_import_from_sdc, mock_send_message_json):
-    mock_send_message_json.side_effect = [{
-        "componentInstances": [{
-            "actualComponentUid": "123",
-            "originType": "VL",
-            "name": "NeutronNet 0",
-            "toscaComponentName": "org.openecomp.resource.vl.nodes.heat.network.neutron.Net",
-            "createdFromCsar": False,
-            "uniqueId": "123",
-            "normalizedName": "123",
-            "customizationUUID": "123",
-            "componentUid": "123",
-            "componentVersion": "123",
-            "componentName": "123",
-            "groupInstances": None
-        }]
-    }, MagicMock()
-    ]
-
-    service = Service(name="test")
+@mock.patch.object(Service, "send_message_json")
+def test_service_networks(mock_send_message_json):
+    service = service_with_template("TestServiceFyx")
     networks = list(service.networks)
     assert len(networks) == 1
     network = networks[0]
     assert network.name == "NeutronNet 0"
     assert network.node_template_type == "org.openecomp.resource.vl.nodes.heat.network.neutron.Net"
+    assert network.model_customization_id == "ae1df985-3313-4a8f-93e6-efbc71fd3938"
+    mock_send_message_json.assert_not_called()
 
 @mock.patch.object(Service, '_unzip_csar_file')
 def test_tosca_template_no_tosca_model(mock_unzip):
     service = Service(name="test")
-    getter_mock = mock.Mock(wraps=Service.tosca_model.fget)
-    getter_mock.return_value = False
-    mock_tosca_model = Service.tosca_model.getter(getter_mock)
-    with mock.patch.object(Service, 'tosca_model', mock_tosca_model):
+    with mock.patch.object(Service, '_download_tosca_model') as mock_download:
+        mock_download.return_value = False
         service.tosca_template
+        mock_download.assert_called_once_with(mock.ANY)
         mock_unzip.assert_not_called()
 
+def test_tosca_template_streamed(requests_mock):
+    requests_mock.get(
+        'https://sdc.api.be.simpledemo.onap.org:30204/sdc/v1/catalog/services/12/toscaModel',
+        content=Path('tests/data/test.csar').read_bytes())
+    service = Service(name="test")
+    service.identifier = "12"
+    assert service.tosca_template["metadata"]["name"]
+    assert service._tosca_model is None
+
 @mock.patch.object(Service, '_unzip_csar_file')
 def test_tosca_template_tosca_model(mock_unzip):
     service = Service(name="test")
@@ -1409,8 +1303,8 @@ def test_component_property_set_value(mock_component_properties):
 
 @mock.patch.object(Service, "add_resource")
 @mock.patch.object(Service, "add_property")
-@mock.patch.object(Service, "declare_input")
-def test_declare_resources_and_properties(mock_declare_input, mock_add_property, mock_add_resource):
+@mock.patch.object(Service, "declare_inputs")
+def test_declare_resources_and_properties(mock_declare_inputs, mock_add_property, mock_add_resource):
 
     service = Service(name="test",
                       resources=[SdcResource()],
@@ -1419,7 +1313,7 @@ def test_declare_resources_and_properties(mock_declare_input, mock_add_property,
     service.declare_resources_and_properties()
     mock_add_resource.assert_called_once()
     mock_add_property.assert_called_once()
-    mock_declare_input.assert_called_once()
+    mock_declare_inputs.assert_called_once_with(service._inputs_to_add)
 
 @mock.patch.object(Service, "created")
 @mock.patch.object(ServiceCategory, "get")
@@ -1488,16 +1382,83 @@ def test_service_components(mock_send_message_json):
     service = Service(name="test")
     service.unique_identifier = "toto"
 
-    mock_send_message_json.side_effect = [COMPONENTS, COMPONENT, COMPONENTS, COMPONENT, COMPONENTS, COMPONENT]
+    mock_send_message_json.side_effect = [COMPONENTS, COMPONENT]
+    assert len(list(service.components)) == 1
+    assert mock_send_message_json.call_count == 2
+
+    # Components are fetched again for the new version, metadata are memoized
+    mock_send_message_json.reset_mock()
+    service.unique_identifier = "toto_2"
+    mock_send_message_json.side_effect = [COMPONENTS_WITH_ALL_ORIGIN_TYPES]
+    assert len(list(service.components)) == 3
+    mock_send_message_json.assert_called_once()
+
+    mock_send_message_json.reset_mock()
+    other_service = Service(name="test_2")
+    other_service.unique_identifier = "tata"
+    mock_send_message_json.side_effect = [COMPONENTS]
+    assert len(list(other_service.components)) == 1
+    mock_send_message_json.assert_called_once()
+
+
+@mock.patch.object(Service, "send_message_json")
+def test_service_has_node_templates(mock_send_message_json):
+    service = Service(name="test")
+    service._model = service_model.ServiceModel(name="test")
     assert not service.has_vnfs
     assert not service.has_pnfs
     assert not service.has_vls
-    mock_send_message_json.side_effect = [COMPONENTS_WITH_ALL_ORIGIN_TYPES, COMPONENT,
-                                          COMPONENTS_WITH_ALL_ORIGIN_TYPES, COMPONENT, COMPONENT,
-                                          COMPONENTS_WITH_ALL_ORIGIN_TYPES, COMPONENT, COMPONENT, COMPONENT]
+    assert len(list(service.vnfs)) == 0
+
+    service = service_with_template("TestServiceFyx")
     assert service.has_vnfs
-    assert service.has_pnfs
+    assert not service.has_pnfs
     assert service.has_vls
+    mock_send_message_json.assert_not_called()
+
+
+@mock.patch.object(Service, "send_message_json")
+def test_service_components_metadata_concurrently(mock_send_message_json):
+    service = Service(name="test")
+    service.unique_identifier = "toto"
+    component_instances = []
+    for idx in range(10):
+        component_instance = dict(COMPONENTS["componentInstances"][0])
+        component_instance["actualComponentUid"] = f"uid_{idx}"
+        component_instances.append(component_instance)
+
+    def send_message_json(method, description, url, **kwargs):
+        if url.endswith("include=componentInstances"):
+            return {"componentInstances": component_instances}
+        return {"metadata": dict(COMPONENT["metadata"],
+                                 uuid=url.split("/")[-2])}
+
+    mock_send_message_json.side_effect = send_message_json
+    components = list(service.components)
+    assert [component.sdc_resource.identifier for component in components] == \
+        [f"uid_{idx}" for idx in range(10)]
+    assert mock_send_message_json.call_count == 11
+
+
+@mock.patch.object(Service, "load")
+@mock.patch.object(Service, "send_message")
+@mock.patch.object(Service, "send_message_json")
+def test_service_add_resource_resets_components(mock_send_message_json, mock_send_message,
+                                                mock_load):
+    service = Service(name="test")
+    service.unique_identifier = "toto"
+    service.identifier = "93"
+    service.status = const.DRAFT
+    resource = SdcResource()
+    resource.unique_identifier = "12"
+    resource.created = MagicMock(return_value=True)
+    resource.version = "40"
+    resource.name = "test"
+    mock_send_message_json.side_effect = [COMPONENTS, COMPONENT, COMPONENTS]
+    list(service.components)
+    service.add_resource(resource)
+    list(service.components)
+    assert mock_send_message_json.call_count == 3
 
 
 @mock.patch.object(Service, "send_message")
@@ -1529,3 +1490,42 @@ def test_service_get_by_identifier(mock_get_all):
     mock_service.identifier = "test"
     mock_get_all.return_value = [mock_service]
     Service.get_by_identifier("test")
+
+
+def test_service_model():
+    template = {
+        "metadata": {"name": "test", "UUID": "test_uuid", "invariantUUID": "test_invariant"},
+        "topology_template": {
+            "node_templates": {
+                "test_VF 0": {
+                    "type": "org.openecomp.resource.vf.Test",
+                    "metadata": {"type": "VF", "customizationUUID": "test_customization"}
+                }
+            }
+        }
+    }
+    service = Service(name="test")
+    service._tosca_template = template
+    model = service.model
+    assert model.model_version_id == "test_uuid"
+    assert model.vnfs[0].model_customization_id == "test_customization"
+    assert service.model is model
+
+
+def test_service_model_sections(requests_mock):
+    requests_mock.get(
+        'https://sdc.api.be.simpledemo.onap.org:30204/sdc/v1/catalog/services/12/toscaModel',
+        content=Path('tests/data/test.csar').read_bytes())
+    service = Service(name="test")
+    service.identifier = "12"
+    with mock.patch("onapsdk.sdc.service.load_template",
+                    wraps=service_model.load_template) as mock_load_template:
+        model = service.model
+    assert model.vnfs
+    mock_load_template.assert_called_once_with(mock.ANY, service_model.MODEL_TEMPLATE_SECTIONS)
+    assert service._tosca_template is None
+
+    service = Service(name="test")
+    service._tosca_model = Path('tests/data/test.csar').read_bytes()
+    assert service.model == model
+
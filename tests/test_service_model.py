@@ -0,0 +1,144 @@
+#   Copyright 2022 Orange, Deutsche Telekom AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import oyaml as yaml
+import pytest
+
+from onapsdk.exceptions import ValidationError
+from onapsdk.utils import service_model
+from onapsdk.utils.service_model import ModelGroup, ModelNodeTemplate, ServiceModel, normalize_name
+
+DATA_PATH = Path(__file__).resolve().parent / "data"
+
+
+def load_template(name):
+    with open(DATA_PATH / f"service-{name}-template.yml") as template_file:
+        return yaml.safe_load(template_file)
+
+
+@pytest.mark.parametrize("name", ["VfwcdsService", "Ubuntu16", "TestPnfVsp", "TestServiceFyx"])
+def test_load_template(name):
+    content = (DATA_PATH / f"service-{name}-template.yml").read_bytes()
+    template = service_model.load_template(content)
+    assert template == load_template(name)
+    assert list(template) == list(load_template(name))
+    assert list(template["topology_template"]["node_templates"]) == \
+        list(load_template(name)["topology_template"]["node_templates"])
+
+
+def test_load_template_sections():
+    content = (DATA_PATH / "service-VfwcdsService-template.yml").read_bytes()
+    full_template = load_template("VfwcdsService")
+    template = service_model.load_template(content, service_model.MODEL_TEMPLATE_SECTIONS)
+    assert list(template) == ["metadata", "topology_template"]
+    assert list(template["topology_template"]) == ["inputs", "node_templates", "groups"]
+    assert template["metadata"] == full_template["metadata"]
+    assert template["topology_template"]["node_templates"] == \
+        full_template["topology_template"]["node_templates"]
+    assert "substitution_mappings" in full_template["topology_template"]
+
+    assert service_model.load_template(content, {"metadata": ("name",)}) == \
+        {"metadata": {"name": full_template["metadata"]["name"]}}
+    assert service_model.load_template(b"") == {}
+
+
+def test_normalize_name():
+    assert normalize_name("ubuntu16_VF 0") == "ubuntu16_vf0"
+    assert normalize_name("vFWCL_vPKG-vf 0") == "vfwcl_vpkgvf0"
+
+
+def test_service_model_from_template():
+    model = ServiceModel.from_template(load_template("VfwcdsService"))
+    assert model.name == "vfwcds_SERVICE"
+    assert model.model_invariant_id == model.metadata["invariantUUID"]
+    assert model.model_version_id == model.metadata["UUID"]
+    assert len(model.vnfs) == 1
+    assert not model.pnfs
+    assert not model.networks
+    vnf = model.vnfs[0]
+    assert vnf.name == "vfwcds_VF 0"
+    assert vnf.origin_type == "VF"
+    assert vnf.model_customization_id
+    assert len(vnf.groups) == 4
+    assert model.vf_modules == vnf.groups
+    assert len(model.inputs) == 4
+
+    assert model.get_by_name("vfwcds_VF 0") is vnf
+    assert model.get_by_uuid(vnf.model_customization_id) is vnf
+    assert model.get_by_uuid(vnf.model_version_id) is vnf
+    vf_module = vnf.groups[0]
+    assert model.get_by_name(vf_module.name) is vf_module
+    assert model.get_by_uuid(vf_module.model_customization_id) is vf_module
+    assert model.get_by_name("not existing") is None
+    assert model.get_input(model.inputs[0].name) is model.inputs[0]
+    assert model.get_input("not existing") is None
+
+    with pytest.raises(FrozenInstanceError):
+        model.name = "test"
+    with pytest.raises(TypeError):
+        vnf.properties["test"] = "test"
+
+
+def test_service_model_pnf_and_multiple_vnfs():
+    model = ServiceModel.from_template(load_template("TestPnfVsp"))
+    assert len(model.pnfs) == 1
+    assert not model.vnfs
+
+    model = ServiceModel.from_template(load_template("Foo"))
+    assert len(model.vnfs) == 2
+    assert all(len(vnf.groups) == 1 for vnf in model.vnfs)
+    assert {vnf.groups[0].name for vnf in model.vnfs} == {group.name for group in model.groups}
+
+
+def test_service_model_from_empty_template():
+    model = ServiceModel.from_template({})
+    assert model.name == ""
+    assert not model.node_templates
+    assert not model.groups
+    assert not model.inputs
+
+
+def test_service_model_from_csar():
+    with open(DATA_PATH / "test.csar", "rb") as csar_file:
+        model = ServiceModel.from_csar(csar_file.read())
+    assert model.name
+    assert model.vnfs
+
+    with open(DATA_PATH / "bad_no_service.csar", "rb") as csar_file:
+        with pytest.raises(ValidationError):
+            ServiceModel.from_csar(csar_file.read())
+
+
+def test_service_model_serialization(tmp_path):
+    model = ServiceModel.from_template(load_template("VfwcdsService"))
+    assert ServiceModel.from_dict(model.to_dict()) == model
+
+    model.save(tmp_path / "model.json")
+    loaded = ServiceModel.load(tmp_path / "model.json")
+    assert loaded == model
+    assert isinstance(loaded.vnfs[0], ModelNodeTemplate)
+    assert isinstance(loaded.vnfs[0].groups[0], ModelGroup)
+    assert loaded.get_by_uuid(model.vnfs[0].model_customization_id) == model.vnfs[0]
+
+
+def test_service_model_hash():
+    model = ServiceModel.from_template(load_template("VfwcdsService"))
+    loaded = ServiceModel.from_dict(model.to_dict())
+    assert hash(loaded) == hash(model)
+    assert {model, loaded} == {model}
+    assert hash(model.vnfs[0]) == hash(loaded.vnfs[0])
+    assert hash(model.vf_modules[0]) == hash(loaded.vf_modules[0])
+    assert len({*model.inputs, *loaded.inputs}) == len(model.inputs)
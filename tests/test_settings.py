@@ -18,15 +18,35 @@ from pathlib import PurePath
 
 import pytest
 
-from onapsdk.configuration import settings, SETTINGS_ENV
+from onapsdk.configuration import global_settings, settings, SETTINGS_ENV
 from onapsdk.configuration.loader import SettingsLoader
 from onapsdk.exceptions import ModuleError
 
 
 def test_global_settings():
     """Test global settings."""
-    assert len(settings._settings) == 65
+    assert len(settings._settings) == 85
     assert settings.AAI_URL == "https://aai.api.sparky.simpledemo.onap.org:30233"
+    assert settings.AAI_PAGE_SIZE == 500
+    assert settings.AAI_MAX_WORKERS == 8
+    assert global_settings.SDC_CATALOG_CACHE_TTL == 60
+    assert settings.SDC_MAX_WORKERS == 8
+    assert settings.SDC_CSAR_CACHE_DIR is None
+    assert settings.SDC_CSAR_CACHE_MAX_SIZE == 512 * 1024 * 1024
+    assert settings.SDC_ARTIFACT_UPLOAD_CHUNK_SIZE == 3 * 1024 * 1024
+    assert settings.SDC_PACKAGE_UPLOAD_CHUNK_SIZE == 1024 * 1024
+    assert settings.SDC_CSAR_DOWNLOAD_CHUNK_SIZE == 1024 * 1024
+    assert settings.SDC_PACKAGE_UPLOAD_RETRIES == 3
+    assert settings.SDC_ONBOARDING_TIMEOUT == 600
+    assert settings.SDC_ONBOARDING_POLL_INTERVAL == 2
+    assert settings.SDC_POLLING_INITIAL_DELAY == 0.5
+    assert settings.SDC_POLLING_MAX_DELAY == 10
+    assert settings.SDC_POLLING_MULTIPLIER == 2
+    assert settings.SDC_POLLING_JITTER == 0.1
+    assert settings.SDC_POLLING_TIMEOUT == 300
+    assert settings.SDC_DISTRIBUTION_STATUS_TOPIC == "SDC-DISTR-STATUS-TOPIC-AUTO"
+    assert settings.SDC_DISTRIBUTION_POLL_INTERVAL == 30
+    assert settings.SDC_DISTRIBUTION_TIMEOUT == 1800
     assert settings.CDS_URL == "http://portal.api.simpledemo.onap.org:30449"
     assert settings.SDNC_URL == "https://sdnc.api.simpledemo.onap.org:30267"
     assert settings.SO_CATALOG_DB_ADAPTER_URL == "http://so-catalog-db-adapter:8082"
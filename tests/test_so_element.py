@@ -13,10 +13,14 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 import json
+from pathlib import Path
 from unittest import mock
 
+import oyaml as yaml
+
 from onapsdk.so.so_element import SoElement
 from onapsdk.utils.gui import GuiList
+from onapsdk.utils.tosca_file_handler import ToscaTemplate
 
 @mock.patch.object(SoElement, "send_message")
 def test_get_guis(send_message_mock):
@@ -39,3 +43,13 @@ def test_get_vnf_model_info(_):
 def test_get_service_model_info(_):
     service_model_info = SoElement.get_service_model_info("test_service")
     assert json.loads(service_model_info)["modelType"] == "service"
+
+
+def test_get_vf_model_info():
+    template_path = Path(__file__).resolve().parent / "data" / "service-Ubuntu16-template.yml"
+    model = json.dumps(yaml.safe_load(template_path.read_text()))
+    vf_model_info = json.loads(SoElement.get_vf_model_info(model))
+    assert len(vf_model_info) == 1
+    assert vf_model_info[0]["modelInfo"]["modelName"] == "Ubuntu16Vf..base_ubuntu16..module-0"
+    assert vf_model_info[0]["instanceName"] == "Ubuntu16Vf..base_ubuntu16..module-0"
+    assert json.loads(SoElement.get_vf_model_info(ToscaTemplate.from_json(model))) == vf_model_info
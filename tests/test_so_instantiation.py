@@ -20,6 +20,7 @@ from unittest import mock
 import pytest
 
 from onapsdk.exceptions import APIError, InvalidResponse, ResourceNotFound, StatusError
+from onapsdk.sdc.sdc_resource import SdcResource
 from onapsdk.sdc.service import Service
 from onapsdk.sdnc import NetworkPreload, VfModulePreload
 from onapsdk.so.instantiation import (
@@ -38,6 +39,7 @@ from onapsdk.so.instantiation import (
     PnfInstantiation
 )
 from onapsdk.aai.business.owning_entity import OwningEntity
+from onapsdk.utils.service_model import ServiceModel, load_template
 
 
 @mock.patch.object(ServiceInstantiation, "send_message_json")
@@ -163,6 +165,44 @@ def test_service_macro_instantiation(mock_service_instantiation_send_message):
                    f"serviceInstantiation/{ServiceInstantiation.api_version}/serviceInstances")
 
 
+@mock.patch.object(ServiceInstantiation, "send_message_json")
+def test_service_macro_instantiation_from_saved_model(mock_service_instantiation_send_message,
+                                                      tmp_path):
+    model = ServiceModel.from_template(load_template(
+        Path("tests/data/service-VfwcdsService-template.yml").read_bytes()))
+    model.save(tmp_path / "model.json")
+    sdc_service = Service.from_model(ServiceModel.load(tmp_path / "model.json"))
+    sdc_error = AssertionError("No SDC request expected")
+    with mock.patch.object(Service, "send_message", side_effect=sdc_error), \
+            mock.patch.object(Service, "send_message_json", side_effect=sdc_error), \
+            mock.patch.object(SdcResource, "send_message", side_effect=sdc_error), \
+            mock.patch.object(SdcResource, "send_message_json", side_effect=sdc_error):
+        ServiceInstantiation.instantiate_macro(sdc_service=sdc_service,
+                                               cloud_region=mock.MagicMock(),
+                                               tenant=mock.MagicMock(),
+                                               customer=mock.MagicMock(),
+                                               owning_entity=mock.MagicMock(),
+                                               project=mock.MagicMock(),
+                                               line_of_business=mock.MagicMock(),
+                                               platform=mock.MagicMock(),
+                                               service_instance_name="test",
+                                               vnf_parameters=[],
+                                               service_subscription=mock.MagicMock())
+    request = json.loads(mock_service_instantiation_send_message.call_args[1]["data"])
+    request_details = request["requestDetails"]
+    assert request_details["modelInfo"]["modelVersionId"] == model.model_version_id
+    assert request_details["modelInfo"]["modelInvariantId"] == model.model_invariant_id
+    assert "cloudConfiguration" in request_details
+    service = request_details["requestParameters"]["userParams"][-1]["service"]
+    vnf_model = model.vnfs[0]
+    vnf = service["resources"]["vnfs"][0]
+    assert vnf["modelInfo"]["modelCustomizationId"] == vnf_model.model_customization_id
+    assert vnf["modelInfo"]["modelVersionId"] == vnf_model.model_version_id
+    assert vnf["modelInfo"]["modelInvariantUuid"] == vnf_model.model_invariant_id
+    assert {vf_module["modelInfo"]["modelCustomizationId"] for vf_module in vnf["vfModules"]} == \
+        {group.model_customization_id for group in vnf_model.groups}
+
+
 ##upgrade service
 @mock.patch.object(ServiceInstantiation, "send_message_json")
 @mock.patch.object(OwningEntity, "get_by_owning_entity_id")
@@ -76,6 +76,56 @@ class ToscaFileHandlerTestingBase(unittest.TestCase):
         vf_modules = tosca_file_handler.get_modules_list_from_tosca_file(model)
         self.assertEqual(len(vf_modules), 1)
 
+    def test_legacy_functions_return_copies(self):
+        with open(self._foo_path) as f:
+            model = json.dumps(yaml.safe_load(f))
+        vf_modules = tosca_file_handler.get_modules_list_from_tosca_file(model)
+        vf_modules.clear()
+        metadata = tosca_file_handler.get_parameter_from_yaml("metadata", model)
+        metadata["name"] = "changed"
+        vf_list = tosca_file_handler.get_vf_list_from_tosca_file(model)
+        vf_list.append("changed")
+        self.assertEqual(len(tosca_file_handler.get_modules_list_from_tosca_file(model)), 1)
+        self.assertEqual(tosca_file_handler.get_parameter_from_yaml("metadata.name", model),
+                         "ubuntu16")
+        self.assertEqual(tosca_file_handler.get_vf_list_from_tosca_file(model), ["ubuntu16_VF"])
+        self.assertEqual(
+            len(tosca_file_handler.ToscaTemplate.from_json(model).groups), 1)
+
+    def test_tosca_template(self):
+        with open(self._foo_path) as f:
+            model = json.dumps(yaml.safe_load(f))
+        tosca_template = tosca_file_handler.ToscaTemplate.from_json(model)
+        self.assertIs(tosca_file_handler.ToscaTemplate.from_json(model), tosca_template)
+        self.assertEqual(tosca_template.get("metadata.name"), "ubuntu16")
+        self.assertEqual(tosca_template.get_vf_list(), ["ubuntu16_VF"])
+        self.assertEqual(
+            tosca_template.get_node_templates_by_type_prefix("org.openecomp.resource.vf"),
+            ["ubuntu16_VF 0"])
+        self.assertEqual(
+            tosca_template.get_node_templates_by_type(
+                "org.openecomp.resource.vf.Ubuntu16Vf"),
+            ["ubuntu16_VF 0"])
+        self.assertEqual(
+            tosca_template.get_node_templates_by_type_prefix("org.openecomp.resource.pnf"), [])
+        self.assertEqual(
+            list(tosca_template.get_groups_by_type("org.openecomp.groups.VfModule")),
+            ["ubuntu16_vf0..Ubuntu16Vf..base_ubuntu16..module-0"])
+        self.assertEqual(tosca_template.get_groups_by_type("wrong_type"), {})
+        self.assertIsNone(tosca_template.get_input("wrong_input"))
+        self.assertEqual(
+            tosca_template.get(
+                "topology_template.groups.ubuntu16_vf0..Ubuntu16Vf..base_ubuntu16..module-0.type"),
+            "org.openecomp.groups.VfModule")
+
+    def test_tosca_template_inputs(self):
+        tosca_template = tosca_file_handler.ToscaTemplate({
+            "topology_template": {"inputs": {"test_input": {"type": "string"}}}
+        })
+        self.assertEqual(tosca_template.get_input("test_input"), {"type": "string"})
+        self.assertEqual(tosca_template.get_vf_list(), [])
+        self.assertEqual(tosca_template.groups, {})
+
     # def get_vf_list_from_tosca_file_wrong_model(self):
     #     with self.assertRaises(FileNotFoundError):
     #         tosca_file_handler.get_vf_list_from_tosca_file(
@@ -12,6 +12,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 import os
+from unittest import mock
 
 import pytest
 import time
@@ -19,6 +20,8 @@ import time
 from onapsdk.onap_service import OnapService
 from onapsdk.utils.mixins import WaitForFinishMixin
 from onapsdk.utils import load_json_file
+from onapsdk.utils.cache import TtlCache
+from onapsdk.utils.concurrency import bounded_map
 
 
 class TestWaitForFinish(WaitForFinishMixin, OnapService):
@@ -44,3 +47,36 @@ def test_load_json_file():
     path_to_event: str = os.path.join(os.getcwd(), "tests/data/utils_load_json_file_test.json")
     test_json: str = load_json_file(path_to_event)
     assert test_json == '{"event": {"test1": "val1"}}'
+
+
+def test_bounded_map():
+    assert list(bounded_map(lambda x: x * 2, range(10), 4)) == [x * 2 for x in range(10)]
+    assert list(bounded_map(lambda x: x * 2, iter(range(3)), 1)) == [0, 2, 4]
+    assert list(bounded_map(lambda x: x, [], 4)) == []
+    with pytest.raises(ValueError):
+        list(bounded_map(int, ["1", "a"], 2))
+
+
+@mock.patch("onapsdk.utils.cache.time.monotonic")
+def test_ttl_cache(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    cache = TtlCache(10)
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    factory = mock.MagicMock(return_value="new")
+    assert cache.get_or_set("key", factory) == "value"
+    factory.assert_not_called()
+
+    mock_monotonic.return_value = 110.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.get_or_set("key", factory) == "new"
+    factory.assert_called_once()
+
+    cache.set("other", 1)
+    cache.invalidate("key")
+    assert cache.get("key") is None
+    assert cache.get("other") == 1
+    cache.invalidate()
+    assert len(cache) == 0
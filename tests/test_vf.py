@@ -321,10 +321,9 @@ def test_onboard_new_vf(mock_add_resource, mock_create, mock_submit, mock_certif
     mock_status = Vf.status.getter(getter_mock)
     with mock.patch.object(Vf, 'status', mock_status):
         getter_mock.side_effect = [None, const.APPROVED, const.APPROVED,
-                                   const.APPROVED, const.APPROVED]
+                                   const.APPROVED, const.APPROVED, const.APPROVED]
         vsp = Vsp()
         vf = Vf(vsp=vsp)
-        vf._time_wait = 0
         vf.onboard()
         mock_create.assert_called_once()
         mock_add_resource.assert_not_called()
@@ -341,11 +340,11 @@ def test_onboard_vf_submit(mock_certify, mock_add_resource, mock_create, mock_su
     getter_mock = mock.Mock(wraps=Vf.status.fget)
     mock_status = Vf.status.getter(getter_mock)
     with mock.patch.object(Vf, 'status', mock_status):
-        getter_mock.side_effect = [const.DRAFT, const.DRAFT,
+        getter_mock.side_effect = [const.DRAFT, const.DRAFT, const.CHECKED_IN,
                                    const.CHECKED_IN, const.CHECKED_IN, const.CHECKED_IN,
-                                   const.APPROVED, const.APPROVED, const.APPROVED, const.APPROVED]
+                                   const.APPROVED, const.APPROVED, const.APPROVED,
+                                   const.APPROVED, const.APPROVED]
         vf = Vf()
-        vf._time_wait = 0
         vf.onboard()
         mock_create.assert_not_called()
         mock_add_resource.assert_not_called()
@@ -367,7 +366,6 @@ def test_onboard_vf_load(mock_certify, mock_add_resource, mock_create, mock_subm
                                    const.APPROVED, const.APPROVED,
                                    const.APPROVED, const.APPROVED]
         vf = Vf()
-        vf._time_wait = 0
         vf.onboard()
         mock_create.assert_not_called()
         mock_add_resource.assert_not_called()
@@ -384,13 +382,14 @@ def test_onboard_whole_vf(mock_certify, mock_add_resource, mock_create, mock_sub
     getter_mock = mock.Mock(wraps=Vf.status.fget)
     mock_status = Vf.status.getter(getter_mock)
     with mock.patch.object(Vf, 'status', mock_status):
-        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT,
+        getter_mock.side_effect = [None, const.DRAFT, const.DRAFT, const.DRAFT,
                                    const.CHECKED_IN, const.CHECKED_IN, const.CHECKED_IN,
-                                   const.CERTIFIED, const.CERTIFIED, const.CERTIFIED, const.CERTIFIED,
-                                   const.APPROVED, const.APPROVED, const.APPROVED, const.APPROVED]
+                                   const.CHECKED_IN, const.CERTIFIED, const.CERTIFIED,
+                                   const.CERTIFIED, const.CERTIFIED, const.CERTIFIED,
+                                   const.APPROVED, const.APPROVED, const.APPROVED,
+                                   const.APPROVED]
         vsp = Vsp()
         vf = Vf(vsp=vsp)
-        vf._time_wait = 0
         vf.onboard()
         mock_create.assert_called_once()
         mock_add_resource.assert_not_called()
@@ -562,3 +561,23 @@ def test_vf_declare_input(mock_send_message, mock_sdc_resource_declare_input):
     vf.declare_input(ComponentProperty("test_unique_id", "test_property_type", "test_name", MagicMock()))
     mock_send_message.assert_called()
     mock_sdc_resource_declare_input.assert_not_called()
+
+@mock.patch.object(Vf, "resource_inputs_url", new_callable=mock.PropertyMock)
+@mock.patch.object(SdcResource, "declare_inputs")
+@mock.patch.object(Vf, "send_message")
+def test_vf_declare_inputs(mock_send_message, mock_sdc_resource_declare_inputs,
+                           mock_resource_inputs_url):
+    mock_resource_inputs_url.return_value = "http://inputs"
+    vf = Vf()
+    prop = Property(name="test_prop", property_type="string")
+    component1, component2 = MagicMock(unique_id="c1"), MagicMock(unique_id="c2")
+    vf.declare_inputs([prop,
+                       ComponentProperty("id1", "string", "prop1", component1),
+                       ComponentProperty("id2", "string", "prop2", component2),
+                       ComponentProperty("id3", "integer", "prop3", component1)])
+    mock_sdc_resource_declare_inputs.assert_called_once_with([prop])
+    assert mock_send_message.call_count == 2
+    first, second = [json.loads(call[1]["data"]) for call in mock_send_message.call_args_list]
+    assert [prop["name"] for prop in first["componentInstanceProperties"]["c1"]] == \
+        ["prop1", "prop3"]
+    assert [prop["name"] for prop in second["componentInstanceProperties"]["c2"]] == ["prop2"]